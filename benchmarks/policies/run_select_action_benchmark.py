@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the latency of `select_action` for the flow matching VLA policies (PI0, PI05, SmolVLA).
+
+Policies are built from their default configuration with random weights, and `select_action` runs a full
+inference (prefix forward and `num_inference_steps` denoising steps) on every call of a synthetic observation. The
+denoising steps attend to the prefix through a read-only `PrefixKVCache`, which is compared to copying the
+prefix cache on every denoising step, as PI0 / PI05 used to. For PI0 / PI05, the attention implementation of the
+inference is compared as well. Both cache modes are checked to produce the same actions.
+See the provided README.md or run `python benchmarks/policies/run_select_action_benchmark.py --help` for usage
+info.
+"""
+
+import argparse
+import copy
+import datetime as dt
+import functools
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import torch
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.policies.factory import get_policy_class, make_policy_config
+from lerobot.policies.pretrained import PreTrainedPolicy
+from lerobot.utils.constants import (
+    ACTION,
+    OBS_IMAGES,
+    OBS_LANGUAGE_ATTENTION_MASK,
+    OBS_LANGUAGE_TOKENS,
+    OBS_STATE,
+)
+
+
+def make_policy(
+    policy_type: str, num_cameras: int, num_steps: int, state_dim: int, action_dim: int, **kwargs
+):
+    steps_key = "num_steps" if policy_type == "smolvla" else "num_inference_steps"
+    config = make_policy_config(
+        policy_type, device="cpu", n_action_steps=1, **{steps_key: num_steps}, **kwargs
+    )
+    config.input_features = {
+        OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(state_dim,)),
+        **{
+            f"{OBS_IMAGES}.camera{i}": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 224, 224))
+            for i in range(num_cameras)
+        },
+    }
+    config.output_features = {ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(action_dim,))}
+    return get_policy_class(policy_type)(config).eval()
+
+
+def make_observation(policy: PreTrainedPolicy, num_cameras: int, state_dim: int) -> dict[str, torch.Tensor]:
+    observation = {f"{OBS_IMAGES}.camera{i}": torch.rand(1, 3, 224, 224) for i in range(num_cameras)}
+    observation[OBS_STATE] = torch.randn(1, state_dim)
+    observation[OBS_LANGUAGE_TOKENS] = torch.randint(0, 1000, (1, policy.config.tokenizer_max_length))
+    observation[OBS_LANGUAGE_ATTENTION_MASK] = torch.ones(
+        1, policy.config.tokenizer_max_length, dtype=torch.bool
+    )
+    return observation
+
+
+def copy_prefix_cache(denoise_step, *args, past_key_values, **kwargs):
+    """Denoising step on a copy of the prefix cache, the behavior of PI0 / PI05 before `PrefixKVCache`."""
+    return denoise_step(*args, past_key_values=copy.deepcopy(past_key_values), **kwargs)
+
+
+def select_action(policy: PreTrainedPolicy, observation: dict[str, torch.Tensor], seed: int) -> torch.Tensor:
+    policy.reset()
+    torch.manual_seed(seed)
+    return policy.select_action(dict(observation))
+
+
+def main(
+    output_dir: Path,
+    policy_types: list[str],
+    attn_implementations: list[str],
+    num_cameras: int,
+    num_steps: int,
+    state_dim: int,
+    action_dim: int,
+    num_iterations: int,
+    num_threads: int | None,
+    paligemma_variant: str,
+    action_expert_variant: str,
+):
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+
+    benchmark_table = []
+    for policy_type in policy_types:
+        kwargs = {}
+        if policy_type in ("pi0", "pi05"):
+            kwargs = {"paligemma_variant": paligemma_variant, "action_expert_variant": action_expert_variant}
+        policy = make_policy(policy_type, num_cameras, num_steps, state_dim, action_dim, **kwargs)
+        observation = make_observation(policy, num_cameras, state_dim)
+        prefix_cache_denoise_step = policy.model.denoise_step
+        copy_denoise_step = functools.partial(copy_prefix_cache, prefix_cache_denoise_step)
+
+        # Only PI0 / PI05 run the inference through the `transformers` attention implementations
+        implementations = attn_implementations if policy_type in ("pi0", "pi05") else ["eager"]
+        for attn_implementation in implementations:
+            if policy_type in ("pi0", "pi05"):
+                policy.config.inference_attn_implementation = attn_implementation
+
+            actions = {}
+            for mode, denoise_step in (
+                ("copy", copy_denoise_step),
+                ("prefix_cache", prefix_cache_denoise_step),
+            ):
+                policy.model.denoise_step = denoise_step
+                actions[mode] = select_action(policy, observation, seed=0)
+
+                select_action(policy, observation, seed=0)  # Warm-up
+                latencies_ms = []
+                for i in range(num_iterations):
+                    start = time.perf_counter()
+                    select_action(policy, observation, seed=i)
+                    latencies_ms.append((time.perf_counter() - start) * 1000)
+                benchmark_table.append(
+                    {
+                        "policy": policy_type,
+                        "attn_implementation": attn_implementation,
+                        "mode": mode,
+                        "mean_ms": np.mean(latencies_ms),
+                        "p50_ms": np.percentile(latencies_ms, 50),
+                        "p90_ms": np.percentile(latencies_ms, 90),
+                    }
+                )
+            policy.model.denoise_step = prefix_cache_denoise_step
+            torch.testing.assert_close(actions["prefix_cache"], actions["copy"])
+        del policy
+
+    benchmark_df = pd.DataFrame(benchmark_table)
+    print(benchmark_df.to_string(index=False, float_format="%.1f"))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    now = dt.datetime.now()
+    csv_path = output_dir / f"{now:%Y-%m-%d}_{now:%H-%M-%S}_select_action_cpu.csv"
+    benchmark_df.to_csv(csv_path, header=True, index=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("outputs/policy_benchmark"),
+        help="Directory where the select_action benchmark outputs are written.",
+    )
+    parser.add_argument(
+        "--policy-types",
+        type=str,
+        nargs="*",
+        default=["pi0", "pi05", "smolvla"],
+        choices=["pi0", "pi05", "smolvla"],
+        help="Policies to benchmark.",
+    )
+    parser.add_argument(
+        "--attn-implementations",
+        type=str,
+        nargs="*",
+        default=["eager", "sdpa"],
+        choices=["eager", "sdpa"],
+        help="Attention implementations of the PI0 / PI05 inference to compare.",
+    )
+    parser.add_argument("--num-cameras", type=int, default=2, help="Number of camera images per observation.")
+    parser.add_argument("--num-steps", type=int, default=10, help="Number of denoising steps per inference.")
+    parser.add_argument("--state-dim", type=int, default=14, help="Size of the state vector.")
+    parser.add_argument("--action-dim", type=int, default=14, help="Size of the actions.")
+    parser.add_argument(
+        "--num-iterations", type=int, default=10, help="Number of timed select_action calls per mode."
+    )
+    parser.add_argument(
+        "--num-threads", type=int, default=None, help="Number of CPU threads of torch (default: torch's)."
+    )
+    parser.add_argument(
+        "--paligemma-variant",
+        type=str,
+        default="gemma_2b",
+        choices=["gemma_300m", "gemma_2b"],
+        help="Language model of PI0 / PI05, gemma_300m fits machines with less memory.",
+    )
+    parser.add_argument(
+        "--action-expert-variant",
+        type=str,
+        default="gemma_300m",
+        choices=["gemma_300m", "gemma_2b"],
+        help="Action expert of PI0 / PI05.",
+    )
+    args = parser.parse_args()
+    main(**vars(args))
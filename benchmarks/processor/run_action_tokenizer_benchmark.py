@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the throughput of the FAST action tokenization of `ActionTokenizerProcessorStep`.
+
+Batches of random action chunks are tokenized by the batched path of the step (one DCT and one BPE call per
+batch, padded tokens built once per batch) and by the previous per-sample path, reproduced here: the FAST
+tokenizer and the PaliGemma prefix / suffix encoding called for every sample, which is then padded on its own.
+The outputs of both paths are checked to be equal.
+See the provided README.md or run `python benchmarks/processor/run_action_tokenizer_benchmark.py --help` for usage
+info.
+"""
+
+import argparse
+import datetime as dt
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pandas as pd
+import torch
+
+from lerobot.processor import ActionTokenizerProcessorStep
+
+
+def tokenize_per_sample(step: ActionTokenizerProcessorStep, action: torch.Tensor) -> tuple[torch.Tensor, ...]:
+    """The per-sample tokenization of `ActionTokenizerProcessorStep` before the batched path."""
+    tokens_list, masks_list = [], []
+    paligemma_tokenizer = step._paligemma_tokenizer
+    for i in range(action.shape[0]):
+        tokens = step.action_tokenizer(action[i : i + 1].cpu())
+        tokens = torch.tensor(tokens, dtype=torch.long, device=action.device).flatten()
+        tokens = torch.cat(
+            [
+                torch.tensor([paligemma_tokenizer.bos_token_id], device=action.device),
+                torch.tensor(
+                    paligemma_tokenizer.encode("Action: ", add_special_tokens=False), device=action.device
+                ),
+                step._act_tokens_to_paligemma_tokens(tokens),
+                torch.tensor(paligemma_tokenizer.encode("|"), device=action.device),
+            ]
+        )
+        if len(tokens) > step.max_action_tokens:
+            tokens = tokens[: step.max_action_tokens]
+            mask = torch.ones(step.max_action_tokens, dtype=torch.bool, device=action.device)
+        else:
+            padding = step.max_action_tokens - len(tokens)
+            mask = torch.cat(
+                [
+                    torch.ones(len(tokens), dtype=torch.bool, device=action.device),
+                    torch.zeros(padding, dtype=torch.bool, device=action.device),
+                ]
+            )
+            tokens = torch.nn.functional.pad(tokens, (0, padding), value=0)
+        tokens_list.append(tokens)
+        masks_list.append(mask)
+    return torch.stack(tokens_list), torch.stack(masks_list)
+
+
+def time_call(fn: Callable[[], object], num_batches: int) -> float:
+    """Average wall time of `fn()` in seconds, after a warm-up call."""
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_batches):
+        fn()
+    return (time.perf_counter() - start) / num_batches
+
+
+def main(
+    output_dir: Path,
+    action_tokenizer_name: str,
+    paligemma_tokenizer_name: str,
+    batch_sizes: list[int],
+    chunk_size: int,
+    action_dim: int,
+    max_action_tokens: int,
+    num_batches: int,
+):
+    step = ActionTokenizerProcessorStep(
+        action_tokenizer_name=action_tokenizer_name,
+        paligemma_tokenizer_name=paligemma_tokenizer_name,
+        max_action_tokens=max_action_tokens,
+    )
+    if not step._is_fast_tokenizer():
+        print(
+            f"{action_tokenizer_name} is not a FAST processor: the batched path encodes samples one by one."
+        )
+
+    benchmark_table = []
+    for batch_size in batch_sizes:
+        # Smooth trajectories, like the normalized action chunks of a dataset
+        action = torch.randn(batch_size, chunk_size, action_dim).cumsum(dim=1) / chunk_size
+        tokens, mask = step._tokenize_action(action)
+        expected_tokens, expected_mask = tokenize_per_sample(step, action)
+        if not (torch.equal(tokens, expected_tokens) and torch.equal(mask, expected_mask)):
+            raise RuntimeError(f"The batched and per-sample tokens differ for a batch size of {batch_size}.")
+
+        for mode, fn in (
+            ("per_sample", lambda action=action: tokenize_per_sample(step, action)),
+            ("batched", lambda action=action: step._tokenize_action(action)),
+        ):
+            batch_time_s = time_call(fn, num_batches)
+            benchmark_table.append(
+                {
+                    "mode": mode,
+                    "batch_size": batch_size,
+                    "samples_per_s": batch_size / batch_time_s,
+                    "avg_batch_time_ms": batch_time_s * 1000,
+                }
+            )
+
+    benchmark_df = pd.DataFrame(benchmark_table)
+    print(benchmark_df.to_string(index=False, float_format="%.2f"))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    now = dt.datetime.now()
+    csv_path = output_dir / f"{now:%Y-%m-%d}_{now:%H-%M-%S}_action_tokenizer_{num_batches}-batches.csv"
+    benchmark_df.to_csv(csv_path, header=True, index=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("outputs/processor_benchmark"),
+        help="Directory where the action tokenizer benchmark outputs are written.",
+    )
+    parser.add_argument(
+        "--action-tokenizer-name",
+        type=str,
+        default="lerobot/fast-action-tokenizer",
+        help="FAST action tokenizer on the Hugging Face Hub.",
+    )
+    parser.add_argument(
+        "--paligemma-tokenizer-name",
+        type=str,
+        default="google/paligemma-3b-pt-224",
+        help="PaliGemma tokenizer on the Hugging Face Hub.",
+    )
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="*", default=[1, 8, 32, 128], help="Batch sizes to compare."
+    )
+    parser.add_argument("--chunk-size", type=int, default=10, help="Number of actions per chunk.")
+    parser.add_argument("--action-dim", type=int, default=14, help="Size of the actions.")
+    parser.add_argument("--max-action-tokens", type=int, default=256, help="Length of the padded tokens.")
+    parser.add_argument("--num-batches", type=int, default=20, help="Number of timed batches per mode.")
+    args = parser.parse_args()
+    main(**vars(args))
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the per-call overhead of the policy processor pipelines, per step and per pipeline.
+
+The pipelines are the typical pre- and postprocessor of a policy (rename, batch, device, normalize / unnormalize,
+device), run on synthetic observations (`--num-cameras` images and a state vector) and action chunks. Every
+step is timed on its own, then the whole pipeline is timed in the default mode and in the frozen mode of
+`DataProcessorPipeline.freeze`, which fuses the steps.
+See the provided README.md or run `python benchmarks/processor/run_pipeline_benchmark.py --help` for usage info.
+"""
+
+import argparse
+import copy
+import datetime as dt
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pandas as pd
+import torch
+
+from lerobot.configs.types import FeatureType, NormalizationMode, PolicyFeature
+from lerobot.processor import (
+    AddBatchDimensionProcessorStep,
+    DeviceProcessorStep,
+    NormalizerProcessorStep,
+    PolicyProcessorPipeline,
+    RenameObservationsProcessorStep,
+    UnnormalizerProcessorStep,
+)
+from lerobot.processor.converters import policy_action_to_transition, transition_to_policy_action
+from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE
+
+
+def make_pipelines(
+    num_cameras: int, image_size: int, state_dim: int, action_dim: int, device: str
+) -> tuple[PolicyProcessorPipeline, PolicyProcessorPipeline]:
+    image_keys = [f"{OBS_IMAGES}.camera_{i}" for i in range(num_cameras)]
+    features = {key: PolicyFeature(FeatureType.VISUAL, (3, image_size, image_size)) for key in image_keys}
+    features[OBS_STATE] = PolicyFeature(FeatureType.STATE, (state_dim,))
+    features[ACTION] = PolicyFeature(FeatureType.ACTION, (action_dim,))
+    norm_map = {
+        FeatureType.VISUAL: NormalizationMode.MEAN_STD,
+        FeatureType.STATE: NormalizationMode.MEAN_STD,
+        FeatureType.ACTION: NormalizationMode.MEAN_STD,
+    }
+    stats = {key: {"mean": torch.rand(3, 1, 1), "std": torch.rand(3, 1, 1) + 0.5} for key in image_keys}
+    stats[OBS_STATE] = {"mean": torch.randn(state_dim), "std": torch.rand(state_dim) + 0.5}
+    stats[ACTION] = {"mean": torch.randn(action_dim), "std": torch.rand(action_dim) + 0.5}
+
+    preprocessor = PolicyProcessorPipeline(
+        steps=[
+            RenameObservationsProcessorStep(rename_map={"observation.images.wrist": image_keys[0]}),
+            AddBatchDimensionProcessorStep(),
+            DeviceProcessorStep(device=device),
+            NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats, device=device),
+        ]
+    )
+    postprocessor = PolicyProcessorPipeline(
+        steps=[
+            UnnormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats, device=device),
+            DeviceProcessorStep(device="cpu"),
+        ],
+        to_transition=policy_action_to_transition,
+        to_output=transition_to_policy_action,
+    )
+    return preprocessor, postprocessor
+
+
+def make_observation(num_cameras: int, image_size: int, state_dim: int) -> dict:
+    observation = {
+        f"{OBS_IMAGES}.camera_{i}": torch.rand(3, image_size, image_size) for i in range(1, num_cameras)
+    }
+    observation["observation.images.wrist"] = torch.rand(3, image_size, image_size)
+    observation[OBS_STATE] = torch.randn(state_dim)
+    observation["task"] = "Pick up the cube"
+    return observation
+
+
+def time_call(fn: Callable[[], object], num_iterations: int, device: torch.device) -> float:
+    """Average wall time of `fn()` in microseconds, after a few warm-up calls."""
+    for _ in range(5):
+        fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    start = time.perf_counter()
+    for _ in range(num_iterations):
+        fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    return (time.perf_counter() - start) * 1e6 / num_iterations
+
+
+def benchmark_pipeline(
+    name: str, pipeline: PolicyProcessorPipeline, data, num_iterations: int, device: torch.device
+) -> list[dict]:
+    rows = []
+    # Per step, each on the output of the previous steps
+    transitions = list(pipeline.step_through(data))
+    for idx, step in enumerate(pipeline.steps):
+        rows.append(
+            {
+                "pipeline": name,
+                "stage": f"{idx}: {type(step).__name__}",
+                "time_us": time_call(lambda s=step, t=transitions[idx]: s(t), num_iterations, device),
+            }
+        )
+
+    rows.append(
+        {
+            "pipeline": name,
+            "stage": "pipeline",
+            "time_us": time_call(lambda: pipeline(data), num_iterations, device),
+        }
+    )
+    frozen = copy.deepcopy(pipeline).freeze()
+    rows.append(
+        {
+            "pipeline": name,
+            "stage": "frozen pipeline",
+            "time_us": time_call(lambda: frozen(data), num_iterations, device),
+        }
+    )
+    return rows
+
+
+def main(
+    output_dir: Path,
+    device: str,
+    num_cameras: int,
+    image_size: int,
+    state_dim: int,
+    action_dim: int,
+    chunk_size: int,
+    num_iterations: int,
+):
+    torch_device = torch.device(device)
+    preprocessor, postprocessor = make_pipelines(num_cameras, image_size, state_dim, action_dim, device)
+    observation = make_observation(num_cameras, image_size, state_dim)
+    action_chunk = torch.randn(chunk_size, action_dim, device=torch_device)
+
+    benchmark_table = [
+        *benchmark_pipeline("preprocessor", preprocessor, observation, num_iterations, torch_device),
+        *benchmark_pipeline("postprocessor", postprocessor, action_chunk, num_iterations, torch_device),
+    ]
+
+    benchmark_df = pd.DataFrame(benchmark_table)
+    benchmark_df["device"] = device
+    print(benchmark_df.to_string(index=False, float_format="%.1f"))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    now = dt.datetime.now()
+    csv_path = output_dir / f"{now:%Y-%m-%d}_{now:%H-%M-%S}_processor_pipeline_{device}.csv"
+    benchmark_df.to_csv(csv_path, header=True, index=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("outputs/processor_benchmark"),
+        help="Directory where the pipeline benchmark outputs are written.",
+    )
+    parser.add_argument(
+        "--device",
+        type=str,
+        default="cuda" if torch.cuda.is_available() else "cpu",
+        help="Device of the policy, targeted by the preprocessor.",
+    )
+    parser.add_argument("--num-cameras", type=int, default=3, help="Number of camera images per observation.")
+    parser.add_argument("--image-size", type=int, default=96, help="Height and width of the images.")
+    parser.add_argument("--state-dim", type=int, default=14, help="Size of the state vector.")
+    parser.add_argument("--action-dim", type=int, default=14, help="Size of the actions.")
+    parser.add_argument("--chunk-size", type=int, default=50, help="Number of actions postprocessed at once.")
+    parser.add_argument(
+        "--num-iterations", type=int, default=2000, help="Number of timed calls per step and pipeline."
+    )
+    args = parser.parse_args()
+    main(**vars(args))
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the sampling throughput of the SAC learner replay buffer.
+
+A buffer of synthetic transitions (camera images and a state vector) is sampled through `get_iterator` while a
+dummy optimization step runs on the sampling device, like in the learner loop. The reference mode is the
+background-thread prefetching of float32 buffers; the other modes store images as uint8 and, on CUDA devices,
+gather batches in pinned memory and copy them on a side stream.
+See the provided README.md or run `python benchmarks/rl/run_replay_buffer_benchmark.py --help` for usage info.
+"""
+
+import argparse
+import datetime as dt
+import itertools
+import time
+from pathlib import Path
+
+import pandas as pd
+import torch
+from tqdm import tqdm
+
+from lerobot.rl.buffer import ReplayBuffer
+from lerobot.utils.constants import ACTION, OBS_IMAGE, OBS_STATE
+
+# Mode name -> (store_images_as_uint8, pin_memory)
+MODES = {
+    "thread_float32": (False, False),
+    "thread_uint8": (True, False),
+    "stream_pinned_uint8": (True, True),
+}
+
+
+def make_buffer(
+    capacity: int,
+    num_cameras: int,
+    image_size: int,
+    device: str,
+    store_images_as_uint8: bool,
+    pin_memory: bool,
+) -> ReplayBuffer:
+    image_keys = [f"{OBS_IMAGE}s.camera_{i}" for i in range(num_cameras)]
+    buffer = ReplayBuffer(
+        capacity=capacity,
+        device=device,
+        state_keys=[*image_keys, OBS_STATE],
+        storage_device="cpu",
+        optimize_memory=True,
+        store_images_as_uint8=store_images_as_uint8,
+        pin_memory=pin_memory,
+    )
+    for i in range(capacity):
+        state = {key: torch.rand(1, 3, image_size, image_size) for key in image_keys}
+        state[OBS_STATE] = torch.randn(1, 18)
+        buffer.add(state, torch.randn(1, 4), 0.0, state, done=(i + 1) % 100 == 0, truncated=False)
+    return buffer
+
+
+def optimization_step(batch: dict, weights: torch.Tensor, num_matmuls: int) -> torch.Tensor:
+    """Stand-in for the learner step: reads the images, then runs `num_matmuls` matrix products."""
+    features = sum(image.mean() for key, image in batch["state"].items() if key.startswith(OBS_IMAGE))
+    out = weights
+    for _ in range(num_matmuls):
+        out = torch.tanh(out @ weights)
+    return out.sum() + features + batch[ACTION].sum()
+
+
+def benchmark_mode(
+    buffer: ReplayBuffer, mode: str, batch_size: int, num_batches: int, num_matmuls: int
+) -> dict:
+    device = torch.device(buffer.device)
+    weights = torch.randn(1024, 1024, device=device) / 32
+    iterator = buffer.get_iterator(batch_size=batch_size, async_prefetch=True, queue_size=2)
+    # Warm up the prefetching (thread startup, pinned memory allocation, compilation of the augmentation)
+    for batch in itertools.islice(iterator, 3):
+        optimization_step(batch, weights, num_matmuls)
+
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    start = time.perf_counter()
+    for batch in tqdm(itertools.islice(iterator, num_batches), total=num_batches, desc=mode, leave=False):
+        optimization_step(batch, weights, num_matmuls)
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    elapsed_s = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "device": str(device),
+        "batch_size": batch_size,
+        "num_matmuls": num_matmuls,
+        "samples_per_s": num_batches * batch_size / elapsed_s,
+        "avg_step_time_ms": elapsed_s * 1000 / num_batches,
+    }
+
+
+def main(
+    output_dir: Path,
+    modes: list[str],
+    device: str,
+    capacity: int,
+    num_cameras: int,
+    image_size: int,
+    batch_size: int,
+    num_batches: int,
+    num_matmuls: int,
+):
+    benchmark_table = []
+    for mode in tqdm(modes, desc="modes"):
+        store_images_as_uint8, pin_memory = MODES[mode]
+        if pin_memory and not device.startswith("cuda"):
+            print(f"Skipping {mode}: pinned memory sampling requires a CUDA device.")
+            continue
+        buffer = make_buffer(capacity, num_cameras, image_size, device, store_images_as_uint8, pin_memory)
+        benchmark_table.append(benchmark_mode(buffer, mode, batch_size, num_batches, num_matmuls))
+
+    benchmark_df = pd.DataFrame(benchmark_table)
+    print(benchmark_df.to_string(index=False))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    now = dt.datetime.now()
+    csv_path = output_dir / f"{now:%Y-%m-%d}_{now:%H-%M-%S}_replay_buffer_{num_batches}-batches.csv"
+    benchmark_df.to_csv(csv_path, header=True, index=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("outputs/rl_benchmark"),
+        help="Directory where the replay buffer benchmark outputs are written.",
+    )
+    parser.add_argument(
+        "--modes",
+        type=str,
+        nargs="*",
+        default=list(MODES),
+        choices=list(MODES),
+        help="Sampling modes to compare.",
+    )
+    parser.add_argument(
+        "--device",
+        type=str,
+        default="cuda" if torch.cuda.is_available() else "cpu",
+        help="Device the batches are sampled to.",
+    )
+    parser.add_argument("--capacity", type=int, default=10_000, help="Number of transitions in the buffer.")
+    parser.add_argument("--num-cameras", type=int, default=2, help="Number of camera images per state.")
+    parser.add_argument("--image-size", type=int, default=128, help="Height and width of the images.")
+    parser.add_argument("--batch-size", type=int, default=256, help="Batch size of the learner.")
+    parser.add_argument("--num-batches", type=int, default=200, help="Number of timed batches per mode.")
+    parser.add_argument(
+        "--num-matmuls",
+        type=int,
+        default=8,
+        help="Size of the dummy optimization step overlapping with sampling. 0 measures sampling alone.",
+    )
+    args = parser.parse_args()
+    main(**vars(args))
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Assess the randomness/throughput trade-off of chunked shuffling for video datasets.
+
+`EpisodeAwareSampler(chunk_size=N)` shuffles chunks of N consecutive frames of an episode instead of single
+frames, so that the samples of a chunk mostly share their video seeks within a batch. This script measures the training
+dataloader throughput for several chunk sizes together with simple measures of how random the batches remain.
+See the provided README.md or run `python benchmarks/video/run_sampler_benchmark.py --help` for usage info.
+"""
+
+import argparse
+import datetime as dt
+import itertools
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import torch
+from tqdm import tqdm
+
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.datasets.sampler import EpisodeAwareSampler
+
+
+def batch_randomness(batch_indices: list[int], episode_of_index: np.ndarray) -> dict:
+    """Per-batch randomness measures: distinct episodes, and share of neighbouring consecutive frames."""
+    indices = np.asarray(batch_indices)
+    consecutive = np.diff(indices) == 1 if len(indices) > 1 else np.zeros(0, dtype=bool)
+    return {
+        "episodes_per_batch": len(np.unique(episode_of_index[indices])),
+        "consecutive_ratio": float(consecutive.mean()) if len(consecutive) else 0.0,
+    }
+
+
+def benchmark_sampler(
+    dataset: LeRobotDataset,
+    chunk_size: int,
+    batch_size: int,
+    num_batches: int,
+    num_workers: int,
+    seed: int,
+) -> dict:
+    episodes = dataset.meta.episodes
+    sampler = EpisodeAwareSampler(
+        episodes["dataset_from_index"],
+        episodes["dataset_to_index"],
+        shuffle=True,
+        chunk_size=chunk_size,
+        seed=seed,
+    )
+    episode_lengths = np.asarray(episodes["dataset_to_index"]) - np.asarray(episodes["dataset_from_index"])
+    episode_of_index = np.repeat(np.arange(len(episodes)), episode_lengths)
+
+    torch.manual_seed(seed)
+    dataloader = torch.utils.data.DataLoader(
+        dataset,
+        batch_size=batch_size,
+        sampler=sampler,
+        num_workers=num_workers,
+        prefetch_factor=2 if num_workers > 0 else None,
+    )
+    dl_iter = iter(dataloader)
+    # Warm up the workers (process startup, decoder initialization) before timing
+    next(dl_iter)
+
+    randomness = []
+    start = time.perf_counter()
+    for batch in tqdm(itertools.islice(dl_iter, num_batches), total=num_batches, desc="batches", leave=False):
+        randomness.append(batch_randomness(batch["index"].tolist(), episode_of_index))
+    elapsed_s = time.perf_counter() - start
+    num_timed_batches = max(len(randomness), 1)
+
+    return {
+        "repo_id": dataset.repo_id,
+        "chunk_size": chunk_size,
+        "batch_size": batch_size,
+        "num_workers": num_workers,
+        "samples_per_s": num_timed_batches * batch_size / elapsed_s,
+        "avg_batch_load_time_ms": elapsed_s * 1000 / num_timed_batches,
+        "avg_episodes_per_batch": float(np.mean([r["episodes_per_batch"] for r in randomness])),
+        "avg_consecutive_ratio": float(np.mean([r["consecutive_ratio"] for r in randomness])),
+    }
+
+
+def main(
+    output_dir: Path,
+    repo_ids: list[str],
+    chunk_sizes: list[int],
+    batch_size: int,
+    num_batches: int,
+    num_workers: int,
+    video_frame_cache_mb: float,
+    seed: int,
+):
+    benchmark_table = []
+    for repo_id in tqdm(repo_ids, desc="datasets"):
+        dataset = LeRobotDataset(repo_id, video_frame_cache_mb=video_frame_cache_mb)
+        if len(dataset.meta.video_keys) == 0:
+            raise ValueError(f"Use only video datasets for running this benchmark. Image dataset: {repo_id}")
+        for chunk_size in tqdm(chunk_sizes, desc="chunk sizes", leave=False):
+            benchmark_table.append(
+                benchmark_sampler(dataset, chunk_size, batch_size, num_batches, num_workers, seed)
+            )
+
+    benchmark_df = pd.DataFrame(benchmark_table)
+    print(benchmark_df.to_string(index=False))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    now = dt.datetime.now()
+    csv_path = output_dir / f"{now:%Y-%m-%d}_{now:%H-%M-%S}_sampler_{num_batches}-batches.csv"
+    benchmark_df.to_csv(csv_path, header=True, index=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("outputs/video_benchmark"),
+        help="Directory where the sampler benchmark outputs are written.",
+    )
+    parser.add_argument(
+        "--repo-ids",
+        type=str,
+        nargs="*",
+        default=["lerobot/pusht", "lerobot/aloha_mobile_shrimp"],
+        help="Video datasets repo-ids to test against.",
+    )
+    parser.add_argument(
+        "--chunk-sizes",
+        type=int,
+        nargs="*",
+        default=[1, 2, 4, 8, 16],
+        help="Number of consecutive frames shuffled together. 1 is the usual uniform shuffling.",
+    )
+    parser.add_argument("--batch-size", type=int, default=32, help="Training batch size.")
+    parser.add_argument("--num-batches", type=int, default=50, help="Number of timed batches per config.")
+    parser.add_argument("--num-workers", type=int, default=4, help="Number of DataLoader workers.")
+    parser.add_argument(
+        "--video-frame-cache-mb",
+        type=float,
+        default=0.0,
+        help="Per-worker budget of the decoded-frame cache. 0 disables it.",
+    )
+    parser.add_argument("--seed", type=int, default=1337, help="Seed of the sampler permutations.")
+    args = parser.parse_args()
+    main(**vars(args))
@@ -20,8 +20,11 @@ import torch
 from lerobot.robots.config import RobotConfig
 
 from .constants import (
+    DEFAULT_BATCH_DEADLINE,
     DEFAULT_FPS,
     DEFAULT_INFERENCE_LATENCY,
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_CLIENTS,
     DEFAULT_OBS_QUEUE_TIMEOUT,
 )
 
@@ -64,6 +67,34 @@ class PolicyServerConfig:
         default=DEFAULT_OBS_QUEUE_TIMEOUT, metadata={"help": "Timeout for observation queue in seconds"}
     )
 
+    # Clients configuration
+    max_clients: int = field(
+        default=DEFAULT_MAX_CLIENTS,
+        metadata={
+            "help": "Maximum number of robot clients served at once. Sizes the gRPC worker pool: each client "
+            "holds a worker with its action stream and another one with its observations"
+        },
+    )
+
+    # Batching configuration, to serve several clients with the same policy
+    max_batch_size: int = field(
+        default=DEFAULT_MAX_BATCH_SIZE,
+        metadata={
+            "help": "Maximum number of observations of different clients run through the policy at once"
+        },
+    )
+    batch_deadline: float = field(
+        default=DEFAULT_BATCH_DEADLINE,
+        metadata={"help": "Max time to wait for more observations to batch with the first one, in seconds"},
+    )
+    speculative_inference: bool = field(
+        default=False,
+        metadata={
+            "help": "Run inference on the newest observation as soon as the previous chunk is predicted, "
+            "while it is being sent, instead of pacing inferences `inference_latency` seconds apart"
+        },
+    )
+
     def __post_init__(self):
         """Validate configuration after initialization."""
         if self.port < 1 or self.port > 65535:
@@ -78,6 +109,15 @@ class PolicyServerConfig:
         if self.obs_queue_timeout < 0:
             raise ValueError(f"obs_queue_timeout must be non-negative, got {self.obs_queue_timeout}")
 
+        if self.max_clients < 1:
+            raise ValueError(f"max_clients must be positive, got {self.max_clients}")
+
+        if self.max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {self.max_batch_size}")
+
+        if self.batch_deadline < 0:
+            raise ValueError(f"batch_deadline must be non-negative, got {self.batch_deadline}")
+
     @classmethod
     def from_dict(cls, config_dict: dict) -> "PolicyServerConfig":
         """Create a PolicyServerConfig from a dictionary."""
@@ -96,6 +136,10 @@ class PolicyServerConfig:
             "fps": self.fps,
             "environment_dt": self.environment_dt,
             "inference_latency": self.inference_latency,
+            "max_clients": self.max_clients,
+            "max_batch_size": self.max_batch_size,
+            "batch_deadline": self.batch_deadline,
+            "speculative_inference": self.speculative_inference,
         }
 
 
@@ -136,6 +180,27 @@ class RobotClientConfig:
     # Control behavior configuration
     chunk_size_threshold: float = field(default=0.5, metadata={"help": "Threshold for chunk size control"})
     fps: int = field(default=DEFAULT_FPS, metadata={"help": "Frames per second"})
+    stream_actions: bool = field(
+        default=True,
+        metadata={
+            "help": "Receive action chunks as soon as the server predicts them, over a single stream, "
+            "instead of polling the server for them"
+        },
+    )
+
+    # Observation upload configuration
+    image_compression_level: int = field(
+        default=0,
+        metadata={
+            "help": "zlib level (1-9) used to compress camera images before sending them, 0 to disable"
+        },
+    )
+    image_quantization_bits: int = field(
+        default=0,
+        metadata={
+            "help": "Lossy image compression: least significant bits dropped from pixels before compressing"
+        },
+    )
 
     # Aggregate function configuration (CLI-compatible)
     aggregate_fn_name: str = field(
@@ -179,6 +244,19 @@ class RobotClientConfig:
         if self.actions_per_chunk <= 0:
             raise ValueError(f"actions_per_chunk must be positive, got {self.actions_per_chunk}")
 
+        if self.image_compression_level < 0 or self.image_compression_level > 9:
+            raise ValueError(
+                f"image_compression_level must be between 0 and 9, got {self.image_compression_level}"
+            )
+
+        if self.image_quantization_bits < 0 or self.image_quantization_bits > 7:
+            raise ValueError(
+                f"image_quantization_bits must be between 0 and 7, got {self.image_quantization_bits}"
+            )
+
+        if self.image_quantization_bits > 0 and self.image_compression_level == 0:
+            raise ValueError("image_quantization_bits requires image_compression_level > 0")
+
         self.aggregate_fn = get_aggregate_function(self.aggregate_fn_name)
 
     @classmethod
@@ -200,4 +278,7 @@ class RobotClientConfig:
             "task": self.task,
             "debug_visualize_queue_size": self.debug_visualize_queue_size,
             "aggregate_fn_name": self.aggregate_fn_name,
+            "image_compression_level": self.image_compression_level,
+            "image_quantization_bits": self.image_quantization_bits,
+            "stream_actions": self.stream_actions,
         }
@@ -22,6 +22,27 @@ DEFAULT_INFERENCE_LATENCY = 1 / DEFAULT_FPS
 """Server side: Timeout for observation queue in seconds"""
 DEFAULT_OBS_QUEUE_TIMEOUT = 2
 
+"""Server side: Id of the state used when the server is driven without any client (e.g. in tests)"""
+DEFAULT_CLIENT_ID = "default"
+
+"""gRPC call metadata key with which clients identify themselves, to be told apart by the server"""
+CLIENT_ID_METADATA_KEY = "lerobot-client-id"
+
+"""Server side: Observations of different clients run through the policy at once (1 disables batching)"""
+DEFAULT_MAX_BATCH_SIZE = 1
+
+"""Server side: Max time to wait for more observations to batch with the first pending one, in seconds"""
+DEFAULT_BATCH_DEADLINE = 0.01
+
+"""Server side: Maximum number of robot clients served at once, each holding a gRPC worker with its action stream"""
+DEFAULT_MAX_CLIENTS = 8
+
+"""Server side: gRPC workers on top of those of the clients, for calls of clients (re)connecting or overflowing"""
+GRPC_EXTRA_WORKERS = 4
+
+"""Server side: Interval at which action streams check that their client is still connected, in seconds"""
+ACTION_STREAM_POLL_INTERVAL = 0.1
+
 # All action chunking policies
 SUPPORTED_POLICIES = ["act", "smolvla", "diffusion", "tdmpc", "vqbet", "pi0", "pi05", "groot"]
 
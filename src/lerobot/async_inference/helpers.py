@@ -16,10 +16,13 @@ import logging
 import logging.handlers
 import os
 import time
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from queue import Empty
 from typing import Any
 
+import numpy as np
 import torch
 
 from lerobot.configs.types import PolicyFeature
@@ -35,7 +38,8 @@ from lerobot.policies import (  # noqa: F401
     VQBeTConfig,
 )
 from lerobot.robots.robot import Robot
-from lerobot.utils.constants import OBS_IMAGES, OBS_STATE, OBS_STR
+from lerobot.transport.tensor_wire import TensorCompression, decode_tensors, encode_tensors
+from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE, OBS_STR
 from lerobot.utils.utils import init_logging
 
 Action = torch.Tensor
@@ -234,6 +238,240 @@ class TimedObservation(TimedData):
         return self.observation
 
 
+def timed_observation_to_bytes(
+    obs: TimedObservation, compression: Mapping[str, TensorCompression] | None = None
+) -> bytes:
+    """Serialize a TimedObservation with the tensor wire format (see `lerobot.transport.tensor_wire`).
+
+    Arrays and tensors of the observation (e.g. camera images) are sent as raw buffers, optionally compressed
+    per key, while scalars (e.g. motor positions) and strings (e.g. the task) go into the message header.
+    """
+    observation = obs.get_observation()
+    tensors = {}
+    values = {}
+    for key, value in observation.items():
+        if isinstance(value, np.ndarray | torch.Tensor):
+            tensors[key] = value
+        else:
+            values[key] = value.item() if isinstance(value, np.generic) else value
+    meta = {
+        "timestamp": obs.get_timestamp(),
+        "timestep": obs.get_timestep(),
+        "must_go": obs.must_go,
+        "keys": list(observation),
+        "values": values,
+    }
+    return encode_tensors(tensors, meta, compression)
+
+
+def bytes_to_timed_observation(buffer: bytes) -> TimedObservation:
+    """Inverse of `timed_observation_to_bytes`. Arrays and tensors are read-only views of `buffer`."""
+    tensors, meta = decode_tensors(buffer)
+    values = meta["values"]
+    observation = {key: tensors[key] if key in tensors else values[key] for key in meta["keys"]}
+    return TimedObservation(
+        timestamp=meta["timestamp"],
+        timestep=meta["timestep"],
+        observation=observation,
+        must_go=meta["must_go"],
+    )
+
+
+def timed_actions_to_bytes(actions: list[TimedAction]) -> bytes:
+    """Serialize an action chunk with the tensor wire format, stacking the actions into a single buffer."""
+    meta = {
+        "timestamps": [action.get_timestamp() for action in actions],
+        "timesteps": [action.get_timestep() for action in actions],
+    }
+    tensors = {ACTION: torch.stack([action.get_action() for action in actions])} if actions else {}
+    return encode_tensors(tensors, meta)
+
+
+def bytes_to_timed_actions(buffer: bytes) -> list[TimedAction]:
+    """Inverse of `timed_actions_to_bytes`. Actions are read-only views of `buffer`, on CPU."""
+    tensors, meta = decode_tensors(buffer)
+    return [
+        TimedAction(timestamp=timestamp, timestep=timestep, action=tensors[ACTION][i])
+        for i, (timestamp, timestep) in enumerate(zip(meta["timestamps"], meta["timesteps"], strict=True))
+    ]
+
+
+@dataclass
+class TimedActionChunk:
+    """Actions of consecutive timesteps, starting at `timestep`, stacked in a single tensor.
+
+    Args:
+        timestep: The timestep of the first action.
+        timestamps: The timestamps of the actions, of shape (N,).
+        actions: The actions, of shape (N, action_dim).
+    """
+
+    timestep: int
+    timestamps: torch.Tensor
+    actions: torch.Tensor
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def __iter__(self) -> Iterator[TimedAction]:
+        for i, (timestamp, action) in enumerate(zip(self.timestamps.tolist(), self.actions, strict=True)):
+            yield TimedAction(timestamp=timestamp, timestep=self.timestep + i, action=action)
+
+    def to(self, device: str | torch.device) -> "TimedActionChunk":
+        return TimedActionChunk(self.timestep, self.timestamps, self.actions.to(device))
+
+    @classmethod
+    def from_timed_actions(cls, actions: list[TimedAction]) -> "TimedActionChunk":
+        if not actions:
+            return cls(0, torch.empty(0, dtype=torch.float64), torch.empty(0, 0))
+        timesteps = [action.get_timestep() for action in actions]
+        if timesteps != list(range(timesteps[0], timesteps[0] + len(timesteps))):
+            raise ValueError(f"Actions of a chunk must have consecutive timesteps, got {timesteps}")
+        return cls(
+            timestep=timesteps[0],
+            timestamps=torch.tensor([action.get_timestamp() for action in actions], dtype=torch.float64),
+            actions=torch.stack([action.get_action() for action in actions]),
+        )
+
+
+def bytes_to_timed_action_chunk(buffer: bytes) -> TimedActionChunk:
+    """Decode a message of `timed_actions_to_bytes` as a single chunk, without per-action objects.
+
+    Actions are a read-only view of `buffer`, on CPU.
+    """
+    tensors, meta = decode_tensors(buffer)
+    timesteps = meta["timesteps"]
+    if not timesteps:
+        return TimedActionChunk(0, torch.empty(0, dtype=torch.float64), torch.empty(0, 0))
+    if timesteps[-1] - timesteps[0] != len(timesteps) - 1:
+        raise ValueError(f"Actions of a chunk must have consecutive timesteps, got {timesteps}")
+    return TimedActionChunk(
+        timestep=timesteps[0],
+        timestamps=torch.tensor(meta["timestamps"], dtype=torch.float64),
+        actions=tensors[ACTION],
+    )
+
+
+class ActionTimeline:
+    """Actions to perform, indexed by timestep, in a tensor ring buffer.
+
+    The timeline holds the actions of the consecutive timesteps `[start, end)`, the action of timestep `t`
+    being stored in the slot `t % capacity` of the buffer. New chunks are merged with a few tensor
+    operations (see `merge`), whatever their length.
+
+    It mimics the subset of the `queue.Queue` interface used for the actions queue of the robot client, and is
+    not thread-safe either: the client guards it with its own lock.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self._capacity = capacity
+        self._actions: torch.Tensor | None = None
+        self._timestamps = torch.zeros(capacity, dtype=torch.float64)
+        self._start = 0
+        self._end = 0
+
+    def qsize(self) -> int:
+        return self._end - self._start
+
+    def empty(self) -> bool:
+        return self._end == self._start
+
+    @property
+    def start(self) -> int:
+        """Timestep of the next action to perform."""
+        return self._start
+
+    @property
+    def queue(self) -> list[TimedAction]:
+        """The actions of the timeline in timestep order, like the underlying deque of a `queue.Queue`."""
+        slots = self._slots(self._start, self._end)
+        return list(TimedActionChunk(self._start, self._timestamps[slots], self._actions[slots]))
+
+    def _slots(self, start: int, end: int) -> torch.Tensor:
+        return torch.arange(start, end) % self._capacity
+
+    def _reserve(self, num_actions: int, like: torch.Tensor) -> None:
+        """Make room for `num_actions` actions shaped like the rows of `like`, keeping the current ones."""
+        if (
+            self._actions is not None
+            and num_actions <= self._capacity
+            and self._actions.shape[1:] == like.shape[1:]
+        ):
+            return
+        current = self._actions[self._slots(self._start, self._end)] if self._actions is not None else None
+        current_timestamps = self._timestamps[self._slots(self._start, self._end)]
+        while self._capacity < num_actions:
+            self._capacity *= 2
+        self._actions = torch.zeros((self._capacity, *like.shape[1:]), dtype=like.dtype, device=like.device)
+        self._timestamps = torch.zeros(self._capacity, dtype=torch.float64)
+        if current is not None and current.shape[1:] == like.shape[1:]:
+            slots = self._slots(self._start, self._end)
+            self._actions[slots] = current.to(like.device)
+            self._timestamps[slots] = current_timestamps
+        else:
+            self._start = self._end
+
+    def put(self, action: TimedAction) -> None:
+        """Append the action of the timestep following the last one of the timeline."""
+        timestep = action.get_timestep()
+        if self.empty():
+            self._start = self._end = timestep
+        elif timestep != self._end:
+            raise ValueError(f"Expected the action of timestep {self._end}, got timestep {timestep}")
+        self._reserve(self.qsize() + 1, action.get_action()[None])
+        slot = timestep % self._capacity
+        self._actions[slot] = action.get_action()
+        self._timestamps[slot] = action.get_timestamp()
+        self._end += 1
+
+    def get_nowait(self) -> TimedAction:
+        """Pop the action of the earliest timestep."""
+        if self.empty():
+            raise Empty
+        slot = self._start % self._capacity
+        # Later merges overwrite the slot, hand over a copy
+        action = TimedAction(
+            timestamp=self._timestamps[slot].item(), timestep=self._start, action=self._actions[slot].clone()
+        )
+        self._start += 1
+        return action
+
+    def merge(
+        self,
+        chunk: TimedActionChunk,
+        min_timestep: int,
+        aggregate_fn: Callable[[torch.Tensor, torch.Tensor], torch.Tensor] | None = None,
+    ) -> None:
+        """Replace the timeline with the actions of `chunk` from `min_timestep` on.
+
+        On the timesteps where the timeline already had actions, the new actions are aggregated with them with
+        `aggregate_fn(current_actions, new_actions)`, called once on all the overlapping actions. Without
+        `aggregate_fn`, the new actions replace the current ones.
+        """
+        first = max(chunk.timestep, min_timestep)
+        actions = chunk.actions[first - chunk.timestep :]
+        timestamps = chunk.timestamps[first - chunk.timestep :]
+        end = first + len(actions)
+        if len(actions) == 0:
+            self._start = self._end = first
+            return
+
+        self._reserve(len(actions), actions)
+        actions = actions.to(self._actions.device)
+        overlap_start, overlap_end = max(first, self._start), min(end, self._end)
+        merged = None
+        if aggregate_fn is not None and overlap_start < overlap_end:
+            current = self._actions[self._slots(overlap_start, overlap_end)]
+            merged = aggregate_fn(current, actions[overlap_start - first : overlap_end - first])
+
+        slots = self._slots(first, end)
+        self._actions[slots] = actions
+        self._timestamps[slots] = timestamps
+        if merged is not None:
+            self._actions[self._slots(overlap_start, overlap_end)] = merged
+        self._start, self._end = first, end
+
+
 @dataclass
 class FPSTracker:
     """Utility class to track FPS metrics over time."""
@@ -262,6 +500,35 @@ class FPSTracker:
         self.total_obs_count = 0
 
 
+@dataclass
+class BatchingStats:
+    """Running metrics of the batches of observations run through the policy by the server."""
+
+    num_batches: int = 0
+    num_observations: int = 0
+    max_batch_size: int = 0
+    total_queue_delay: float = 0.0
+    max_queue_delay: float = 0.0
+
+    def record(self, batch_size: int, queue_delays: list[float]) -> None:
+        """Record a batch, with the time each of its observations waited for it (in seconds)."""
+        self.num_batches += 1
+        self.num_observations += batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self.total_queue_delay += sum(queue_delays)
+        self.max_queue_delay = max([self.max_queue_delay, *queue_delays])
+
+    def summary(self) -> dict[str, float]:
+        num_observations = max(self.num_observations, 1)
+        return {
+            "num_batches": self.num_batches,
+            "avg_batch_size": self.num_observations / max(self.num_batches, 1),
+            "max_batch_size": self.max_batch_size,
+            "avg_queue_delay_ms": 1000 * self.total_queue_delay / num_observations,
+            "max_queue_delay_ms": 1000 * self.max_queue_delay,
+        }
+
+
 @dataclass
 class RemotePolicyConfig:
     policy_type: str
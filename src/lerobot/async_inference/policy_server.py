@@ -20,7 +20,11 @@ python -m lerobot.async_inference.policy_server \
      --port=8080 \
      --fps=30 \
      --inference_latency=0.033 \
-     --obs_queue_timeout=1
+     --obs_queue_timeout=1 \
+     --max_clients=8 \
+     --max_batch_size=4 \
+     --batch_deadline=0.01 \
+     --speculative_inference=false
 ```
 """
 
@@ -29,7 +33,7 @@ import pickle  # nosec
 import threading
 import time
 from concurrent import futures
-from dataclasses import asdict
+from dataclasses import asdict, dataclass, field
 from pprint import pformat
 from queue import Empty, Queue
 from typing import Any
@@ -48,20 +52,69 @@ from lerobot.transport.utils import receive_bytes_in_chunks
 from lerobot.types import PolicyAction
 
 from .configs import PolicyServerConfig
-from .constants import SUPPORTED_POLICIES
+from .constants import (
+    ACTION_STREAM_POLL_INTERVAL,
+    CLIENT_ID_METADATA_KEY,
+    DEFAULT_CLIENT_ID,
+    GRPC_EXTRA_WORKERS,
+    SUPPORTED_POLICIES,
+)
 from .helpers import (
+    BatchingStats,
     FPSTracker,
     Observation,
     RemotePolicyConfig,
     TimedAction,
     TimedObservation,
+    bytes_to_timed_observation,
     get_logger,
     observations_similar,
     raw_observation_to_observation,
+    timed_actions_to_bytes,
 )
 
 
+@dataclass
+class ClientState:
+    """Per-client state of the server: latest pending observation, latest predicted action chunk, etc."""
+
+    client_id: str
+    target_fps: float
+    # Robot features and chunk length requested by the client, the server-wide ones when not set
+    lerobot_features: dict[str, dict] | None = None
+    actions_per_chunk: int | None = None
+    # Only running inference on the latest observation received from the client
+    observation_queue: Queue = field(default_factory=lambda: Queue(maxsize=1))
+    # Latest action chunk predicted for the client, with the observation it was predicted from
+    action_queue: Queue = field(default_factory=lambda: Queue(maxsize=1))
+    # Time at which the observation in `observation_queue` was enqueued
+    enqueued_at: float = 0.0
+    last_processed_obs: TimedObservation | None = None
+    predicted_timesteps: set[int] = field(default_factory=set)
+    predicted_timesteps_lock: threading.Lock = field(default_factory=threading.Lock)
+    fps_tracker: FPSTracker = field(init=False)
+    fps_metrics: dict[str, float] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.fps_tracker = FPSTracker(target_fps=self.target_fps)
+
+
+def _get_client_id(context) -> str:
+    """Clients identify themselves with call metadata, or by their address otherwise."""
+    metadata = dict(context.invocation_metadata() or ())
+    return metadata.get(CLIENT_ID_METADATA_KEY, context.peer())
+
+
 class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
+    """Serves action chunks of a policy to one or several robot clients.
+
+    Observations received from the clients are collected by a scheduler thread, which runs the policy once
+    on batches of up to `config.max_batch_size` observations of different clients. A batch is run as soon as
+    it is full, or `config.batch_deadline` seconds after its first observation arrived. Each action chunk is
+    then routed back to its client, timed with the client's own timesteps, and pushed to it over its
+    `StreamActions` stream (or returned by its next `GetActions` call, for polling clients).
+    """
+
     prefix = "policy_server"
     logger = get_logger(prefix)
 
@@ -69,19 +122,31 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         self.config = config
         self.shutdown_event = threading.Event()
 
-        # FPS measurement
-        self.fps_tracker = FPSTracker(target_fps=config.fps)
-
-        self.observation_queue = Queue(maxsize=1)
-
-        self._predicted_timesteps_lock = threading.Lock()
-        self._predicted_timesteps = set()
-
-        self.last_processed_obs = None
+        # State of every connected client. Methods called without a client id use the state of the client
+        # that connected last, which is the only one in single-client setups.
+        self._clients: dict[str, ClientState] = {}
+        self._current_client_id = DEFAULT_CLIENT_ID
+        # Notified whenever a client has a new pending observation
+        self._observations_available = threading.Condition()
+        self._scheduler_thread: threading.Thread | None = None
+        self._scheduler_stop = threading.Event()
+        # Guards the scheduler thread, started by the concurrent `SendObservations` calls
+        self._scheduler_lock = threading.Lock()
+        self.batching_stats = BatchingStats()
+        # Each open action stream holds a gRPC worker, at most `config.max_clients` of them are accepted
+        self._action_streams = threading.BoundedSemaphore(config.max_clients)
+
+        # Held by each batched inference and by policy swaps, so that a batch never runs the policy of a
+        # request with the processors of another one
+        self._policy_lock = threading.Lock()
+        # Serializes the policy loads of different clients
+        self._policy_load_lock = threading.Lock()
 
         # Attributes will be set by SendPolicyInstructions
         self.device = None
         self.policy_type = None
+        self.pretrained_name_or_path = None
+        self.rename_map = None
         self.lerobot_features = None
         self.actions_per_chunk = None
         self.policy = None
@@ -96,23 +161,64 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
     def policy_image_features(self):
         return self.policy.config.image_features
 
+    def _get_client(self, client_id: str | None = None) -> ClientState:
+        with self._observations_available:
+            client_id = client_id if client_id is not None else self._current_client_id
+            if client_id not in self._clients:
+                self._clients[client_id] = ClientState(client_id, target_fps=self.config.fps)
+            return self._clients[client_id]
+
+    @property
+    def observation_queue(self) -> Queue:
+        return self._get_client().observation_queue
+
+    @property
+    def last_processed_obs(self) -> TimedObservation | None:
+        return self._get_client().last_processed_obs
+
+    @last_processed_obs.setter
+    def last_processed_obs(self, obs: TimedObservation | None) -> None:
+        self._get_client().last_processed_obs = obs
+
+    @property
+    def _predicted_timesteps(self) -> set[int]:
+        return self._get_client().predicted_timesteps
+
     def _reset_server(self) -> None:
-        """Flushes server state when new client connects."""
-        # only running inference on the latest observation received by the server
+        """Flushes the state of every client and stops the scheduler."""
         self.shutdown_event.set()
-        self.observation_queue = Queue(maxsize=1)
-
-        with self._predicted_timesteps_lock:
-            self._predicted_timesteps = set()
+        self._scheduler_stop.set()
+        with self._observations_available:
+            self._clients = {}
+            self._observations_available.notify_all()
+        with self._scheduler_lock:
+            if self._scheduler_thread is not None:
+                self._scheduler_thread.join()
+                self._scheduler_thread = None
+
+    def _reset_client(self, client_id: str) -> None:
+        """Flushes the state of a (re)connecting client, without affecting the other clients."""
+        with self._observations_available:
+            self._clients[client_id] = ClientState(client_id, target_fps=self.config.fps)
+            self._current_client_id = client_id
 
     def Ready(self, request, context):  # noqa: N802
-        client_id = context.peer()
+        client_id = _get_client_id(context)
         self.logger.info(f"Client {client_id} connected and ready")
-        self._reset_server()
+        self._reset_client(client_id)
         self.shutdown_event.clear()
 
         return services_pb2.Empty()
 
+    def _same_policy(self, policy_specs: RemotePolicyConfig) -> bool:
+        return (
+            self.policy is not None
+            and self.policy_type == policy_specs.policy_type
+            and self.pretrained_name_or_path == policy_specs.pretrained_name_or_path
+            and self.device == policy_specs.device
+            and self.rename_map == policy_specs.rename_map
+        )
+
     def SendPolicyInstructions(self, request, context):  # noqa: N802
         """Receive policy instructions from the robot client"""
 
@@ -120,7 +226,7 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             self.logger.warning("Server is not running. Ignoring policy instructions.")
             return services_pb2.Empty()
 
-        client_id = context.peer()
+        client_id = _get_client_id(context)
 
         policy_specs = pickle.loads(request.data)  # nosec
 
@@ -141,38 +247,65 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             f"Device: {policy_specs.device}"
         )
 
-        self.device = policy_specs.device
-        self.policy_type = policy_specs.policy_type  # act, pi0, etc.
+        client = self._get_client(client_id)
+        client.lerobot_features = policy_specs.lerobot_features
+        client.actions_per_chunk = policy_specs.actions_per_chunk
         self.lerobot_features = policy_specs.lerobot_features
-        self.actions_per_chunk = policy_specs.actions_per_chunk
-
-        policy_class = get_policy_class(self.policy_type)
-
-        start = time.perf_counter()
-        self.policy = policy_class.from_pretrained(policy_specs.pretrained_name_or_path)
-        self.policy.to(self.device)
-
-        # Load preprocessor and postprocessor, overriding device to match requested device
-        device_override = {"device": self.device}
-        self.preprocessor, self.postprocessor = make_pre_post_processors(
-            self.policy.config,
-            pretrained_path=policy_specs.pretrained_name_or_path,
-            preprocessor_overrides={
-                "device_processor": device_override,
-                "rename_observations_processor": {"rename_map": policy_specs.rename_map},
-            },
-            postprocessor_overrides={"device_processor": device_override},
-        )
+        # Chunks are predicted for the longest request, and cut to the length requested by each client
+        with self._observations_available:
+            self.actions_per_chunk = max(c.actions_per_chunk or 0 for c in self._clients.values())
+
+        with self._policy_load_lock:
+            if self._same_policy(policy_specs):
+                # Another client of the fleet already loaded this policy, share it
+                self.logger.info(f"Policy already loaded, serving it to {client_id} too")
+                return services_pb2.Empty()
+
+            if self.policy is not None and len(self._clients) > 1:
+                self.logger.warning(
+                    f"Client {client_id} requested a different policy: "
+                    "replacing the policy of the other clients"
+                )
+
+            # The current policy keeps serving the other clients while the new one loads
+            start = time.perf_counter()
+            policy_class = get_policy_class(policy_specs.policy_type)
+            policy = policy_class.from_pretrained(policy_specs.pretrained_name_or_path)
+            policy.to(policy_specs.device)
+
+            # Load preprocessor and postprocessor, overriding device to match requested device
+            device_override = {"device": policy_specs.device}
+            preprocessor, postprocessor = make_pre_post_processors(
+                policy.config,
+                pretrained_path=policy_specs.pretrained_name_or_path,
+                preprocessor_overrides={
+                    "device_processor": device_override,
+                    "rename_observations_processor": {"rename_map": policy_specs.rename_map},
+                },
+                postprocessor_overrides={"device_processor": device_override},
+            )
+            # Called for every observation and action chunk: run them without hooks, with fused steps
+            preprocessor.freeze()
+            postprocessor.freeze()
+
+            # Swapped between two batched inferences
+            with self._policy_lock:
+                self.device = policy_specs.device
+                self.policy_type = policy_specs.policy_type  # act, pi0, etc.
+                self.pretrained_name_or_path = policy_specs.pretrained_name_or_path
+                self.rename_map = policy_specs.rename_map
+                self.policy = policy
+                self.preprocessor, self.postprocessor = preprocessor, postprocessor
 
-        end = time.perf_counter()
+            end = time.perf_counter()
 
-        self.logger.info(f"Time taken to put policy on {self.device}: {end - start:.4f} seconds")
+        self.logger.info(f"Time taken to put policy on {policy_specs.device}: {end - start:.4f} seconds")
 
         return services_pb2.Empty()
 
     def SendObservations(self, request_iterator, context):  # noqa: N802
         """Receive observations from the robot client"""
-        client_id = context.peer()
+        client_id = _get_client_id(context)
         self.logger.debug(f"Receiving observations from {client_id}")
 
         receive_time = time.time()  # comparing timestamps so need time.time()
@@ -180,7 +313,9 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         received_bytes = receive_bytes_in_chunks(
             request_iterator, None, self.shutdown_event, self.logger
         )  # blocking call while looping over request_iterator
-        timed_observation = pickle.loads(received_bytes)  # nosec
+        if received_bytes is None:  # server shutting down
+            return services_pb2.Empty()
+        timed_observation = bytes_to_timed_observation(received_bytes)
         deserialize_time = time.perf_counter() - start_deserialize
 
         self.logger.debug(f"Received observation #{timed_observation.get_timestep()}")
@@ -189,10 +324,12 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         obs_timestamp = timed_observation.get_timestamp()
 
         # Calculate FPS metrics
-        fps_metrics = self.fps_tracker.calculate_fps_metrics(obs_timestamp)
+        client = self._get_client(client_id)
+        fps_metrics = client.fps_tracker.calculate_fps_metrics(obs_timestamp)
+        client.fps_metrics = fps_metrics
 
         self.logger.debug(
-            f"Received observation #{obs_timestep} | "
+            f"Received observation #{obs_timestep} from {client_id} | "
             f"Avg FPS: {fps_metrics['avg_fps']:.2f} | "  # fps at which observations are received from client
             f"Target: {fps_metrics['target_fps']:.2f} | "
             f"One-way latency: {(receive_time - obs_timestamp) * 1000:.2f}ms"
@@ -204,77 +341,96 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             f"Deserialization time: {deserialize_time:.6f}s"
         )
 
+        self._ensure_scheduler()
         if not self._enqueue_observation(
-            timed_observation  # wrapping a RawObservation
+            timed_observation,  # wrapping a RawObservation
+            client_id,
         ):
             self.logger.debug(f"Observation #{obs_timestep} has been filtered out")
 
         return services_pb2.Empty()
 
+    def _actions_message(
+        self, action_chunk: list[TimedAction], obs: TimedObservation, client_id: str
+    ) -> services_pb2.Actions:
+        start_time = time.perf_counter()
+        actions_bytes = timed_actions_to_bytes(action_chunk)
+        serialize_time = time.perf_counter() - start_time
+
+        self.logger.debug(
+            f"Action chunk #{obs.get_timestep()} sent to {client_id} (must_go: {obs.must_go}) | "
+            f"Serialize time: {serialize_time * 1000:.2f}ms"
+        )
+        return services_pb2.Actions(data=actions_bytes)
+
     def GetActions(self, request, context):  # noqa: N802
         """Returns actions to the robot client. Actions are sent as a single
         chunk, containing multiple actions."""
-        client_id = context.peer()
-        self.logger.debug(f"Client {client_id} connected for action streaming")
+        client_id = _get_client_id(context)
+        self.logger.debug(f"Client {client_id} polling for actions")
 
-        # Generate action based on the most recent observation and its timestep
         try:
-            getactions_starts = time.perf_counter()
-            obs = self.observation_queue.get(timeout=self.config.obs_queue_timeout)
-            self.logger.info(
-                f"Running inference for observation #{obs.get_timestep()} (must_go: {obs.must_go})"
-            )
-
-            with self._predicted_timesteps_lock:
-                self._predicted_timesteps.add(obs.get_timestep())
-
-            start_time = time.perf_counter()
-            action_chunk = self._predict_action_chunk(obs)
-            inference_time = time.perf_counter() - start_time
-
-            start_time = time.perf_counter()
-            actions_bytes = pickle.dumps(action_chunk)  # nosec
-            serialize_time = time.perf_counter() - start_time
-
-            # Create and return the action chunk
-            actions = services_pb2.Actions(data=actions_bytes)
-
-            self.logger.info(
-                f"Action chunk #{obs.get_timestep()} generated | "
-                f"Total time: {(inference_time + serialize_time) * 1000:.2f}ms"
-            )
-
-            self.logger.debug(
-                f"Action chunk #{obs.get_timestep()} generated | "
-                f"Inference time: {inference_time:.2f}s |"
-                f"Serialize time: {serialize_time:.2f}s |"
-                f"Total time: {inference_time + serialize_time:.2f}s"
+            # Action chunks are predicted by the scheduler, from the most recent observation of the client
+            action_chunk, obs = self._get_client(client_id).action_queue.get(
+                timeout=self.config.obs_queue_timeout
             )
+            return self._actions_message(action_chunk, obs, client_id)
 
-            time.sleep(
-                max(0, self.config.inference_latency - max(0, time.perf_counter() - getactions_starts))
-            )  # sleep controls inference latency
-
-            return actions
-
-        except Empty:  # no observation added to queue in obs_queue_timeout
+        except Empty:  # no observation processed in obs_queue_timeout
             return services_pb2.Empty()
 
         except Exception as e:
-            self.logger.error(f"Error in StreamActions: {e}")
+            self.logger.error(f"Error in GetActions: {e}")
 
             return services_pb2.Empty()
 
-    def _obs_sanity_checks(self, obs: TimedObservation, previous_obs: TimedObservation) -> bool:
+    def StreamActions(self, request, context):  # noqa: N802
+        """Pushes every action chunk predicted for the robot client as soon as the scheduler produces it,
+        until the client disconnects or the server stops."""
+        client_id = _get_client_id(context)
+        # Streams beyond `max_clients` would pin the remaining workers, which the unary calls of all clients need
+        if not self._action_streams.acquire(blocking=False):
+            self.logger.warning(
+                f"Refusing the action stream of client {client_id}: {self.config.max_clients} clients are "
+                "already streaming (see `max_clients`)"
+            )
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Too many action streams, poll for actions")
+
+        self.logger.info(f"Client {client_id} connected for action streaming")
+        try:
+            while self.running and context.is_active():
+                try:
+                    # Looked up at every chunk, as the state of the client is reset when it reconnects
+                    action_chunk, obs = self._get_client(client_id).action_queue.get(
+                        timeout=ACTION_STREAM_POLL_INTERVAL
+                    )
+                except Empty:
+                    continue
+
+                try:
+                    yield self._actions_message(action_chunk, obs, client_id)
+                except Exception as e:
+                    self.logger.error(f"Error in StreamActions: {e}")
+        finally:
+            self._action_streams.release()
+
+        self.logger.info(f"Action stream of client {client_id} closed")
+
+    def _obs_sanity_checks(
+        self, obs: TimedObservation, previous_obs: TimedObservation, client_id: str | None = None
+    ) -> bool:
         """Check if the observation is valid to be processed by the policy"""
-        with self._predicted_timesteps_lock:
-            predicted_timesteps = self._predicted_timesteps
+        client = self._get_client(client_id)
+        with client.predicted_timesteps_lock:
+            predicted_timesteps = client.predicted_timesteps
 
         if obs.get_timestep() in predicted_timesteps:
             self.logger.debug(f"Skipping observation #{obs.get_timestep()} - Timestep predicted already!")
             return False
 
-        elif observations_similar(obs, previous_obs, lerobot_features=self.lerobot_features):
+        elif observations_similar(
+            obs, previous_obs, lerobot_features=client.lerobot_features or self.lerobot_features
+        ):
             self.logger.debug(
                 f"Skipping observation #{obs.get_timestep()} - Observation too similar to last obs predicted!"
             )
@@ -283,32 +439,122 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         else:
             return True
 
-    def _enqueue_observation(self, obs: TimedObservation) -> bool:
+    def _enqueue_observation(self, obs: TimedObservation, client_id: str | None = None) -> bool:
         """Enqueue an observation if it must go through processing, otherwise skip it.
         Observations not in queue are never run through the policy network"""
+        client = self._get_client(client_id)
 
         if (
             obs.must_go
-            or self.last_processed_obs is None
-            or self._obs_sanity_checks(obs, self.last_processed_obs)
+            or client.last_processed_obs is None
+            or self._obs_sanity_checks(obs, client.last_processed_obs, client.client_id)
         ):
-            last_obs = self.last_processed_obs.get_timestep() if self.last_processed_obs else "None"
+            last_obs = client.last_processed_obs.get_timestep() if client.last_processed_obs else "None"
             self.logger.debug(
                 f"Enqueuing observation. Must go: {obs.must_go} | Last processed obs: {last_obs}"
             )
 
-            # If queue is full, get the old observation to make room
-            if self.observation_queue.full():
-                # pops from queue
-                _ = self.observation_queue.get_nowait()
-                self.logger.debug("Observation queue was full, removed oldest observation")
-
-            # Now put the new observation (never blocks as queue is non-full here)
-            self.observation_queue.put(obs)
+            with self._observations_available:
+                # If queue is full, get the old observation to make room
+                if client.observation_queue.full():
+                    # pops from queue
+                    _ = client.observation_queue.get_nowait()
+                    self.logger.debug("Observation queue was full, removed oldest observation")
+
+                # Now put the new observation (never blocks as queue is non-full here)
+                client.observation_queue.put(obs)
+                client.enqueued_at = time.perf_counter()
+                self._observations_available.notify()
             return True
 
         return False
 
+    def _ensure_scheduler(self) -> None:
+        with self._scheduler_lock:
+            if self._scheduler_thread is None or not self._scheduler_thread.is_alive():
+                self._scheduler_stop.clear()
+                self._scheduler_thread = threading.Thread(
+                    target=self._scheduler_loop, name="policy_server_scheduler", daemon=True
+                )
+                self._scheduler_thread.start()
+
+    def _pending_clients(self) -> list[ClientState]:
+        """Clients with a pending observation, oldest first. Call with `_observations_available` held."""
+        pending = [client for client in self._clients.values() if not client.observation_queue.empty()]
+        return sorted(pending, key=lambda client: client.enqueued_at)
+
+    def _collect_batch(self) -> list[tuple[ClientState, TimedObservation, float]]:
+        """Wait for pending observations and dequeue a batch of them, with their queueing delay.
+
+        Returns as soon as `max_batch_size` clients have a pending observation, or `batch_deadline` seconds
+        after the oldest pending observation was enqueued.
+        """
+        with self._observations_available:
+            while not self._pending_clients():
+                self._observations_available.wait(timeout=0.1)
+                if self._scheduler_stop.is_set():
+                    return []
+
+            deadline = self._pending_clients()[0].enqueued_at + self.config.batch_deadline
+            while len(self._pending_clients()) < self.config.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or self._scheduler_stop.is_set():
+                    break
+                self._observations_available.wait(timeout=remaining)
+
+            batch_start = time.perf_counter()
+            batch = []
+            for client in self._pending_clients()[: self.config.max_batch_size]:
+                obs = client.observation_queue.get_nowait()
+                batch.append((client, obs, batch_start - client.enqueued_at))
+            return batch
+
+    def _scheduler_loop(self) -> None:
+        while not self._scheduler_stop.is_set():
+            batch = self._collect_batch()
+            if not batch:
+                continue
+
+            start_time = time.perf_counter()
+            clients = [client for client, _, _ in batch]
+            observations = [obs for _, obs, _ in batch]
+            self.batching_stats.record(len(batch), [queue_delay for _, _, queue_delay in batch])
+            self.logger.info(
+                f"Running inference for {len(batch)} observation(s) | "
+                + " | ".join(
+                    f"{c.client_id}: #{o.get_timestep()} (must_go: {o.must_go})"
+                    for c, o in zip(clients, observations, strict=True)
+                )
+            )
+
+            for client, obs in zip(clients, observations, strict=True):
+                with client.predicted_timesteps_lock:
+                    client.predicted_timesteps.add(obs.get_timestep())
+
+            try:
+                action_chunks = self._predict_action_chunks(observations, [c.client_id for c in clients])
+            except Exception as e:
+                self.logger.error(f"Error predicting action chunks: {e}")
+                continue
+
+            for client, obs, action_chunk in zip(clients, observations, action_chunks, strict=True):
+                # Only the latest action chunk is relevant to the client
+                with self._observations_available:
+                    if client.action_queue.full():
+                        _ = client.action_queue.get_nowait()
+                    client.action_queue.put((action_chunk, obs))
+
+            if not self.config.speculative_inference:
+                time.sleep(
+                    max(0, self.config.inference_latency - (time.perf_counter() - start_time))
+                )  # sleep controls inference latency
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Batching metrics (batch size, queueing delay) and the observation FPS of every client."""
+        with self._observations_available:
+            clients_fps = {client_id: dict(client.fps_metrics) for client_id, client in self._clients.items()}
+        return {**self.batching_stats.summary(), "clients": clients_fps}
+
     def _time_action_chunk(self, t_0: float, action_chunk: list[torch.Tensor], i_0: int) -> list[TimedAction]:
         """Turn a chunk of actions into a list of TimedAction instances,
         with the first action corresponding to t_0 and the rest corresponding to
@@ -327,34 +573,60 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
         return chunk[:, : self.actions_per_chunk, :]
 
-    def _predict_action_chunk(self, observation_t: TimedObservation) -> list[TimedAction]:
-        """Predict an action chunk based on an observation.
+    def _predict_action_chunk(
+        self, observation_t: TimedObservation, client_id: str | None = None
+    ) -> list[TimedAction]:
+        """Predict an action chunk based on a single observation, see `_predict_action_chunks`."""
+        return self._predict_action_chunks([observation_t], [client_id])[0]
+
+    def _predict_action_chunks(
+        self, observations_t: list[TimedObservation], client_ids: list[str | None]
+    ) -> list[list[TimedAction]]:
+        """Predict an action chunk for each observation, running the policy on batches of observations.
 
         Pipeline:
-        1. Convert raw observation to LeRobot format
+        1. Convert raw observations to LeRobot format
         2. Apply preprocessor (tokenization, normalization, batching, device placement)
-        3. Run policy inference to get action chunk
+        3. Stack the observations and run policy inference to get action chunks
         4. Apply postprocessor (unnormalization, device movement)
-        5. Convert to TimedAction list
+        5. Convert to TimedAction lists, with the timesteps of each client
+
+        The policy and its processors are not swapped by `SendPolicyInstructions` while a batch runs.
         """
-        """1. Prepare observation"""
+        with self._policy_lock:
+            return self._predict_action_chunks_locked(observations_t, client_ids)
+
+    def _predict_action_chunks_locked(
+        self, observations_t: list[TimedObservation], client_ids: list[str | None]
+    ) -> list[list[TimedAction]]:
+        """1. Prepare observations"""
         start_prepare = time.perf_counter()
-        observation: Observation = raw_observation_to_observation(
-            observation_t.get_observation(),
-            self.lerobot_features,
-            self.policy_image_features,
-        )
+        clients = [self._get_client(client_id) for client_id in client_ids]
+        observations: list[Observation] = [
+            raw_observation_to_observation(
+                observation_t.get_observation(),
+                client.lerobot_features or self.lerobot_features,
+                self.policy_image_features,
+            )
+            for client, observation_t in zip(clients, observations_t, strict=True)
+        ]
         prepare_time = time.perf_counter() - start_prepare
 
         """2. Apply preprocessor"""
         start_preprocess = time.perf_counter()
-        observation = self.preprocessor(observation)
-        self.last_processed_obs: TimedObservation = observation_t
+        observations = [self.preprocessor(observation) for observation in observations]
+        for client, observation_t in zip(clients, observations_t, strict=True):
+            client.last_processed_obs = observation_t
         preprocessing_time = time.perf_counter() - start_preprocess
 
-        """3. Get action chunk"""
+        """3. Get action chunks"""
         start_inference = time.perf_counter()
-        action_tensor = self._get_action_chunk(observation)
+        action_tensors: list[torch.Tensor | None] = [None] * len(observations)
+        for indices in _group_stackable(observations):
+            chunk = self._get_action_chunk(_stack_observations([observations[i] for i in indices]))
+            for row, i in enumerate(indices):
+                action_tensors[i] = chunk[row : row + 1]
+        action_tensor = torch.cat(action_tensors)
         inference_time = time.perf_counter() - start_inference
         self.logger.info(
             f"Preprocessing and inference took {inference_time:.4f}s, action shape: {action_tensor.shape}"
@@ -362,39 +634,37 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
         """4. Apply postprocessor"""
         # Apply postprocessor (handles unnormalization and device movement)
-        # Postprocessor expects (B, action_dim) per action, but we have (B, chunk_size, action_dim)
-        # So we process each action in the chunk individually
+        # Postprocessor expects (B, action_dim) actions, but we have (B, chunk_size, action_dim)
+        # So we process all the actions of the chunks at once, as a batch of B * chunk_size actions
         start_postprocess = time.perf_counter()
-        _, chunk_size, _ = action_tensor.shape
-
-        # Process each action in the chunk
-        processed_actions = []
-        for i in range(chunk_size):
-            # Extract action at timestep i: (B, action_dim)
-            single_action = action_tensor[:, i, :]
-            processed_action = self.postprocessor(single_action)
-            processed_actions.append(processed_action)
-
-        # Stack back to (B, chunk_size, action_dim), then remove batch dim
-        action_tensor = torch.stack(processed_actions, dim=1).squeeze(0)
+        batch_size, chunk_size, action_dim = action_tensor.shape
+        action_tensor = self.postprocessor(action_tensor.reshape(batch_size * chunk_size, action_dim))
+        action_tensor = action_tensor.reshape(batch_size, chunk_size, -1)
         self.logger.debug(f"Postprocessed action shape: {action_tensor.shape}")
 
         action_tensor = action_tensor.detach().cpu()
 
-        """5. Convert to TimedAction list"""
-        action_chunk = self._time_action_chunk(
-            observation_t.get_timestamp(), list(action_tensor), observation_t.get_timestep()
-        )
+        """5. Convert to TimedAction lists"""
+        action_chunks = []
+        for client, observation_t, actions in zip(clients, observations_t, action_tensor, strict=True):
+            actions_per_chunk = client.actions_per_chunk or self.actions_per_chunk
+            action_chunks.append(
+                self._time_action_chunk(
+                    observation_t.get_timestamp(),
+                    list(actions[:actions_per_chunk]),
+                    observation_t.get_timestep(),
+                )
+            )
         postprocess_stops = time.perf_counter()
         postprocessing_time = postprocess_stops - start_postprocess
 
+        timesteps = [observation_t.get_timestep() for observation_t in observations_t]
         self.logger.info(
-            f"Observation {observation_t.get_timestep()} | "
-            f"Total time: {1000 * (postprocess_stops - start_prepare):.2f}ms"
+            f"Observations {timesteps} | Total time: {1000 * (postprocess_stops - start_prepare):.2f}ms"
         )
 
         self.logger.debug(
-            f"Observation {observation_t.get_timestep()} | "
+            f"Observations {timesteps} | "
             f"Prepare time: {1000 * prepare_time:.2f}ms | "
             f"Preprocessing time: {1000 * preprocessing_time:.2f}ms | "
             f"Inference time: {1000 * inference_time:.2f}ms | "
@@ -402,7 +672,7 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             f"Total time: {1000 * (postprocess_stops - start_prepare):.2f}ms"
         )
 
-        return action_chunk
+        return action_chunks
 
     def stop(self):
         """Stop the server"""
@@ -410,6 +680,46 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         self.logger.info("Server stopping...")
 
 
+def _batch_signature(observation: dict[str, Any]) -> tuple:
+    return tuple(
+        (key, tuple(value.shape[1:]), value.dtype) if isinstance(value, torch.Tensor) else (key, type(value))
+        for key, value in observation.items()
+    )
+
+
+def _group_stackable(observations: list[dict[str, Any]]) -> list[list[int]]:
+    """Group the indices of the preprocessed observations that can be stacked into a single batch.
+
+    Observations of different clients can differ, e.g. with different robots or padded language tokens.
+    """
+    groups: dict[tuple, list[int]] = {}
+    for i, observation in enumerate(observations):
+        groups.setdefault(_batch_signature(observation), []).append(i)
+    return list(groups.values())
+
+
+def _stack_observations(observations: list[dict[str, Any]]) -> dict[str, Any]:
+    """Concatenate preprocessed observations (each with a batch dimension) along their batch dimension."""
+    if len(observations) == 1:
+        return observations[0]
+    stacked = {}
+    for key, value in observations[0].items():
+        values = [observation[key] for observation in observations]
+        if isinstance(value, torch.Tensor):
+            stacked[key] = torch.cat(values)
+        elif isinstance(value, list):
+            stacked[key] = [item for v in values for item in v]
+        else:
+            stacked[key] = value
+    return stacked
+
+
+def grpc_max_workers(config: PolicyServerConfig) -> int:
+    """Size of the gRPC worker pool of a server. Each client holds up to two calls at once, its action stream
+    (or `GetActions` call) and its `SendObservations` call, with workers to spare for the short calls."""
+    return 2 * config.max_clients + GRPC_EXTRA_WORKERS
+
+
 @draccus.wrap()
 def serve(cfg: PolicyServerConfig):
     """Start the PolicyServer with the given configuration.
@@ -423,7 +733,7 @@ def serve(cfg: PolicyServerConfig):
     policy_server = PolicyServer(cfg)
 
     # Setup and start gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=grpc_max_workers(cfg)))
     services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
     server.add_insecure_port(f"{cfg.host}:{cfg.port}")
 
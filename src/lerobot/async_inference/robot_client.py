@@ -37,10 +37,10 @@ import logging
 import pickle  # nosec
 import threading
 import time
+import uuid
 from collections.abc import Callable
 from dataclasses import asdict
 from pprint import pformat
-from queue import Queue
 from typing import Any
 
 import draccus
@@ -62,20 +62,26 @@ from lerobot.transport import (
     services_pb2,  # type: ignore
     services_pb2_grpc,  # type: ignore
 )
+from lerobot.transport.tensor_wire import TensorCompression
 from lerobot.transport.utils import grpc_channel_options, send_bytes_in_chunks
 from lerobot.utils.import_utils import register_third_party_plugins
 
 from .configs import RobotClientConfig
+from .constants import CLIENT_ID_METADATA_KEY
 from .helpers import (
     Action,
+    ActionTimeline,
     FPSTracker,
     Observation,
     RawObservation,
     RemotePolicyConfig,
     TimedAction,
+    TimedActionChunk,
     TimedObservation,
+    bytes_to_timed_action_chunk,
     get_logger,
     map_robot_keys_to_lerobot_features,
+    timed_observation_to_bytes,
     visualize_action_queue_size,
 )
 
@@ -97,6 +103,16 @@ class RobotClient:
 
         lerobot_features = map_robot_keys_to_lerobot_features(self.robot)
 
+        # Camera images dominate the size of observations, they are the only ones worth compressing
+        self.observation_compression: dict[str, TensorCompression] = {}
+        if config.image_compression_level > 0:
+            compression = TensorCompression(config.image_compression_level, config.image_quantization_bits)
+            self.observation_compression = {
+                key: compression
+                for key, feature in self.robot.observation_features.items()
+                if isinstance(feature, tuple)
+            }
+
         # Use environment variable if server_address is not provided in config
         self.server_address = config.server_address
 
@@ -111,6 +127,9 @@ class RobotClient:
             self.server_address, grpc_channel_options(initial_backoff=f"{config.environment_dt:.4f}s")
         )
         self.stub = services_pb2_grpc.AsyncInferenceStub(self.channel)
+        # Lets a server shared by several robots tell its clients apart
+        self.client_id = f"{self.robot.name}-{uuid.uuid4().hex[:8]}"
+        self._call_metadata = ((CLIENT_ID_METADATA_KEY, self.client_id),)
         self.logger.info(f"Initializing client to connect to server at {self.server_address}")
 
         self.shutdown_event = threading.Event()
@@ -122,7 +141,7 @@ class RobotClient:
 
         self._chunk_size_threshold = config.chunk_size_threshold
 
-        self.action_queue = Queue()
+        self.action_queue = ActionTimeline(capacity=2 * config.actions_per_chunk)
         self.action_queue_lock = threading.Lock()  # Protect queue operations
         self.action_queue_size = []
         self.start_barrier = threading.Barrier(2)  # 2 threads: action receiver, control loop
@@ -145,7 +164,7 @@ class RobotClient:
         try:
             # client-server handshake
             start_time = time.perf_counter()
-            self.stub.Ready(services_pb2.Empty())
+            self.stub.Ready(services_pb2.Empty(), metadata=self._call_metadata)
             end_time = time.perf_counter()
             self.logger.debug(f"Connected to policy server in {end_time - start_time:.4f}s")
 
@@ -160,7 +179,7 @@ class RobotClient:
                 f"Device: {self.policy_config.device}"
             )
 
-            self.stub.SendPolicyInstructions(policy_setup)
+            self.stub.SendPolicyInstructions(policy_setup, metadata=self._call_metadata)
 
             self.shutdown_event.clear()
 
@@ -193,7 +212,7 @@ class RobotClient:
             raise ValueError("Input observation needs to be a TimedObservation!")
 
         start_time = time.perf_counter()
-        observation_bytes = pickle.dumps(obs)
+        observation_bytes = timed_observation_to_bytes(obs, self.observation_compression)
         serialize_time = time.perf_counter() - start_time
         self.logger.debug(f"Observation serialization time: {serialize_time:.6f}s")
 
@@ -204,7 +223,7 @@ class RobotClient:
                 log_prefix="[CLIENT] Observation",
                 silent=True,
             )
-            _ = self.stub.SendObservations(observation_iterator)
+            _ = self.stub.SendObservations(observation_iterator, metadata=self._call_metadata)
             obs_timestep = obs.get_timestep()
             self.logger.debug(f"Sent observation #{obs_timestep} | ")
 
@@ -223,48 +242,20 @@ class RobotClient:
 
     def _aggregate_action_queues(
         self,
-        incoming_actions: list[TimedAction],
+        incoming_actions: TimedActionChunk | list[TimedAction],
         aggregate_fn: Callable[[torch.Tensor, torch.Tensor], torch.Tensor] | None = None,
     ):
-        """Finds the same timestep actions in the queue and aggregates them using the aggregate_fn"""
-        if aggregate_fn is None:
-            # default aggregate function: take the latest action
-            def aggregate_fn(x1, x2):
-                return x2
-
-        future_action_queue = Queue()
-        with self.action_queue_lock:
-            internal_queue = self.action_queue.queue
-
-        current_action_queue = {action.get_timestep(): action.get_action() for action in internal_queue}
+        """Replaces the queue with the incoming actions not performed yet, aggregating them with the queued
+        actions of the same timesteps using the aggregate_fn (by default, the incoming actions are kept)"""
+        if not isinstance(incoming_actions, TimedActionChunk):
+            incoming_actions = TimedActionChunk.from_timed_actions(incoming_actions)
 
-        for new_action in incoming_actions:
-            with self.latest_action_lock:
-                latest_action = self.latest_action
-
-            # New action is older than the latest action in the queue, skip it
-            if new_action.get_timestep() <= latest_action:
-                continue
-
-            # If the new action's timestep is not in the current action queue, add it directly
-            elif new_action.get_timestep() not in current_action_queue:
-                future_action_queue.put(new_action)
-                continue
-
-            # If the new action's timestep is in the current action queue, aggregate it
-            # TODO: There is probably a way to do this with broadcasting of the two action tensors
-            future_action_queue.put(
-                TimedAction(
-                    timestamp=new_action.get_timestamp(),
-                    timestep=new_action.get_timestep(),
-                    action=aggregate_fn(
-                        current_action_queue[new_action.get_timestep()], new_action.get_action()
-                    ),
-                )
-            )
+        with self.latest_action_lock:
+            latest_action = self.latest_action
 
         with self.action_queue_lock:
-            self.action_queue = future_action_queue
+            # Actions older than the latest performed action are skipped
+            self.action_queue.merge(incoming_actions, latest_action + 1, aggregate_fn)
 
     def receive_actions(self, verbose: bool = False):
         """Receive actions from the policy server"""
@@ -272,91 +263,113 @@ class RobotClient:
         self.start_barrier.wait()
         self.logger.info("Action receiving thread starting")
 
+        stream_actions = self.config.stream_actions
         while self.running:
             try:
-                # Use StreamActions to get a stream of actions from the server
-                actions_chunk = self.stub.GetActions(services_pb2.Empty())
-                if len(actions_chunk.data) == 0:
-                    continue  # received `Empty` from server, wait for next call
-
-                receive_time = time.time()
-
-                # Deserialize bytes back into list[TimedAction]
-                deserialize_start = time.perf_counter()
-                timed_actions = pickle.loads(actions_chunk.data)  # nosec
-                deserialize_time = time.perf_counter() - deserialize_start
-
-                # Log device type of received actions
-                if len(timed_actions) > 0:
-                    received_device = timed_actions[0].get_action().device.type
-                    self.logger.debug(f"Received actions on device: {received_device}")
-
-                # Move actions to client_device (e.g., for downstream planners that need GPU)
-                client_device = self.config.client_device
-                if client_device != "cpu":
-                    for timed_action in timed_actions:
-                        if timed_action.get_action().device.type != client_device:
-                            timed_action.action = timed_action.get_action().to(client_device)
-                    self.logger.debug(f"Converted actions to device: {client_device}")
+                if stream_actions:
+                    # The server pushes every action chunk as soon as it is predicted
+                    for actions_chunk in self.stub.StreamActions(
+                        services_pb2.Empty(), metadata=self._call_metadata
+                    ):
+                        self._receive_action_chunk(actions_chunk, verbose)
+                        if not self.running:
+                            break
                 else:
-                    self.logger.debug(f"Actions kept on device: {client_device}")
+                    actions_chunk = self.stub.GetActions(services_pb2.Empty(), metadata=self._call_metadata)
+                    if len(actions_chunk.data) == 0:
+                        continue  # received `Empty` from server, wait for next call
+                    self._receive_action_chunk(actions_chunk, verbose)
 
-                self.action_chunk_size = max(self.action_chunk_size, len(timed_actions))
+            except grpc.RpcError as e:
+                if stream_actions and e.code() in (
+                    grpc.StatusCode.UNIMPLEMENTED,
+                    grpc.StatusCode.RESOURCE_EXHAUSTED,
+                ):
+                    self.logger.warning(
+                        f"Server does not stream actions ({e.code().name}), polling it for actions instead"
+                    )
+                    stream_actions = False
+                    continue
+                self.logger.error(f"Error receiving actions: {e}")
 
-                # Calculate network latency if we have matching observations
-                if len(timed_actions) > 0 and verbose:
-                    with self.latest_action_lock:
-                        latest_action = self.latest_action
+    def _receive_action_chunk(self, actions_chunk: services_pb2.Actions, verbose: bool = False) -> None:
+        """Merge an action chunk received from the server into the action queue"""
+        receive_time = time.time()
 
-                    self.logger.debug(f"Current latest action: {latest_action}")
+        # Deserialize bytes back into a chunk of actions, stacked in a single tensor
+        deserialize_start = time.perf_counter()
+        timed_actions = bytes_to_timed_action_chunk(actions_chunk.data)
+        deserialize_time = time.perf_counter() - deserialize_start
 
-                    # Get queue state before changes
-                    old_size, old_timesteps = self._inspect_action_queue()
-                    if not old_timesteps:
-                        old_timesteps = [latest_action]  # queue was empty
+        # Log device type of received actions
+        if len(timed_actions) > 0:
+            received_device = timed_actions.actions.device.type
+            self.logger.debug(f"Received actions on device: {received_device}")
 
-                    # Log incoming actions
-                    incoming_timesteps = [a.get_timestep() for a in timed_actions]
+        # Move actions to client_device (e.g., for downstream planners that need GPU)
+        client_device = self.config.client_device
+        if client_device != "cpu":
+            timed_actions = timed_actions.to(client_device)
+            self.logger.debug(f"Converted actions to device: {client_device}")
+        else:
+            self.logger.debug(f"Actions kept on device: {client_device}")
 
-                    first_action_timestep = timed_actions[0].get_timestep()
-                    server_to_client_latency = (receive_time - timed_actions[0].get_timestamp()) * 1000
+        self.action_chunk_size = max(self.action_chunk_size, len(timed_actions))
 
-                    self.logger.info(
-                        f"Received action chunk for step #{first_action_timestep} | "
-                        f"Latest action: #{latest_action} | "
-                        f"Incoming actions: {incoming_timesteps[0]}:{incoming_timesteps[-1]} | "
-                        f"Network latency (server->client): {server_to_client_latency:.2f}ms | "
-                        f"Deserialization time: {deserialize_time * 1000:.2f}ms"
-                    )
+        # Calculate network latency if we have matching observations
+        if len(timed_actions) > 0 and verbose:
+            with self.latest_action_lock:
+                latest_action = self.latest_action
 
-                # Update action queue
-                start_time = time.perf_counter()
-                self._aggregate_action_queues(timed_actions, self.config.aggregate_fn)
-                queue_update_time = time.perf_counter() - start_time
+            self.logger.debug(f"Current latest action: {latest_action}")
 
-                self.must_go.set()  # after receiving actions, next empty queue triggers must-go processing!
+            # Get queue state before changes
+            old_size, old_timesteps = self._inspect_action_queue()
+            if not old_timesteps:
+                old_timesteps = [latest_action]  # queue was empty
 
-                if verbose:
-                    # Get queue state after changes
-                    new_size, new_timesteps = self._inspect_action_queue()
+            # Log incoming actions
+            incoming_timesteps = [
+                timed_actions.timestep,
+                timed_actions.timestep + len(timed_actions) - 1,
+            ]
 
-                    with self.latest_action_lock:
-                        latest_action = self.latest_action
+            first_action_timestep = timed_actions.timestep
+            server_to_client_latency = (receive_time - timed_actions.timestamps[0].item()) * 1000
 
-                    self.logger.info(
-                        f"Latest action: {latest_action} | "
-                        f"Old action steps: {old_timesteps[0]}:{old_timesteps[-1]} | "
-                        f"Incoming action steps: {incoming_timesteps[0]}:{incoming_timesteps[-1]} | "
-                        f"Updated action steps: {new_timesteps[0]}:{new_timesteps[-1]}"
-                    )
-                    self.logger.debug(
-                        f"Queue update complete ({queue_update_time:.6f}s) | "
-                        f"Before: {old_size} items | "
-                        f"After: {new_size} items | "
-                    )
+            self.logger.info(
+                f"Received action chunk for step #{first_action_timestep} | "
+                f"Latest action: #{latest_action} | "
+                f"Incoming actions: {incoming_timesteps[0]}:{incoming_timesteps[-1]} | "
+                f"Network latency (server->client): {server_to_client_latency:.2f}ms | "
+                f"Deserialization time: {deserialize_time * 1000:.2f}ms"
+            )
 
-            except grpc.RpcError as e:
-                self.logger.error(f"Error receiving actions: {e}")
+        # Update action queue
+        start_time = time.perf_counter()
+        self._aggregate_action_queues(timed_actions, self.config.aggregate_fn)
+        queue_update_time = time.perf_counter() - start_time
+
+        self.must_go.set()  # after receiving actions, next empty queue triggers must-go processing!
+
+        if verbose:
+            # Get queue state after changes
+            new_size, new_timesteps = self._inspect_action_queue()
+
+            with self.latest_action_lock:
+                latest_action = self.latest_action
+
+            self.logger.info(
+                f"Latest action: {latest_action} | "
+                f"Old action steps: {old_timesteps[0]}:{old_timesteps[-1]} | "
+                f"Incoming action steps: {incoming_timesteps[0]}:{incoming_timesteps[-1]} | "
+                f"Updated action steps: {new_timesteps[0]}:{new_timesteps[-1]}"
+            )
+            self.logger.debug(
+                f"Queue update complete ({queue_update_time:.6f}s) | "
+                f"Before: {old_size} items | "
+                f"After: {new_size} items | "
+            )
 
     def actions_available(self):
         """Check if there are actions available in the queue"""
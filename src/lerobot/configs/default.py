@@ -36,6 +36,25 @@ class DatasetConfig:
     use_imagenet_stats: bool = True
     video_backend: str = field(default_factory=get_safe_default_codec)
     streaming: bool = False
+    # Streaming only: number of frames each shard builds ahead of time on a background thread, so that shards
+    # are fetched and decoded concurrently. 0 builds frames on demand.
+    streaming_prefetch_size: int = 0
+    # Read numeric features from a memory-mapped columnar cache built once per dataset version, instead of
+    # decoding parquet rows on every access. Not used for streaming datasets.
+    use_frame_store: bool = False
+    # Per-worker memory budget (MB) of the LRU cache of decoded video frames. 0 disables it.
+    video_frame_cache_mb: float = 0.0
+    # Per-worker number of threads decoding the camera streams of a sample concurrently. 0 decodes them one
+    # after the other.
+    video_decode_threads: int = 0
+    # Resize (then center crop) every camera frame to this (height, width). Frames are read from a pre-decoded
+    # training view when one was built with `lerobot-edit-dataset --operation.type build_frame_view`.
+    frame_view_resize: tuple[int, int] | None = None
+    frame_view_crop: tuple[int, int] | None = None
+    # When > 1, training shuffles chunks of this many consecutive frames of an episode (counted from its start,
+    # not aligned to video keyframes) instead of single frames, so that the samples of a chunk mostly share their
+    # video seek/decode passes within a batch. See `EpisodeAwareSampler`.
+    shuffle_chunk_size: int = 1
 
     def __post_init__(self) -> None:
         if self.episodes is not None:
@@ -55,6 +55,13 @@ class TrainPipelineConfig(HubMixin):
     cudnn_deterministic: bool = False
     # Number of workers for the dataloader.
     num_workers: int = 4
+    # Number of batches run through the policy preprocessor ahead of the training steps, by a background thread
+    # (and CUDA stream), e.g. `--prefetch_batches=1` to overlap the preprocessing with the training step. 0 runs
+    # the preprocessor in the training loop.
+    prefetch_batches: int = 0
+    # Set to True to run the leading steps of the policy preprocessor that only need CPU data (e.g. renaming,
+    # batching, tokenization) in the dataloader workers, when `num_workers > 0`.
+    preprocess_in_workers: bool = False
     batch_size: int = 8
     steps: int = 100_000
     eval_freq: int = 20_000
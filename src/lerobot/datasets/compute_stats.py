@@ -13,11 +13,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from lerobot.datasets.io_utils import load_image_as_numpy
 
 DEFAULT_QUANTILES = [0.01, 0.10, 0.50, 0.90, 0.99]
+# Number of threads loading the sampled images of an episode
+SAMPLE_IMAGES_NUM_THREADS = 8
 
 
 class RunningQuantileStats:
@@ -28,6 +33,9 @@ class RunningQuantileStats:
     Statistics are computed per feature dimension and updated incrementally
     as new batches are observed. Quantiles are estimated using histograms,
     which adapt dynamically if the observed data range expands.
+
+    Statistics computed separately (e.g. for different episodes, in different
+    processes) can be combined with `merge`.
     """
 
     def __init__(self, quantile_list: list[float] | None = None, num_quantile_bins: int = 5000):
@@ -91,6 +99,46 @@ class RunningQuantileStats:
 
         self._update_histograms(batch)
 
+    def merge(self, other: "RunningQuantileStats") -> None:
+        """Merge the statistics of `other` into these ones, as if its vectors had been passed to `update`.
+
+        The count, mean, mean of squares, min and max are combined exactly. The histograms of `other` are
+        re-binned onto the bins of the merged range, like when `update` observes vectors outside of the
+        current range.
+        """
+        if other._count == 0:
+            return
+        if self._count == 0:
+            self._count = other._count
+            self._mean = other._mean.copy()
+            self._mean_of_squares = other._mean_of_squares.copy()
+            self._min = other._min.copy()
+            self._max = other._max.copy()
+            self._histograms = [hist.copy() for hist in other._histograms]
+            self._bin_edges = [edges.copy() for edges in other._bin_edges]
+            return
+
+        if other._mean.size != self._mean.size:
+            raise ValueError("The length of merged vectors does not match the initialized vector length.")
+
+        new_max = np.maximum(self._max, other._max)
+        new_min = np.minimum(self._min, other._min)
+        range_changed = np.any(new_max > self._max) or np.any(new_min < self._min)
+        self._max = new_max
+        self._min = new_min
+        if range_changed:
+            self._adjust_histograms()
+
+        self._count += other._count
+        weight = other._count / self._count
+        self._mean += (other._mean - self._mean) * weight
+        self._mean_of_squares += (other._mean_of_squares - self._mean_of_squares) * weight
+
+        for i in range(len(self._histograms)):
+            self._histograms[i] += self._rebin_histogram(
+                other._histograms[i], other._bin_edges[i], self._bin_edges[i]
+            )
+
     def get_statistics(self) -> dict[str, np.ndarray]:
         """Compute and return the statistics of the vectors processed so far.
 
@@ -133,21 +181,19 @@ class RunningQuantileStats:
                 self._min[i] - padding, self._max[i] + padding, self._num_quantile_bins + 1
             )
 
-            # Redistribute existing histogram counts to new bins
-            # We need to map each old bin center to the new bins
-            old_centers = (old_edges[:-1] + old_edges[1:]) / 2
-            new_hist = np.zeros(self._num_quantile_bins)
-
-            for old_center, count in zip(old_centers, old_hist, strict=False):
-                if count > 0:
-                    # Find which new bin this old center belongs to
-                    bin_idx = np.searchsorted(new_edges, old_center) - 1
-                    bin_idx = max(0, min(bin_idx, self._num_quantile_bins - 1))
-                    new_hist[bin_idx] += count
-
-            self._histograms[i] = new_hist
+            self._histograms[i] = self._rebin_histogram(old_hist, old_edges, new_edges)
             self._bin_edges[i] = new_edges
 
+    @staticmethod
+    def _rebin_histogram(hist: np.ndarray, edges: np.ndarray, new_edges: np.ndarray) -> np.ndarray:
+        """Redistribute histogram counts to new bins, by mapping each old bin center to the new bins."""
+        centers = (edges[:-1] + edges[1:]) / 2
+        non_empty = hist > 0
+        num_bins = len(new_edges) - 1
+        # Find which new bin each old center belongs to
+        bin_idx = np.clip(np.searchsorted(new_edges, centers[non_empty]) - 1, 0, num_bins - 1)
+        return np.bincount(bin_idx, weights=hist[non_empty], minlength=num_bins)
+
     def _update_histograms(self, batch: np.ndarray) -> None:
         """Update histograms with new vectors."""
         for i in range(batch.shape[1]):
@@ -227,18 +273,27 @@ def auto_downsample_height_width(img: np.ndarray, target_size: int = 150, max_si
     return img[:, ::downsample_factor, ::downsample_factor]
 
 
+def _load_sampled_image(path: str) -> np.ndarray:
+    # we load as uint8 to reduce memory usage
+    img = load_image_as_numpy(path, dtype=np.uint8, channel_first=True)
+    return auto_downsample_height_width(img)
+
+
 def sample_images(image_paths: list[str]) -> np.ndarray:
-    sampled_indices = sample_indices(len(image_paths))
+    sampled_paths = [image_paths[idx] for idx in sample_indices(len(image_paths))]
 
-    images = None
-    for i, idx in enumerate(sampled_indices):
-        path = image_paths[idx]
-        # we load as uint8 to reduce memory usage
-        img = load_image_as_numpy(path, dtype=np.uint8, channel_first=True)
-        img = auto_downsample_height_width(img)
+    # Image decoding mostly releases the GIL, so the sampled images are loaded concurrently
+    num_threads = min(SAMPLE_IMAGES_NUM_THREADS, len(sampled_paths))
+    if num_threads > 1:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            loaded = executor.map(_load_sampled_image, sampled_paths)
+    else:
+        loaded = map(_load_sampled_image, sampled_paths)
 
+    images = None
+    for i, img in enumerate(loaded):
         if images is None:
-            images = np.empty((len(sampled_indices), *img.shape), dtype=np.uint8)
+            images = np.empty((len(sampled_paths), *img.shape), dtype=np.uint8)
 
         images[i] = img
 
@@ -529,6 +584,99 @@ def compute_episode_stats(
     return ep_stats
 
 
+class FeatureStatsSketch:
+    """Mergeable partial statistics of a single feature.
+
+    A sketch holds the moments and quantile histograms of a feature (see `RunningQuantileStats`) together with
+    its number of samples. Sketches computed for different episodes, possibly in different processes, are
+    combined with `merge`, and `get_statistics` returns the same stats format as `compute_episode_stats`.
+
+    Unlike `aggregate_stats`, which can only average the quantiles of each episode, merging sketches yields
+    the quantiles of the merged data up to the histogram resolution.
+    """
+
+    def __init__(self, is_visual: bool = False, quantile_list: list[float] | None = None):
+        self.is_visual = is_visual
+        self.num_samples = 0
+        self.running_stats = RunningQuantileStats(quantile_list)
+
+    def update(self, array: np.ndarray) -> None:
+        """Add samples of shape (N, C, H, W) with values in [0, 1] for visual features, (N, ...) otherwise."""
+        reshaped, num_samples = _prepare_array_for_stats(array, (0, 2, 3) if self.is_visual else 0)
+        self.running_stats.update(reshaped)
+        self.num_samples += num_samples
+
+    def merge(self, other: "FeatureStatsSketch") -> None:
+        if other.is_visual != self.is_visual:
+            raise ValueError("Cannot merge the sketches of a visual and a non-visual feature.")
+        self.running_stats.merge(other.running_stats)
+        self.num_samples += other.num_samples
+
+    def get_statistics(self) -> dict[str, np.ndarray]:
+        stats = self.running_stats.get_statistics()
+        stats["count"] = np.array([self.num_samples])
+        if self.is_visual:
+            # Per-channel stats, shaped (C, 1, 1) to broadcast with (C, H, W) frames
+            stats = {k: v if k == "count" else v.reshape(-1, 1, 1) for k, v in stats.items()}
+        return stats
+
+
+def compute_episode_sketches(
+    episode_data: dict[str, list[str] | np.ndarray],
+    features: dict,
+    quantile_list: list[float] | None = None,
+) -> dict[str, FeatureStatsSketch]:
+    """Mergeable counterpart of `compute_episode_stats`, taking the same inputs.
+
+    Returns:
+        Dictionary mapping feature names to their `FeatureStatsSketch`. Use `aggregate_sketches` to merge the
+        sketches of several episodes into stats.
+    """
+    sketches = {}
+    for key, data in episode_data.items():
+        if features[key]["dtype"] == "string":
+            continue
+
+        is_visual = features[key]["dtype"] in ["image", "video"]
+        sketches[key] = FeatureStatsSketch(is_visual=is_visual, quantile_list=quantile_list)
+        sketches[key].update(sample_images(data) / 255.0 if is_visual else data)
+
+    return sketches
+
+
+def aggregate_sketches(
+    sketches_list: Iterable[dict[str, FeatureStatsSketch]],
+) -> dict[str, dict[str, np.ndarray]]:
+    """Merge the sketches of several episodes and compute the stats of the merged data.
+
+    The final stats have the union of all feature keys of the sketches.
+    """
+    merged: dict[str, FeatureStatsSketch] = {}
+    for sketches in sketches_list:
+        for key, sketch in sketches.items():
+            if key not in merged:
+                merged[key] = FeatureStatsSketch(sketch.is_visual, sketch.running_stats._quantile_list)
+            merged[key].merge(sketch)
+
+    return {key: sketch.get_statistics() for key, sketch in merged.items()}
+
+
+def compute_stats(
+    episodes_data: Iterable[dict[str, list[str] | np.ndarray]],
+    features: dict,
+    quantile_list: list[float] | None = None,
+) -> dict[str, dict[str, np.ndarray]]:
+    """Compute the stats of a whole dataset from the data of each of its episodes.
+
+    Episodes are turned into sketches (see `compute_episode_sketches`) one at a time, so `episodes_data` can be
+    a generator loading episodes lazily. To spread the episodes over processes, compute their sketches in the
+    workers and merge them with `aggregate_sketches`, as `augment_dataset_quantile_stats` does.
+    """
+    return aggregate_sketches(
+        compute_episode_sketches(episode_data, features, quantile_list) for episode_data in episodes_data
+    )
+
+
 def _validate_stat_value(value: np.ndarray, key: str, feature_key: str) -> None:
     """Validate a single statistic value."""
     if not isinstance(value, np.ndarray):
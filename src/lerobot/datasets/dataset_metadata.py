@@ -466,7 +466,8 @@ class LeRobotDatasetMetadata:
         episode_tasks: list[str],
         episode_stats: dict[str, dict],
         episode_metadata: dict,
-    ) -> None:
+        write_metadata: bool = True,
+    ) -> dict:
         """Persist episode metadata, update dataset info, and aggregate stats.
 
         Writes the episode's metadata to the buffered parquet writer, increments
@@ -480,6 +481,12 @@ class LeRobotDatasetMetadata:
             episode_stats: Per-feature statistics for this episode.
             episode_metadata: Additional metadata (chunk/file indices, frame
                 ranges, video timestamps, etc.).
+            write_metadata: If False, the metadata row of the episode is not
+                written, e.g. until its videos are encoded. It must then be
+                written with ``_save_episode_metadata``, in episode order.
+
+        Returns:
+            The metadata row of the episode.
         """
         episode_dict = {
             "episode_index": episode_index,
@@ -488,7 +495,8 @@ class LeRobotDatasetMetadata:
         }
         episode_dict.update(episode_metadata)
         episode_dict.update(flatten_dict({"stats": episode_stats}))
-        self._save_episode_metadata(episode_dict)
+        if write_metadata:
+            self._save_episode_metadata(episode_dict)
 
         # Update info
         self.info["total_episodes"] += 1
@@ -500,6 +508,7 @@ class LeRobotDatasetMetadata:
 
         self.stats = aggregate_stats([self.stats, episode_stats]) if self.stats is not None else episode_stats
         write_stats(self.stats, self.root)
+        return episode_dict
 
     def update_video_info(self, video_key: str | None = None) -> None:
         """
@@ -15,10 +15,15 @@
 # limitations under the License.
 """Private reader component for LeRobotDataset. Handles random-access reading (HF dataset, delta indices, video decoding)."""
 
+import logging
+import os
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import datasets
+import numpy as np
 import torch
 
 from lerobot.datasets.dataset_metadata import LeRobotDatasetMetadata
@@ -27,11 +32,18 @@ from lerobot.datasets.feature_utils import (
     get_delta_indices,
     get_hf_features_from_features,
 )
+from lerobot.datasets.frame_store import FrameStore, get_frame_store_dir
+from lerobot.datasets.frame_view import FrameView, FrameViewSpec
 from lerobot.datasets.io_utils import (
     hf_transform_to_torch,
     load_nested_dataset,
 )
-from lerobot.datasets.video_utils import decode_video_frames
+from lerobot.datasets.video_utils import VideoDecoderCache, decode_video_frames
+
+logger = logging.getLogger(__name__)
+
+# Stages of an item read, timed by the reader (see DatasetReader.timing_stats)
+READ_STAGES = ("read", "query", "video_decode", "transform")
 
 
 class DatasetReader:
@@ -49,6 +61,11 @@ class DatasetReader:
         video_backend: str,
         delta_timestamps: dict[str, list[float]] | None,
         image_transforms: Callable | None,
+        use_frame_store: bool = False,
+        video_frame_cache_mb: float = 0.0,
+        disabled_features: set[str] | None = None,
+        video_decode_threads: int = 0,
+        frame_view: FrameViewSpec | None = None,
     ):
         """Initialize the reader with metadata, filtering, and transform config.
 
@@ -66,6 +83,22 @@ class DatasetReader:
                 relative timestamp offsets for temporal context windows.
             image_transforms: Optional torchvision v2 transform applied to
                 visual features.
+            use_frame_store: If ``True``, numeric features are read from a
+                memory-mapped :class:`FrameStore` (built on first use) instead
+                of going through the HF dataset for every row.
+            video_frame_cache_mb: Memory budget, per DataLoader worker, of the
+                LRU cache of decoded video frames (torchcodec backend only).
+                ``0`` disables frame caching; decoders are cached regardless.
+            disabled_features: Optional feature keys that are never read:
+                their parquet columns are not loaded, their videos are not
+                decoded, and they are left out of the returned items.
+            video_decode_threads: Size of the per-process thread pool
+                decoding the camera streams of a sample (or of a batch)
+                concurrently. ``0`` decodes them one after the other.
+            frame_view: Optional resize/crop applied to every camera
+                frame. Frames are read from the matching pre-decoded
+                :class:`FrameView` when one was built, and transformed on
+                the fly otherwise.
         """
         self._meta = meta
         self.root = root
@@ -73,15 +106,93 @@ class DatasetReader:
         self._tolerance_s = tolerance_s
         self._video_backend = video_backend
         self._image_transforms = image_transforms
+        self._use_frame_store = use_frame_store
+        self.decoder_cache = VideoDecoderCache(frame_cache_size_mb=video_frame_cache_mb)
+        self.disabled_features = set(disabled_features) if disabled_features else set()
+        # Features, video keys and camera keys actually read (i.e. minus the disabled ones)
+        self._features = {k: ft for k, ft in meta.features.items() if k not in self.disabled_features}
+        self._video_keys = [k for k in meta.video_keys if k not in self.disabled_features]
+        self._camera_keys = [k for k in meta.camera_keys if k not in self.disabled_features]
+        self._frame_view_spec = frame_view
+        self._frame_view: FrameView | None = None
+        if frame_view is not None:
+            self._frame_view = FrameView.find(meta, frame_view)
+            if self._frame_view is None:
+                logger.warning(
+                    f"No frame view '{frame_view.name}' found for {meta.repo_id}, frames are resized on "
+                    "the fly. Build it with `lerobot-edit-dataset --operation.type build_frame_view`."
+                )
+        # Camera keys read from the frame view, and the video keys that still need decoding
+        self._view_keys = [
+            k for k in self._camera_keys if self._frame_view is not None and k in self._frame_view
+        ]
+        self._decoded_video_keys = [k for k in self._video_keys if k not in self._view_keys]
+        self._video_decode_threads = video_decode_threads
+        self._decode_pool: ThreadPoolExecutor | None = None
+        self._decode_pool_pid: int | None = None
+        self.reset_timing_stats()
 
         self.hf_dataset: datasets.Dataset | None = None
         self._absolute_to_relative_idx: dict[int, int] | None = None
+        # Vectorized counterparts used by get_items (built in _build_index_mapping)
+        self._ep_from_index: np.ndarray | None = None
+        self._ep_to_index: np.ndarray | None = None
+        self._sorted_abs_idx: np.ndarray | None = None
+        self._sorted_abs_order: np.ndarray | None = None
+        self._window_dataset: datasets.Dataset | None = None
+        self._window_columns: list[str] | None = None
+        self._frame_store: FrameStore | None = None
+        # HF dataset restricted to the columns the frame store does not hold (e.g. images)
+        self._remaining_dataset: datasets.Dataset | None = None
 
         # Setup delta_indices (doesn't depend on hf_dataset)
         self.delta_indices = None
         if delta_timestamps is not None:
             check_delta_timestamps(delta_timestamps, meta.fps, tolerance_s)
-            self.delta_indices = get_delta_indices(delta_timestamps, meta.fps)
+            self.delta_indices = {
+                key: delta_idx
+                for key, delta_idx in get_delta_indices(delta_timestamps, meta.fps).items()
+                if key not in self.disabled_features
+            }
+
+    def __getstate__(self) -> dict:
+        # Thread pools can't be pickled (e.g. with the "spawn" start method); workers create their own
+        state = self.__dict__.copy()
+        state["_decode_pool"] = None
+        state["_decode_pool_pid"] = None
+        return state
+
+    def reset_timing_stats(self) -> None:
+        """Reset the accumulated per-stage read timings."""
+        self._num_timed_items = 0
+        self._stage_times = dict.fromkeys(READ_STAGES, 0.0)
+
+    def timing_stats(self) -> dict[str, float]:
+        """Time spent in every stage of item reads since the last reset, in seconds.
+
+        Stages are ``read`` (rows of the current frames), ``query`` (delta-timestamp windows),
+        ``video_decode`` and ``transform`` (image transforms). Stats are accumulated per process, i.e. per
+        DataLoader worker.
+        """
+        return {"num_items": self._num_timed_items, **{f"{k}_s": v for k, v in self._stage_times.items()}}
+
+    def _record_time(self, stage: str, start: float) -> float:
+        """Add the time elapsed since ``start`` to ``stage`` and return the current time."""
+        now = time.perf_counter()
+        self._stage_times[stage] += now - start
+        return now
+
+    def _get_decode_pool(self) -> ThreadPoolExecutor | None:
+        """Thread pool decoding camera streams concurrently, if enabled."""
+        if self._video_decode_threads <= 0:
+            return None
+        # Threads don't survive a fork, so every DataLoader worker creates its own pool
+        if self._decode_pool is None or self._decode_pool_pid != os.getpid():
+            self._decode_pool = ThreadPoolExecutor(
+                max_workers=self._video_decode_threads, thread_name_prefix="lerobot-video-decode"
+            )
+            self._decode_pool_pid = os.getpid()
+        return self._decode_pool
 
     def try_load(self) -> bool:
         """Attempt to load from local cache. Returns True if data is sufficient."""
@@ -94,21 +205,68 @@ class DatasetReader:
             self.hf_dataset = None
             return False
         self._build_index_mapping()
+        self._load_frame_store()
         return True
 
     def load_and_activate(self) -> None:
         """Load HF dataset from disk and build index mapping. Call after data is on disk."""
         self.hf_dataset = self._load_hf_dataset()
         self._build_index_mapping()
+        self._load_frame_store()
+
+    def _load_frame_store(self) -> None:
+        """Open (building it on first use) the memory-mapped frame store, if enabled."""
+        self._frame_store = None
+        self._remaining_dataset = None
+        if not self._use_frame_store or self.hf_dataset is None:
+            return
+        store_dir = get_frame_store_dir(self._meta.repo_id, self.root, self._features, self.episodes)
+        self._frame_store = FrameStore.load_or_build(self.hf_dataset, self._features, store_dir)
+        remaining = [key for key in self.hf_dataset.column_names if key not in self._frame_store]
+        if remaining:
+            self._remaining_dataset = self.hf_dataset.select_columns(remaining)
+
+    def _read_row(self, idx: int) -> dict:
+        """Read one row, from the frame store when available."""
+        if self._frame_store is None:
+            return self.hf_dataset[idx]
+        item = self._frame_store.get_row(idx)
+        if self._remaining_dataset is not None:
+            item.update(self._remaining_dataset[idx])
+        return item
+
+    def _read_column(self, key: str, relative_indices: list[int] | np.ndarray) -> torch.Tensor:
+        """Gather ``key`` at ``relative_indices``, from the frame store when available."""
+        if self._frame_store is not None and key in self._frame_store:
+            return self._frame_store.get_rows(key, relative_indices)
+        try:
+            return torch.stack(self.hf_dataset[key][relative_indices])
+        except (KeyError, TypeError, IndexError):
+            return torch.stack(self.hf_dataset[relative_indices][key])
 
     def _build_index_mapping(self) -> None:
         """Build absolute-to-relative index mapping from loaded hf_dataset."""
         self._absolute_to_relative_idx = None
+        self._sorted_abs_idx = None
+        self._sorted_abs_order = None
+        self._window_dataset = None
+        self._window_columns = None
         if self.episodes is not None and self.hf_dataset is not None:
             self._absolute_to_relative_idx = {
                 abs_idx.item() if isinstance(abs_idx, torch.Tensor) else abs_idx: rel_idx
                 for rel_idx, abs_idx in enumerate(self.hf_dataset["index"])
             }
+            abs_indices = np.fromiter(self._absolute_to_relative_idx.keys(), dtype=np.int64)
+            rel_indices = np.fromiter(self._absolute_to_relative_idx.values(), dtype=np.int64)
+            order = np.argsort(abs_indices, kind="stable")
+            self._sorted_abs_idx = abs_indices[order]
+            self._sorted_abs_order = rel_indices[order]
+
+        self._ep_from_index = None
+        self._ep_to_index = None
+        if self._meta.episodes is not None:
+            self._ep_from_index = np.asarray(self._meta.episodes["dataset_from_index"], dtype=np.int64)
+            self._ep_to_index = np.asarray(self._meta.episodes["dataset_to_index"], dtype=np.int64)
 
     @property
     def num_frames(self) -> int:
@@ -124,8 +282,14 @@ class DatasetReader:
 
     def _load_hf_dataset(self) -> datasets.Dataset:
         """hf_dataset contains all the observations, states, actions, rewards, etc."""
-        features = get_hf_features_from_features(self._meta.features)
-        hf_dataset = load_nested_dataset(self.root / "data", features=features, episodes=self.episodes)
+        features = get_hf_features_from_features(
+            {key: ft for key, ft in self._features.items() if key not in self._view_keys}
+        )
+        # Only read the enabled columns (and not the images served by the frame view) from the parquet files
+        columns = list(features) if self.disabled_features or self._view_keys else None
+        hf_dataset = load_nested_dataset(
+            self.root / "data", features=features, episodes=self.episodes, columns=columns
+        )
         hf_dataset.set_transform(hf_transform_to_torch)
         return hf_dataset
 
@@ -147,9 +311,9 @@ class DatasetReader:
         if not requested_episodes.issubset(available_episodes):
             return False
 
-        if len(self._meta.video_keys) > 0:
+        if len(self._video_keys) > 0:
             for ep_idx in requested_episodes:
-                for vid_key in self._meta.video_keys:
+                for vid_key in self._video_keys:
                     video_path = self.root / self._meta.get_video_file_path(ep_idx, vid_key)
                     if not video_path.exists():
                         return False
@@ -163,10 +327,10 @@ class DatasetReader:
         """
         episodes = self.episodes if self.episodes is not None else list(range(self._meta.total_episodes))
         fpaths = [str(self._meta.get_data_file_path(ep_idx)) for ep_idx in episodes]
-        if len(self._meta.video_keys) > 0:
+        if len(self._video_keys) > 0:
             video_files = [
                 str(self._meta.get_video_file_path(ep_idx, vid_key))
-                for vid_key in self._meta.video_keys
+                for vid_key in self._video_keys
                 for ep_idx in episodes
             ]
             fpaths += video_files
@@ -199,14 +363,13 @@ class DatasetReader:
         query_indices: dict[str, list[int]] | None = None,
     ) -> dict[str, list[float]]:
         query_timestamps = {}
-        for key in self._meta.video_keys:
+        for key in self._decoded_video_keys:
             if query_indices is not None and key in query_indices:
                 if self._absolute_to_relative_idx is not None:
                     relative_indices = [self._absolute_to_relative_idx[idx] for idx in query_indices[key]]
-                    timestamps = self.hf_dataset[relative_indices]["timestamp"]
                 else:
-                    timestamps = self.hf_dataset[query_indices[key]]["timestamp"]
-                query_timestamps[key] = torch.stack(timestamps).tolist()
+                    relative_indices = query_indices[key]
+                query_timestamps[key] = self._read_column("timestamp", relative_indices).tolist()
             else:
                 query_timestamps[key] = [current_ts]
 
@@ -216,35 +379,84 @@ class DatasetReader:
         """Query dataset for indices across keys, skipping video keys."""
         result: dict = {}
         for key, q_idx in query_indices.items():
-            if key in self._meta.video_keys:
+            if key in self._video_keys or key in self._view_keys:
                 continue
             relative_indices = (
                 q_idx
                 if self._absolute_to_relative_idx is None
                 else [self._absolute_to_relative_idx[idx] for idx in q_idx]
             )
-            try:
-                result[key] = torch.stack(self.hf_dataset[key][relative_indices])
-            except (KeyError, TypeError, IndexError):
-                result[key] = torch.stack(self.hf_dataset[relative_indices][key])
+            result[key] = self._read_column(key, relative_indices)
         return result
 
+    def _get_video_requests(
+        self, query_timestamps: dict[str, list[float]], ep_idx: int
+    ) -> dict[str, tuple[Path, list[float]]]:
+        """Video file and timestamps (in that file) to decode for every video key of an episode."""
+        ep = self._meta.episodes[ep_idx]
+        return {
+            vid_key: (
+                self.root / self._meta.get_video_file_path(ep_idx, vid_key),
+                [ep[f"videos/{vid_key}/from_timestamp"] + ts for ts in query_ts],
+            )
+            for vid_key, query_ts in query_timestamps.items()
+        }
+
+    def _decode_videos(
+        self, requests: dict[str, list[tuple[Path, list[float]]]], as_uint8: bool = False
+    ) -> dict[str, list[torch.Tensor]]:
+        """Decode lists of ``(video_path, timestamps)`` requests, keyed by video key.
+
+        The requests of a video key are decoded one after the other since they may share a decoder, while
+        the video keys are decoded concurrently when ``video_decode_threads > 0``. Decoders release the GIL,
+        so the latency of a sample becomes that of its slowest camera rather than the sum over cameras.
+        Frames are float32 in [0, 1], or uint8 with ``as_uint8=True``.
+        """
+
+        def decode(key_requests: list[tuple[Path, list[float]]]) -> list[torch.Tensor]:
+            return [
+                decode_video_frames(
+                    video_path,
+                    timestamps,
+                    self._tolerance_s,
+                    self._video_backend,
+                    decoder_cache=self.decoder_cache,
+                    as_uint8=as_uint8,
+                )
+                for video_path, timestamps in key_requests
+            ]
+
+        pool = self._get_decode_pool() if len(requests) > 1 else None
+        if pool is None:
+            return {vid_key: decode(key_requests) for vid_key, key_requests in requests.items()}
+        futures = {vid_key: pool.submit(decode, key_requests) for vid_key, key_requests in requests.items()}
+        return {vid_key: future.result() for vid_key, future in futures.items()}
+
     def _query_videos(self, query_timestamps: dict[str, list[float]], ep_idx: int) -> dict[str, torch.Tensor]:
         """Note: When using data workers (e.g. DataLoader with num_workers>0), do not call this function
         in the main process (e.g. by using a second Dataloader with num_workers=0). It will result in a
         Segmentation Fault.
         """
-        ep = self._meta.episodes[ep_idx]
-        item = {}
-        for vid_key, query_ts in query_timestamps.items():
-            from_timestamp = ep[f"videos/{vid_key}/from_timestamp"]
-            shifted_query_ts = [from_timestamp + ts for ts in query_ts]
-
-            video_path = self.root / self._meta.get_video_file_path(ep_idx, vid_key)
-            frames = decode_video_frames(video_path, shifted_query_ts, self._tolerance_s, self._video_backend)
-            item[vid_key] = frames.squeeze(0)
+        requests = self._get_video_requests(query_timestamps, ep_idx)
+        frames = self._decode_videos({vid_key: [request] for vid_key, request in requests.items()})
+        return {vid_key: vid_frames[0].squeeze(0) for vid_key, vid_frames in frames.items()}
+
+    def _read_frame_view(
+        self, abs_indices: int | np.ndarray, query_indices: dict | None = None
+    ) -> dict[str, torch.Tensor]:
+        """Frames of the camera keys served by the frame view, at ``abs_indices`` or their delta windows."""
+        return {
+            key: self._frame_view.get_frames(
+                key, query_indices[key] if query_indices is not None and key in query_indices else abs_indices
+            )
+            for key in self._view_keys
+        }
 
-        return item
+    def _apply_frame_view_spec(self, item: dict) -> None:
+        """Resize/crop, on the fly, the camera frames of ``item`` that were not read from the frame view."""
+        for key in self._camera_keys:
+            if key not in self._view_keys:
+                item[key] = self._frame_view_spec.apply_to_float(item[key])
 
     def get_item(self, idx) -> dict:
         """Core __getitem__ logic. Assumes hf_dataset is loaded.
@@ -253,9 +465,11 @@ class DatasetReader:
         HF dataset, **not** the absolute frame index stored in the ``index``
         column.  The absolute index is retrieved from the row itself.
         """
-        item = self.hf_dataset[idx]
+        start = time.perf_counter()
+        item = self._read_row(idx)
         ep_idx = item["episode_index"].item()
         abs_idx = item["index"].item()
+        start = self._record_time("read", start)
 
         query_indices = None
         if self.delta_indices is not None:
@@ -264,25 +478,181 @@ class DatasetReader:
             item = {**item, **padding}
             for key, val in query_result.items():
                 item[key] = val
+            start = self._record_time("query", start)
 
-        if len(self._meta.video_keys) > 0:
+        if len(self._decoded_video_keys) > 0:
             current_ts = item["timestamp"].item()
             query_timestamps = self._get_query_timestamps(current_ts, query_indices)
             video_frames = self._query_videos(query_timestamps, ep_idx)
             item = {**video_frames, **item}
+            start = self._record_time("video_decode", start)
+
+        if self._frame_view is not None:
+            item = {**self._read_frame_view(abs_idx, query_indices), **item}
+            start = self._record_time("read", start)
+
+        if self._frame_view_spec is not None:
+            self._apply_frame_view_spec(item)
+            start = self._record_time("transform", start)
 
         if self._image_transforms is not None:
-            image_keys = self._meta.camera_keys
+            image_keys = self._camera_keys
             for cam in image_keys:
                 item[cam] = self._image_transforms(item[cam])
+            self._record_time("transform", start)
+        self._num_timed_items += 1
 
         # Add task as a string
         task_idx = item["task_index"].item()
         item["task"] = self._meta.tasks.iloc[task_idx].name
 
         # add subtask information if available
-        if "subtask_index" in self._meta.features and self._meta.subtasks is not None:
+        if "subtask_index" in self._features and self._meta.subtasks is not None:
             subtask_idx = item["subtask_index"].item()
             item["subtask"] = self._meta.subtasks.iloc[subtask_idx].name
 
         return item
+
+    def _to_relative_indices(self, abs_indices: np.ndarray) -> np.ndarray:
+        """Vectorized equivalent of looking up ``_absolute_to_relative_idx`` for every element."""
+        if self._sorted_abs_idx is None:
+            return abs_indices
+        pos = np.searchsorted(self._sorted_abs_idx, abs_indices)
+        return self._sorted_abs_order[pos]
+
+    def _get_batch_query_indices(
+        self, abs_indices: np.ndarray, ep_indices: np.ndarray
+    ) -> tuple[dict[str, np.ndarray], dict[str, torch.Tensor]]:
+        """Batched version of :meth:`_get_query_indices`.
+
+        Returns ``(batch_size, num_deltas)`` arrays of clamped absolute indices per key, and the
+        corresponding ``{key}_is_pad`` boolean masks.
+        """
+        ep_start = self._ep_from_index[ep_indices][:, None]
+        ep_end = self._ep_to_index[ep_indices][:, None]
+        query_indices = {}
+        padding = {}
+        for key, delta_idx in self.delta_indices.items():
+            query = abs_indices[:, None] + np.asarray(delta_idx, dtype=np.int64)[None, :]
+            padding[f"{key}_is_pad"] = torch.from_numpy((query < ep_start) | (query >= ep_end))
+            query_indices[key] = np.clip(query, ep_start, ep_end - 1)
+        return query_indices, padding
+
+    def _query_hf_dataset_batch(self, queries: dict[str, tuple[str, np.ndarray]]) -> dict[str, torch.Tensor]:
+        """Fetch several delta windows for a whole batch with a single Arrow take.
+
+        ``queries`` maps an output name to a ``(column, absolute_indices)`` pair. The union of all
+        requested rows is read once, then each output is gathered into a ``(batch_size, num_deltas, ...)``
+        tensor with index arithmetic.
+        """
+        relative = {name: self._to_relative_indices(q_idx) for name, (_, q_idx) in queries.items()}
+        result = {}
+        if self._frame_store is not None:
+            for name, (column, _) in queries.items():
+                if column in self._frame_store:
+                    result[name] = self._frame_store.get_rows(column, relative[name])
+            if len(result) == len(queries):
+                return result
+            relative = {name: rel for name, rel in relative.items() if name not in result}
+
+        unique_rows = np.unique(np.concatenate([rel.ravel() for rel in relative.values()]))
+        columns = sorted({queries[name][0] for name in relative})
+        if self._window_columns != columns:
+            self._window_dataset = self.hf_dataset.select_columns(columns)
+            self._window_columns = columns
+        rows = self._window_dataset[unique_rows.tolist()]
+        stacked = {column: torch.stack(rows[column]) for column in columns}
+
+        for name, rel in relative.items():
+            result[name] = stacked[queries[name][0]][torch.from_numpy(np.searchsorted(unique_rows, rel))]
+        return result
+
+    def get_items(self, indices) -> dict:
+        """Batched counterpart of :meth:`get_item`, returning an already-collated batch.
+
+        Delta-timestamp windows and padding masks are computed for the whole batch with NumPy index
+        arithmetic against the episode boundary arrays, and all non-video windowed columns are fetched
+        with a single Arrow take. Tensors are stacked along a leading batch dimension; ``task`` and
+        ``subtask`` are returned as lists of strings, matching ``default_collate``.
+
+        Args:
+            indices: Sequence of *relative* indices into the (possibly episode-filtered) HF dataset.
+        """
+        indices = [int(i) for i in indices]
+        start = time.perf_counter()
+        batch = {}
+        hf_dataset = self.hf_dataset
+        if self._frame_store is not None:
+            batch = {key: self._frame_store.get_rows(key, indices) for key in self._frame_store.keys}
+            hf_dataset = self._remaining_dataset
+        if hf_dataset is not None:
+            rows = hf_dataset[indices]
+            for key, values in rows.items():
+                batch[key] = torch.stack(values) if isinstance(values[0], torch.Tensor) else values
+        ep_indices = batch["episode_index"].numpy().astype(np.int64)
+        start = self._record_time("read", start)
+
+        video_timestamps = None
+        query_indices = None
+        if self.delta_indices is not None:
+            abs_indices = batch["index"].numpy().astype(np.int64)
+            query_indices, padding = self._get_batch_query_indices(abs_indices, ep_indices)
+            queries = {
+                key: (key, q_idx)
+                for key, q_idx in query_indices.items()
+                if key not in self._video_keys and key not in self._view_keys
+            }
+            video_queries = {
+                key: ("timestamp", q_idx)
+                for key, q_idx in query_indices.items()
+                if key in self._decoded_video_keys
+            }
+            if queries or video_queries:
+                # Video keys share the output namespace, so prefix their timestamp queries
+                query_result = self._query_hf_dataset_batch(
+                    {**queries, **{f"{key}/timestamp": q for key, q in video_queries.items()}}
+                )
+                for key in queries:
+                    batch[key] = query_result[key]
+                video_timestamps = {key: query_result[f"{key}/timestamp"] for key in video_queries}
+            batch.update(padding)
+            start = self._record_time("query", start)
+
+        if len(self._decoded_video_keys) > 0:
+            requests = {key: [] for key in self._decoded_video_keys}
+            for i, ep_idx in enumerate(ep_indices.tolist()):
+                query_timestamps = {
+                    key: video_timestamps[key][i].tolist()
+                    if video_timestamps is not None and key in video_timestamps
+                    else [batch["timestamp"][i].item()]
+                    for key in self._decoded_video_keys
+                }
+                for vid_key, request in self._get_video_requests(query_timestamps, ep_idx).items():
+                    requests[vid_key].append(request)
+            frames = self._decode_videos(requests)
+            batch = {
+                **{key: torch.stack([f.squeeze(0) for f in val]) for key, val in frames.items()},
+                **batch,
+            }
+            start = self._record_time("video_decode", start)
+
+        if self._frame_view is not None:
+            abs_indices = batch["index"].numpy().astype(np.int64)
+            batch = {**self._read_frame_view(abs_indices, query_indices), **batch}
+            start = self._record_time("read", start)
+
+        if self._frame_view_spec is not None:
+            self._apply_frame_view_spec(batch)
+            start = self._record_time("transform", start)
+
+        if self._image_transforms is not None:
+            for cam in self._camera_keys:
+                batch[cam] = torch.stack([self._image_transforms(img) for img in batch[cam]])
+            self._record_time("transform", start)
+        self._num_timed_items += len(indices)
+
+        batch["task"] = [self._meta.tasks.iloc[idx].name for idx in batch["task_index"].tolist()]
+        if "subtask_index" in self._features and self._meta.subtasks is not None:
+            batch["subtask"] = [self._meta.subtasks.iloc[idx].name for idx in batch["subtask_index"].tolist()]
+
+        return batch
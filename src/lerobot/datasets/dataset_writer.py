@@ -17,16 +17,18 @@
 
 from __future__ import annotations
 
+import collections
 import concurrent.futures
 import contextlib
 import logging
+import os
 import shutil
 import tempfile
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 import datasets
 import numpy as np
-import pandas as pd
 import PIL.Image
 import pyarrow.parquet as pq
 import torch
@@ -42,11 +44,9 @@ from lerobot.datasets.image_writer import AsyncImageWriter, write_image
 from lerobot.datasets.io_utils import (
     embed_images,
     get_file_size_in_mb,
-    load_episodes,
     write_info,
 )
 from lerobot.datasets.utils import (
-    DEFAULT_EPISODES_PATH,
     DEFAULT_IMAGE_PATH,
     update_chunk_file_indices,
 )
@@ -82,7 +82,8 @@ class DatasetWriter:
     """Encapsulates write-side state and methods for LeRobotDataset.
 
     Owns: episode_buffer, image_writer, _pq_writer (ParquetWriter), _latest_episode,
-    _current_file_start_frame, _streaming_encoder, _episodes_since_last_encoding, _recorded_frames.
+    _current_file_start_frame, _streaming_encoder, _encoding_pool, _episodes_since_last_encoding,
+    _recorded_frames.
     """
 
     def __init__(
@@ -94,6 +95,7 @@ class DatasetWriter:
         batch_encoding_size: int,
         streaming_encoder: StreamingVideoEncoder | None = None,
         initial_frames: int = 0,
+        encoding_workers: int | None = None,
     ):
         """Initialize the writer with metadata, codec, and encoding config.
 
@@ -108,6 +110,9 @@ class DatasetWriter:
             streaming_encoder: Optional pre-built :class:`StreamingVideoEncoder`
                 for real-time encoding. ``None`` disables streaming mode.
             initial_frames: Starting frame count (non-zero when resuming).
+            encoding_workers: Number of processes of the pool encoding the videos
+                of (episode, camera) pairs in parallel. ``None`` for one per
+                camera, up to half of the CPU cores when batch-encoding.
         """
         self._meta = meta
         self._root = root
@@ -115,6 +120,11 @@ class DatasetWriter:
         self._encoder_threads = encoder_threads
         self._batch_encoding_size = batch_encoding_size
         self._streaming_encoder = streaming_encoder
+        self._encoding_workers = encoding_workers
+        # Started on first use and kept until `finalize`, see `_encode_videos`
+        self._encoding_pool: concurrent.futures.ProcessPoolExecutor | None = None
+        # Metadata rows of the episodes waiting for batch encoding, written once their videos are saved
+        self._pending_episode_rows: collections.deque[dict] = collections.deque()
 
         # Writer state
         self.image_writer: AsyncImageWriter | None = None
@@ -267,32 +277,7 @@ class DatasetWriter:
         elif has_video_keys and not use_batched_encoding:
             num_cameras = len(self._meta.video_keys)
             if parallel_encoding and num_cameras > 1:
-                with concurrent.futures.ProcessPoolExecutor(max_workers=num_cameras) as executor:
-                    future_to_key = {
-                        executor.submit(
-                            _encode_video_worker,
-                            video_key,
-                            episode_index,
-                            self._root,
-                            self._meta.fps,
-                            self._vcodec,
-                            self._encoder_threads,
-                        ): video_key
-                        for video_key in self._meta.video_keys
-                    }
-
-                    results = {}
-                    for future in concurrent.futures.as_completed(future_to_key):
-                        video_key = future_to_key[future]
-                        try:
-                            temp_path = future.result()
-                            results[video_key] = temp_path
-                        except Exception as exc:
-                            logger.error(f"Video encoding failed for {video_key}: {exc}")
-                            raise exc
-
-                for video_key in self._meta.video_keys:
-                    temp_path = results[video_key]
+                for _, video_key, temp_path in self._encode_videos([episode_index]):
                     ep_metadata.update(
                         self._save_episode_video(video_key, episode_index, temp_path=temp_path)
                     )
@@ -300,10 +285,20 @@ class DatasetWriter:
                 for video_key in self._meta.video_keys:
                     ep_metadata.update(self._save_episode_video(video_key, episode_index))
 
-        # `meta.save_episode` need to be executed after encoding the videos
-        self._meta.save_episode(episode_index, episode_length, episode_tasks, ep_stats, ep_metadata)
+        # `meta.save_episode` need to be executed after encoding the videos. When batch-encoding, the metadata
+        # row of the episode is written by `_batch_save_episode_video`, with the metadata of its videos.
+        use_batched_video_encoding = has_video_keys and use_batched_encoding
+        episode_row = self._meta.save_episode(
+            episode_index,
+            episode_length,
+            episode_tasks,
+            ep_stats,
+            ep_metadata,
+            write_metadata=not use_batched_video_encoding,
+        )
 
-        if has_video_keys and use_batched_encoding:
+        if use_batched_video_encoding:
+            self._pending_episode_rows.append(episode_row)
             self._episodes_since_last_encoding += 1
             if self._episodes_since_last_encoding == self._batch_encoding_size:
                 start_ep = self._meta.total_episodes - self._batch_encoding_size
@@ -323,41 +318,84 @@ class DatasetWriter:
             f"Batch encoding {self._batch_encoding_size} videos for episodes {start_episode} to {end_episode - 1}"
         )
 
-        chunk_idx = self._meta.episodes[start_episode]["data/chunk_index"]
-        file_idx = self._meta.episodes[start_episode]["data/file_index"]
-        episode_df_path = self._root / DEFAULT_EPISODES_PATH.format(
-            chunk_index=chunk_idx, file_index=file_idx
-        )
-        episode_df = pd.read_parquet(episode_df_path)
-
-        for ep_idx in range(start_episode, end_episode):
-            logger.info(f"Encoding videos for episode {ep_idx}")
-
-            if (
-                self._meta.episodes[ep_idx]["data/chunk_index"] != chunk_idx
-                or self._meta.episodes[ep_idx]["data/file_index"] != file_idx
-            ):
-                episode_df.to_parquet(episode_df_path)
-                self._meta.episodes = load_episodes(self._root)
-
-                chunk_idx = self._meta.episodes[ep_idx]["data/chunk_index"]
-                file_idx = self._meta.episodes[ep_idx]["data/file_index"]
-                episode_df_path = self._root / DEFAULT_EPISODES_PATH.format(
-                    chunk_index=chunk_idx, file_index=file_idx
-                )
-                episode_df = pd.read_parquet(episode_df_path)
+        # Videos are encoded in parallel in the encoding pool, and saved in order as they come
+        first_key, last_key = self._meta.video_keys[0], self._meta.video_keys[-1]
+        for ep_idx, video_key, temp_path in self._encode_videos(range(start_episode, end_episode)):
+            if video_key == first_key:
+                logger.info(f"Saving videos for episode {ep_idx}")
+                episode_row = self._pending_episode_rows.popleft()
+                video_ep_metadata = {}
 
-            video_ep_metadata = {}
-            for video_key in self._meta.video_keys:
-                video_ep_metadata.update(self._save_episode_video(video_key, ep_idx))
+            video_ep_metadata.update(self._save_episode_video(video_key, ep_idx, temp_path=temp_path))
+            if video_key != last_key:
+                continue
+
+            # Written in episode order, so that `meta.latest_episode` holds the videos the next episode appends to
             video_ep_metadata.pop("episode_index")
-            video_ep_df = pd.DataFrame(video_ep_metadata, index=[ep_idx]).convert_dtypes(
-                dtype_backend="pyarrow"
-            )
+            stats = {key: value for key, value in episode_row.items() if key.startswith("stats/")}
+            episode_row = {key: value for key, value in episode_row.items() if key not in stats}
+            self._meta._save_episode_metadata({**episode_row, **video_ep_metadata, **stats})
+
+    def _encode_videos(self, episode_indices: Iterable[int]) -> Iterator[tuple[int, str, Path]]:
+        """Encode the videos of every camera of the given episodes in the encoding pool.
 
-            episode_df = episode_df.combine_first(video_ep_df)
-            episode_df.to_parquet(episode_df_path)
-            self._meta.episodes = load_episodes(self._root)
+        Each (episode, camera) pair is a job of the pool. At most twice as many
+        jobs as workers are in flight, so that the caller saves the first videos
+        while the next ones are encoded.
+
+        Yields:
+            ``(episode_index, video_key, temp_path)`` for every job, in submission
+            order (episode by episode, cameras in ``meta.video_keys`` order).
+        """
+        if self._encoding_pool is None:
+            num_workers = self._encoding_workers
+            if num_workers is None:
+                num_cameras = len(self._meta.video_keys)
+                max_workers = max(1, (os.cpu_count() or 1) // 2)
+                num_workers = max(num_cameras, min(num_cameras * self._batch_encoding_size, max_workers))
+            self._encoding_workers = num_workers
+            self._encoding_pool = concurrent.futures.ProcessPoolExecutor(max_workers=num_workers)
+
+        jobs = ((ep_idx, video_key) for ep_idx in episode_indices for video_key in self._meta.video_keys)
+        pending: collections.deque[tuple[int, str, concurrent.futures.Future]] = collections.deque()
+        try:
+            for job in jobs:
+                # Back-pressure: wait for the oldest job before submitting more
+                while len(pending) >= 2 * self._encoding_workers:
+                    yield self._encoding_result(*pending.popleft())
+                ep_idx, video_key = job
+                future = self._encoding_pool.submit(
+                    _encode_video_worker,
+                    video_key,
+                    ep_idx,
+                    self._root,
+                    self._meta.fps,
+                    self._vcodec,
+                    self._encoder_threads,
+                )
+                pending.append((ep_idx, video_key, future))
+            while pending:
+                yield self._encoding_result(*pending.popleft())
+        finally:
+            # On failure, drop the jobs not started yet
+            for _, _, future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _encoding_result(
+        episode_index: int, video_key: str, future: concurrent.futures.Future
+    ) -> tuple[int, str, Path]:
+        try:
+            return episode_index, video_key, future.result()
+        except Exception as exc:
+            logger.error(f"Video encoding failed for {video_key} of episode {episode_index}: {exc}")
+            raise
+
+    def _shutdown_encoding_pool(self) -> None:
+        """Wait for the running encoding jobs and stop the encoding pool."""
+        if self._encoding_pool is not None:
+            self._encoding_pool.shutdown(wait=True, cancel_futures=True)
+            self._encoding_pool = None
 
     def _save_episode_data(self, episode_buffer: dict) -> dict:
         """Save episode data to a parquet file."""
@@ -430,6 +468,7 @@ class DatasetWriter:
         episode_index: int,
         temp_path: Path | None = None,
     ) -> dict:
+        """Move the video of an episode into the dataset, appending it to the latest video file if it fits."""
         if temp_path is None:
             ep_path = self._encode_temporary_episode_video(video_key, episode_index)
         else:
@@ -610,8 +649,9 @@ class DatasetWriter:
             self.image_writer.wait_until_done()
             self.image_writer.stop()
             self.image_writer = None
-        # 2. Flush pending video encoding (streaming or batch)
+        # 2. Flush pending video encoding (streaming or batch), then stop the encoding pool
         self.flush_pending_videos()
+        self._shutdown_encoding_pool()
         # 3. Close own parquet writer
         self.close_writer()
         # 4. Finalize metadata (idempotent)
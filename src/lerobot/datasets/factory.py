@@ -21,6 +21,7 @@ import torch
 from lerobot.configs.policies import PreTrainedConfig
 from lerobot.configs.train import TrainPipelineConfig
 from lerobot.datasets.dataset_metadata import LeRobotDatasetMetadata
+from lerobot.datasets.frame_view import FrameViewSpec
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.datasets.multi_dataset import MultiLeRobotDataset
 from lerobot.datasets.streaming_dataset import StreamingLeRobotDataset
@@ -87,6 +88,9 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
             cfg.dataset.repo_id, root=cfg.dataset.root, revision=cfg.dataset.revision
         )
         delta_timestamps = resolve_delta_timestamps(cfg.policy, ds_meta)
+        frame_view = None
+        if cfg.dataset.frame_view_resize is not None or cfg.dataset.frame_view_crop is not None:
+            frame_view = FrameViewSpec(cfg.dataset.frame_view_resize, cfg.dataset.frame_view_crop)
         if not cfg.dataset.streaming:
             dataset = LeRobotDataset(
                 cfg.dataset.repo_id,
@@ -97,6 +101,10 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
                 revision=cfg.dataset.revision,
                 video_backend=cfg.dataset.video_backend,
                 tolerance_s=cfg.tolerance_s,
+                use_frame_store=cfg.dataset.use_frame_store,
+                video_frame_cache_mb=cfg.dataset.video_frame_cache_mb,
+                video_decode_threads=cfg.dataset.video_decode_threads,
+                frame_view=frame_view,
             )
         else:
             dataset = StreamingLeRobotDataset(
@@ -108,6 +116,7 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
                 revision=cfg.dataset.revision,
                 max_num_shards=cfg.num_workers,
                 tolerance_s=cfg.tolerance_s,
+                prefetch_size=cfg.dataset.streaming_prefetch_size,
             )
     else:
         raise NotImplementedError("The MultiLeRobotDataset isn't supported for now.")
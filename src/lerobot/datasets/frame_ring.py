@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Preallocated shared-memory slots to hand camera frames over to writer threads and processes.
+
+While recording, every camera frame is handed over to a background worker (video encoder or image writer).
+Sending the arrays themselves through a ``multiprocessing`` queue pickles each of them, and even with threads
+every frame is copied into a freshly allocated array. A :class:`SharedFrameRing` instead holds a fixed
+number of uint8 ``(H, W, C)`` slots in shared memory:
+
+- the producer (the recording loop) acquires a free slot, copies the frame into it and sends the slot index,
+- the consumer reads the frame as an ``np.ndarray`` view of the slot and sends the slot index back once done,
+- the producer returns the slot to the free list when it receives it back (see :meth:`reclaim`).
+
+Only the producer tracks free slots, so the ring needs no cross-process lock. Pickling a ring (e.g. through
+a ``multiprocessing`` queue) only sends the name of its shared memory block, which the consumer maps once.
+"""
+
+import contextlib
+import queue
+from collections import deque
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Shared memory blocks mapped by this process for rings created by other processes, by name
+_attached_blocks: dict[str, shared_memory.SharedMemory] = {}
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    if name not in _attached_blocks:
+        _attached_blocks[name] = shared_memory.SharedMemory(name=name)
+    return _attached_blocks[name]
+
+
+def to_hwc_uint8(frame: np.ndarray) -> np.ndarray:
+    """View a (H, W, C) or (C, H, W) frame as (H, W, C), converting [0, 1] floats to uint8."""
+    if frame.ndim == 3 and frame.shape[0] == 3:
+        frame = frame.transpose(1, 2, 0)
+    if frame.dtype != np.uint8:
+        frame = (frame * 255).astype(np.uint8)
+    return frame
+
+
+class SharedFrameRing:
+    """Fixed number of uint8 frame slots of a given ``(H, W, C)`` shape in shared memory."""
+
+    def __init__(self, shape: tuple[int, ...], num_slots: int):
+        if num_slots < 1:
+            raise ValueError(f"num_slots must be >= 1, got {num_slots}")
+        self.shape = tuple(int(s) for s in shape)
+        self.num_slots = num_slots
+        self._shm = shared_memory.SharedMemory(create=True, size=num_slots * int(np.prod(self.shape)))
+        self.name = self._shm.name
+        self._owner = True
+        self._free = deque(range(num_slots))
+        self._slots = np.ndarray((num_slots, *self.shape), dtype=np.uint8, buffer=self._shm.buf)
+
+    def __getstate__(self) -> dict:
+        # Consumers only need to find the block: the free list stays with the producer
+        return {"name": self.name, "shape": self.shape, "num_slots": self.num_slots}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._owner = False
+        self._free = deque()
+        self._shm = _attach(self.name)
+        self._slots = np.ndarray((self.num_slots, *self.shape), dtype=np.uint8, buffer=self._shm.buf)
+
+    @property
+    def num_free(self) -> int:
+        return len(self._free)
+
+    def put(self, frame: np.ndarray) -> int | None:
+        """Copy ``frame`` into a free slot and return its index, or None if all slots are in use.
+
+        The frame can be (H, W, C) or (C, H, W), uint8 or float in [0, 1].
+        """
+        if not self._free:
+            return None
+        frame = to_hwc_uint8(frame)
+        if frame.shape != self.shape:
+            raise ValueError(
+                f"Frame of shape {frame.shape} does not fit the ring slots of shape {self.shape}."
+            )
+        slot = self._free.popleft()
+        np.copyto(self._slots[slot], frame)
+        return slot
+
+    def frame(self, slot: int) -> np.ndarray:
+        """(H, W, C) uint8 view of a slot. It is only valid until the slot is released."""
+        return self._slots[slot]
+
+    def release(self, slot: int) -> None:
+        """Return a slot to the free list. Producer side only."""
+        self._free.append(slot)
+
+    def reclaim(self, released: queue.Queue) -> None:
+        """Return to the free list every slot index the consumers sent back on ``released``."""
+        while True:
+            try:
+                self.release(released.get_nowait())
+            except queue.Empty:
+                return
+
+    def reset(self) -> None:
+        """Mark every slot as free, once no consumer uses the ring anymore."""
+        self._free = deque(range(self.num_slots))
+
+    def close(self) -> None:
+        """Unmap the slots, and free the shared memory block if this ring created it."""
+        if not self._owner:
+            return
+        self._slots = None
+        # Views of the slots still referenced elsewhere prevent unmapping, but not freeing the block
+        with contextlib.suppress(BufferError):
+            self._shm.close()
+        self._shm.unlink()
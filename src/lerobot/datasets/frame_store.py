@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Memory-mapped columnar cache of the numeric features of a dataset.
+
+Every numeric (non-visual, non-string) feature is laid out as one contiguous, fixed-dtype ``.npy`` file so
+that rows can be read with zero-copy slicing and ``torch.from_numpy``. The files are opened copy-on-write
+through the page cache, so all DataLoader workers share the same physical memory instead of each holding
+its own decoded copy of the Arrow tables.
+
+A store is built once per dataset version (see :func:`get_frame_store_dir`) and reused afterwards.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+
+import datasets
+import numpy as np
+import torch
+
+from lerobot.utils.constants import HF_LEROBOT_FRAME_STORE
+
+logger = logging.getLogger(__name__)
+
+FRAME_STORE_INFO = "frame_store.json"
+FRAME_STORE_BUILD_BATCH_SIZE = 10_000
+NON_NUMERIC_DTYPES = {"image", "video", "string"}
+
+
+def get_frame_store_features(features: dict[str, dict]) -> dict[str, dict]:
+    """Return the subset of ``features`` that can be stored as fixed-dtype arrays."""
+    return {key: ft for key, ft in features.items() if ft["dtype"] not in NON_NUMERIC_DTYPES}
+
+
+def get_frame_store_dtype(dtype: str) -> np.dtype:
+    """Storage dtype for a feature, matching what ``hf_transform_to_torch`` yields for it.
+
+    ``torch.tensor`` turns Python floats into the default float dtype and Python ints into int64, so the
+    store uses the same dtypes to keep items bit-identical with the parquet path.
+    """
+    np_dtype = np.dtype(dtype)
+    if np_dtype.kind == "f":
+        return np.dtype(np.float32)
+    if np_dtype.kind in "iu":
+        return np.dtype(np.int64)
+    return np_dtype
+
+
+def get_frame_store_dir(
+    repo_id: str, root: Path, features: dict[str, dict], episodes: list[int] | None
+) -> Path:
+    """Location of the frame store matching the current content of ``root/data``.
+
+    The directory name is a fingerprint of the feature spec, the episode selection, and the size and
+    modification time of every data file, so editing or re-downloading the dataset produces a new store.
+    """
+    data_files = sorted((root / "data").glob("*/*.parquet"))
+    fingerprint = {
+        "features": get_frame_store_features(features),
+        "episodes": sorted(episodes) if episodes is not None else None,
+        "files": [
+            (str(path.relative_to(root)), path.stat().st_size, path.stat().st_mtime_ns) for path in data_files
+        ],
+    }
+    digest = hashlib.sha256(json.dumps(fingerprint, sort_keys=True, default=str).encode()).hexdigest()
+    return HF_LEROBOT_FRAME_STORE / repo_id / digest[:16]
+
+
+class FrameStore:
+    """Read-only, memory-mapped columns indexed by *relative* row (same order as the HF dataset)."""
+
+    def __init__(self, store_dir: Path):
+        self.store_dir = Path(store_dir)
+        with open(self.store_dir / FRAME_STORE_INFO) as f:
+            info = json.load(f)
+        self.num_frames: int = info["num_frames"]
+        self.keys: list[str] = info["keys"]
+        self._open()
+
+    def _open(self) -> None:
+        # Copy-on-write so that ``torch.from_numpy`` gets writable arrays without ever touching the files
+        self.columns: dict[str, np.ndarray] = {
+            key: np.load(self.store_dir / f"{key}.npy", mmap_mode="c") for key in self.keys
+        }
+
+    def __getstate__(self) -> dict:
+        # Re-map on unpickling instead of serializing the arrays (e.g. with the "spawn" start method)
+        return {"store_dir": self.store_dir, "num_frames": self.num_frames, "keys": self.keys}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._open()
+
+    def __len__(self) -> int:
+        return self.num_frames
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.columns
+
+    def get_row(self, idx: int) -> dict[str, torch.Tensor]:
+        """Zero-copy views of every stored column at row ``idx``."""
+        # ``[idx, ...]`` returns a 0-d array view (rather than a scalar) for 1-D columns
+        return {key: torch.from_numpy(col[idx, ...]) for key, col in self.columns.items()}
+
+    def get_rows(self, key: str, indices: np.ndarray | list[int]) -> torch.Tensor:
+        """Gather rows of a column; the result has shape ``(*indices.shape, *feature_shape)``."""
+        return torch.from_numpy(self.columns[key][np.asarray(indices)])
+
+    @classmethod
+    def build(cls, hf_dataset: datasets.Dataset, features: dict[str, dict], store_dir: Path) -> "FrameStore":
+        """Write the numeric columns of ``hf_dataset`` to ``store_dir``.
+
+        The store is written to a temporary sibling directory and atomically moved in place, so concurrent
+        builders (e.g. several training processes) never observe a partial store.
+        """
+        store_dir = Path(store_dir)
+        store_features = {
+            key: ft
+            for key, ft in get_frame_store_features(features).items()
+            if key in hf_dataset.column_names
+        }
+        num_frames = len(hf_dataset)
+        tmp_dir = store_dir.with_name(f"{store_dir.name}.tmp-{os.getpid()}")
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            columns = {}
+            for key, ft in store_features.items():
+                shape = tuple(ft["shape"])
+                shape = () if shape == (1,) else shape
+                columns[key] = np.lib.format.open_memmap(
+                    tmp_dir / f"{key}.npy",
+                    mode="w+",
+                    dtype=get_frame_store_dtype(ft["dtype"]),
+                    shape=(num_frames, *shape),
+                )
+
+            np_dataset = hf_dataset.select_columns(list(store_features)).with_format("numpy")
+            for start in range(0, num_frames, FRAME_STORE_BUILD_BATCH_SIZE):
+                end = min(start + FRAME_STORE_BUILD_BATCH_SIZE, num_frames)
+                batch = np_dataset[start:end]
+                for key, col in columns.items():
+                    col[start:end] = np.asarray(batch[key]).reshape(end - start, *col.shape[1:])
+
+            for col in columns.values():
+                col.flush()
+            del columns
+
+            with open(tmp_dir / FRAME_STORE_INFO, "w") as f:
+                json.dump({"num_frames": num_frames, "keys": list(store_features)}, f, indent=4)
+
+            try:
+                os.replace(tmp_dir, store_dir)
+            except OSError:
+                # Another process finished building the same store first
+                if not (store_dir / FRAME_STORE_INFO).exists():
+                    raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        return cls(store_dir)
+
+    @classmethod
+    def load_or_build(
+        cls, hf_dataset: datasets.Dataset, features: dict[str, dict], store_dir: Path
+    ) -> "FrameStore":
+        """Open the store at ``store_dir``, building it from ``hf_dataset`` first if needed."""
+        store_dir = Path(store_dir)
+        if (store_dir / FRAME_STORE_INFO).exists():
+            store = cls(store_dir)
+            if len(store) == len(hf_dataset):
+                return store
+            logger.warning(f"Frame store at {store_dir} is stale, rebuilding it.")
+            shutil.rmtree(store_dir, ignore_errors=True)
+
+        logger.info(f"Building frame store for {len(hf_dataset)} frames at {store_dir}")
+        store_dir.parent.mkdir(parents=True, exist_ok=True)
+        return cls.build(hf_dataset, features, store_dir)
@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pre-decoded, downscaled "training views" of the camera frames of a dataset.
+
+Training a policy usually resizes (and crops) every camera frame to a small resolution, so decoding full
+resolution videos at every epoch is mostly wasted work. A frame view stores the frames of every camera key
+once, already resized and center-cropped to a :class:`FrameViewSpec`, as one uint8 ``(num_frames, C, H, W)``
+``.npy`` file per key, indexed by the absolute frame ``index``. The files are memory-mapped, so DataLoader
+workers share them through the page cache.
+
+Views are built with ``lerobot-edit-dataset --operation.type build_frame_view`` (see :func:`build_frame_view`)
+and picked up by ``LeRobotDataset(frame_view=spec)`` whenever one matching the dataset and the spec exists.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import torch
+from torchvision.transforms.v2 import functional as F  # noqa: N812
+from tqdm import tqdm
+
+from lerobot.datasets.dataset_metadata import LeRobotDatasetMetadata
+from lerobot.utils.constants import HF_LEROBOT_FRAME_VIEWS
+
+if TYPE_CHECKING:
+    from lerobot.datasets.lerobot_dataset import LeRobotDataset
+
+logger = logging.getLogger(__name__)
+
+FRAME_VIEW_INFO = "frame_view.json"
+# Memory budget of the full resolution frames of a camera decoded at once while building a view, in MB. The
+# frames are resized before the next ones are decoded, so this bounds the memory of a build.
+FRAME_VIEW_BUILD_CHUNK_MB = 256
+
+
+@dataclass(frozen=True)
+class FrameViewSpec:
+    """Target geometry of the camera frames of a training view.
+
+    Frames are first resized to ``resize``, then center-cropped to ``crop``. Both are ``(height, width)``
+    and optional.
+    """
+
+    resize: tuple[int, int] | None = None
+    crop: tuple[int, int] | None = None
+
+    def __post_init__(self) -> None:
+        if self.resize is None and self.crop is None:
+            raise ValueError("A frame view needs at least one of `resize` or `crop`.")
+        # Normalize lists (e.g. parsed from a config) so that equal specs hash equally
+        for name in ("resize", "crop"):
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, tuple(int(v) for v in value))
+
+    @property
+    def name(self) -> str:
+        parts = []
+        if self.resize is not None:
+            parts.append(f"resize-{self.resize[0]}x{self.resize[1]}")
+        if self.crop is not None:
+            parts.append(f"crop-{self.crop[0]}x{self.crop[1]}")
+        return "_".join(parts)
+
+    def apply(self, frames: torch.Tensor) -> torch.Tensor:
+        """Resize and crop uint8 frames of shape ``(..., C, H, W)``."""
+        if self.resize is not None:
+            frames = F.resize(frames, list(self.resize), antialias=True)
+        if self.crop is not None:
+            frames = F.center_crop(frames, list(self.crop))
+        return frames
+
+    def apply_to_float(self, frames: torch.Tensor) -> torch.Tensor:
+        """Same as :meth:`apply` for float frames in [0, 1], going through uint8 like a stored view does.
+
+        Decoded video frames and images are uint8 values divided by 255, so the round trip is exact and
+        frames transformed on the fly are identical to the ones read from a view.
+        """
+        frames = (frames * 255).round().to(torch.uint8)
+        return self.apply(frames).float() / 255
+
+
+def get_frame_view_dir(meta: LeRobotDatasetMetadata, spec: FrameViewSpec) -> Path:
+    """Location of the view of ``meta``'s dataset for ``spec``.
+
+    The directory name includes a fingerprint of the dataset info (features, number of frames, codecs...), so
+    a re-recorded or edited dataset never picks up the view of a previous version.
+    """
+    digest = hashlib.sha256(json.dumps(meta.info, sort_keys=True, default=str).encode()).hexdigest()
+    return HF_LEROBOT_FRAME_VIEWS / meta.repo_id / f"{spec.name}-{digest[:16]}"
+
+
+class FrameView:
+    """Read-only, memory-mapped uint8 frames indexed by *absolute* frame index."""
+
+    def __init__(self, view_dir: Path):
+        self.view_dir = Path(view_dir)
+        with open(self.view_dir / FRAME_VIEW_INFO) as f:
+            info = json.load(f)
+        self.num_frames: int = info["num_frames"]
+        self.keys: list[str] = info["keys"]
+        self.spec = FrameViewSpec(**info["spec"])
+        self._open()
+
+    def _open(self) -> None:
+        self.columns: dict[str, np.ndarray] = {
+            key: np.load(self.view_dir / f"{key}.npy", mmap_mode="c") for key in self.keys
+        }
+
+    def __getstate__(self) -> dict:
+        # Re-map on unpickling instead of serializing the arrays (e.g. with the "spawn" start method)
+        return {
+            "view_dir": self.view_dir,
+            "num_frames": self.num_frames,
+            "keys": self.keys,
+            "spec": self.spec,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._open()
+
+    def __len__(self) -> int:
+        return self.num_frames
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.columns
+
+    def get_frames(self, key: str, indices: int | np.ndarray | list[int]) -> torch.Tensor:
+        """Float frames in [0, 1] of shape ``(*indices.shape, C, H, W)``, like decoded video frames."""
+        frames = self.columns[key][np.asarray(indices)]
+        return torch.from_numpy(frames).float() / 255
+
+    @classmethod
+    def find(cls, meta: LeRobotDatasetMetadata, spec: FrameViewSpec) -> "FrameView | None":
+        """Open the view of ``meta``'s dataset matching ``spec``, if it was built."""
+        view_dir = get_frame_view_dir(meta, spec)
+        if not (view_dir / FRAME_VIEW_INFO).exists():
+            return None
+        view = cls(view_dir)
+        if len(view) != meta.total_frames:
+            logger.warning(f"Ignoring stale frame view at {view_dir}.")
+            return None
+        return view
+
+
+def _build_chunk_size(meta: LeRobotDatasetMetadata, key: str) -> int:
+    """Number of frames of camera ``key`` read at once while building a view, within
+    ``FRAME_VIEW_BUILD_CHUNK_MB``."""
+    # Videos are decoded to uint8 frames, images are read as float32 frames
+    bytes_per_value = 1 if key in meta.video_keys else 4
+    frame_bytes = math.prod(meta.features[key]["shape"]) * bytes_per_value
+    return max(1, int(FRAME_VIEW_BUILD_CHUNK_MB * 1024**2) // frame_bytes)
+
+
+def _read_camera_frames(dataset: "LeRobotDataset", key: str, start: int, end: int) -> torch.Tensor:
+    """uint8 frames of camera ``key`` for the dataset rows ``[start, end)``, all from a single episode."""
+    if key not in dataset.meta.video_keys:
+        frames = torch.stack(dataset.hf_dataset.select_columns(key)[start:end][key])
+        return (frames * 255).round().to(torch.uint8)
+
+    rows = dataset.hf_dataset.select_columns(["timestamp", "episode_index"])[start:end]
+    # Decode the whole chunk with one call, instead of seeking once per frame
+    timestamps = [ts.item() for ts in rows["timestamp"]]
+    request = dataset.reader._get_video_requests({key: timestamps}, rows["episode_index"][0].item())[key]
+    return dataset.reader._decode_videos({key: [request]}, as_uint8=True)[key][0]
+
+
+def build_frame_view(
+    dataset: "LeRobotDataset", spec: FrameViewSpec, view_dir: Path | None = None
+) -> FrameView:
+    """Decode every camera frame of ``dataset`` once, resize/crop it to ``spec`` and store it as a view.
+
+    The view is written to a temporary sibling directory and atomically moved in place, so that concurrent
+    readers never observe a partial view.
+
+    Args:
+        dataset: Dataset to materialize. It must include all its episodes.
+        spec: Target resize/crop of the frames.
+        view_dir: Where to write the view. Defaults to the location looked up by ``LeRobotDataset``
+            (see :func:`get_frame_view_dir`).
+    """
+    if dataset.episodes is not None:
+        raise ValueError("A frame view covers the whole dataset, load it without `episodes`.")
+    if len(dataset.meta.camera_keys) == 0:
+        raise ValueError(f"Dataset {dataset.repo_id} has no camera to build a frame view from.")
+
+    view_dir = Path(view_dir) if view_dir is not None else get_frame_view_dir(dataset.meta, spec)
+    num_frames = dataset.meta.total_frames
+    tmp_dir = view_dir.with_name(f"{view_dir.name}.tmp-{os.getpid()}")
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        columns: dict[str, np.ndarray] = {}
+        episodes = dataset.meta.episodes
+        for ep_idx in tqdm(range(len(episodes)), desc="Building frame view"):
+            ep_start = episodes[ep_idx]["dataset_from_index"]
+            ep_end = episodes[ep_idx]["dataset_to_index"]
+            # One camera at a time, so that a single chunk of full resolution frames is in memory
+            for key in dataset.meta.camera_keys:
+                chunk_size = _build_chunk_size(dataset.meta, key)
+                for start in range(ep_start, ep_end, chunk_size):
+                    end = min(start + chunk_size, ep_end)
+                    frames = spec.apply(_read_camera_frames(dataset, key, start, end))
+                    if key not in columns:
+                        columns[key] = np.lib.format.open_memmap(
+                            tmp_dir / f"{key}.npy",
+                            mode="w+",
+                            dtype=np.uint8,
+                            shape=(num_frames, *frames.shape[1:]),
+                        )
+                    columns[key][start:end] = frames.numpy()
+
+        for col in columns.values():
+            col.flush()
+        del columns
+
+        info = {"num_frames": num_frames, "keys": dataset.meta.camera_keys, "spec": asdict(spec)}
+        with open(tmp_dir / FRAME_VIEW_INFO, "w") as f:
+            json.dump(info, f, indent=4)
+
+        view_dir.parent.mkdir(parents=True, exist_ok=True)
+        if view_dir.exists():
+            shutil.rmtree(view_dir)
+        os.replace(tmp_dir, view_dir)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return FrameView(view_dir)
@@ -23,6 +23,8 @@ import numpy as np
 import PIL.Image
 import torch
 
+from lerobot.datasets.frame_ring import SharedFrameRing, to_hwc_uint8
+
 logger = logging.getLogger(__name__)
 
 
@@ -106,21 +108,27 @@ def write_image(image: np.ndarray | PIL.Image.Image, fpath: Path, compress_level
         logger.error("Error writing image %s: %s", fpath, e)
 
 
-def worker_thread_loop(queue: queue.Queue):
+def worker_thread_loop(queue: queue.Queue, released_queue: queue.Queue | None = None):
     while True:
         item = queue.get()
         if item is None:
             queue.task_done()
             break
-        image_array, fpath, compress_level = item
-        write_image(image_array, fpath, compress_level)
+        if isinstance(item[0], SharedFrameRing):
+            # The image is in a slot of a shared-memory ring, hand the slot back once written
+            frame_ring, slot, fpath, compress_level = item
+            write_image(frame_ring.frame(slot), fpath, compress_level)
+            released_queue.put((frame_ring.name, slot))
+        else:
+            image_array, fpath, compress_level = item
+            write_image(image_array, fpath, compress_level)
         queue.task_done()
 
 
-def worker_process(queue: queue.Queue, num_threads: int):
+def worker_process(queue: queue.Queue, num_threads: int, released_queue: queue.Queue | None = None):
     threads = []
     for _ in range(num_threads):
-        t = threading.Thread(target=worker_thread_loop, args=(queue,))
+        t = threading.Thread(target=worker_thread_loop, args=(queue, released_queue))
         t.daemon = True
         t.start()
         threads.append(t)
@@ -141,14 +149,21 @@ class AsyncImageWriter:
     The optimal number of processes and threads depends on your computer capabilities.
     We advise to use 4 threads per camera with 0 processes. If the fps is not stable, try to increase or lower
     the number of threads. If it is still not stable, try to use 1 subprocess, or more.
+
+    With processes, uint8 images are copied into a shared-memory ring of `shared_memory_slots` slots per image
+    shape (see `SharedFrameRing`) instead of being pickled through the queue. When all the slots are in use,
+    images are pickled as usual, so `save_image` never blocks.
     """
 
-    def __init__(self, num_processes: int = 0, num_threads: int = 1):
+    def __init__(self, num_processes: int = 0, num_threads: int = 1, shared_memory_slots: int = 16):
         self.num_processes = num_processes
         self.num_threads = num_threads
+        self.shared_memory_slots = shared_memory_slots
         self.queue = None
         self.threads = []
         self.processes = []
+        self._released_queue = None
+        self._frame_rings: dict[tuple[int, ...], SharedFrameRing] = {}
         self._stopped = False
 
         if num_threads <= 0 and num_processes <= 0:
@@ -165,8 +180,11 @@ class AsyncImageWriter:
         else:
             # Use multiprocessing
             self.queue = multiprocessing.JoinableQueue()
+            self._released_queue = multiprocessing.Queue()
             for _ in range(self.num_processes):
-                p = multiprocessing.Process(target=worker_process, args=(self.queue, self.num_threads))
+                p = multiprocessing.Process(
+                    target=worker_process, args=(self.queue, self.num_threads, self._released_queue)
+                )
                 p.daemon = True
                 p.start()
                 self.processes.append(p)
@@ -177,8 +195,39 @@ class AsyncImageWriter:
         if isinstance(image, torch.Tensor):
             # Convert tensor to numpy array to minimize main process time
             image = image.cpu().numpy()
+        if (
+            self.num_processes > 0
+            and self.shared_memory_slots > 0
+            and self._put_in_shared_memory(image, fpath, compress_level)
+        ):
+            return
         self.queue.put((image, fpath, compress_level))
 
+    def _put_in_shared_memory(self, image, fpath: Path, compress_level: int) -> bool:
+        # Float images go through the queue, so that their range is checked by `image_array_to_pil_image`
+        if not isinstance(image, np.ndarray) or image.dtype != np.uint8 or image.ndim != 3:
+            return False
+
+        self._reclaim_slots()
+        shape = to_hwc_uint8(image).shape
+        if shape not in self._frame_rings:
+            self._frame_rings[shape] = SharedFrameRing(shape, num_slots=self.shared_memory_slots)
+        frame_ring = self._frame_rings[shape]
+        slot = frame_ring.put(image)
+        if slot is None:
+            return False
+        self.queue.put((frame_ring, slot, fpath, compress_level))
+        return True
+
+    def _reclaim_slots(self) -> None:
+        rings_by_name = {frame_ring.name: frame_ring for frame_ring in self._frame_rings.values()}
+        while True:
+            try:
+                name, slot = self._released_queue.get_nowait()
+            except queue.Empty:
+                return
+            rings_by_name[name].release(slot)
+
     def wait_until_done(self):
         self.queue.join()
 
@@ -201,5 +250,10 @@ class AsyncImageWriter:
                     p.terminate()
             self.queue.close()
             self.queue.join_thread()
+            self._released_queue.close()
+            self._released_queue.cancel_join_thread()
+            for frame_ring in self._frame_rings.values():
+                frame_ring.close()
+            self._frame_rings.clear()
 
         self._stopped = True
@@ -27,6 +27,7 @@ from huggingface_hub.errors import RevisionNotFoundError
 from lerobot.datasets.dataset_metadata import CODEBASE_VERSION, LeRobotDatasetMetadata
 from lerobot.datasets.dataset_reader import DatasetReader
 from lerobot.datasets.dataset_writer import DatasetWriter
+from lerobot.datasets.frame_view import FrameViewSpec
 from lerobot.datasets.utils import (
     create_lerobot_dataset_card,
     get_safe_version,
@@ -60,6 +61,11 @@ class LeRobotDataset(torch.utils.data.Dataset):
         streaming_encoding: bool = False,
         encoder_queue_maxsize: int = 30,
         encoder_threads: int | None = None,
+        use_frame_store: bool = False,
+        video_frame_cache_mb: float = 0.0,
+        disabled_features: set[str] | None = None,
+        video_decode_threads: int = 0,
+        frame_view: FrameViewSpec | None = None,
     ):
         """
         2 modes are available for instantiating this class, depending on 2 different use cases:
@@ -183,6 +189,29 @@ class LeRobotDataset(torch.utils.data.Dataset):
             encoder_threads (int | None, optional): Number of threads per encoder instance. None lets the
                 codec auto-detect (default). Lower values reduce CPU usage per encoder. Maps to 'lp' (via svtav1-params) for
                 libsvtav1 and 'threads' for h264/hevc.
+            use_frame_store (bool, optional): If True, numeric features (state, action, timestamp, indices...)
+                are read from a memory-mapped columnar cache under $HF_LEROBOT_HOME/frame_store, built once per
+                dataset version, instead of decoding parquet rows on every access. The cache is shared across
+                DataLoader workers through the page cache. Defaults to False.
+            video_frame_cache_mb (float, optional): Memory budget in MB of the per-worker LRU cache of decoded
+                video frames, keyed by (video file, frame index). Useful when neighbouring samples or overlapping
+                delta_timestamps windows request the same frames. Only used by the torchcodec backend. Decoding
+                statistics are available through ``dataset.reader.decoder_cache.stats()``. Defaults to 0
+                (disabled).
+            disabled_features (set[str] | None, optional): Feature keys that are never read. Their parquet
+                columns are not loaded, their videos are neither downloaded nor decoded, and they are left out
+                of the returned items. Note that ``features`` and ``meta`` still describe the whole dataset.
+                Defaults to None.
+            video_decode_threads (int, optional): Size of the per-worker thread pool decoding the camera
+                streams of a sample (or of a batch, see ``get_items``) concurrently, so that multi-camera
+                datasets pay the latency of the slowest camera rather than the sum over all of them. Per-stage
+                read timings are available through ``dataset.reader.timing_stats()``. Defaults to 0 (cameras
+                are decoded one after the other).
+            frame_view (FrameViewSpec | None, optional): Resize and center crop applied to every camera frame
+                before ``image_transforms``. When a training view of the dataset was built for this spec (with
+                ``lerobot-edit-dataset --operation.type build_frame_view``), frames are read from its
+                pre-decoded, memory-mapped files instead of being decoded from the videos. Otherwise they are
+                decoded and transformed on the fly, with identical results. Defaults to None.
 
         Note:
             Write-mode parameters (``streaming_encoding``, ``batch_encoding_size``) passed to
@@ -201,6 +230,11 @@ class LeRobotDataset(torch.utils.data.Dataset):
         self._batch_encoding_size = batch_encoding_size
         self._vcodec = resolve_vcodec(vcodec)
         self._encoder_threads = encoder_threads
+        self._use_frame_store = use_frame_store
+        self._video_frame_cache_mb = video_frame_cache_mb
+        self._disabled_features = disabled_features
+        self._video_decode_threads = video_decode_threads
+        self._frame_view = frame_view
 
         if self._requested_root is not None:
             self._requested_root.mkdir(exist_ok=True, parents=True)
@@ -221,6 +255,11 @@ class LeRobotDataset(torch.utils.data.Dataset):
             video_backend=self._video_backend,
             delta_timestamps=delta_timestamps,
             image_transforms=image_transforms,
+            use_frame_store=use_frame_store,
+            video_frame_cache_mb=video_frame_cache_mb,
+            disabled_features=disabled_features,
+            video_decode_threads=video_decode_threads,
+            frame_view=frame_view,
         )
 
         # Load actual data
@@ -283,6 +322,11 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 video_backend=self._video_backend,
                 delta_timestamps=self.delta_timestamps,
                 image_transforms=self.image_transforms,
+                use_frame_store=self._use_frame_store,
+                video_frame_cache_mb=self._video_frame_cache_mb,
+                disabled_features=self._disabled_features,
+                video_decode_threads=self._video_decode_threads,
+                frame_view=self._frame_view,
             )
         return self.reader
 
@@ -292,6 +336,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         vcodec: str,
         encoder_queue_maxsize: int,
         encoder_threads: int | None,
+        encoder_processes: bool = False,
     ) -> StreamingVideoEncoder:
         return StreamingVideoEncoder(
             fps=fps,
@@ -302,6 +347,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
             preset=None,
             queue_maxsize=encoder_queue_maxsize,
             encoder_threads=encoder_threads,
+            use_processes=encoder_processes,
         )
 
     # ── Metadata properties ───────────────────────────────────────────
@@ -448,6 +494,43 @@ class LeRobotDataset(torch.utils.data.Dataset):
             reader.load_and_activate()
         return reader.get_item(idx)
 
+    def get_items(self, indices: list[int]) -> dict:
+        """Return a batch of frames as an already-collated dict.
+
+        Equivalent to collating ``[self[i] for i in indices]``, but delta-timestamp windows are
+        computed for the whole batch at once and non-video columns are fetched with a single
+        Arrow take. Delegates to :meth:`DatasetReader.get_items`.
+
+        Args:
+            indices: Indices into the (possibly episode-filtered) dataset.
+
+        Returns:
+            Dict mapping feature names to tensors with a leading batch dimension (``task`` and
+            ``subtask`` are lists of strings).
+
+        Raises:
+            RuntimeError: If the dataset is currently being recorded and
+                :meth:`finalize` has not been called yet.
+        """
+        if self.writer is not None and not self._is_finalized:
+            raise RuntimeError(
+                "Cannot read from a dataset that is being recorded. Call finalize() first, then access items."
+            )
+        reader = self._ensure_reader()
+        if reader.hf_dataset is None:
+            reader.load_and_activate()
+        return reader.get_items(indices)
+
+    def __getitems__(self, indices: list[int]) -> list[dict]:
+        """Batched fetch hook used by ``torch.utils.data.DataLoader`` when batching is enabled.
+
+        Builds the batch with :meth:`get_items` and hands it back as per-sample views so that any
+        ``collate_fn`` (including the default one, which stacks into shared memory in workers)
+        keeps working unchanged.
+        """
+        batch = self.get_items(indices)
+        return [{key: val[i] for key, val in batch.items()} for i in range(len(indices))]
+
     def select_columns(self, column_names: str | list[str]):
         """Select specific columns from the underlying dataset.
 
@@ -556,6 +639,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
     def _download(self, download_videos: bool = True) -> None:
         """Downloads the dataset from the given 'repo_id' at the provided version."""
         ignore_patterns = None if download_videos else "videos/"
+        if download_videos and self._disabled_features:
+            ignore_patterns = [
+                f"videos/{key}/*" for key in self.meta.video_keys if key in self._disabled_features
+            ] or None
         files = None
         if self.episodes is not None:
             # Reader is guaranteed to exist here (created in __init__ before _download)
@@ -609,6 +696,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
         streaming_encoding: bool = False,
         encoder_queue_maxsize: int = 30,
         encoder_threads: int | None = None,
+        encoder_processes: bool = False,
+        encoding_workers: int | None = None,
     ) -> "LeRobotDataset":
         """Create a new LeRobotDataset from scratch for recording data.
 
@@ -642,6 +731,12 @@ class LeRobotDataset(torch.utils.data.Dataset):
             encoder_queue_maxsize: Max buffered frames per camera when using
                 streaming encoding.
             encoder_threads: Threads per encoder instance. ``None`` for auto.
+            encoder_processes: If ``True``, run each streaming encoder in its own
+                subprocess, receiving frames through shared memory, instead of a
+                thread of the recording process.
+            encoding_workers: Number of processes encoding the videos of
+                (episode, camera) pairs in parallel when not streaming. ``None``
+                for one per camera, up to half of the CPU cores when batch-encoding.
 
         Returns:
             A new :class:`LeRobotDataset` in write mode.
@@ -669,6 +764,11 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj._batch_encoding_size = batch_encoding_size
         obj._vcodec = vcodec
         obj._encoder_threads = encoder_threads
+        obj._use_frame_store = False
+        obj._video_frame_cache_mb = 0.0
+        obj._disabled_features = None
+        obj._video_decode_threads = 0
+        obj._frame_view = None
 
         # Reader is lazily created on first access (write-only mode)
         obj.reader = None
@@ -676,7 +776,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         # Create writer
         streaming_enc = None
         if streaming_encoding and len(obj.meta.video_keys) > 0:
-            streaming_enc = cls._build_streaming_encoder(fps, vcodec, encoder_queue_maxsize, encoder_threads)
+            streaming_enc = cls._build_streaming_encoder(
+                fps, vcodec, encoder_queue_maxsize, encoder_threads, encoder_processes
+            )
         obj.writer = DatasetWriter(
             meta=obj.meta,
             root=obj.root,
@@ -684,6 +786,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
             encoder_threads=encoder_threads,
             batch_encoding_size=batch_encoding_size,
             streaming_encoder=streaming_enc,
+            encoding_workers=encoding_workers,
         )
 
         if image_writer_processes or image_writer_threads:
@@ -709,6 +812,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
         streaming_encoding: bool = False,
         encoder_queue_maxsize: int = 30,
         encoder_threads: int | None = None,
+        encoder_processes: bool = False,
+        encoding_workers: int | None = None,
     ) -> "LeRobotDataset":
         """Resume recording on an existing dataset.
 
@@ -738,6 +843,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 capture.
             encoder_queue_maxsize: Max buffered frames per camera for streaming.
             encoder_threads: Threads per encoder instance. ``None`` for auto.
+            encoder_processes: If ``True``, run each streaming encoder in its own
+                subprocess instead of a thread.
+            encoding_workers: Number of processes encoding the videos in parallel
+                when not streaming, see :meth:`create`.
 
         Returns:
             A :class:`LeRobotDataset` in write mode, ready to append episodes.
@@ -761,6 +870,11 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj._batch_encoding_size = batch_encoding_size
         obj._vcodec = vcodec
         obj._encoder_threads = encoder_threads
+        obj._use_frame_store = False
+        obj._video_frame_cache_mb = 0.0
+        obj._disabled_features = None
+        obj._video_decode_threads = 0
+        obj._frame_view = None
 
         if obj._requested_root is not None:
             obj._requested_root.mkdir(exist_ok=True, parents=True)
@@ -778,7 +892,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         streaming_enc = None
         if streaming_encoding and len(obj.meta.video_keys) > 0:
             streaming_enc = cls._build_streaming_encoder(
-                obj.meta.fps, vcodec, encoder_queue_maxsize, encoder_threads
+                obj.meta.fps, vcodec, encoder_queue_maxsize, encoder_threads, encoder_processes
             )
         obj.writer = DatasetWriter(
             meta=obj.meta,
@@ -788,6 +902,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
             batch_encoding_size=batch_encoding_size,
             streaming_encoder=streaming_enc,
             initial_frames=obj.meta.total_frames,
+            encoding_workers=encoding_workers,
         )
 
         if image_writer_processes or image_writer_threads:
@@ -13,6 +13,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import bisect
+import itertools
 import logging
 from collections.abc import Callable
 from pathlib import Path
@@ -22,8 +24,10 @@ import torch
 import torch.utils
 
 from lerobot.datasets.compute_stats import aggregate_stats
+from lerobot.datasets.dataset_metadata import LeRobotDatasetMetadata
 from lerobot.datasets.feature_utils import get_hf_features_from_features
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.datasets.sampler import WeightedDatasetSampler
 from lerobot.datasets.video_utils import VideoFrame
 from lerobot.utils.constants import HF_LEROBOT_HOME
 
@@ -34,7 +38,8 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
     """A dataset consisting of multiple underlying `LeRobotDataset`s.
 
     The underlying `LeRobotDataset`s are effectively concatenated, and this class adopts much of the API
-    structure of `LeRobotDataset`.
+    structure of `LeRobotDataset`. Use :meth:`make_sampler` to draw from the datasets according to
+    `sampling_weights` rather than proportionally to their number of frames.
     """
 
     def __init__(
@@ -47,41 +52,35 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
         tolerances_s: dict | None = None,
         download_videos: bool = True,
         video_backend: str | None = None,
+        sampling_weights: dict[str, float] | None = None,
     ):
         super().__init__()
         self.repo_ids = repo_ids
         self.root = Path(root) if root else HF_LEROBOT_HOME
         self.tolerances_s = tolerances_s if tolerances_s else dict.fromkeys(repo_ids, 0.0001)
-        # Construct the underlying datasets passing everything but `transform` and `delta_timestamps` which
-        # are handled by this class.
-        self._datasets = [
-            LeRobotDataset(
-                repo_id,
-                root=self.root / repo_id,
-                episodes=episodes[repo_id] if episodes else None,
-                image_transforms=image_transforms,
-                delta_timestamps=delta_timestamps,
-                tolerance_s=self.tolerances_s[repo_id],
-                download_videos=download_videos,
-                video_backend=video_backend,
+        if sampling_weights is not None and set(sampling_weights) != set(repo_ids):
+            raise ValueError(
+                f"sampling_weights must have one entry per repo_id, got {sorted(sampling_weights)} for "
+                f"{sorted(repo_ids)}."
             )
-            for repo_id in repo_ids
-        ]
+        self.sampling_weights = sampling_weights
 
         # Disable any data keys that are not common across all of the datasets. Note: we may relax this
         # restriction in future iterations of this class. For now, this is necessary at least for being able
-        # to use PyTorch's default DataLoader collate function.
+        # to use PyTorch's default DataLoader collate function. The keys are computed from the metadata
+        # only, so that the disabled columns and videos are never downloaded nor read.
+        metas = [LeRobotDatasetMetadata(repo_id, root=self.root / repo_id) for repo_id in repo_ids]
         self.disabled_features = set()
-        intersection_features = set(self._datasets[0].features)
-        for ds in self._datasets:
-            intersection_features.intersection_update(ds.features)
+        intersection_features = set(metas[0].features)
+        for meta in metas:
+            intersection_features.intersection_update(meta.features)
         if len(intersection_features) == 0:
             raise RuntimeError(
                 "Multiple datasets were provided but they had no keys common to all of them. "
                 "The multi-dataset functionality currently only keeps common keys."
             )
-        for repo_id, ds in zip(self.repo_ids, self._datasets, strict=True):
-            extra_keys = set(ds.features).difference(intersection_features)
+        for repo_id, meta in zip(self.repo_ids, metas, strict=True):
+            extra_keys = set(meta.features).difference(intersection_features)
             if extra_keys:
                 logger.warning(
                     f"keys {extra_keys} of {repo_id} were disabled as they are not contained in all the "
@@ -89,6 +88,25 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
                 )
                 self.disabled_features.update(extra_keys)
 
+        # Construct the underlying datasets passing everything but `transform` and `delta_timestamps` which
+        # are handled by this class.
+        self._datasets = [
+            LeRobotDataset(
+                repo_id,
+                root=self.root / repo_id,
+                episodes=episodes[repo_id] if episodes else None,
+                image_transforms=image_transforms,
+                delta_timestamps=delta_timestamps,
+                tolerance_s=self.tolerances_s[repo_id],
+                download_videos=download_videos,
+                video_backend=video_backend,
+                disabled_features=self.disabled_features & set(meta.features),
+            )
+            for repo_id, meta in zip(repo_ids, metas, strict=True)
+        ]
+        # End index (in the concatenation) of every dataset, for `bisect` lookups
+        self.cumulative_sizes = list(itertools.accumulate(len(dataset) for dataset in self._datasets))
+
         self.image_transforms = image_transforms
         self.delta_timestamps = delta_timestamps
         # TODO(rcadene, aliberts): We should not perform this aggregation for datasets
@@ -161,7 +179,7 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
     @property
     def num_frames(self) -> int:
         """Number of samples/frames."""
-        return sum(d.num_frames for d in self._datasets)
+        return self.cumulative_sizes[-1]
 
     @property
     def num_episodes(self) -> int:
@@ -184,24 +202,29 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
         if idx >= len(self):
             raise IndexError(f"Index {idx} out of bounds.")
         # Determine which dataset to get an item from based on the index.
-        start_idx = 0
-        dataset_idx = 0
-        for dataset in self._datasets:
-            if idx >= start_idx + dataset.num_frames:
-                start_idx += dataset.num_frames
-                dataset_idx += 1
-                continue
-            break
-        else:
-            raise AssertionError("We expect the loop to break out as long as the index is within bounds.")
+        dataset_idx = bisect.bisect_right(self.cumulative_sizes, idx)
+        start_idx = self.cumulative_sizes[dataset_idx - 1] if dataset_idx > 0 else 0
+        # Disabled features are never read by the underlying datasets (see `disabled_features`)
         item = self._datasets[dataset_idx][idx - start_idx]
         item["dataset_index"] = torch.tensor(dataset_idx)
-        for data_key in self.disabled_features:
-            if data_key in item:
-                del item[data_key]
-
         return item
 
+    def make_sampler(self, num_samples: int | None = None, seed: int | None = None) -> WeightedDatasetSampler:
+        """Sampler drawing each dataset with its probability from `sampling_weights`.
+
+        Without `sampling_weights`, datasets are weighted by their number of frames, which amounts to
+        sampling frames uniformly (with replacement).
+
+        Args:
+            num_samples: Number of samples per epoch. Defaults to the total number of frames.
+            seed: Seed of the per-epoch draws. If None, it is drawn from the global torch RNG.
+        """
+        sizes = [len(dataset) for dataset in self._datasets]
+        weights = (
+            sizes if self.sampling_weights is None else [self.sampling_weights[r] for r in self.repo_ids]
+        )
+        return WeightedDatasetSampler(sizes, weights, num_samples=num_samples, seed=seed)
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(\n"
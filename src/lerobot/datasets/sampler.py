@@ -14,25 +14,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 
+import numpy as np
 import torch
 
 logger = logging.getLogger(__name__)
 
 
+def _concat_ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Vectorized ``np.concatenate([np.arange(s, s + n) for s, n in zip(starts, lengths)])``."""
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(lengths.sum(), dtype=np.int64) + np.repeat(starts - offsets, lengths)
+
+
 class EpisodeAwareSampler:
     def __init__(
         self,
-        dataset_from_indices: list[int],
-        dataset_to_indices: list[int],
-        episode_indices_to_use: list | None = None,
+        dataset_from_indices: Sequence[int],
+        dataset_to_indices: Sequence[int],
+        episode_indices_to_use: Sequence[int] | None = None,
         drop_n_first_frames: int = 0,
         drop_n_last_frames: int = 0,
         shuffle: bool = False,
+        chunk_size: int = 1,
+        seed: int | None = None,
+        rank: int = 0,
+        world_size: int = 1,
     ):
         """Sampler that optionally incorporates episode boundary information.
 
+        The frame indices are kept in NumPy arrays and the permutation of every epoch is derived from
+        ``(seed, epoch)``, so the sampler is cheap to build on large datasets, all ranks agree on the order of
+        an epoch, and its position can be checkpointed with a few integers (see :meth:`state_dict`).
+
         Args:
             dataset_from_indices: List of indices containing the start of each episode in the dataset.
             dataset_to_indices: List of indices containing the end of each episode in the dataset.
@@ -41,46 +56,198 @@ class EpisodeAwareSampler:
             drop_n_first_frames: Number of frames to drop from the start of each episode.
             drop_n_last_frames: Number of frames to drop from the end of each episode.
             shuffle: Whether to shuffle the indices.
+            chunk_size: When shuffling, shuffle chunks of up to ``chunk_size`` consecutive frames of the same
+                episode instead of individual frames. Chunks are plain runs of consecutive frames, counted from
+                the first frame kept of each episode: they are not aligned to the keyframes of the videos. The
+                frames of a chunk are yielded back to back, so they land in the same batch and mostly share
+                their video seek/decode passes. Keep it at most the batch size. ``1`` shuffles individual
+                frames.
+            seed: Seed of the per-epoch permutations. It must be the same on every rank. If None, it is drawn
+                from the global torch RNG, so that ``set_seed`` makes runs reproducible.
+            rank: Rank of the current process when sharding the samples across processes.
+            world_size: Number of processes to shard the samples across. Every rank gets a contiguous block
+                of ``ceil(len(indices) / world_size)`` samples of the epoch order, the last block being padded
+                with samples from the start of the epoch so that all ranks yield the same number of samples.
         """
         if drop_n_first_frames < 0:
             raise ValueError(f"drop_n_first_frames must be >= 0, got {drop_n_first_frames}")
         if drop_n_last_frames < 0:
             raise ValueError(f"drop_n_last_frames must be >= 0, got {drop_n_last_frames}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        if world_size < 1 or not 0 <= rank < world_size:
+            raise ValueError(f"Invalid rank={rank} for world_size={world_size}")
+
+        from_indices = np.asarray(dataset_from_indices, dtype=np.int64).reshape(-1)
+        to_indices = np.asarray(dataset_to_indices, dtype=np.int64).reshape(-1)
+        if len(from_indices) != len(to_indices):
+            raise ValueError(
+                f"Got {len(from_indices)} episode start indices but {len(to_indices)} episode end indices."
+            )
+
+        if episode_indices_to_use is None:
+            selected = np.ones(len(from_indices), dtype=bool)
+        else:
+            selected = np.isin(np.arange(len(from_indices)), np.asarray(list(episode_indices_to_use)))
+
+        starts = from_indices + drop_n_first_frames
+        lengths = to_indices - drop_n_last_frames - starts
+        for episode_idx in np.flatnonzero(selected & (lengths <= 0)):
+            logger.warning(
+                "Episode %d has %d frames but drop_n_first_frames=%d and "
+                "drop_n_last_frames=%d removes all frames. Skipping.",
+                episode_idx,
+                to_indices[episode_idx] - from_indices[episode_idx],
+                drop_n_first_frames,
+                drop_n_last_frames,
+            )
+        keep = selected & (lengths > 0)
+        starts, lengths = starts[keep], lengths[keep]
 
-        indices = []
-        for episode_idx, (start_index, end_index) in enumerate(
-            zip(dataset_from_indices, dataset_to_indices, strict=True)
-        ):
-            if episode_indices_to_use is None or episode_idx in episode_indices_to_use:
-                ep_length = end_index - start_index
-                if drop_n_first_frames + drop_n_last_frames >= ep_length:
-                    logger.warning(
-                        "Episode %d has %d frames but drop_n_first_frames=%d and "
-                        "drop_n_last_frames=%d removes all frames. Skipping.",
-                        episode_idx,
-                        ep_length,
-                        drop_n_first_frames,
-                        drop_n_last_frames,
-                    )
-                    continue
-                indices.extend(range(start_index + drop_n_first_frames, end_index - drop_n_last_frames))
-
-        if not indices:
+        if lengths.sum() == 0:
             raise ValueError(
                 "No valid frames remain after applying drop_n_first_frames and drop_n_last_frames. "
                 "All episodes were either filtered out or had too few frames."
             )
 
-        self.indices = indices
+        self._indices = _concat_ranges(starts, lengths)
         self.shuffle = shuffle
+        self.chunk_size = chunk_size
+        self.seed = int(torch.empty((), dtype=torch.int64).random_().item()) if seed is None else seed
+        self.rank = rank
+        self.world_size = world_size
+        self.num_samples = -(-len(self._indices) // world_size)
+        self.epoch = 0
+        # Number of samples of the current epoch already yielded by this rank
+        self._position = 0
 
-    def __iter__(self) -> Iterator[int]:
+        # Offsets (in `self._indices`) of the chunks of consecutive frames, counted from the start of every
+        # episode so that they never cross episodes
+        ep_offsets = np.cumsum(lengths) - lengths
+        chunks_per_episode = -(-lengths // chunk_size)
+        chunk_rank = _concat_ranges(np.zeros_like(lengths), chunks_per_episode)
+        self._episode_chunk_starts = np.repeat(ep_offsets, chunks_per_episode) + chunk_rank * chunk_size
+        self._episode_chunk_ends = np.append(self._episode_chunk_starts[1:], len(self._indices))
+
+    @property
+    def indices(self) -> list[int]:
+        """Every frame index the sampler draws from, in dataset order (before sharding)."""
+        return self._indices.tolist()
+
+    def set_epoch(self, epoch: int) -> None:
+        """Select the permutation used by the next iteration, as with ``DistributedSampler``.
+
+        Calling it with the current epoch is a no-op, so that a restored mid-epoch position is kept. Epochs
+        also advance on their own once an iteration is exhausted.
+        """
+        if epoch != self.epoch:
+            self.epoch = epoch
+            self._position = 0
+
+    def _epoch_indices(self) -> np.ndarray:
+        """Frame indices of the current epoch for this rank."""
         if self.shuffle:
-            for i in torch.randperm(len(self.indices)):
-                yield self.indices[i]
+            rng = np.random.default_rng([self.seed, self.epoch])
+            if self.chunk_size > 1:
+                perm = rng.permutation(len(self._episode_chunk_starts))
+                order = _concat_ranges(
+                    self._episode_chunk_starts[perm],
+                    (self._episode_chunk_ends - self._episode_chunk_starts)[perm],
+                )
+            else:
+                order = rng.permutation(len(self._indices))
+            samples = self._indices[order]
         else:
-            for i in self.indices:
-                yield i
+            samples = self._indices
+
+        if self.world_size > 1:
+            # Wrap around so that every rank gets exactly `num_samples` samples
+            samples = np.resize(samples, self.num_samples * self.world_size)
+            samples = samples[self.rank * self.num_samples : (self.rank + 1) * self.num_samples]
+        return samples
+
+    def __iter__(self) -> Iterator[int]:
+        for idx in self._epoch_indices()[self._position :].tolist():
+            self._position += 1
+            yield idx
+        self.epoch += 1
+        self._position = 0
+
+    def __len__(self) -> int:
+        return self.num_samples
+
+    def state_dict(self) -> dict[str, int]:
+        """Position of the sampler, from which :meth:`load_state_dict` resumes the same epoch order.
+
+        The position counts the samples handed out by this sampler. When it feeds a ``DataLoader``, those
+        include the batches prefetched by the workers, so a training loop should rather checkpoint
+        :meth:`state_dict_after` the batches it actually consumed.
+        """
+        return {"seed": self.seed, "epoch": self.epoch, "position": self._position}
+
+    def state_dict_after(self, num_batches: int, batch_size: int) -> dict[str, int]:
+        """Position of the sampler once ``num_batches`` batches of ``batch_size`` samples were consumed from
+        the start of the first epoch, by a ``DataLoader`` keeping the last incomplete batch of every epoch.
+        """
+        batches_per_epoch = -(-self.num_samples // batch_size)
+        epoch, batch_idx = divmod(num_batches, batches_per_epoch)
+        return {"seed": self.seed, "epoch": epoch, "position": batch_idx * batch_size}
+
+    def load_state_dict(self, state_dict: dict[str, int]) -> None:
+        """Resume from a :meth:`state_dict`; the next iteration continues the epoch where it stopped."""
+        if not 0 <= state_dict["position"] <= self.num_samples:
+            raise ValueError(f"Invalid position {state_dict['position']} for {self.num_samples} samples")
+        self.seed = state_dict.get("seed", self.seed)
+        self.epoch = state_dict["epoch"]
+        self._position = state_dict["position"]
+
+
+class WeightedDatasetSampler:
+    def __init__(
+        self,
+        dataset_sizes: Sequence[int],
+        weights: Sequence[float],
+        num_samples: int | None = None,
+        seed: int | None = None,
+    ):
+        """Sampler drawing from a concatenation of datasets according to per-dataset mixture weights.
+
+        Every sample first picks a dataset with probability proportional to its weight, then a frame uniformly
+        within it. Only one cumulative size per dataset is stored, so memory and per-sample cost do not grow
+        with the number of frames, and drawing a whole epoch is a couple of vectorized NumPy calls.
+
+        Args:
+            dataset_sizes: Number of frames of each dataset, in concatenation order (e.g. as in
+                ``MultiLeRobotDataset``).
+            weights: Non-negative sampling weight of each dataset. They do not need to sum to 1.
+            num_samples: Number of samples per epoch. Defaults to the total number of frames.
+            seed: Seed of the per-epoch draws. If None, it is drawn from the global torch RNG.
+        """
+        sizes = np.asarray(dataset_sizes, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64)
+        if len(sizes) != len(weights):
+            raise ValueError(f"Got {len(weights)} weights for {len(sizes)} datasets.")
+        if (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError(f"Weights must be non-negative with a positive sum, got {weights.tolist()}")
+        if ((weights > 0) & (sizes == 0)).any():
+            raise ValueError("Empty datasets can't have a positive sampling weight.")
+
+        self.dataset_sizes = sizes
+        self.probabilities = weights / weights.sum()
+        self.num_samples = int(sizes.sum()) if num_samples is None else num_samples
+        self.seed = int(torch.empty((), dtype=torch.int64).random_().item()) if seed is None else seed
+        self.epoch = 0
+        self._dataset_starts = np.cumsum(sizes) - sizes
+
+    def set_epoch(self, epoch: int) -> None:
+        self.epoch = epoch
+
+    def __iter__(self) -> Iterator[int]:
+        rng = np.random.default_rng([self.seed, self.epoch])
+        dataset_indices = rng.choice(len(self.dataset_sizes), size=self.num_samples, p=self.probabilities)
+        offsets = rng.integers(0, self.dataset_sizes[dataset_indices])
+        self.epoch += 1
+        yield from (self._dataset_starts[dataset_indices] + offsets).tolist()
 
     def __len__(self) -> int:
-        return len(self.indices)
+        return self.num_samples
@@ -13,6 +13,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import queue
+import threading
+import time
 from collections import deque
 from collections.abc import Callable, Generator, Iterable, Iterator
 from pathlib import Path
@@ -196,6 +199,74 @@ class Backtrackable[T]:
             return False
 
 
+# Marks the end of a shard in the queue of a `ShardPrefetcher`
+_SHARD_EXHAUSTED = object()
+
+
+class ShardPrefetcher:
+    """Iterate over the frames of a shard ahead of time, on a background thread.
+
+    The thread pulls rows from the shard (fetching the underlying parquet bytes) and builds frames
+    (including video decoding) into a bounded queue of ``size`` frames, while the consumer yields frames
+    already in the queue. Frames come out in the exact same order as from the wrapped iterator, and
+    exceptions raised by the wrapped iterator are re-raised in the consumer.
+    """
+
+    def __init__(self, frames: Iterator[dict], size: int, name: str | None = None):
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        self._frames = frames
+        self._queue: queue.Queue = queue.Queue(maxsize=size)
+        self._stop = threading.Event()
+        self._exhausted = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            for frame in self._frames:
+                if not self._put(frame):
+                    return
+            self._put(_SHARD_EXHAUSTED)
+        except BaseException as e:  # noqa: BLE001 - forwarded to the consumer
+            self._put(e)
+
+    def _put(self, item) -> bool:
+        # Poll the stop event so that `close` never leaves the thread blocked on a full queue
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __iter__(self) -> "ShardPrefetcher":
+        return self
+
+    def __next__(self) -> dict:
+        if self._exhausted:
+            raise StopIteration
+        item = self._queue.get()
+        if item is _SHARD_EXHAUSTED:
+            self._exhausted = True
+            raise StopIteration
+        if isinstance(item, BaseException):
+            self._exhausted = True
+            raise item
+        return item
+
+    def close(self) -> None:
+        """Stop reading ahead. The thread exits after the frame it is currently building, if any."""
+        self._stop.set()
+        # Unblock a producer waiting for room in the queue
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+
 class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
     """LeRobotDataset with streaming capabilities.
 
@@ -207,6 +278,12 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
     items, allowing us to access previous frames for delta timestamps without loading the entire
     dataset into memory.
 
+    With ``prefetch_size > 0``, every shard is read on its own background thread (see
+    :class:`ShardPrefetcher`), so that fetching the data files and decoding the videos of several shards
+    overlap with each other and with the training step. The order of the frames does not change. Each
+    shard then decodes its videos with its own :class:`VideoDecoderCache`, as torchcodec decoders must not be
+    used by several threads at once.
+
     Example:
         Basic usage:
         ```python
@@ -250,6 +327,7 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
         seed: int = 42,
         rng: np.random.Generator | None = None,
         shuffle: bool = True,
+        prefetch_size: int = 0,
     ):
         """Initialize a StreamingLeRobotDataset.
 
@@ -270,6 +348,8 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
             seed (int, optional): Reproducibility random seed.
             rng (np.random.Generator | None, optional): Random number generator.
             shuffle (bool, optional): Whether to shuffle the dataset across exhaustions. Defaults to True.
+            prefetch_size (int, optional): Number of frames each shard builds ahead of time on a background
+                thread. 0 builds frames on the iterating thread, when they are needed. Defaults to 0.
         """
         super().__init__()
         self.repo_id = repo_id
@@ -287,6 +367,11 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
 
         self.streaming = streaming
         self.buffer_size = buffer_size
+        if prefetch_size < 0:
+            raise ValueError(f"prefetch_size must be >= 0, got {prefetch_size}")
+        self.prefetch_size = prefetch_size
+        self._timing_lock = threading.Lock()
+        self.reset_timing_stats()
 
         # We cache the video decoders to avoid re-initializing them at each frame (avoiding a ~10x slowdown)
         self.video_decoder_cache = None
@@ -321,6 +406,15 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
 
         self.num_shards = min(self.hf_dataset.num_shards, max_num_shards)
 
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_timing_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._timing_lock = threading.Lock()
+
     @property
     def num_frames(self):
         return self.meta.total_frames
@@ -333,6 +427,37 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
     def fps(self):
         return self.meta.fps
 
+    def reset_timing_stats(self) -> None:
+        self._num_items = 0
+        self._stall_s = 0.0
+        self._make_frame_s = 0.0
+
+    def timing_stats(self) -> dict[str, float]:
+        """Time spent since the last :meth:`reset_timing_stats`.
+
+        ``stall_s`` is the time the iterating thread waited for frames to be built, ``make_frame_s`` the time
+        spent building frames (summed over the prefetching threads, if any). When prefetching keeps up,
+        ``stall_s`` is much smaller than ``make_frame_s``.
+        """
+        return {"num_items": self._num_items, "stall_s": self._stall_s, "make_frame_s": self._make_frame_s}
+
+    def _iter_shard_frames(
+        self, dataset_iterator: Backtrackable, decoder_cache: VideoDecoderCache | None = None
+    ) -> Iterator[dict]:
+        """Frames of a shard, until it is exhausted."""
+        while True:
+            start = time.perf_counter()
+            try:
+                frame = next(self.make_frame(dataset_iterator, decoder_cache))
+            except (
+                RuntimeError,
+                StopIteration,
+            ):  # NOTE: StopIteration inside a generator throws a RuntimeError since python 3.7
+                return
+            with self._timing_lock:
+                self._make_frame_s += time.perf_counter() - start
+            yield frame
+
     @staticmethod
     def _iter_random_indices(
         rng: np.random.Generator, buffer_size: int, random_batch_size=100
@@ -345,10 +470,6 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
         while True:
             yield rng.choice(elements)
 
-    # TODO(fracapuano): Implement multi-threaded prefetching to accelerate data loading.
-    # The current sequential iteration is a bottleneck. A producer-consumer pattern
-    # could be used with a ThreadPoolExecutor to run `make_frame` (especially video decoding)
-    # in parallel, feeding a queue from which this iterator will yield processed items.
     def __iter__(self) -> Iterator[dict[str, torch.Tensor]]:
         if self.video_decoder_cache is None:
             self.video_decoder_cache = VideoDecoderCache()
@@ -358,38 +479,55 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
 
         buffer_indices_generator = self._iter_random_indices(rng, self.buffer_size)
 
-        idx_to_backtrack_dataset = {
-            idx: self._make_backtrackable_dataset(safe_shard(self.hf_dataset, idx, self.num_shards))
+        idx_to_shard_frames: dict[int, Iterator[dict]] = {
+            idx: self._iter_shard_frames(
+                self._make_backtrackable_dataset(safe_shard(self.hf_dataset, idx, self.num_shards)),
+                # The prefetching threads must not share decoders, which are not thread-safe
+                decoder_cache=VideoDecoderCache() if self.prefetch_size > 0 else self.video_decoder_cache,
+            )
             for idx in range(self.num_shards)
         }
+        if self.prefetch_size > 0:
+            # All the shards are read concurrently, each one up to `prefetch_size` frames ahead
+            idx_to_shard_frames = {
+                idx: ShardPrefetcher(frames, self.prefetch_size, name=f"lerobot-stream-shard-{idx}")
+                for idx, frames in idx_to_shard_frames.items()
+            }
 
-        # This buffer is populated while iterating on the dataset's shards
-        # the logic is to add 2 levels of randomness:
-        # (1) sample one shard at random from the ones available, and
-        # (2) sample one frame from the shard sampled at (1)
-        frames_buffer = []
-        while available_shards := list(idx_to_backtrack_dataset.keys()):
-            shard_key = next(self._infinite_generator_over_elements(rng, available_shards))
-            backtrack_dataset = idx_to_backtrack_dataset[shard_key]  # selects which shard to iterate on
-
-            try:
-                for frame in self.make_frame(backtrack_dataset):
-                    if len(frames_buffer) == self.buffer_size:
-                        i = next(buffer_indices_generator)  # samples a element from the buffer
-                        yield frames_buffer[i]
-                        frames_buffer[i] = frame
-                    else:
-                        frames_buffer.append(frame)
-                    break  # random shard sampled, switch shard
-            except (
-                RuntimeError,
-                StopIteration,
-            ):  # NOTE: StopIteration inside a generator throws a RuntimeError since python 3.7
-                del idx_to_backtrack_dataset[shard_key]  # Remove exhausted shard, onto another shard
+        try:
+            # This buffer is populated while iterating on the dataset's shards
+            # the logic is to add 2 levels of randomness:
+            # (1) sample one shard at random from the ones available, and
+            # (2) sample one frame from the shard sampled at (1)
+            frames_buffer = []
+            while available_shards := list(idx_to_shard_frames.keys()):
+                shard_key = next(self._infinite_generator_over_elements(rng, available_shards))
+
+                start = time.perf_counter()
+                try:
+                    frame = next(idx_to_shard_frames[shard_key])  # selects which shard to iterate on
+                except StopIteration:
+                    del idx_to_shard_frames[shard_key]  # Remove exhausted shard, onto another shard
+                    continue
+                finally:
+                    self._stall_s += time.perf_counter() - start
+
+                self._num_items += 1
+                if len(frames_buffer) == self.buffer_size:
+                    i = next(buffer_indices_generator)  # samples a element from the buffer
+                    yield frames_buffer[i]
+                    frames_buffer[i] = frame
+                else:
+                    frames_buffer.append(frame)
 
-        # Once shards are all exhausted, shuffle the buffer and yield the remaining frames
-        rng.shuffle(frames_buffer)
-        yield from frames_buffer
+            # Once shards are all exhausted, shuffle the buffer and yield the remaining frames
+            rng.shuffle(frames_buffer)
+            yield from frames_buffer
+        finally:
+            # Stop the prefetching threads when the iteration ends early (e.g. `break` in the training loop)
+            for shard_frames in idx_to_shard_frames.values():
+                if isinstance(shard_frames, ShardPrefetcher):
+                    shard_frames.close()
 
     def _get_window_steps(
         self, delta_timestamps: dict[str, list[float]] | None = None, dynamic_bounds: bool = False
@@ -414,7 +552,8 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
 
     def _make_backtrackable_dataset(self, dataset: datasets.IterableDataset) -> Backtrackable:
         lookback, lookahead = self._get_window_steps(self.delta_timestamps)
-        return Backtrackable(dataset, history=lookback, lookahead=lookahead)
+        # Convert the rows once when they are read, rather than every time they are part of a delta window
+        return Backtrackable(map(item_to_torch, dataset), history=lookback, lookahead=lookahead)
 
     def _make_timestamps_from_indices(
         self, start_ts: float, indices: dict[str, list[int]] | None = None
@@ -460,10 +599,12 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
 
         return padding_mask
 
-    def make_frame(self, dataset_iterator: Backtrackable) -> Generator:
-        """Makes a frame starting from a dataset iterator"""
+    def make_frame(
+        self, dataset_iterator: Backtrackable, decoder_cache: VideoDecoderCache | None = None
+    ) -> Generator:
+        """Makes a frame starting from a dataset iterator, decoding videos with `decoder_cache` (defaults to
+        the decoder cache of the dataset)"""
         item = next(dataset_iterator)
-        item = item_to_torch(item)
 
         updates = []  # list of "updates" to apply to the item retrieved from hf_dataset (w/o camera features)
 
@@ -495,7 +636,7 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
             query_timestamps = self._get_query_timestamps(
                 current_ts, self.delta_indices, episode_boundaries_ts
             )
-            video_frames = self._query_videos(query_timestamps, ep_idx)
+            video_frames = self._query_videos(query_timestamps, ep_idx, decoder_cache)
 
             if self.image_transforms is not None:
                 image_keys = self.meta.camera_keys
@@ -540,7 +681,12 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
 
         return query_timestamps
 
-    def _query_videos(self, query_timestamps: dict[str, list[float]], ep_idx: int) -> dict:
+    def _query_videos(
+        self,
+        query_timestamps: dict[str, list[float]],
+        ep_idx: int,
+        decoder_cache: VideoDecoderCache | None = None,
+    ) -> dict:
         """Note: When using data workers (e.g. DataLoader with num_workers>0), do not call this function
         in the main process (e.g. by using a second Dataloader with num_workers=0). It will result in a
         Segmentation Fault. This probably happens because a memory reference to the video loader is created in
@@ -552,7 +698,10 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
             root = self.meta.url_root if self.streaming and not self.streaming_from_local else self.root
             video_path = f"{root}/{self.meta.get_video_file_path(ep_idx, video_key)}"
             frames = decode_video_frames_torchcodec(
-                video_path, query_ts, self.tolerance_s, decoder_cache=self.video_decoder_cache
+                video_path,
+                query_ts,
+                self.tolerance_s,
+                decoder_cache=decoder_cache if decoder_cache is not None else self.video_decoder_cache,
             )
 
             item[video_key] = frames.squeeze(0) if len(query_ts) == 1 else frames
@@ -612,7 +761,6 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
                     steps_back = abs(delta)
                     if dataset_iterator.can_peek_back(steps_back):
                         past_item = dataset_iterator.peek_back(steps_back)
-                        past_item = item_to_torch(past_item)
 
                         if past_item["episode_index"] == current_episode_idx:
                             delta_results[delta] = (past_item[key], False)
@@ -639,7 +787,6 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
                 try:
                     if dataset_iterator.can_peek_ahead(delta):
                         future_item = dataset_iterator.peek_ahead(delta)
-                        future_item = item_to_torch(future_item)
 
                         if future_item["episode_index"] == current_episode_idx:
                             delta_results[delta] = (future_item[key], False)
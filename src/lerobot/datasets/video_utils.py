@@ -17,11 +17,14 @@ import contextlib
 import glob
 import importlib
 import logging
+import multiprocessing
 import queue
 import shutil
 import tempfile
 import threading
 import warnings
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from fractions import Fraction
 from pathlib import Path
@@ -37,6 +40,8 @@ import torchvision
 from datasets.features.features import register_feature
 from PIL import Image
 
+from lerobot.datasets.frame_ring import SharedFrameRing, to_hwc_uint8
+
 logger = logging.getLogger(__name__)
 
 # List of hardware encoders to probe for auto-selection. Availability depends on the platform and FFmpeg build.
@@ -52,6 +57,9 @@ HW_ENCODERS = [
 
 VALID_VIDEO_CODECS = {"h264", "hevc", "libsvtav1", "auto"} | set(HW_ENCODERS)
 
+# Upper bound on simultaneously open video decoders (and file handles) per VideoDecoderCache.
+DEFAULT_MAX_OPEN_DECODERS = 128
+
 
 def _get_codec_options(
     vcodec: str,
@@ -131,6 +139,8 @@ def decode_video_frames(
     timestamps: list[float],
     tolerance_s: float,
     backend: str | None = None,
+    decoder_cache: "VideoDecoderCache | None" = None,
+    as_uint8: bool = False,
 ) -> torch.Tensor:
     """
     Decodes video frames using the specified backend.
@@ -140,6 +150,10 @@ def decode_video_frames(
         timestamps (list[float]): List of timestamps to extract frames.
         tolerance_s (float): Allowed deviation in seconds for frame retrieval.
         backend (str, optional): Backend to use for decoding. Defaults to "torchcodec" when available in the platform; otherwise, defaults to "pyav"..
+        decoder_cache (VideoDecoderCache, optional): Decoder/frame cache used by the torchcodec backend.
+            Defaults to the module-level cache.
+        as_uint8 (bool, optional): Return the uint8 frames of the decoder instead of float32 frames in [0, 1],
+            which take 4 times less memory. Defaults to False.
 
     Returns:
         torch.Tensor: Decoded frames.
@@ -149,9 +163,13 @@ def decode_video_frames(
     if backend is None:
         backend = get_safe_default_codec()
     if backend == "torchcodec":
-        return decode_video_frames_torchcodec(video_path, timestamps, tolerance_s)
+        return decode_video_frames_torchcodec(
+            video_path, timestamps, tolerance_s, decoder_cache=decoder_cache, as_uint8=as_uint8
+        )
     elif backend in ["pyav", "video_reader"]:
-        return decode_video_frames_torchvision(video_path, timestamps, tolerance_s, backend)
+        return decode_video_frames_torchvision(
+            video_path, timestamps, tolerance_s, backend, as_uint8=as_uint8
+        )
     else:
         raise ValueError(f"Unsupported video backend: {backend}")
 
@@ -162,10 +180,12 @@ def decode_video_frames_torchvision(
     tolerance_s: float,
     backend: str = "pyav",
     log_loaded_timestamps: bool = False,
+    as_uint8: bool = False,
 ) -> torch.Tensor:
     """Loads frames associated to the requested timestamps of a video
 
-    The backend can be either "pyav" (default) or "video_reader".
+    The backend can be either "pyav" (default) or "video_reader". Frames are returned as float32 in [0, 1],
+    or as the uint8 frames of the decoder with `as_uint8=True`.
     "video_reader" requires installing torchvision from source, see:
     https://github.com/pytorch/vision/blob/main/torchvision/csrc/io/decoder/gpu/README.rst
     (note that you need to compile against ffmpeg<4.3)
@@ -249,7 +269,8 @@ def decode_video_frames_torchvision(
         logger.info(f"{closest_ts=}")
 
     # convert to the pytorch format which is float32 in [0,1] range (and channel first)
-    closest_frames = closest_frames.type(torch.float32) / 255
+    if not as_uint8:
+        closest_frames = closest_frames.type(torch.float32) / 255
 
     if len(timestamps) != len(closest_frames):
         raise FrameTimestampError(
@@ -260,11 +281,43 @@ def decode_video_frames_torchvision(
 
 
 class VideoDecoderCache:
-    """Thread-safe cache for video decoders to avoid expensive re-initialization."""
+    """Thread-safe cache for video decoders to avoid expensive re-initialization.
+
+    Decoders are kept in LRU order and at most ``max_decoders`` of them stay open, so that long runs over
+    thousands of video files do not leak file descriptors. Optionally, decoded frames are also cached, keyed
+    by ``(video path, frame index)``, within a ``frame_cache_size_mb`` memory budget with LRU eviction, so that
+    neighbouring samples and overlapping ``delta_timestamps`` windows do not decode the same frames again.
 
-    def __init__(self):
-        self._cache: dict[str, tuple[Any, Any]] = {}
+    Each DataLoader worker holds its own copy: pickling only transfers the configuration, not the cached
+    decoders or frames.
+    """
+
+    def __init__(
+        self, max_decoders: int | None = DEFAULT_MAX_OPEN_DECODERS, frame_cache_size_mb: float = 0.0
+    ):
+        if max_decoders is not None and max_decoders < 1:
+            raise ValueError(f"max_decoders must be positive or None, got {max_decoders}")
+        if frame_cache_size_mb < 0:
+            raise ValueError(f"frame_cache_size_mb must be non-negative, got {frame_cache_size_mb}")
+        self.max_decoders = max_decoders
+        self.frame_cache_size_mb = frame_cache_size_mb
+        self._max_frame_bytes = int(frame_cache_size_mb * 1024**2)
+        self._init_state()
+
+    def _init_state(self) -> None:
+        self._cache: OrderedDict[str, tuple[Any, Any]] = OrderedDict()
+        self._frames: OrderedDict[tuple[str, int], tuple[torch.Tensor, float]] = OrderedDict()
+        self._frame_bytes = 0
         self._lock = Lock()
+        self.frame_hits = 0
+        self.frame_misses = 0
+        self.decoder_evictions = 0
+
+    def __getstate__(self) -> dict:
+        return {"max_decoders": self.max_decoders, "frame_cache_size_mb": self.frame_cache_size_mb}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
 
     def get_decoder(self, video_path: str):
         """Get a cached decoder or create a new one."""
@@ -276,19 +329,80 @@ class VideoDecoderCache:
         video_path = str(video_path)
 
         with self._lock:
-            if video_path not in self._cache:
+            if video_path in self._cache:
+                self._cache.move_to_end(video_path)
+            else:
                 file_handle = fsspec.open(video_path).__enter__()
                 decoder = VideoDecoder(file_handle, seek_mode="approximate")
                 self._cache[video_path] = (decoder, file_handle)
+                self._evict_decoders()
 
             return self._cache[video_path][0]
 
+    def _evict_decoders(self) -> None:
+        while self.max_decoders is not None and len(self._cache) > self.max_decoders:
+            _, (decoder, file_handle) = self._cache.popitem(last=False)
+            # Another thread may still be decoding with it: close the file once the decoder is released
+            weakref.finalize(decoder, file_handle.close)
+            self.decoder_evictions += 1
+
+    def get_frames(self, video_path: str, frame_indices: list[int]) -> dict[int, tuple[torch.Tensor, float]]:
+        """Return the cached ``(frame, pts_seconds)`` pairs among ``frame_indices``, counting hits/misses."""
+        if self._max_frame_bytes == 0:
+            return {}
+        video_path = str(video_path)
+        found = {}
+        with self._lock:
+            for idx in frame_indices:
+                key = (video_path, idx)
+                if key in self._frames:
+                    self._frames.move_to_end(key)
+                    found[idx] = self._frames[key]
+                    self.frame_hits += 1
+                else:
+                    self.frame_misses += 1
+        return found
+
+    def put_frames(
+        self, video_path: str, frame_indices: list[int], frames: torch.Tensor, pts_seconds: list[float]
+    ) -> None:
+        """Insert decoded frames, evicting least recently used ones to stay within the memory budget."""
+        if self._max_frame_bytes == 0:
+            return
+        video_path = str(video_path)
+        with self._lock:
+            for idx, frame, pts in zip(frame_indices, frames, pts_seconds, strict=True):
+                key = (video_path, idx)
+                nbytes = frame.element_size() * frame.nelement()
+                if key in self._frames or nbytes > self._max_frame_bytes:
+                    continue
+                # Clone so that cached frames don't keep the whole decoded batch alive
+                self._frames[key] = (frame.clone(), pts)
+                self._frame_bytes += nbytes
+            while self._frame_bytes > self._max_frame_bytes:
+                _, (frame, _) = self._frames.popitem(last=False)
+                self._frame_bytes -= frame.element_size() * frame.nelement()
+
+    def stats(self) -> dict[str, int]:
+        """Counters describing the cache usage, e.g. for logging from DataLoader workers."""
+        with self._lock:
+            return {
+                "num_decoders": len(self._cache),
+                "decoder_evictions": self.decoder_evictions,
+                "num_cached_frames": len(self._frames),
+                "frame_cache_bytes": self._frame_bytes,
+                "frame_hits": self.frame_hits,
+                "frame_misses": self.frame_misses,
+            }
+
     def clear(self):
         """Clear the cache and close file handles."""
         with self._lock:
             for _, file_handle in self._cache.values():
                 file_handle.close()
             self._cache.clear()
+            self._frames.clear()
+            self._frame_bytes = 0
 
     def size(self) -> int:
         """Return the number of cached decoders."""
@@ -311,6 +425,7 @@ def decode_video_frames_torchcodec(
     tolerance_s: float,
     log_loaded_timestamps: bool = False,
     decoder_cache: VideoDecoderCache | None = None,
+    as_uint8: bool = False,
 ) -> torch.Tensor:
     """Loads frames associated with the requested timestamps of a video using torchcodec.
 
@@ -320,6 +435,7 @@ def decode_video_frames_torchcodec(
         tolerance_s: Allowed deviation in seconds for frame retrieval.
         log_loaded_timestamps: Whether to log loaded timestamps.
         decoder_cache: Optional decoder cache instance. Uses default if None.
+        as_uint8: Return the uint8 frames of the decoder instead of float32 frames in [0, 1].
 
     Note: Setting device="cuda" outside the main process, e.g. in data loader workers, will lead to CUDA initialization errors.
 
@@ -343,12 +459,20 @@ def decode_video_frames_torchcodec(
     average_fps = metadata.average_fps
     # convert timestamps to frame indices
     frame_indices = [round(ts * average_fps) for ts in timestamps]
-    # retrieve frames based on indices
-    frames_batch = decoder.get_frames_at(indices=frame_indices)
-
-    for frame, pts in zip(frames_batch.data, frames_batch.pts_seconds, strict=True):
+    # only decode the frames that are not already in the decoded-frame cache
+    cached = decoder_cache.get_frames(video_path, frame_indices)
+    missing_indices = list(dict.fromkeys(idx for idx in frame_indices if idx not in cached))
+    if missing_indices:
+        # retrieve frames based on indices
+        frames_batch = decoder.get_frames_at(indices=missing_indices)
+        pts_seconds = frames_batch.pts_seconds.tolist()
+        decoder_cache.put_frames(video_path, missing_indices, frames_batch.data, pts_seconds)
+        cached.update(zip(missing_indices, zip(frames_batch.data, pts_seconds, strict=True), strict=True))
+
+    for idx in frame_indices:
+        frame, pts = cached[idx]
         loaded_frames.append(frame)
-        loaded_ts.append(pts.item())
+        loaded_ts.append(pts)
         if log_loaded_timestamps:
             logger.info(f"Frame loaded at timestamp={pts:.4f}")
 
@@ -379,7 +503,8 @@ def decode_video_frames_torchcodec(
         logger.info(f"{closest_ts=}")
 
     # convert to float32 in [0,1] range
-    closest_frames = (closest_frames / 255.0).type(torch.float32)
+    if not as_uint8:
+        closest_frames = (closest_frames / 255.0).type(torch.float32)
 
     if not len(timestamps) == len(closest_frames):
         raise FrameTimestampError(
@@ -569,14 +694,144 @@ def concatenate_video_files(
     Path(tmp_concatenate_path).unlink()
 
 
-class _CameraEncoderThread(threading.Thread):
-    """A thread that encodes video frames streamed via a queue into an MP4 file.
+def _encode_camera_stream(
+    video_path: Path,
+    fps: int,
+    vcodec: str,
+    pix_fmt: str,
+    g: int | None,
+    crf: int | None,
+    preset: int | None,
+    frame_queue: queue.Queue,
+    result_queue: queue.Queue,
+    stop_event: threading.Event,
+    encoder_threads: int | None = None,
+    released_queue: queue.Queue | None = None,
+) -> None:
+    """Encode the frames received on `frame_queue` into an MP4 file, and put the result on `result_queue`.
 
-    One instance is created per camera per episode. Frames are received as numpy arrays
-    from the main thread, encoded in real-time using PyAV (which releases the GIL during
-    encoding), and written to disk. Stats are computed incrementally using
-    RunningQuantileStats and returned via result_queue.
+    Items of `frame_queue` are either frames as numpy arrays, a `SharedFrameRing`, or the index of a slot of
+    the last received ring holding the next frame. Slot indices are sent back on `released_queue` as soon as
+    the frame has been encoded. `None` finishes the video.
     """
+    from lerobot.datasets.compute_stats import RunningQuantileStats, auto_downsample_height_width
+
+    container = None
+    output_stream = None
+    stats_tracker = RunningQuantileStats()
+    frame_count = 0
+    frame_ring: SharedFrameRing | None = None
+    slot = None
+
+    try:
+        logging.getLogger("libav").setLevel(av.logging.WARNING)
+
+        while True:
+            try:
+                item = frame_queue.get(timeout=1)
+            except queue.Empty:
+                if stop_event.is_set():
+                    break
+                continue
+
+            if item is None:
+                # Sentinel: flush and close
+                break
+
+            if isinstance(item, SharedFrameRing):
+                frame_ring = item
+                continue
+
+            slot = None
+            if isinstance(item, int):
+                # Zero-copy view of the frame in shared memory
+                slot = item
+                frame_data = frame_ring.frame(slot)
+            else:
+                # Ensure HWC uint8 numpy array
+                frame_data = to_hwc_uint8(item)
+
+            # Open container on first frame (to get width/height)
+            if container is None:
+                height, width = frame_data.shape[:2]
+                video_options = _get_codec_options(vcodec, g, crf, preset)
+                if encoder_threads is not None:
+                    if vcodec == "libsvtav1":
+                        lp_param = f"lp={encoder_threads}"
+                        if "svtav1-params" in video_options:
+                            video_options["svtav1-params"] += f":{lp_param}"
+                        else:
+                            video_options["svtav1-params"] = lp_param
+                    else:
+                        video_options["threads"] = str(encoder_threads)
+                Path(video_path).parent.mkdir(parents=True, exist_ok=True)
+                container = av.open(str(video_path), "w")
+                output_stream = container.add_stream(vcodec, fps, options=video_options)
+                output_stream.pix_fmt = pix_fmt
+                output_stream.width = width
+                output_stream.height = height
+                output_stream.time_base = Fraction(1, fps)
+
+            # Encode frame with explicit timestamps. The frame is copied straight from the array.
+            video_frame = av.VideoFrame.from_ndarray(np.ascontiguousarray(frame_data), format="rgb24")
+            video_frame.pts = frame_count
+            video_frame.time_base = Fraction(1, fps)
+            packet = output_stream.encode(video_frame)
+            if packet:
+                container.mux(packet)
+
+            # Update stats with downsampled frame (per-channel stats like compute_episode_stats)
+            img_chw = frame_data.transpose(2, 0, 1)  # HWC -> CHW
+            img_downsampled = auto_downsample_height_width(img_chw)
+            # Reshape CHW to (H*W, C) for per-channel stats
+            channels = img_downsampled.shape[0]
+            img_for_stats = img_downsampled.transpose(1, 2, 0).reshape(-1, channels)
+            stats_tracker.update(img_for_stats)
+
+            if slot is not None:
+                released_queue.put(slot)
+                slot = None
+
+            frame_count += 1
+
+        # Flush encoder
+        if output_stream is not None:
+            packet = output_stream.encode()
+            if packet:
+                container.mux(packet)
+
+        if container is not None:
+            container.close()
+
+        av.logging.restore_default_callback()
+
+        # Get stats and put on result queue
+        if frame_count >= 2:
+            stats = stats_tracker.get_statistics()
+            result_queue.put(("ok", stats))
+        else:
+            result_queue.put(("ok", None))
+
+    except Exception as e:
+        logger.error(f"Encoder thread error: {e}")
+        if container is not None:
+            with contextlib.suppress(Exception):
+                container.close()
+        if released_queue is not None:
+            # Give back the slots of the frames that won't be encoded, so that the ring isn't left exhausted
+            pending = [slot] if slot is not None else []
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    item = frame_queue.get_nowait()
+                    if isinstance(item, int):
+                        pending.append(item)
+            for pending_slot in pending:
+                released_queue.put(pending_slot)
+        result_queue.put(("error", str(e)))
+
+
+class _CameraEncoderWorker:
+    """Arguments and entry point of the encoder workers, see `_encode_camera_stream`."""
 
     def __init__(
         self,
@@ -591,6 +846,7 @@ class _CameraEncoderThread(threading.Thread):
         result_queue: queue.Queue,
         stop_event: threading.Event,
         encoder_threads: int | None = None,
+        released_queue: queue.Queue | None = None,
     ):
         super().__init__(daemon=True)
         self.video_path = video_path
@@ -604,102 +860,41 @@ class _CameraEncoderThread(threading.Thread):
         self.result_queue = result_queue
         self.stop_event = stop_event
         self.encoder_threads = encoder_threads
+        self.released_queue = released_queue
 
     def run(self) -> None:
-        from lerobot.datasets.compute_stats import RunningQuantileStats, auto_downsample_height_width
-
-        container = None
-        output_stream = None
-        stats_tracker = RunningQuantileStats()
-        frame_count = 0
-
-        try:
-            logging.getLogger("libav").setLevel(av.logging.WARNING)
-
-            while True:
-                try:
-                    frame_data = self.frame_queue.get(timeout=1)
-                except queue.Empty:
-                    if self.stop_event.is_set():
-                        break
-                    continue
-
-                if frame_data is None:
-                    # Sentinel: flush and close
-                    break
-
-                # Ensure HWC uint8 numpy array
-                if isinstance(frame_data, np.ndarray):
-                    if frame_data.ndim == 3 and frame_data.shape[0] == 3:
-                        # CHW -> HWC
-                        frame_data = frame_data.transpose(1, 2, 0)
-                    if frame_data.dtype != np.uint8:
-                        frame_data = (frame_data * 255).astype(np.uint8)
-
-                # Open container on first frame (to get width/height)
-                if container is None:
-                    height, width = frame_data.shape[:2]
-                    video_options = _get_codec_options(self.vcodec, self.g, self.crf, self.preset)
-                    if self.encoder_threads is not None:
-                        if self.vcodec == "libsvtav1":
-                            lp_param = f"lp={self.encoder_threads}"
-                            if "svtav1-params" in video_options:
-                                video_options["svtav1-params"] += f":{lp_param}"
-                            else:
-                                video_options["svtav1-params"] = lp_param
-                        else:
-                            video_options["threads"] = str(self.encoder_threads)
-                    Path(self.video_path).parent.mkdir(parents=True, exist_ok=True)
-                    container = av.open(str(self.video_path), "w")
-                    output_stream = container.add_stream(self.vcodec, self.fps, options=video_options)
-                    output_stream.pix_fmt = self.pix_fmt
-                    output_stream.width = width
-                    output_stream.height = height
-                    output_stream.time_base = Fraction(1, self.fps)
-
-                # Encode frame with explicit timestamps
-                pil_img = Image.fromarray(frame_data)
-                video_frame = av.VideoFrame.from_image(pil_img)
-                video_frame.pts = frame_count
-                video_frame.time_base = Fraction(1, self.fps)
-                packet = output_stream.encode(video_frame)
-                if packet:
-                    container.mux(packet)
-
-                # Update stats with downsampled frame (per-channel stats like compute_episode_stats)
-                img_chw = frame_data.transpose(2, 0, 1)  # HWC -> CHW
-                img_downsampled = auto_downsample_height_width(img_chw)
-                # Reshape CHW to (H*W, C) for per-channel stats
-                channels = img_downsampled.shape[0]
-                img_for_stats = img_downsampled.transpose(1, 2, 0).reshape(-1, channels)
-                stats_tracker.update(img_for_stats)
+        _encode_camera_stream(
+            self.video_path,
+            self.fps,
+            self.vcodec,
+            self.pix_fmt,
+            self.g,
+            self.crf,
+            self.preset,
+            self.frame_queue,
+            self.result_queue,
+            self.stop_event,
+            self.encoder_threads,
+            self.released_queue,
+        )
 
-                frame_count += 1
 
-            # Flush encoder
-            if output_stream is not None:
-                packet = output_stream.encode()
-                if packet:
-                    container.mux(packet)
+class _CameraEncoderThread(_CameraEncoderWorker, threading.Thread):
+    """A thread that encodes video frames streamed via a queue into an MP4 file.
 
-            if container is not None:
-                container.close()
+    One instance is created per camera per episode. Frames are received as numpy arrays
+    from the main thread, encoded in real-time using PyAV (which releases the GIL during
+    encoding), and written to disk. Stats are computed incrementally using
+    RunningQuantileStats and returned via result_queue.
+    """
 
-            av.logging.restore_default_callback()
 
-            # Get stats and put on result queue
-            if frame_count >= 2:
-                stats = stats_tracker.get_statistics()
-                self.result_queue.put(("ok", stats))
-            else:
-                self.result_queue.put(("ok", None))
+class _CameraEncoderProcess(_CameraEncoderWorker, multiprocessing.Process):
+    """Same as `_CameraEncoderThread`, in a separate process.
 
-        except Exception as e:
-            logger.error(f"Encoder thread error: {e}")
-            if container is not None:
-                with contextlib.suppress(Exception):
-                    container.close()
-            self.result_queue.put(("error", str(e)))
+    Frames are read from a `SharedFrameRing`, so that they are neither pickled nor copied on their way to the
+    process, and the conversion and stats computation of each frame don't hold the GIL of the recording loop.
+    """
 
 
 class StreamingVideoEncoder:
@@ -709,9 +904,11 @@ class StreamingVideoEncoder:
     this class streams frames directly to encoder threads, eliminating the
     PNG round-trip and making save_episode() near-instant.
 
-    Uses threading instead of multiprocessing to avoid the overhead of pickling large
-    numpy arrays through multiprocessing.Queue. PyAV's encode() releases the GIL,
-    so encoding runs in parallel with the main recording loop.
+    Frames are copied into a preallocated shared-memory ring of `queue_maxsize` slots per camera (see
+    `SharedFrameRing`) and only their slot index goes through the queue. PyAV's encode() releases the GIL,
+    so with threads encoding already runs in parallel with the main recording loop. With `use_processes`, each
+    camera is encoded in its own process instead, which reads the frames from shared memory without any
+    pickling, so that e.g. several high-resolution cameras don't compete for the GIL of the recording loop.
     """
 
     def __init__(
@@ -724,6 +921,7 @@ class StreamingVideoEncoder:
         preset: int | None = None,
         queue_maxsize: int = 30,
         encoder_threads: int | None = None,
+        use_processes: bool = False,
     ):
         self.fps = fps
         self.vcodec = resolve_vcodec(vcodec)
@@ -733,11 +931,16 @@ class StreamingVideoEncoder:
         self.preset = preset
         self.queue_maxsize = queue_maxsize
         self.encoder_threads = encoder_threads
+        self.use_processes = use_processes
 
         self._frame_queues: dict[str, queue.Queue] = {}
         self._result_queues: dict[str, queue.Queue] = {}
-        self._threads: dict[str, _CameraEncoderThread] = {}
+        self._released_queues: dict[str, queue.Queue] = {}
+        self._threads: dict[str, _CameraEncoderWorker] = {}
         self._stop_events: dict[str, threading.Event] = {}
+        # Kept across episodes, and re-created only if the frame shape changes
+        self._frame_rings: dict[str, SharedFrameRing] = {}
+        self._rings_sent: set[str] = set()
         self._video_paths: dict[str, Path] = {}
         self._dropped_frames: dict[str, int] = {}
         self._episode_active = False
@@ -756,14 +959,23 @@ class StreamingVideoEncoder:
         self._dropped_frames.clear()
 
         for video_key in video_keys:
-            frame_queue: queue.Queue = queue.Queue(maxsize=self.queue_maxsize)
-            result_queue: queue.Queue = queue.Queue(maxsize=1)
-            stop_event = threading.Event()
+            # The number of frames in flight is bounded by the slots of the frame ring
+            if self.use_processes:
+                frame_queue = multiprocessing.Queue()
+                result_queue = multiprocessing.Queue(maxsize=1)
+                released_queue = multiprocessing.Queue()
+                stop_event = multiprocessing.Event()
+            else:
+                frame_queue = queue.Queue()
+                result_queue = queue.Queue(maxsize=1)
+                released_queue = queue.Queue()
+                stop_event = threading.Event()
 
             temp_video_dir = Path(tempfile.mkdtemp(dir=temp_dir))
             video_path = temp_video_dir / f"{video_key.replace('/', '_')}_streaming.mp4"
 
-            encoder_thread = _CameraEncoderThread(
+            worker_cls = _CameraEncoderProcess if self.use_processes else _CameraEncoderThread
+            encoder_thread = worker_cls(
                 video_path=video_path,
                 fps=self.fps,
                 vcodec=self.vcodec,
@@ -775,11 +987,13 @@ class StreamingVideoEncoder:
                 result_queue=result_queue,
                 stop_event=stop_event,
                 encoder_threads=self.encoder_threads,
+                released_queue=released_queue,
             )
             encoder_thread.start()
 
             self._frame_queues[video_key] = frame_queue
             self._result_queues[video_key] = result_queue
+            self._released_queues[video_key] = released_queue
             self._threads[video_key] = encoder_thread
             self._stop_events[video_key] = stop_event
             self._video_paths[video_key] = video_path
@@ -789,10 +1003,9 @@ class StreamingVideoEncoder:
     def feed_frame(self, video_key: str, image: np.ndarray) -> None:
         """Feed a frame to the encoder for a specific camera.
 
-        A copy of the image is made before enqueueing to prevent race conditions
-        with camera drivers that may reuse buffers. If the encoder queue is full
-        (encoder can't keep up), the frame is dropped with a warning instead of
-        crashing the recording session.
+        The image is copied into a free slot of the camera's shared-memory ring before enqueueing, which
+        prevents race conditions with camera drivers that may reuse buffers. If no slot is free (encoder
+        can't keep up), the frame is dropped with a warning instead of crashing the recording session.
 
         Args:
             video_key: The video feature key
@@ -815,9 +1028,19 @@ class StreamingVideoEncoder:
                 pass
             raise RuntimeError(f"Encoder thread for {video_key} is not alive")
 
-        try:
-            self._frame_queues[video_key].put(image.copy(), timeout=0.1)
-        except queue.Full:
+        frame_ring = self._get_frame_ring(video_key, image)
+        released_queue = self._released_queues[video_key]
+        frame_ring.reclaim(released_queue)
+        slot = frame_ring.put(image)
+        if slot is None:
+            # Give the encoder a chance to catch up before dropping the frame
+            with contextlib.suppress(queue.Empty):
+                frame_ring.release(released_queue.get(timeout=0.1))
+                slot = frame_ring.put(image)
+
+        if slot is not None:
+            self._frame_queues[video_key].put(slot)
+        else:
             self._dropped_frames[video_key] = self._dropped_frames.get(video_key, 0) + 1
             count = self._dropped_frames[video_key]
             # Log periodically to avoid spam (1st, then every 10th)
@@ -827,6 +1050,20 @@ class StreamingVideoEncoder:
                     f"Consider using vcodec='auto' for hardware encoding or increasing encoder_queue_maxsize."
                 )
 
+    def _get_frame_ring(self, video_key: str, image: np.ndarray) -> SharedFrameRing:
+        """Frame ring of a camera, sent to its encoder with the first frame of each episode."""
+        frame_ring = self._frame_rings.get(video_key)
+        if video_key not in self._rings_sent:
+            shape = to_hwc_uint8(image).shape
+            if frame_ring is None or frame_ring.shape != shape:
+                if frame_ring is not None:
+                    frame_ring.close()
+                frame_ring = SharedFrameRing(shape, num_slots=self.queue_maxsize)
+                self._frame_rings[video_key] = frame_ring
+            self._frame_queues[video_key].put(frame_ring)
+            self._rings_sent.add(video_key)
+        return frame_ring
+
     def finish_episode(self) -> dict[str, tuple[Path, dict | None]]:
         """Finish encoding the current episode.
 
@@ -900,16 +1137,30 @@ class StreamingVideoEncoder:
             return
         if self._episode_active:
             self.cancel_episode()
+        for frame_ring in self._frame_rings.values():
+            frame_ring.close()
+        self._frame_rings.clear()
         self._closed = True
 
     def _cleanup(self) -> None:
         """Clean up queues and thread tracking dicts."""
-        for q in self._frame_queues.values():
+        for worker in self._threads.values():
+            if isinstance(worker, multiprocessing.Process) and worker.is_alive():
+                worker.terminate()
+        for q in [*self._frame_queues.values(), *self._released_queues.values()]:
             with contextlib.suppress(Exception):
                 while not q.empty():
                     q.get_nowait()
+            if not isinstance(q, queue.Queue):
+                # Don't wait for undelivered items when no process reads them anymore
+                q.cancel_join_thread()
+        # The encoders are done: every slot of the rings is free again
+        for frame_ring in self._frame_rings.values():
+            frame_ring.reset()
+        self._rings_sent.clear()
         self._frame_queues.clear()
         self._result_queues.clear()
+        self._released_queues.clear()
         self._threads.clear()
         self._stop_events.clear()
         self._video_paths.clear()
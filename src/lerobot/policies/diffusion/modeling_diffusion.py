@@ -71,6 +71,9 @@ class DiffusionPolicy(PreTrainedPolicy):
 
         # queues are populated during rollout of the policy, they contain the n latest observations and actions
         self._queues = None
+        # (image, features) pairs of the latest encoded observation images, so that the images kept in the
+        # observation queue are only encoded once
+        self._image_features = None
 
         self.diffusion = DiffusionModel(config)
 
@@ -87,15 +90,34 @@ class DiffusionPolicy(PreTrainedPolicy):
         }
         if self.config.image_features:
             self._queues[OBS_IMAGES] = deque(maxlen=self.config.n_obs_steps)
+            self._image_features = deque(maxlen=self.config.n_obs_steps)
         if self.config.env_state_feature:
             self._queues[OBS_ENV_STATE] = deque(maxlen=self.config.n_obs_steps)
 
+    def _encode_queued_images(self) -> Tensor:
+        """Image features of the observation queue, (B, n_obs_steps, num_cameras * feature_dim).
+
+        Only the images not encoded by a previous call are run through the encoder: the features of the older
+        images of the queue are reused. Images are matched by identity, which also encodes the first
+        observation only once while it fills the queue.
+        """
+        images = self._queues[OBS_IMAGES]
+        encoded = {id(image) for image, _ in self._image_features}
+        new_images = list({id(image): image for image in images if id(image) not in encoded}.values())
+        if new_images:
+            new_features = self.diffusion.encode_images(torch.stack(new_images, dim=1))
+            # The queue is in chronological order, the features of the images leaving it are dropped first
+            self._image_features.extend(zip(new_images, new_features.unbind(dim=1), strict=True))
+        features = {id(image): image_features for image, image_features in self._image_features}
+        return torch.stack([features[id(image)] for image in images], dim=1)
+
     @torch.no_grad()
     def predict_action_chunk(self, batch: dict[str, Tensor], noise: Tensor | None = None) -> Tensor:
         """Predict a chunk of actions given environment observations."""
         # stack n latest observations from the queue
         batch = {k: torch.stack(list(self._queues[k]), dim=1) for k in batch if k in self._queues}
-        actions = self.diffusion.generate_actions(batch, noise=noise)
+        image_features = self._encode_queued_images() if OBS_IMAGES in batch else None
+        actions = self.diffusion.generate_actions(batch, noise=noise, image_features=image_features)
 
         return actions
 
@@ -106,7 +128,8 @@ class DiffusionPolicy(PreTrainedPolicy):
         This method handles caching a history of observations and an action trajectory generated by the
         underlying diffusion model. Here's how it works:
           - `n_obs_steps` steps worth of observations are cached (for the first steps, the observation is
-            copied `n_obs_steps` times to fill the cache).
+            copied `n_obs_steps` times to fill the cache). The image features of the cached observations are
+            kept as well, so that each image is only encoded once.
           - The diffusion model generates `horizon` steps worth of actions.
           - `n_action_steps` worth of actions are actually kept for execution, starting from the current step.
         Schematically this looks like:
@@ -243,37 +266,42 @@ class DiffusionModel(nn.Module):
 
         return sample
 
-    def _prepare_global_conditioning(self, batch: dict[str, Tensor]) -> Tensor:
-        """Encode image features and concatenate them all together along with the state vector."""
-        batch_size, n_obs_steps = batch[OBS_STATE].shape[:2]
+    def encode_images(self, images: Tensor) -> Tensor:
+        """Encode images of shape (B, n_obs_steps, num_cameras, C, H, W).
+
+        Returns the (B, n_obs_steps, num_cameras * feature_dim) features, the cameras being concatenated.
+        """
+        batch_size, n_obs_steps = images.shape[:2]
+        if self.config.use_separate_rgb_encoder_per_camera:
+            # Combine batch and sequence dims while rearranging to make the camera index dimension first.
+            images_per_camera = einops.rearrange(images, "b s n ... -> n (b s) ...")
+            img_features_list = torch.cat(
+                [encoder(images) for encoder, images in zip(self.rgb_encoder, images_per_camera, strict=True)]
+            )
+            # Separate batch and sequence dims back out. The camera index dim gets absorbed into the
+            # feature dim (effectively concatenating the camera features).
+            return einops.rearrange(
+                img_features_list, "(n b s) ... -> b s (n ...)", b=batch_size, s=n_obs_steps
+            )
+        # Combine batch, sequence, and "which camera" dims before passing to shared encoder.
+        img_features = self.rgb_encoder(einops.rearrange(images, "b s n ... -> (b s n) ..."))
+        # Separate batch dim and sequence dim back out. The camera index dim gets absorbed into the
+        # feature dim (effectively concatenating the camera features).
+        return einops.rearrange(img_features, "(b s n) ... -> b s (n ...)", b=batch_size, s=n_obs_steps)
+
+    def _prepare_global_conditioning(
+        self, batch: dict[str, Tensor], image_features: Tensor | None = None
+    ) -> Tensor:
+        """Encode image features and concatenate them all together along with the state vector.
+
+        `image_features` are the already encoded images of the batch, see `encode_images`.
+        """
         global_cond_feats = [batch[OBS_STATE]]
         # Extract image features.
         if self.config.image_features:
-            if self.config.use_separate_rgb_encoder_per_camera:
-                # Combine batch and sequence dims while rearranging to make the camera index dimension first.
-                images_per_camera = einops.rearrange(batch[OBS_IMAGES], "b s n ... -> n (b s) ...")
-                img_features_list = torch.cat(
-                    [
-                        encoder(images)
-                        for encoder, images in zip(self.rgb_encoder, images_per_camera, strict=True)
-                    ]
-                )
-                # Separate batch and sequence dims back out. The camera index dim gets absorbed into the
-                # feature dim (effectively concatenating the camera features).
-                img_features = einops.rearrange(
-                    img_features_list, "(n b s) ... -> b s (n ...)", b=batch_size, s=n_obs_steps
-                )
-            else:
-                # Combine batch, sequence, and "which camera" dims before passing to shared encoder.
-                img_features = self.rgb_encoder(
-                    einops.rearrange(batch[OBS_IMAGES], "b s n ... -> (b s n) ...")
-                )
-                # Separate batch dim and sequence dim back out. The camera index dim gets absorbed into the
-                # feature dim (effectively concatenating the camera features).
-                img_features = einops.rearrange(
-                    img_features, "(b s n) ... -> b s (n ...)", b=batch_size, s=n_obs_steps
-                )
-            global_cond_feats.append(img_features)
+            if image_features is None:
+                image_features = self.encode_images(batch[OBS_IMAGES])
+            global_cond_feats.append(image_features)
 
         if self.config.env_state_feature:
             global_cond_feats.append(batch[OBS_ENV_STATE])
@@ -281,7 +309,9 @@ class DiffusionModel(nn.Module):
         # Concatenate features then flatten to (B, global_cond_dim).
         return torch.cat(global_cond_feats, dim=-1).flatten(start_dim=1)
 
-    def generate_actions(self, batch: dict[str, Tensor], noise: Tensor | None = None) -> Tensor:
+    def generate_actions(
+        self, batch: dict[str, Tensor], noise: Tensor | None = None, image_features: Tensor | None = None
+    ) -> Tensor:
         """
         This function expects `batch` to have:
         {
@@ -291,12 +321,14 @@ class DiffusionModel(nn.Module):
                 AND/OR
             "observation.environment_state": (B, n_obs_steps, environment_dim)
         }
+        The images are not encoded when their features, (B, n_obs_steps, num_cameras * feature_dim), are
+        passed as `image_features`.
         """
         batch_size, n_obs_steps = batch[OBS_STATE].shape[:2]
         assert n_obs_steps == self.config.n_obs_steps
 
         # Encode image features and concatenate them all together along with the state vector.
-        global_cond = self._prepare_global_conditioning(batch)  # (B, global_cond_dim)
+        global_cond = self._prepare_global_conditioning(batch, image_features)  # (B, global_cond_dim)
 
         # run sampling
         actions = self.conditional_sample(batch_size, global_cond=global_cond, noise=noise)
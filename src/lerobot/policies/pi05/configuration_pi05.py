@@ -43,6 +43,8 @@ class PI05Config(PreTrainedConfig):
 
     # Flow matching parameters: see openpi `PI0Pytorch`
     num_inference_steps: int = 10
+    # Attention of the inference forward passes: "eager" (as in openpi) or "sdpa" (scaled_dot_product_attention)
+    inference_attn_implementation: str = "eager"
     time_sampling_beta_alpha: float = 1.5
     time_sampling_beta_beta: float = 1.0
     time_sampling_scale: float = 0.999
@@ -115,6 +117,9 @@ class PI05Config(PreTrainedConfig):
         if self.dtype not in ["bfloat16", "float32"]:
             raise ValueError(f"Invalid dtype: {self.dtype}")
 
+        if self.inference_attn_implementation not in ["eager", "sdpa"]:
+            raise ValueError(f"Invalid inference_attn_implementation: {self.inference_attn_implementation}")
+
     def validate_features(self) -> None:
         """Validate and set up input/output features."""
         for i in range(self.empty_cameras):
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import inspect
 from typing import TYPE_CHECKING
 
 import torch
@@ -50,6 +51,11 @@ else:
     BaseModelOutputWithPast = None
     create_causal_mask = None
 
+# `cache_position` was removed from the arguments of `create_causal_mask` in later transformers 5 releases
+_CAUSAL_MASK_TAKES_CACHE_POSITION = (
+    create_causal_mask is not None and "cache_position" in inspect.signature(create_causal_mask).parameters
+)
+
 
 def _gated_residual(
     x: torch.Tensor | None,
@@ -258,13 +264,14 @@ class PiGemmaModel(GemmaModel):  # type: ignore[misc]
         if position_ids is None:
             position_ids = cache_position.unsqueeze(0)
 
+        mask_kwargs = {"cache_position": cache_position} if _CAUSAL_MASK_TAKES_CACHE_POSITION else {}
         causal_mask = create_causal_mask(
             config=self.config,
             inputs_embeds=inputs_embeds,
             attention_mask=attention_mask,
-            cache_position=cache_position,
             past_key_values=past_key_values,
             position_ids=position_ids,
+            **mask_kwargs,
         )
 
         # embed positions
@@ -53,6 +53,12 @@ class ActorLearnerConfig:
     learner_port: int = 50051
     policy_parameters_push_frequency: int = 4
     queue_get_timeout: float = 2
+    # Only send the parameters that changed since the last full snapshot of the policy, which is sent every
+    # `policy_parameters_keyframe_interval` pushes (see `lerobot.transport.parameter_delta`)
+    policy_parameters_delta: bool = True
+    policy_parameters_keyframe_interval: int = 10
+    # Cast the floating point parameters to "float16" or "bfloat16" before sending them, None sends them as is
+    policy_parameters_dtype: str | None = None
 
 
 @dataclass
@@ -145,6 +151,20 @@ class SACConfig(PreTrainedConfig):
     offline_buffer_capacity: int = 100000
     # Whether to use asynchronous prefetching for the buffers
     async_prefetch: bool = False
+    # Whether to store the images of the buffers as uint8 instead of float32, using 4x less memory
+    buffer_images_as_uint8: bool = False
+    # Whether to sample the buffers stored on CPU through pinned memory, copying batches to a CUDA device
+    # asynchronously (and, with async_prefetch, while the previous optimization step runs)
+    buffer_pin_memory: bool = False
+    # Whether to keep the online buffer in memory-mapped files in the output directory, so that it can be
+    # larger than RAM and checkpointed without converting it to a dataset (requires storage_device="cpu")
+    buffer_memory_map: bool = False
+    # Whether to sample the buffers in proportion to the TD errors of the transitions (prioritized replay)
+    prioritized_replay: bool = False
+    # Prioritization exponent of prioritized replay, 0 being uniform sampling
+    priority_alpha: float = 0.6
+    # Importance sampling correction exponent of prioritized replay, 1 fully correcting the sampling bias
+    priority_beta: float = 0.4
     # Number of steps before learning starts
     online_step_before_learning: int = 100
     # Frequency of policy updates
@@ -150,12 +150,14 @@ class SACPolicy(
                 - state: Observations tensor dict
                 - next_state: Next observations tensor dict
                 - done: Done mask tensor
+                - weights: Optional importance sampling weights of the transitions (prioritized replay)
                 - observation_feature: Optional pre-computed observation features
                 - next_observation_feature: Optional pre-computed next observation features
             model: Which model to compute the loss for ("actor", "critic", "discrete_critic", or "temperature")
 
         Returns:
-            The computed loss tensor
+            The computed loss tensor. For the critic, also the absolute TD errors of the transitions, which
+            prioritized replay buffers use as new priorities.
         """
         # Extract common components from batch
         actions: Tensor = batch[ACTION]
@@ -169,7 +171,7 @@ class SACPolicy(
             done: Tensor = batch["done"]
             next_observation_features: Tensor = batch.get("next_observation_feature")
 
-            loss_critic = self.compute_loss_critic(
+            loss_critic, td_errors = self.compute_loss_critic(
                 observations=observations,
                 actions=actions,
                 rewards=rewards,
@@ -177,9 +179,11 @@ class SACPolicy(
                 done=done,
                 observation_features=observation_features,
                 next_observation_features=next_observation_features,
+                weights=batch.get("weights"),
+                return_td_errors=True,
             )
 
-            return {"loss_critic": loss_critic}
+            return {"loss_critic": loss_critic, "td_errors": td_errors}
 
         if model == "discrete_critic" and self.config.num_discrete_actions is not None:
             # Extract critic-specific components
@@ -253,7 +257,9 @@ class SACPolicy(
         done,
         observation_features: Tensor | None = None,
         next_observation_features: Tensor | None = None,
-    ) -> Tensor:
+        weights: Tensor | None = None,
+        return_td_errors: bool = False,
+    ) -> Tensor | tuple[Tensor, Tensor]:
         with torch.no_grad():
             next_action_preds, next_log_probs, _ = self.actor(next_observations, next_observation_features)
 
@@ -296,13 +302,18 @@ class SACPolicy(
         # Compute state-action value loss (TD loss) for all of the Q functions in the ensemble.
         td_target_duplicate = einops.repeat(td_target, "b -> e b", e=q_preds.shape[0])
         # You compute the mean loss of the batch for each critic and then to compute the final loss you sum them up
-        critics_loss = (
-            F.mse_loss(
-                input=q_preds,
-                target=td_target_duplicate,
-                reduction="none",
-            ).mean(dim=1)
-        ).sum()
+        td_losses = F.mse_loss(
+            input=q_preds,
+            target=td_target_duplicate,
+            reduction="none",
+        )
+        if weights is not None:
+            # Importance sampling weights correct the bias of prioritized sampling
+            td_losses = td_losses * weights
+        critics_loss = td_losses.mean(dim=1).sum()
+        if return_td_errors:
+            td_errors = (q_preds - td_target_duplicate).abs().mean(dim=0).detach()
+            return critics_loss, td_errors
         return critics_loss
 
     def compute_loss_discrete_critic(
@@ -65,6 +65,7 @@ from lerobot.policies.rtc.modeling_rtc import RTCProcessor
 from lerobot.policies.smolvla.configuration_smolvla import SmolVLAConfig
 from lerobot.policies.smolvla.smolvlm_with_expert import SmolVLMWithExpertModel
 from lerobot.policies.utils import (
+    PrefixKVCache,
     populate_queues,
 )
 from lerobot.utils.constants import ACTION, OBS_LANGUAGE_ATTENTION_MASK, OBS_LANGUAGE_TOKENS, OBS_STATE
@@ -830,6 +831,9 @@ class VLAFlowMatching(nn.Module):
             use_cache=self.config.use_cache,
             fill_kv_cache=True,
         )
+        if past_key_values is not None:
+            # Shared by the denoising steps, which attend to the prefix without copying or extending its cache
+            past_key_values = PrefixKVCache.from_layer_dict(past_key_values)
         num_steps = self.config.num_steps
         dt = -1.0 / num_steps
 
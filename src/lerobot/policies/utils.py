@@ -247,3 +247,92 @@ def validate_visual_features_consistency(
 
     if not (policy_subset_of_dataset or dataset_subset_of_policy):
         raise_feature_mismatch_error(provided_visuals, expected_visuals)
+
+
+class PrefixKVCache:
+    """Read-only key / value cache of the prefix of a flow matching policy, shared by its denoising steps.
+
+    Every denoising step of `sample_actions` (PI0, PI05, SmolVLA) attends to the keys and values of the same
+    prefix (images, language, state), followed by those of its suffix (the noisy actions). Instead of copying or
+    extending the cache of the prefix on every step, `update` writes the keys and values of the suffix into
+    per-layer buffers holding a single copy of the prefix, and returns these buffers. The prefix is never
+    modified, so the same cache serves all the denoising steps of an inference.
+
+    It implements the part of the `transformers` `Cache` interface used by the Gemma attention layers (`update`,
+    `get_seq_length`), and indexing it by layer returns the prefix as a `{"key_states", "value_states"}` dict,
+    like the caches of SmolVLA.
+
+    Args:
+        keys: Keys of the prefix, by layer index.
+        values: Values of the prefix, by layer index.
+        seq_dim: Sequence dimension of the keys and values: 2 for the `(batch, heads, seq, head_dim)` layout of
+            `transformers`, 1 for the `(batch, seq, heads, head_dim)` layout of SmolVLA.
+    """
+
+    def __init__(self, keys: dict[int, torch.Tensor], values: dict[int, torch.Tensor], seq_dim: int):
+        self.keys = keys
+        self.values = values
+        self.seq_dim = seq_dim
+        # Prefix followed by the keys / values of the last suffix, by layer index
+        self._buffers: dict[int, tuple[torch.Tensor, torch.Tensor]] = {}
+
+    @classmethod
+    def from_dynamic_cache(cls, cache) -> "PrefixKVCache":
+        """Wraps the `transformers.DynamicCache` of a prefix, without copying it."""
+        return cls(
+            keys={idx: layer.keys for idx, layer in enumerate(cache.layers)},
+            values={idx: layer.values for idx, layer in enumerate(cache.layers)},
+            seq_dim=2,
+        )
+
+    @classmethod
+    def from_layer_dict(cls, cache: dict[int, dict[str, torch.Tensor]]) -> "PrefixKVCache":
+        """Wraps the `{layer_idx: {"key_states", "value_states"}}` cache of a SmolVLA prefix, without copying it."""
+        return cls(
+            keys={idx: layer["key_states"] for idx, layer in cache.items()},
+            values={idx: layer["value_states"] for idx, layer in cache.items()},
+            seq_dim=1,
+        )
+
+    def __getitem__(self, layer_idx: int) -> dict[str, torch.Tensor]:
+        return {"key_states": self.keys[layer_idx], "value_states": self.values[layer_idx]}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def get_seq_length(self, layer_idx: int = 0) -> int:
+        return self.keys[layer_idx].shape[self.seq_dim]
+
+    def update(
+        self,
+        key_states: torch.Tensor,
+        value_states: torch.Tensor,
+        layer_idx: int,
+        cache_kwargs: dict | None = None,
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Returns the keys and values of the prefix followed by `key_states` and `value_states`."""
+        prefix_keys, prefix_values = self.keys[layer_idx], self.values[layer_idx]
+        if torch.is_grad_enabled() and (key_states.requires_grad or value_states.requires_grad):
+            # Writing into the buffers would record them in the autograd graph (e.g. of Real-Time Chunking)
+            return (
+                torch.cat([prefix_keys, key_states], dim=self.seq_dim),
+                torch.cat([prefix_values, value_states], dim=self.seq_dim),
+            )
+
+        prefix_len = prefix_keys.shape[self.seq_dim]
+        suffix_len = key_states.shape[self.seq_dim]
+        buffers = self._buffers.get(layer_idx)
+        if (
+            buffers is None
+            or buffers[0].shape[self.seq_dim] != prefix_len + suffix_len
+            or buffers[0].shape[0] != key_states.shape[0]
+        ):
+            buffers = (
+                torch.cat([prefix_keys, key_states], dim=self.seq_dim),
+                torch.cat([prefix_values, value_states], dim=self.seq_dim),
+            )
+            self._buffers[layer_idx] = buffers
+        else:
+            buffers[0].narrow(self.seq_dim, prefix_len, suffix_len).copy_(key_states)
+            buffers[1].narrow(self.seq_dim, prefix_len, suffix_len).copy_(value_states)
+        return buffers
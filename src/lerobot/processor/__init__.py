@@ -58,6 +58,7 @@ from .pipeline import (
     ComplementaryDataProcessorStep,
     DataProcessorPipeline,
     DoneProcessorStep,
+    FusedOps,
     IdentityProcessorStep,
     InfoProcessorStep,
     ObservationProcessorStep,
@@ -89,6 +90,7 @@ __all__ = [
     "DoneProcessorStep",
     "EnvAction",
     "EnvTransition",
+    "FusedOps",
     "GymHILAdapterProcessorStep",
     "GripperPenaltyProcessorStep",
     "hotswap_stats",
@@ -20,7 +20,10 @@ This script defines processor steps for adding a batch dimension to various comp
 These steps are designed to process actions, observations, and complementary data, making them suitable for batch processing by adding a leading dimension. This is a common requirement before feeding data into a neural network model.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
 
 from torch import Tensor
 
@@ -30,6 +33,7 @@ from lerobot.utils.constants import OBS_ENV_STATE, OBS_IMAGE, OBS_IMAGES, OBS_ST
 
 from .pipeline import (
     ComplementaryDataProcessorStep,
+    FusedOps,
     ObservationProcessorStep,
     PolicyActionProcessorStep,
     ProcessorStep,
@@ -38,6 +42,17 @@ from .pipeline import (
 )
 
 
+def _add_batch_dim(value: Any, *, dim: int) -> Any:
+    """Adds a leading dimension to `value` if it is a tensor with `dim` dimensions."""
+    if isinstance(value, Tensor) and value.dim() == dim:
+        return value.unsqueeze(0)
+    return value
+
+
+def _wrap_task(task: Any) -> Any:
+    return [task] if isinstance(task, str) else task
+
+
 @dataclass
 @ProcessorStepRegistry.register(name="to_batch_processor_action")
 class AddBatchDimensionActionStep(PolicyActionProcessorStep):
@@ -61,6 +76,14 @@ class AddBatchDimensionActionStep(PolicyActionProcessorStep):
             return action
         return action.unsqueeze(0)
 
+    def _process_action(self, action: PolicyAction) -> PolicyAction:
+        if not isinstance(action, PolicyAction):
+            raise ValueError(f"Action should be a PolicyAction type (tensor), but got {type(action)}")
+        return self.action(action)
+
+    def fused_ops(self) -> FusedOps:
+        return FusedOps(action=self._process_action)
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
@@ -119,6 +142,16 @@ class AddBatchDimensionObservationStep(ObservationProcessorStep):
                 observation[key] = value.unsqueeze(0)
         return observation
 
+    def _observation_op(self, key: str) -> Callable[[Any], Any] | None:
+        if key in (OBS_STATE, OBS_ENV_STATE):
+            return partial(_add_batch_dim, dim=1)
+        if key == OBS_IMAGE or key.startswith(f"{OBS_IMAGES}."):
+            return partial(_add_batch_dim, dim=3)
+        return None
+
+    def fused_ops(self) -> FusedOps:
+        return FusedOps(observation=self._observation_op)
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
@@ -176,6 +209,16 @@ class AddBatchDimensionComplementaryDataStep(ComplementaryDataProcessorStep):
                 complementary_data["task_index"] = task_index_value.unsqueeze(0)
         return complementary_data
 
+    def _complementary_data_op(self, key: str) -> Callable[[Any], Any] | None:
+        if key == "task":
+            return _wrap_task
+        if key in ("index", "task_index"):
+            return partial(_add_batch_dim, dim=0)
+        return None
+
+    def fused_ops(self) -> FusedOps:
+        return FusedOps(complementary_data=self._complementary_data_op)
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
@@ -236,6 +279,13 @@ class AddBatchDimensionProcessorStep(ProcessorStep):
             transition = self.to_batch_complementary_data_processor(transition)
         return transition
 
+    def fused_ops(self) -> FusedOps:
+        return FusedOps(
+            observation=self.to_batch_observation_processor.fused_ops().observation,
+            complementary_data=self.to_batch_complementary_data_processor.fused_ops().complementary_data,
+            action=self.to_batch_action_processor.fused_ops().action,
+        )
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
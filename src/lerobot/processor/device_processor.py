@@ -19,6 +19,7 @@ This script defines a processor step for moving environment transition data to a
 its floating-point precision.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -28,7 +29,7 @@ from lerobot.configs.types import PipelineFeatureType, PolicyFeature
 from lerobot.types import EnvTransition, PolicyAction, TransitionKey
 from lerobot.utils.device_utils import get_safe_torch_device
 
-from .pipeline import ProcessorStep, ProcessorStepRegistry
+from .pipeline import FusedOps, ProcessorStep, ProcessorStepRegistry
 
 
 @ProcessorStepRegistry.register("device_processor")
@@ -168,6 +169,27 @@ class DeviceProcessorStep(ProcessorStep):
 
         return new_transition
 
+    def _process_value(self, value: Any) -> Any:
+        """Processes `value` if it is a tensor, returns it unchanged otherwise."""
+        return self._process_tensor(value) if isinstance(value, torch.Tensor) else value
+
+    def _value_op(self, key: str) -> Callable[[Any], Any]:
+        return self._process_value
+
+    def _process_action(self, action: PolicyAction) -> PolicyAction:
+        if not isinstance(action, PolicyAction):
+            raise ValueError(f"If action is not None should be a PolicyAction type got {type(action)}")
+        return self._process_tensor(action)
+
+    def fused_ops(self) -> FusedOps:
+        """Processes every tensor of the transition, like `__call__`."""
+        return FusedOps(
+            observation=self._value_op,
+            complementary_data=self._value_op,
+            action=self._process_action,
+            scalars=self._process_value,
+        )
+
     def get_config(self) -> dict[str, Any]:
         """
         Returns the serializable configuration of the processor.
@@ -17,8 +17,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any
 
 import torch
@@ -30,7 +32,13 @@ from lerobot.types import EnvTransition, PolicyAction, TransitionKey
 from lerobot.utils.constants import ACTION
 
 from .converters import from_tensor_to_numpy, to_tensor
-from .pipeline import PolicyProcessorPipeline, ProcessorStep, ProcessorStepRegistry, RobotObservation
+from .pipeline import (
+    FusedOps,
+    PolicyProcessorPipeline,
+    ProcessorStep,
+    ProcessorStepRegistry,
+    RobotObservation,
+)
 
 
 @dataclass
@@ -275,6 +283,21 @@ class _NormalizationMixin:
         processed_action = self._apply_transform(action, ACTION, FeatureType.ACTION, inverse=inverse)
         return processed_action
 
+    def _observation_op(self, key: str, *, inverse: bool) -> Callable[[Any], Tensor] | None:
+        """Operation (un)normalizing the observation value of `key` like `_normalize_observation`, if any."""
+        feature = self.features.get(key)
+        if feature is None or feature.type == FeatureType.ACTION:
+            return None
+        if self.normalize_observation_keys is not None and key not in self.normalize_observation_keys:
+            return None
+        return _FusedTransform(self, key, feature.type, inverse=inverse)
+
+    def _fused_ops(self, *, inverse: bool) -> FusedOps:
+        return FusedOps(
+            observation=partial(self._observation_op, inverse=inverse),
+            action=_FusedTransform(self, ACTION, FeatureType.ACTION, inverse=inverse, is_action=True),
+        )
+
     def _apply_transform(
         self, tensor: Tensor, key: str, feature_type: FeatureType, *, inverse: bool = False
     ) -> Tensor:
@@ -397,6 +420,85 @@ class _NormalizationMixin:
         return tensor
 
 
+class _FusedTransform:
+    """(Un)normalization of a feature as a single multiply-add, for the frozen pipelines.
+
+    `scale` and `shift` are computed once from the statistics of the processor, such that `tensor * scale + shift`
+    equals `_apply_transform` up to floating point rounding. Non floating point inputs, and inputs on another
+    device or of another dtype than the statistics, go through `_apply_transform`. The constants are computed
+    again when the statistics are reloaded or moved.
+    """
+
+    def __init__(
+        self,
+        processor: _NormalizationMixin,
+        key: str,
+        feature_type: FeatureType,
+        *,
+        inverse: bool,
+        is_action: bool = False,
+    ):
+        self.processor = processor
+        self.key = key
+        self.feature_type = feature_type
+        self.inverse = inverse
+        self.is_action = is_action
+        # Statistics of the processor the constants were computed from
+        self._stats: dict[str, Tensor] | None = None
+        self._scale: Tensor | None = None
+        self._shift: Tensor | None = None
+
+    def _compute_constants(self) -> None:
+        self._stats = self.processor._tensor_stats.get(self.key)
+        self._scale = self._shift = None
+        norm_mode = self.processor.norm_map.get(self.feature_type, NormalizationMode.IDENTITY)
+        if self._stats is None:
+            return
+        eps = self.processor.eps
+        if norm_mode == NormalizationMode.MEAN_STD and {"mean", "std"} <= self._stats.keys():
+            mean, std = self._stats["mean"], self._stats["std"]
+            if self.inverse:
+                self._scale, self._shift = std, mean
+            else:
+                self._scale = 1 / (std + eps)
+                self._shift = -mean * self._scale
+            return
+
+        low_high = {
+            NormalizationMode.MIN_MAX: ("min", "max"),
+            NormalizationMode.QUANTILES: ("q01", "q99"),
+            NormalizationMode.QUANTILE10: ("q10", "q90"),
+        }.get(norm_mode)
+        if low_high is None or not set(low_high) <= self._stats.keys():
+            # Identity, or missing statistics: `_apply_transform` returns the input or raises
+            return
+        low, high = self._stats[low_high[0]], self._stats[low_high[1]]
+        denom = high - low
+        denom = torch.where(denom == 0, torch.tensor(eps, device=denom.device, dtype=denom.dtype), denom)
+        if self.inverse:
+            self._scale = denom / 2
+            self._shift = denom / 2 + low
+        else:
+            self._scale = 2 / denom
+            self._shift = -2 * low / denom - 1
+
+    def __call__(self, value: Any) -> Tensor:
+        if self.is_action and not isinstance(value, PolicyAction):
+            raise ValueError(f"Action should be a PolicyAction type got {type(value)}")
+        tensor = torch.as_tensor(value)
+        if self.processor._tensor_stats.get(self.key) is not self._stats:
+            self._compute_constants()
+        scale = self._scale
+        if (
+            scale is None
+            or not tensor.is_floating_point()
+            or scale.device != tensor.device
+            or scale.dtype != tensor.dtype
+        ):
+            return self.processor._apply_transform(tensor, self.key, self.feature_type, inverse=self.inverse)
+        return torch.addcmul(self._shift, tensor, scale)
+
+
 @dataclass
 @ProcessorStepRegistry.register(name="normalizer_processor")
 class NormalizerProcessorStep(_NormalizationMixin, ProcessorStep):
@@ -465,6 +567,9 @@ class NormalizerProcessorStep(_NormalizationMixin, ProcessorStep):
 
         return new_transition
 
+    def fused_ops(self) -> FusedOps:
+        return self._fused_ops(inverse=False)
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
@@ -526,6 +631,9 @@ class UnnormalizerProcessorStep(_NormalizationMixin, ProcessorStep):
 
         return new_transition
 
+    def fused_ops(self) -> FusedOps:
+        return self._fused_ops(inverse=True)
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
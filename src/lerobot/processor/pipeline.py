@@ -140,6 +140,30 @@ class ProcessorStepRegistry:
         cls._registry.clear()
 
 
+@dataclass
+class FusedOps:
+    """Describes a step as operations on the individual values of a transition.
+
+    Steps returning a `FusedOps` from `ProcessorStep.fused_ops` can be fused with their neighbours when the
+    pipeline is frozen (see `DataProcessorPipeline.freeze`): the operations of adjacent steps are chained per
+    value, and the transition is copied once for all of them. Operations are not applied to `None` values.
+
+    Attributes:
+        observation_renames: Observation keys to rename, applied before the other operations of the step.
+        observation: Returns the operation to apply to the observation value of a key (after renaming), or
+            None to leave it unchanged.
+        complementary_data: Same as `observation`, for the values of the complementary data.
+        action: Operation applied to the action.
+        scalars: Operation applied to the reward, done and truncated values.
+    """
+
+    observation_renames: dict[str, str] = field(default_factory=dict)
+    observation: Callable[[str], Callable[[Any], Any] | None] | None = None
+    complementary_data: Callable[[str], Callable[[Any], Any] | None] | None = None
+    action: Callable[[Any], Any] | None = None
+    scalars: Callable[[Any], Any] | None = None
+
+
 class ProcessorStep(ABC):
     """Abstract base class for a single step in a data processing pipeline.
 
@@ -209,6 +233,17 @@ class ProcessorStep(ABC):
         """Resets the internal state of the processor step, if any."""
         return None
 
+    def fused_ops(self) -> FusedOps | None:
+        """Describes the step as per-value operations, for the fusion of frozen pipelines.
+
+        Only steps that transform values independently of each other and of the rest of the transition can
+        be fused. Subclasses overriding the processing of a fusable step must override this method as well.
+
+        Returns:
+            The operations of the step, or None (the default) if the step cannot be fused.
+        """
+        return None
+
     @abstractmethod
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
@@ -250,6 +285,135 @@ class ProcessorMigrationError(Exception):
         )
 
 
+def _chain(operations: Sequence[Callable[[Any], Any]], value: Any) -> Any:
+    for operation in operations:
+        value = operation(value)
+    return value
+
+
+class _FusedProcessorSteps:
+    """Adjacent fusable steps of a frozen pipeline, executed as a single step.
+
+    The per-value operations of the steps (see `FusedOps`) are chained on the first call, for the observation
+    and complementary data keys of its transition. Later transitions with the same keys only go through the
+    chained operations; transitions with other keys go through the original steps, and the operations are
+    chained again for their keys.
+    """
+
+    _SCALAR_KEYS = (TransitionKey.REWARD, TransitionKey.DONE, TransitionKey.TRUNCATED)
+
+    def __init__(self, steps: Sequence[ProcessorStep]):
+        self.steps = list(steps)
+        self._signature: tuple | None = None
+        # Observation values as (key, source key, operations) when keys are renamed, else (key, operations)
+        self._observation_moves: list[tuple[str, str, tuple]] | None = None
+        self._observation_ops: list[tuple[str, tuple]] = []
+        self._complementary_data_ops: list[tuple[str, tuple]] = []
+        self._action_ops: tuple = ()
+        self._scalar_ops: tuple = ()
+
+    @staticmethod
+    def _keys(values: Any) -> tuple | object | None:
+        if values is None:
+            return None
+        if isinstance(values, dict):
+            return tuple(values)
+        # Never equal to a previous signature: such transitions always go through the original steps
+        return object()
+
+    def _signature_of(self, transition: EnvTransition) -> tuple:
+        return (
+            self._keys(transition.get(TransitionKey.OBSERVATION)),
+            self._keys(transition.get(TransitionKey.COMPLEMENTARY_DATA)),
+            transition.get(TransitionKey.ACTION) is None,
+            *(transition.get(key) is None for key in self._SCALAR_KEYS),
+        )
+
+    def _specialize(self, transition: EnvTransition) -> None:
+        """Chains the operations of the steps for the keys of `transition`."""
+        observation = transition.get(TransitionKey.OBSERVATION)
+        complementary_data = transition.get(TransitionKey.COMPLEMENTARY_DATA)
+        # Output key -> (source key, operations)
+        observation_plan = {key: (key, []) for key in observation} if observation is not None else {}
+        complementary_data_plan = {key: [] for key in complementary_data} if complementary_data else {}
+        action_ops, scalar_ops = [], []
+
+        for step in self.steps:
+            ops = step.fused_ops()
+            if ops.observation_renames:
+                renamed = {}
+                for key, entry in observation_plan.items():
+                    renamed[ops.observation_renames.get(key, key)] = entry
+                observation_plan = renamed
+            if ops.observation is not None:
+                for key, (_, key_ops) in observation_plan.items():
+                    if (operation := ops.observation(key)) is not None:
+                        key_ops.append(operation)
+            if ops.complementary_data is not None:
+                for key, key_ops in complementary_data_plan.items():
+                    if (operation := ops.complementary_data(key)) is not None:
+                        key_ops.append(operation)
+            if ops.action is not None:
+                action_ops.append(ops.action)
+            if ops.scalars is not None:
+                scalar_ops.append(ops.scalars)
+
+        if any(key != source for key, (source, _) in observation_plan.items()) or (
+            observation is not None and len(observation_plan) != len(observation)
+        ):
+            self._observation_moves = [
+                (key, source, tuple(key_ops)) for key, (source, key_ops) in observation_plan.items()
+            ]
+        else:
+            self._observation_moves = None
+        self._observation_ops = [
+            (key, tuple(key_ops)) for key, (_, key_ops) in observation_plan.items() if key_ops
+        ]
+        self._complementary_data_ops = [
+            (key, tuple(key_ops)) for key, key_ops in complementary_data_plan.items() if key_ops
+        ]
+        self._action_ops = tuple(action_ops)
+        self._scalar_ops = tuple(scalar_ops)
+
+    def __call__(self, transition: EnvTransition) -> EnvTransition:
+        signature = self._signature_of(transition)
+        if signature != self._signature:
+            output = transition
+            for step in self.steps:
+                output = step(output)
+            # Only specialized once the original steps accepted the transition
+            self._specialize(transition)
+            self._signature = signature
+            return output
+
+        transition = transition.copy()
+        observation = transition.get(TransitionKey.OBSERVATION)
+        if self._observation_moves is not None:
+            transition[TransitionKey.OBSERVATION] = {
+                key: _chain(key_ops, observation[source]) for key, source, key_ops in self._observation_moves
+            }
+        elif self._observation_ops:
+            # The copy is owned by this step: update it in place
+            observation = dict(observation)
+            for key, key_ops in self._observation_ops:
+                observation[key] = _chain(key_ops, observation[key])
+            transition[TransitionKey.OBSERVATION] = observation
+
+        if self._complementary_data_ops:
+            complementary_data = dict(transition[TransitionKey.COMPLEMENTARY_DATA])
+            for key, key_ops in self._complementary_data_ops:
+                complementary_data[key] = _chain(key_ops, complementary_data[key])
+            transition[TransitionKey.COMPLEMENTARY_DATA] = complementary_data
+
+        if self._action_ops and transition.get(TransitionKey.ACTION) is not None:
+            transition[TransitionKey.ACTION] = _chain(self._action_ops, transition[TransitionKey.ACTION])
+        if self._scalar_ops:
+            for key in self._SCALAR_KEYS:
+                if transition.get(key) is not None:
+                    transition[key] = _chain(self._scalar_ops, transition[key])
+        return transition
+
+
 @dataclass
 class DataProcessorPipeline[TInput, TOutput](HubMixin):
     """A sequential pipeline for processing data, integrated with the Hugging Face Hub.
@@ -303,6 +467,11 @@ class DataProcessorPipeline[TInput, TOutput](HubMixin):
         Returns:
             The final `EnvTransition` after all steps have been applied.
         """
+        if self._frozen_steps is not None:
+            for frozen_step in self._frozen_steps:
+                transition = frozen_step(transition)
+            return transition
+
         for idx, processor_step in enumerate(self.steps):
             # Execute pre-hooks
             for hook in self.before_step_hooks:
@@ -315,6 +484,53 @@ class DataProcessorPipeline[TInput, TOutput](HubMixin):
                 hook(idx, transition)
         return transition
 
+    def freeze(self) -> DataProcessorPipeline[TInput, TOutput]:
+        """Switches the pipeline to a frozen execution mode, with less Python overhead per call.
+
+        This is meant for inference loops running the same pipeline at a high rate. In the frozen mode:
+        - The before / after step hooks are not called.
+        - Runs of adjacent steps that can be fused (see `ProcessorStep.fused_ops`), e.g. renaming, batching,
+          device placement and (un)normalization, are executed as a single step. It is specialized on its
+          first call to the observation and complementary data keys of the transition, and copies the
+          transition once instead of once per step. Transitions with other keys go through the original
+          steps, and specialize the fused step again.
+
+        Steps must not be replaced or reconfigured while the pipeline is frozen: `unfreeze` it, then
+        `freeze` it again after such changes. Loading new statistics with `load_state_dict` is supported.
+
+        Returns:
+            The pipeline itself.
+        """
+        frozen_steps: list[Callable[[EnvTransition], EnvTransition]] = []
+        fusable_steps: list[ProcessorStep] = []
+        for step in self.steps:
+            if step.fused_ops() is not None:
+                fusable_steps.append(step)
+                continue
+            if fusable_steps:
+                frozen_steps.append(_FusedProcessorSteps(fusable_steps))
+                fusable_steps = []
+            frozen_steps.append(step)
+        if fusable_steps:
+            frozen_steps.append(_FusedProcessorSteps(fusable_steps))
+
+        self._frozen_steps = frozen_steps
+        return self
+
+    def unfreeze(self) -> DataProcessorPipeline[TInput, TOutput]:
+        """Switches the pipeline back to the default execution mode, see `freeze`.
+
+        Returns:
+            The pipeline itself.
+        """
+        self._frozen_steps = None
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the pipeline runs in the frozen execution mode, see `freeze`."""
+        return self._frozen_steps is not None
+
     def step_through(self, data: TInput) -> Iterable[EnvTransition]:
         """Processes data step-by-step, yielding the transition at each stage.
 
@@ -1313,6 +1529,8 @@ class DataProcessorPipeline[TInput, TOutput](HubMixin):
         for i, step in enumerate(self.steps):
             if not isinstance(step, ProcessorStep):
                 raise TypeError(f"Step {i} ({type(step).__name__}) must inherit from ProcessorStep")
+        # Steps executed in the frozen mode, see `freeze`
+        self._frozen_steps: list[Callable[[EnvTransition], EnvTransition]] | None = None
 
     def transform_features(
         self, initial_features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Overlap the policy preprocessor with the training steps.
+
+In a training loop, the batches of the dataloader go through the policy preprocessor (normalization,
+tokenization, device placement) before the policy update. :class:`PreprocessorPrefetcher` runs this stage on a
+background thread, and on a separate CUDA stream, for the next batches while the current one trains.
+
+The leading steps of the preprocessor that only work on CPU data (e.g. renaming, batching, tokenization, see
+:func:`num_worker_safe_steps`) can additionally run in the DataLoader workers, with
+:class:`WorkerPreprocessor` as the `collate_fn` of the DataLoader.
+"""
+
+import copy
+import logging
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any
+
+import torch
+from accelerate.utils import send_to_device
+from torch.utils.data import default_collate
+
+from .device_processor import DeviceProcessorStep
+from .pipeline import DataProcessorPipeline
+
+
+def num_worker_safe_steps(preprocessor: DataProcessorPipeline) -> int:
+    """Number of leading steps of a preprocessor that can run in DataLoader worker processes.
+
+    These are the steps before the first `DeviceProcessorStep`, up to the first step holding tensors outside
+    of the CPU (e.g. statistics of a `NormalizerProcessorStep` on the GPU), which worker processes cannot use.
+    """
+    for idx, step in enumerate(preprocessor.steps):
+        if isinstance(step, DeviceProcessorStep):
+            return idx
+        if any(tensor.device.type != "cpu" for tensor in step.state_dict().values()):
+            return idx
+    return len(preprocessor.steps)
+
+
+class WorkerPreprocessor:
+    """`collate_fn` of a DataLoader running the leading steps of a preprocessor in its workers.
+
+    Args:
+        preprocessor: The policy preprocessor.
+        num_steps: Number of leading steps to run, at most `num_worker_safe_steps(preprocessor)`. The
+            remaining steps are run by `PreprocessorPrefetcher` with `start_step=num_steps`.
+    """
+
+    def __init__(self, preprocessor: DataProcessorPipeline, num_steps: int):
+        if num_steps > num_worker_safe_steps(preprocessor):
+            raise ValueError(
+                f"Only the first {num_worker_safe_steps(preprocessor)} steps of the preprocessor can run in "
+                f"DataLoader workers, got num_steps={num_steps}"
+            )
+        self.pipeline = preprocessor[:num_steps]
+
+    def __call__(self, samples: list[dict[str, Any]]) -> dict[str, Any]:
+        return self.pipeline(default_collate(samples))
+
+
+@dataclass
+class PrefetchTimings:
+    """Time spent on a batch by each stage of `PreprocessorPrefetcher`, in seconds.
+
+    Attributes:
+        wait_s: Waiting for the batch from the DataLoader (its workers, or the main process without workers).
+        h2d_s: Transferring the batch to the device.
+        preprocess_s: Running the preprocessor steps not run in the DataLoader workers.
+    """
+
+    wait_s: float = 0.0
+    h2d_s: float = 0.0
+    preprocess_s: float = 0.0
+
+
+@dataclass
+class _PrefetchedBatch:
+    batch: dict[str, Any] | None = None
+    timings: PrefetchTimings = field(default_factory=PrefetchTimings)
+    event: torch.cuda.Event | None = None
+    error: BaseException | None = None
+
+
+class PreprocessorPrefetcher:
+    """Iterator over the preprocessed batches of a DataLoader, preprocessed ahead of the training steps.
+
+    Each batch is transferred to `device` (from pinned memory, without blocking when possible), then goes
+    through the preprocessor steps from `start_step` on. With `num_prefetch > 0`, a background thread does this
+    for up to `num_prefetch` batches ahead, on its own CUDA stream when `device` is a CUDA device, so that it
+    overlaps with the GPU work of the training step. With `num_prefetch=0`, batches are preprocessed when
+    requested, like calling the preprocessor in the training loop.
+
+    The background thread runs a copy of the preprocessor steps, the preprocessor itself can still be used by the
+    training loop, e.g. for evaluation. Steps must therefore not be reconfigured during training.
+
+    Args:
+        batches: Iterator over the batches of the DataLoader, e.g. `cycle(dataloader)`. Its batches are expected
+            on CPU: the DataLoader should not be prepared with device placement by `accelerate`.
+        preprocessor: The policy preprocessor.
+        device: Device of the policy.
+        num_prefetch: Number of batches preprocessed ahead by the background thread, 0 to disable it.
+        start_step: Index of the first preprocessor step to run, the previous ones being run by a
+            `WorkerPreprocessor` in the DataLoader workers.
+    """
+
+    def __init__(
+        self,
+        batches: Iterator[dict[str, Any]],
+        preprocessor: DataProcessorPipeline,
+        device: torch.device,
+        num_prefetch: int = 1,
+        start_step: int = 0,
+    ):
+        if num_prefetch < 0:
+            raise ValueError(f"num_prefetch must be >= 0, got {num_prefetch}")
+        self.batches = batches
+        self.device = device
+        self.num_prefetch = num_prefetch
+        self.pipeline = preprocessor[start_step:]
+        self.non_blocking = device.type == "cuda"
+
+        self._stream: torch.cuda.Stream | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        if num_prefetch > 0:
+            self.pipeline = copy.deepcopy(self.pipeline)
+            if device.type == "cuda":
+                self._stream = torch.cuda.Stream(device=device)
+            self._queue: queue.Queue[_PrefetchedBatch] = queue.Queue(maxsize=num_prefetch)
+            self._thread = threading.Thread(
+                target=self._prefetch_loop, name="preprocessor_prefetch", daemon=True
+            )
+            self._thread.start()
+
+    def _preprocess_next(self) -> _PrefetchedBatch:
+        start_time = time.perf_counter()
+        batch = next(self.batches)
+        wait_time = time.perf_counter()
+
+        batch = send_to_device(batch, self.device, non_blocking=self.non_blocking)
+        if self.device.type == "cuda":
+            # Only blocks the stream of the transfers, i.e. the background thread when prefetching
+            torch.cuda.current_stream(self.device).synchronize()
+        h2d_time = time.perf_counter()
+
+        batch = self.pipeline(batch)
+        timings = PrefetchTimings(
+            wait_s=wait_time - start_time,
+            h2d_s=h2d_time - wait_time,
+            preprocess_s=time.perf_counter() - h2d_time,
+        )
+        return _PrefetchedBatch(batch=batch, timings=timings)
+
+    def _prefetch_loop(self) -> None:
+        # Also makes the device of the stream the current device of the thread
+        with torch.cuda.stream(self._stream) if self._stream is not None else nullcontext():
+            while not self._stop.is_set():
+                try:
+                    prefetched = self._preprocess_next()
+                    if self._stream is not None:
+                        prefetched.event = torch.cuda.Event()
+                        prefetched.event.record(self._stream)
+                except BaseException as e:
+                    prefetched = _PrefetchedBatch(error=e)
+                while not self._stop.is_set():
+                    try:
+                        self._queue.put(prefetched, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if prefetched.error is not None:
+                    return
+
+    def __iter__(self) -> "PreprocessorPrefetcher":
+        return self
+
+    def __next__(self) -> dict[str, Any]:
+        return self.next_with_timings()[0]
+
+    def next_with_timings(self) -> tuple[dict[str, Any], PrefetchTimings]:
+        """Returns the next preprocessed batch, and the time its preprocessing stages took."""
+        if self._thread is None:
+            prefetched = self._preprocess_next()
+            return prefetched.batch, prefetched.timings
+
+        if self._stop.is_set():
+            raise RuntimeError("The prefetcher is closed")
+        prefetched = self._queue.get()
+        if prefetched.error is not None:
+            self.close()
+            raise prefetched.error
+
+        if prefetched.event is not None:
+            current_stream = torch.cuda.current_stream(self.device)
+            current_stream.wait_event(prefetched.event)
+            # The memory of the tensors allocated on the prefetch stream must not be reused while the
+            # training step still uses them
+            for value in _iter_tensors(prefetched.batch):
+                if value.is_cuda:
+                    value.record_stream(current_stream)
+        return prefetched.batch, prefetched.timings
+
+    def close(self) -> None:
+        """Stops the background thread, if any."""
+        if self._thread is None or self._stop.is_set():
+            return
+        self._stop.set()
+        self._thread.join(timeout=10)
+        if self._thread.is_alive():
+            logging.warning("The preprocessor prefetch thread did not stop in time")
+
+
+def _iter_tensors(value: Any) -> Iterator[torch.Tensor]:
+    if isinstance(value, torch.Tensor):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_tensors(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_tensors(item)
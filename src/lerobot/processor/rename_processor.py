@@ -19,7 +19,7 @@ from typing import Any
 
 from lerobot.configs.types import PipelineFeatureType, PolicyFeature
 
-from .pipeline import ObservationProcessorStep, ProcessorStepRegistry
+from .pipeline import FusedOps, ObservationProcessorStep, ProcessorStepRegistry
 
 
 @dataclass
@@ -53,6 +53,9 @@ class RenameObservationsProcessorStep(ObservationProcessorStep):
     def get_config(self) -> dict[str, Any]:
         return {"rename_map": self.rename_map}
 
+    def fused_ops(self) -> FusedOps:
+        return FusedOps(observation_renames=self.rename_map)
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
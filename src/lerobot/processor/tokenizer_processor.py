@@ -23,10 +23,12 @@ token IDs and attention masks, which are then added to the observation dictionar
 
 from __future__ import annotations
 
+import itertools
 import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import torch
 
 from lerobot.configs.types import FeatureType, PipelineFeatureType, PolicyFeature
@@ -39,7 +41,7 @@ from lerobot.utils.constants import (
     OBS_LANGUAGE_SUBTASK_TOKENS,
     OBS_LANGUAGE_TOKENS,
 )
-from lerobot.utils.import_utils import _transformers_available
+from lerobot.utils.import_utils import _scipy_available, _transformers_available
 
 from .pipeline import ActionProcessorStep, ObservationProcessorStep, ProcessorStepRegistry
 
@@ -50,6 +52,11 @@ else:
     AutoProcessor = None
     AutoTokenizer = None
 
+if TYPE_CHECKING or _scipy_available:
+    from scipy.fft import dct
+else:
+    dct = None
+
 
 @dataclass
 @ProcessorStepRegistry.register(name="tokenizer_processor")
@@ -352,6 +359,9 @@ class ActionTokenizerProcessorStep(ActionProcessorStep):
     # Internal tokenizer instance (not part of the config)
     action_tokenizer: Any = field(default=None, init=False, repr=False)
     _paligemma_tokenizer: Any = field(default=None, init=False, repr=False)
+    # PaliGemma token IDs before ("<bos>Action: ") and after ("|<eos>") the action tokens of every sample
+    _prefix_ids: np.ndarray | None = field(default=None, init=False, repr=False)
+    _suffix_ids: np.ndarray | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         """
@@ -391,6 +401,14 @@ class ActionTokenizerProcessorStep(ActionProcessorStep):
             add_eos_token=True,
             add_bos_token=False,
         )
+        self._prefix_ids = np.array(
+            [
+                self._paligemma_tokenizer.bos_token_id,
+                *self._paligemma_tokenizer.encode("Action: ", add_special_tokens=False),
+            ],
+            dtype=np.int64,
+        )
+        self._suffix_ids = np.array(self._paligemma_tokenizer.encode("|"), dtype=np.int64)
 
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         """
@@ -430,10 +448,88 @@ class ActionTokenizerProcessorStep(ActionProcessorStep):
         """
         return self._paligemma_tokenizer.vocab_size - 1 - self.fast_skip_tokens - tokens
 
+    def _is_fast_tokenizer(self) -> bool:
+        """Whether the action tokenizer is a FAST processor, whose encoding can be batched."""
+        return _scipy_available and all(
+            hasattr(self.action_tokenizer, attr) for attr in ("bpe_tokenizer", "scale", "min_token")
+        )
+
+    def _encode_actions(self, action: torch.Tensor) -> list[np.ndarray]:
+        """
+        Encodes every sample of a batch of actions with the action tokenizer.
+
+        FAST processors encode the samples of a batch one by one. Their encoding is reproduced here on the
+        whole batch instead: a single DCT of the action chunks, and a single call to the BPE tokenizer.
+
+        Args:
+            action: The batch of actions. Shape: (B, H, action_dim) or (B, action_dim)
+
+        Returns:
+            The action token IDs of every sample.
+        """
+        # The tokenizers work on numpy arrays: move the whole batch to CPU once
+        action = action.detach().cpu()
+        tokenizer = self.action_tokenizer
+        if self._is_fast_tokenizer() and action.dim() in (2, 3):
+            chunks = action.numpy()
+            if chunks.ndim == 2:
+                # Like a (1, action_dim) sample given to the tokenizer: a chunk of one action
+                chunks = chunks[:, None]
+            coefficients = np.around(dct(chunks, axis=1, norm="ortho") * tokenizer.scale)
+            codes = np.maximum(coefficients.reshape(len(chunks), -1) - tokenizer.min_token, 0).astype(int)
+            token_strings = ["".join(map(chr, sample_codes)) for sample_codes in codes.tolist()]
+            input_ids = tokenizer.bpe_tokenizer(token_strings)["input_ids"]
+            return [np.asarray(ids, dtype=np.int64) for ids in input_ids]
+
+        # Other tokenizers: one sample at a time
+        return [
+            torch.as_tensor(tokenizer(action[i : i + 1]), dtype=torch.long).flatten().numpy()
+            for i in range(len(action))
+        ]
+
+    def _pad_action_tokens(
+        self, action_ids: list[np.ndarray], device: torch.device
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """
+        Builds the padded PaliGemma tokens of a batch and their mask.
+
+        Every sample is "<bos>Action: ", its action tokens mapped to PaliGemma tokens, and "|<eos>",
+        truncated or padded with zeros to `max_action_tokens`.
+
+        Returns:
+            A tuple of (tokens, mask) of shape (B, max_action_tokens).
+        """
+        sequences = [
+            np.concatenate([self._prefix_ids, self._act_tokens_to_paligemma_tokens(ids), self._suffix_ids])
+            for ids in action_ids
+        ]
+        lengths = np.array([len(sequence) for sequence in sequences], dtype=np.int64)
+        if len(lengths) > 0 and lengths.max() > self.max_action_tokens:
+            logging.warning(
+                f"Token length ({lengths.max()}) of {(lengths > self.max_action_tokens).sum()} sample(s) exceeds "
+                f"max length ({self.max_action_tokens}), truncating. Consider increasing the "
+                "`max_action_tokens` in your model config if this happens frequently."
+            )
+            lengths = np.minimum(lengths, self.max_action_tokens)
+
+        mask = np.arange(self.max_action_tokens) < lengths[:, None]
+        tokens = np.zeros((len(sequences), self.max_action_tokens), dtype=np.int64)
+        tokens[mask] = np.fromiter(
+            itertools.chain.from_iterable(
+                sequence[:length] for sequence, length in zip(sequences, lengths, strict=True)
+            ),
+            dtype=np.int64,
+            count=int(lengths.sum()),
+        )
+        return torch.from_numpy(tokens).to(device), torch.from_numpy(mask).to(device)
+
     def _tokenize_action(self, action: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
         """
         Tokenizes the action tensor and creates a mask.
 
+        The samples of the batch are encoded together (see `_encode_actions`), and the padded tokens are built
+        once for the batch.
+
         Args:
             action: The input action tensor to tokenize. Shape: (B, H, action_dim) or (H, action_dim,)
 
@@ -445,88 +541,20 @@ class ActionTokenizerProcessorStep(ActionProcessorStep):
         if action is None:
             raise ValueError("Action cannot be None")
 
-        # Get the device and dtype of the input action
-        device = action.device if isinstance(action, torch.Tensor) else None
-
         # Handle single sample (add batch dimension)
         single_sample = action.dim() == 1
         if single_sample:
             action = action.unsqueeze(0)
 
-        batch_size = action.shape[0]
-
-        # Tokenize the action batch
-        # The fast tokenizer expects action data and returns token IDs
-        tokens_list = []
-        masks_list = []
-
-        for i in range(batch_size):
-            # Tokenize single action (move to CPU first as tokenizer uses scipy which requires numpy)
-            action_cpu = action[i : i + 1].cpu()
-            tokens = self.action_tokenizer(action_cpu)
-
-            # Convert to numpy array if it's a list
-            if isinstance(tokens, list) or not isinstance(tokens, torch.Tensor):
-                tokens = torch.tensor(tokens, dtype=torch.long, device=action.device)
-            else:
-                # Move tokens back to the same device as input action
-                tokens = tokens.to(device=action.device)
-
-            # Flatten to 1D if needed
-            if tokens.dim() > 1:
-                tokens = tokens.flatten()
-
-            bos_id = self._paligemma_tokenizer.bos_token_id
-            # add bos
-            tokens = torch.cat(
-                [
-                    torch.tensor([bos_id], device=action.device),
-                    torch.tensor(
-                        self._paligemma_tokenizer.encode("Action: ", add_special_tokens=False),
-                        device=action.device,
-                    ),
-                    self._act_tokens_to_paligemma_tokens(tokens),
-                    torch.tensor(self._paligemma_tokenizer.encode("|"), device=action.device),
-                ]
-            )
-
-            # Truncate or pad to max_action_tokens
-            if len(tokens) > self.max_action_tokens:
-                logging.warning(
-                    f"Token length ({len(tokens)}) exceeds max length ({self.max_action_tokens}), truncating. "
-                    "Consider increasing the `max_action_tokens` in your model config if this happens frequently."
-                )
-                tokens = tokens[: self.max_action_tokens]
-                mask = torch.ones(self.max_action_tokens, dtype=torch.bool, device=action.device)
-            else:
-                mask = torch.cat(
-                    [
-                        torch.ones(len(tokens), dtype=torch.bool, device=action.device),
-                        torch.zeros(
-                            self.max_action_tokens - len(tokens), dtype=torch.bool, device=action.device
-                        ),
-                    ]
-                )
-                # Pad tokens with zeros
-                tokens = torch.nn.functional.pad(tokens, (0, self.max_action_tokens - len(tokens)), value=0)
-
-            tokens_list.append(tokens)
-            masks_list.append(mask)
-
-        # Stack into batched tensors
-        tokens_batch = torch.stack(tokens_list, dim=0)  # (B, max_action_tokens)
-        masks_batch = torch.stack(masks_list, dim=0)  # (B, max_action_tokens)
+        tokens_batch, masks_batch = self._pad_action_tokens(
+            self._encode_actions(action), device=action.device
+        )
 
         # Remove batch dimension if input was single sample
         if single_sample:
             tokens_batch = tokens_batch.squeeze(0)
             masks_batch = masks_batch.squeeze(0)
 
-        # Move to the same device as the input
-        if device is not None:
-            tokens_batch = tokens_batch.to(device)
-            masks_batch = masks_batch.to(device)
-
         return tokens_batch, masks_batch
 
     def action(self, action: torch.Tensor) -> torch.Tensor:
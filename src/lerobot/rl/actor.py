@@ -68,6 +68,7 @@ from lerobot.robots import so_follower  # noqa: F401
 from lerobot.teleoperators import gamepad, so_leader  # noqa: F401
 from lerobot.teleoperators.utils import TeleopEvents
 from lerobot.transport import services_pb2, services_pb2_grpc
+from lerobot.transport.parameter_delta import ParameterDeltaDecoder
 from lerobot.transport.utils import (
     bytes_to_state_dict,
     grpc_channel_options,
@@ -257,6 +258,9 @@ def act_with_policy(
     )
     policy = policy.eval()
     assert isinstance(policy, nn.Module)
+    parameter_decoder = (
+        ParameterDeltaDecoder() if cfg.policy.actor_learner_config.policy_parameters_delta else None
+    )
 
     obs, info = online_env.reset()
     env_processor.reset()
@@ -351,7 +355,12 @@ def act_with_policy(
         if done or truncated:
             logging.info(f"[ACTOR] Global step {interaction_step}: Episode reward: {sum_reward_episode}")
 
-            update_policy_parameters(policy=policy, parameters_queue=parameters_queue, device=device)
+            update_policy_parameters(
+                policy=policy,
+                parameters_queue=parameters_queue,
+                device=device,
+                parameter_decoder=parameter_decoder,
+            )
 
             if len(list_transition_to_send_to_learner) > 0:
                 push_transitions_to_transport_queue(
@@ -649,11 +658,30 @@ def interactions_stream(
 #  Policy functions
 
 
-def update_policy_parameters(policy: SACPolicy, parameters_queue: Queue, device):
+def update_policy_parameters(
+    policy: SACPolicy,
+    parameters_queue: Queue,
+    device,
+    parameter_decoder: ParameterDeltaDecoder | None = None,
+):
+    """Load the latest parameters received from the learner, if any.
+
+    Args:
+        policy: The policy to update.
+        parameters_queue: Queue of the parameters received from the learner.
+        device: Device of the policy.
+        parameter_decoder: Decoder of the parameters when the learner streams deltas
+            (`actor_learner_config.policy_parameters_delta`). Otherwise, the learner sends full state dicts.
+    """
     bytes_state_dict = get_last_item_from_queue(parameters_queue, block=False)
     if bytes_state_dict is not None:
         logging.info("[ACTOR] Load new parameters from Learner.")
-        state_dicts = bytes_to_state_dict(bytes_state_dict)
+        if parameter_decoder is not None:
+            state_dicts = parameter_decoder.decode(bytes_state_dict)
+            if state_dicts is None:
+                return
+        else:
+            state_dicts = bytes_to_state_dict(bytes_state_dict)
 
         # TODO: check encoder parameter synchronization possible issues:
         # 1. When shared_encoder=True, we're loading stale encoder params from actor's state_dict
@@ -14,11 +14,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import functools
-from collections.abc import Callable, Sequence
+import json
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import suppress
-from typing import TypedDict
+from pathlib import Path
+from typing import NotRequired, TypedDict
 
+import numpy as np
 import torch
 import torch.nn.functional as F  # noqa: N812
 from tqdm import tqdm
@@ -27,6 +34,9 @@ from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGE, REWARD
 from lerobot.utils.transition import Transition
 
+# Name of the file holding the state of a memory-mapped buffer in its storage_dir
+BUFFER_STATE_FILE = "buffer_state.json"
+
 
 class BatchTransition(TypedDict):
     state: dict[str, torch.Tensor]
@@ -36,6 +46,9 @@ class BatchTransition(TypedDict):
     done: torch.Tensor
     truncated: torch.Tensor
     complementary_info: dict[str, torch.Tensor | float | int] | None = None
+    # Sampled by `PrioritizedReplayBuffer` only: importance sampling weights and buffer indices of the batch
+    weights: NotRequired[torch.Tensor]
+    indices: NotRequired[torch.Tensor]
 
 
 def random_crop_vectorized(images: torch.Tensor, output_size: tuple) -> torch.Tensor:
@@ -87,12 +100,17 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        store_images_as_uint8: bool = False,
+        pin_memory: bool = False,
+        storage_dir: str | Path | None = None,
     ):
         """
         Replay buffer for storing transitions.
         It will allocate tensors on the specified device, when the first transition is added.
         NOTE: If you encounter memory issues, you can try to use the `optimize_memory` flag to save memory or
-        and use the `storage_device` flag to store the buffer on a different device.
+        and use the `storage_device` flag to store the buffer on a different device. Storing images as uint8
+        with `store_images_as_uint8` divides their memory footprint, and the size of their copies to `device`,
+        by 4.
         Args:
             capacity (int): Maximum number of transitions to store in the buffer.
             device (str): The device where the tensors will be moved when sampling ("cuda:0" or "cpu").
@@ -104,9 +122,22 @@ class ReplayBuffer:
                 Using "cpu" can help save GPU memory.
             optimize_memory (bool): If True, optimizes memory by not storing duplicate next_states when
                 they can be derived from states. This is useful for large datasets where next_state[i] = state[i+1].
+            store_images_as_uint8 (bool): If True, images (state keys starting with "observation.image") in
+                [0, 1] are stored quantized to uint8, and converted back to float on `device` when sampling.
+            pin_memory (bool): If True and the storage is on CPU while `device` is a CUDA device, sampled
+                batches are gathered in pinned memory and copied to `device` asynchronously. `get_iterator` then
+                prepares the next batches on a side CUDA stream, overlapping with the optimization step.
+            storage_dir (str | Path | None): If set, the storage is kept in memory-mapped files in this
+                directory (one `.npy` file per key), so that the buffer can be larger than RAM. The buffer is then
+                checkpointed with `save_state` and resumed with `from_storage_dir`. Requires a CPU
+                `storage_device`, and is best combined with `store_images_as_uint8`.
         """
         if capacity <= 0:
             raise ValueError("Capacity must be greater than 0.")
+        if storage_dir is not None and torch.device(storage_device).type != "cpu":
+            raise ValueError(
+                f"A memory-mapped buffer must be stored on CPU, got storage_device={storage_device}"
+            )
 
         self.capacity = capacity
         self.device = device
@@ -115,9 +146,23 @@ class ReplayBuffer:
         self.size = 0
         self.initialized = False
         self.optimize_memory = optimize_memory
-
-        # Track episode boundaries for memory optimization
-        self.episode_ends = torch.zeros(capacity, dtype=torch.bool, device=storage_device)
+        self.store_images_as_uint8 = store_images_as_uint8
+        self.storage_dir = Path(storage_dir) if storage_dir is not None else None
+        # Memory-mapped arrays backing the storage tensors, by file name
+        self._memmaps: dict[str, np.memmap] = {}
+        # Shapes of the stored values, saved along with the memory-mapped storage
+        self._storage_shapes: dict = {}
+
+        self.pin_memory = pin_memory
+        if pin_memory and not (
+            torch.cuda.is_available()
+            and torch.device(storage_device).type == "cpu"
+            and torch.device(device).type == "cuda"
+        ):
+            logging.warning(
+                "pin_memory only applies to buffers stored on CPU and sampled on a CUDA device, disabling it."
+            )
+            self.pin_memory = False
 
         # If no state_keys provided, default to an empty list
         self.state_keys = state_keys if state_keys is not None else []
@@ -136,22 +181,78 @@ class ReplayBuffer:
         complementary_info: dict[str, torch.Tensor] | None = None,
     ):
         """Initialize the storage tensors based on the first transition."""
+        complementary_info_shapes = None
+        if complementary_info is not None:
+            complementary_info_shapes = {}
+            for key, value in complementary_info.items():
+                if isinstance(value, torch.Tensor):
+                    complementary_info_shapes[key] = list(value.squeeze(0).shape)
+                elif isinstance(value, (int | float)):
+                    # Handle scalar values similar to reward
+                    complementary_info_shapes[key] = []
+                else:
+                    raise ValueError(f"Unsupported type {type(value)} for complementary_info[{key}]")
+
         # Determine shapes from the first transition
-        state_shapes = {key: val.squeeze(0).shape for key, val in state.items()}
-        action_shape = action.squeeze(0).shape
+        self._allocate_storage(
+            state_shapes={key: list(val.squeeze(0).shape) for key, val in state.items()},
+            action_shape=list(action.squeeze(0).shape),
+            complementary_info_shapes=complementary_info_shapes,
+        )
+
+    def _allocate(
+        self, name: str, shape: Sequence[int], dtype: torch.dtype, open_existing: bool = False
+    ) -> torch.Tensor:
+        """Allocate a storage tensor of `capacity` values of `shape`, in a memory-mapped file in `storage_dir`
+        if set."""
+        shape = (self.capacity, *shape)
+        if self.storage_dir is None:
+            return torch.empty(shape, dtype=dtype, device=self.storage_device)
+
+        path = self.storage_dir / f"{name}.npy"
+        if open_existing:
+            array = np.load(path, mmap_mode="r+")
+            if array.shape != shape:
+                raise ValueError(f"Expected {path} to hold an array of shape {shape}, got {array.shape}.")
+        else:
+            np_dtype = torch.empty((), dtype=dtype).numpy().dtype
+            array = np.lib.format.open_memmap(path, mode="w+", dtype=np_dtype, shape=shape)
+        self._memmaps[name] = array
+        return torch.from_numpy(array)
+
+    def _allocate_storage(
+        self,
+        state_shapes: dict[str, list[int]],
+        action_shape: list[int],
+        complementary_info_shapes: dict[str, list[int]] | None = None,
+        open_existing: bool = False,
+    ):
+        """Pre-allocate the storage tensors, or map the ones saved in `storage_dir` if `open_existing`."""
+        if self.storage_dir is not None:
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+            if not open_existing:
+                # The saved state does not describe the new storage
+                (self.storage_dir / BUFFER_STATE_FILE).unlink(missing_ok=True)
+        self._storage_shapes = {
+            "state": state_shapes,
+            "action": action_shape,
+            "complementary_info": complementary_info_shapes,
+        }
+        allocate = functools.partial(self._allocate, open_existing=open_existing)
+        default_dtype = torch.get_default_dtype()
 
         # Pre-allocate tensors for storage
         self.states = {
-            key: torch.empty((self.capacity, *shape), device=self.storage_device)
+            key: allocate(f"state.{key}", shape, self._storage_dtype(key))
             for key, shape in state_shapes.items()
         }
-        self.actions = torch.empty((self.capacity, *action_shape), device=self.storage_device)
-        self.rewards = torch.empty((self.capacity,), device=self.storage_device)
+        self.actions = allocate("action", action_shape, default_dtype)
+        self.rewards = allocate("reward", [], default_dtype)
 
         if not self.optimize_memory:
             # Standard approach: store states and next_states separately
             self.next_states = {
-                key: torch.empty((self.capacity, *shape), device=self.storage_device)
+                key: allocate(f"next_state.{key}", shape, self._storage_dtype(key))
                 for key, shape in state_shapes.items()
             }
         else:
@@ -159,31 +260,49 @@ class ReplayBuffer:
             # Just create a reference to states for consistent API
             self.next_states = self.states  # Just a reference for API consistency
 
-        self.dones = torch.empty((self.capacity,), dtype=torch.bool, device=self.storage_device)
-        self.truncateds = torch.empty((self.capacity,), dtype=torch.bool, device=self.storage_device)
+        self.dones = allocate("done", [], torch.bool)
+        self.truncateds = allocate("truncated", [], torch.bool)
+        # Track episode boundaries: whether each transition is the last one of its episode
+        self.episode_ends = allocate("episode_end", [], torch.bool)
 
         # Initialize storage for complementary_info
-        self.has_complementary_info = complementary_info is not None
+        self.has_complementary_info = complementary_info_shapes is not None
         self.complementary_info_keys = []
         self.complementary_info = {}
 
         if self.has_complementary_info:
-            self.complementary_info_keys = list(complementary_info.keys())
+            self.complementary_info_keys = list(complementary_info_shapes.keys())
             # Pre-allocate tensors for each key in complementary_info
-            for key, value in complementary_info.items():
-                if isinstance(value, torch.Tensor):
-                    value_shape = value.squeeze(0).shape
-                    self.complementary_info[key] = torch.empty(
-                        (self.capacity, *value_shape), device=self.storage_device
-                    )
-                elif isinstance(value, (int | float)):
-                    # Handle scalar values similar to reward
-                    self.complementary_info[key] = torch.empty((self.capacity,), device=self.storage_device)
-                else:
-                    raise ValueError(f"Unsupported type {type(value)} for complementary_info[{key}]")
+            for key, shape in complementary_info_shapes.items():
+                self.complementary_info[key] = allocate(f"complementary_info.{key}", shape, default_dtype)
 
         self.initialized = True
 
+    def _is_uint8_image(self, key: str) -> bool:
+        return self.store_images_as_uint8 and key.startswith(OBS_IMAGE)
+
+    def _storage_dtype(self, key: str) -> torch.dtype:
+        return torch.uint8 if self._is_uint8_image(key) else torch.get_default_dtype()
+
+    def _to_storage(self, key: str, value: torch.Tensor) -> torch.Tensor:
+        """Quantize the [0, 1] float images stored as uint8, other values are stored as is."""
+        if self._is_uint8_image(key) and value.dtype != torch.uint8:
+            return value.mul(255).round_().clamp_(0, 255)
+        return value
+
+    def _from_storage(self, key: str, value: torch.Tensor) -> torch.Tensor:
+        if self._is_uint8_image(key):
+            return value.float().div_(255)
+        return value
+
+    def _gather(self, storage: torch.Tensor, idx: torch.Tensor) -> torch.Tensor:
+        """Gather `storage[idx]` on the sampling device, through pinned memory when enabled."""
+        if not self.pin_memory:
+            return storage[idx].to(self.device)
+        gathered = torch.empty((len(idx), *storage.shape[1:]), dtype=storage.dtype, pin_memory=True)
+        torch.index_select(storage, 0, idx, out=gathered)
+        return gathered.to(self.device, non_blocking=True)
+
     def __len__(self):
         return self.size
 
@@ -204,16 +323,19 @@ class ReplayBuffer:
 
         # Store the transition in pre-allocated tensors
         for key in self.states:
-            self.states[key][self.position].copy_(state[key].squeeze(dim=0))
+            self.states[key][self.position].copy_(self._to_storage(key, state[key].squeeze(dim=0)))
 
             if not self.optimize_memory:
                 # Only store next_states if not optimizing memory
-                self.next_states[key][self.position].copy_(next_state[key].squeeze(dim=0))
+                self.next_states[key][self.position].copy_(
+                    self._to_storage(key, next_state[key].squeeze(dim=0))
+                )
 
         self.actions[self.position].copy_(action.squeeze(dim=0))
         self.rewards[self.position] = reward
         self.dones[self.position] = done
         self.truncateds[self.position] = truncated
+        self.episode_ends[self.position] = done or truncated
 
         # Handle complementary_info if provided and storage is initialized
         if complementary_info is not None and self.has_complementary_info:
@@ -229,6 +351,71 @@ class ReplayBuffer:
         self.position = (self.position + 1) % self.capacity
         self.size = min(self.size + 1, self.capacity)
 
+    def add_batch(
+        self,
+        state: dict[str, torch.Tensor],
+        action: torch.Tensor,
+        reward: torch.Tensor,
+        next_state: dict[str, torch.Tensor],
+        done: torch.Tensor,
+        truncated: torch.Tensor,
+        complementary_info: dict[str, torch.Tensor] | None = None,
+    ) -> torch.Tensor:
+        """Saves a batch of transitions, e.g. stacked with `stack_transitions`, with a single copy per key.
+
+        The values are batched along their first dimension, in insertion order. The result is the same as
+        adding the transitions one by one with `add`.
+
+        Returns:
+            The positions in the buffer where the transitions were written, in insertion order. Only the last
+            `capacity` transitions of a larger batch are written.
+        """
+        batch_size = len(reward)
+        if batch_size == 0:
+            return torch.empty(0, dtype=torch.long, device=self.storage_device)
+        if not self.initialized:
+            self._initialize_storage(
+                state={key: value[:1] for key, value in state.items()},
+                action=action[:1],
+                complementary_info=(
+                    {key: value[:1] for key, value in complementary_info.items()}
+                    if complementary_info is not None
+                    else None
+                ),
+            )
+
+        # Transitions overwritten within the batch itself are skipped
+        skipped = max(0, batch_size - self.capacity)
+        positions = (self.position + skipped + torch.arange(batch_size - skipped)) % self.capacity
+        positions = positions.to(self.storage_device)
+
+        def write(storage: torch.Tensor, values: torch.Tensor, key: str | None = None) -> None:
+            values = values[skipped:]
+            if key is not None:
+                values = self._to_storage(key, values)
+            storage.index_copy_(0, positions, values.to(device=storage.device, dtype=storage.dtype))
+
+        for key in self.states:
+            write(self.states[key], state[key], key)
+            if not self.optimize_memory:
+                write(self.next_states[key], next_state[key], key)
+
+        write(self.actions, action)
+        write(self.rewards, torch.as_tensor(reward))
+        done, truncated = torch.as_tensor(done).bool(), torch.as_tensor(truncated).bool()
+        write(self.dones, done)
+        write(self.truncateds, truncated)
+        write(self.episode_ends, done | truncated)
+
+        if complementary_info is not None and self.has_complementary_info:
+            for key in self.complementary_info_keys:
+                if key in complementary_info:
+                    write(self.complementary_info[key], torch.as_tensor(complementary_info[key]))
+
+        self.position = (self.position + batch_size) % self.capacity
+        self.size = min(self.size + batch_size, self.capacity)
+        return positions
+
     def sample(self, batch_size: int) -> BatchTransition:
         """Sample a random batch of transitions and collate them into batched tensors."""
         if not self.initialized:
@@ -239,6 +426,11 @@ class ReplayBuffer:
 
         # Random indices for sampling - create on the same device as storage
         idx = torch.randint(low=0, high=high, size=(batch_size,), device=self.storage_device)
+        return self._collate(idx)
+
+    def _collate(self, idx: torch.Tensor) -> BatchTransition:
+        """Gather the transitions at `idx` (on the storage device) into batched tensors on `device`."""
+        batch_size = len(idx)
 
         # Identify image keys that need augmentation
         image_keys = [k for k in self.states if k.startswith(OBS_IMAGE)] if self.use_drq else []
@@ -248,16 +440,17 @@ class ReplayBuffer:
         batch_next_state = {}
 
         # First pass: load all state tensors to target device
+        # Memory-optimized approach: next_states are the states at the next index, gathered along with the
+        # states with a single fused index
+        fused_idx = torch.cat([idx, (idx + 1) % self.capacity]) if self.optimize_memory else None
         for key in self.states:
-            batch_state[key] = self.states[key][idx].to(self.device)
-
-            if not self.optimize_memory:
-                # Standard approach - load next_states directly
-                batch_next_state[key] = self.next_states[key][idx].to(self.device)
+            if self.optimize_memory:
+                states = self._from_storage(key, self._gather(self.states[key], fused_idx))
+                batch_state[key], batch_next_state[key] = states[:batch_size], states[batch_size:]
             else:
-                # Memory-optimized approach - get next_state from the next index
-                next_idx = (idx + 1) % self.capacity
-                batch_next_state[key] = self.states[key][next_idx].to(self.device)
+                # Standard approach - load next_states directly
+                batch_state[key] = self._from_storage(key, self._gather(self.states[key], idx))
+                batch_next_state[key] = self._from_storage(key, self._gather(self.next_states[key], idx))
 
         # Apply image augmentation in a batched way if needed
         if self.use_drq and image_keys:
@@ -281,17 +474,17 @@ class ReplayBuffer:
                 batch_next_state[key] = augmented_images[(i * 2 + 1) * batch_size : (i + 1) * 2 * batch_size]
 
         # Sample other tensors
-        batch_actions = self.actions[idx].to(self.device)
-        batch_rewards = self.rewards[idx].to(self.device)
-        batch_dones = self.dones[idx].to(self.device).float()
-        batch_truncateds = self.truncateds[idx].to(self.device).float()
+        batch_actions = self._gather(self.actions, idx)
+        batch_rewards = self._gather(self.rewards, idx)
+        batch_dones = self._gather(self.dones, idx).float()
+        batch_truncateds = self._gather(self.truncateds, idx).float()
 
         # Sample complementary_info if available
         batch_complementary_info = None
         if self.has_complementary_info:
             batch_complementary_info = {}
             for key in self.complementary_info_keys:
-                batch_complementary_info[key] = self.complementary_info[key][idx].to(self.device)
+                batch_complementary_info[key] = self._gather(self.complementary_info[key], idx)
 
         return BatchTransition(
             state=batch_state,
@@ -315,14 +508,17 @@ class ReplayBuffer:
 
         Args:
             batch_size (int): Size of batches to sample
-            async_prefetch (bool): Whether to use asynchronous prefetching with threads (default: True)
+            async_prefetch (bool): Whether to use asynchronous prefetching (default: True). Batches are
+                prepared on a side CUDA stream with `pin_memory`, and in a background thread otherwise.
             queue_size (int): Number of batches to prefetch (default: 2)
 
         Yields:
             BatchTransition: Batched transitions
         """
         while True:  # Create an infinite loop
-            if async_prefetch:
+            if async_prefetch and self.pin_memory:
+                iterator = self._get_stream_iterator(batch_size=batch_size, queue_size=queue_size)
+            elif async_prefetch:
                 # Get the standard iterator
                 iterator = self._get_async_iterator(queue_size=queue_size, batch_size=batch_size)
             else:
@@ -386,6 +582,40 @@ class ReplayBuffer:
             # Give the producer thread a bit of time to finish.
             producer_thread.join(timeout=1.0)
 
+    def _get_stream_iterator(self, batch_size: int, queue_size: int = 2) -> Iterator[BatchTransition]:
+        """
+        Create an iterator that samples batches ahead on a side CUDA stream. The copies of the next batches
+        from pinned memory (and their augmentation) run on the GPU while the caller uses the current batch.
+
+        Args:
+            batch_size (int): Size of batches to sample.
+            queue_size (int): Number of batches sampled ahead.
+
+        Yields:
+            BatchTransition: A batch sampled from the replay buffer, ready to use on the current stream.
+        """
+        stream = torch.cuda.Stream(device=self.device)
+        pending = collections.deque()
+
+        def enqueue():
+            with torch.cuda.stream(stream):
+                batch = self.sample(batch_size)
+                ready = torch.cuda.Event()
+                ready.record(stream)
+            pending.append((batch, ready))
+
+        for _ in range(queue_size):
+            enqueue()
+        while pending:
+            batch, ready = pending.popleft()
+            current_stream = torch.cuda.current_stream(self.device)
+            current_stream.wait_event(ready)
+            # The batch was allocated on the side stream: keep its memory until the current stream is done
+            for tensor in _batch_tensors(batch):
+                tensor.record_stream(current_stream)
+            enqueue()
+            yield batch
+
     def _get_naive_iterator(self, batch_size: int, queue_size: int = 2):
         """
         Creates a simple non-threaded iterator that yields batches.
@@ -411,6 +641,75 @@ class ReplayBuffer:
             yield queue.popleft()
             enqueue(1)
 
+    def save_state(self) -> None:
+        """Checkpoint a memory-mapped buffer: flush its storage to disk and save the state of the ring buffer
+        (position, size, shapes...) in `storage_dir`, from which `from_storage_dir` resumes it.
+
+        Transitions added after the last call are written to the files too, but not accounted for by the saved
+        state: a resumed buffer overwrites them, or holds them in place of its oldest transitions once full.
+        """
+        if self.storage_dir is None:
+            raise ValueError("Only buffers memory-mapped in a storage_dir can save their state.")
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        for array in self._memmaps.values():
+            array.flush()
+
+        state = {
+            "capacity": self.capacity,
+            "position": self.position,
+            "size": self.size,
+            "state_keys": list(self.state_keys),
+            "optimize_memory": self.optimize_memory,
+            "store_images_as_uint8": self.store_images_as_uint8,
+            "shapes": self._storage_shapes if self.initialized else None,
+        }
+        # Written atomically, so that a crash while checkpointing leaves the previous state
+        state_path = self.storage_dir / BUFFER_STATE_FILE
+        tmp_path = state_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, indent=4)
+        os.replace(tmp_path, state_path)
+
+    @classmethod
+    def from_storage_dir(
+        cls, storage_dir: str | Path, device: str = "cuda:0", **buffer_kwargs
+    ) -> "ReplayBuffer":
+        """Resume a memory-mapped buffer from the state saved in `storage_dir` by `save_state`, without copying
+        its storage.
+
+        Args:
+            storage_dir (str | Path): Directory of the memory-mapped buffer.
+            device (str): The device where the tensors will be moved when sampling.
+            buffer_kwargs: Other arguments of the buffer class, e.g. `image_augmentation_function`. The capacity,
+                state keys and storage format are the saved ones.
+
+        Returns:
+            ReplayBuffer: The buffer, holding the transitions it held when its state was saved.
+        """
+        storage_dir = Path(storage_dir)
+        with open(storage_dir / BUFFER_STATE_FILE) as f:
+            state = json.load(f)
+
+        replay_buffer = cls(
+            capacity=state["capacity"],
+            device=device,
+            state_keys=state["state_keys"],
+            optimize_memory=state["optimize_memory"],
+            store_images_as_uint8=state["store_images_as_uint8"],
+            storage_dir=storage_dir,
+            **buffer_kwargs,
+        )
+        if state["shapes"] is not None:
+            replay_buffer._allocate_storage(
+                state_shapes=state["shapes"]["state"],
+                action_shape=state["shapes"]["action"],
+                complementary_info_shapes=state["shapes"]["complementary_info"],
+                open_existing=True,
+            )
+        replay_buffer.position = state["position"]
+        replay_buffer.size = state["size"]
+        return replay_buffer
+
     @classmethod
     def from_lerobot_dataset(
         cls,
@@ -422,6 +721,9 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        store_images_as_uint8: bool = False,
+        pin_memory: bool = False,
+        **buffer_kwargs,
     ) -> "ReplayBuffer":
         """
         Convert a LeRobotDataset into a ReplayBuffer.
@@ -437,6 +739,10 @@ class ReplayBuffer:
             use_drq (bool): Whether to use DrQ image augmentation when sampling.
             storage_device (str): Device for storing tensor data. Using "cpu" saves GPU memory.
             optimize_memory (bool): If True, reduces memory usage by not duplicating state data.
+            store_images_as_uint8 (bool): If True, stores images as uint8 instead of float.
+            pin_memory (bool): If True, samples through pinned memory, see `ReplayBuffer`.
+            buffer_kwargs: Other arguments of the buffer class, e.g. the prioritization of a
+                `PrioritizedReplayBuffer`.
 
         Returns:
             ReplayBuffer: The replay buffer with dataset transitions.
@@ -458,6 +764,9 @@ class ReplayBuffer:
             use_drq=use_drq,
             storage_device=storage_device,
             optimize_memory=optimize_memory,
+            store_images_as_uint8=store_images_as_uint8,
+            pin_memory=pin_memory,
+            **buffer_kwargs,
         )
 
         # Convert dataset to transitions
@@ -539,7 +848,7 @@ class ReplayBuffer:
 
         # Add state keys
         for key in self.states:
-            sample_val = self.states[key][0]
+            sample_val = self._from_storage(key, self.states[key][0])
             f_info = guess_feature_info(t=sample_val, name=key)
             features[key] = f_info
 
@@ -574,7 +883,7 @@ class ReplayBuffer:
 
             # Fill the data for state keys
             for key in self.states:
-                frame_dict[key] = self.states[key][actual_idx].cpu()
+                frame_dict[key] = self._from_storage(key, self.states[key][actual_idx]).cpu()
 
             # Fill action, reward, done
             frame_dict[ACTION] = self.actions[actual_idx].cpu()
@@ -735,6 +1044,190 @@ class ReplayBuffer:
         return transitions
 
 
+def _batch_tensors(batch: BatchTransition) -> Iterator[torch.Tensor]:
+    for value in batch.values():
+        if isinstance(value, dict):
+            yield from (v for v in value.values() if isinstance(v, torch.Tensor))
+        elif isinstance(value, torch.Tensor):
+            yield value
+
+
+class SumTree:
+    """Array-backed binary tree whose leaves hold the priorities of the transitions of a buffer.
+
+    Every node holds the sum of its children, so that sampling transitions in proportion to their priorities and
+    updating priorities both take O(log n). Both are vectorized over batches of transitions. Node 1 is the root
+    and the leaves are the nodes `[num_leaves, 2 * num_leaves)`, `num_leaves` being a power of 2.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.num_leaves = 1 << max(0, (capacity - 1).bit_length())
+        self._tree = torch.zeros(2 * self.num_leaves, dtype=torch.float64)
+
+    @property
+    def total(self) -> float:
+        return self._tree[1].item()
+
+    def __getitem__(self, indices: torch.Tensor) -> torch.Tensor:
+        return self._tree[indices + self.num_leaves]
+
+    def update(self, indices: torch.Tensor, priorities: torch.Tensor) -> None:
+        """Set the priorities of the leaves at `indices`, then recompute the sums of their ancestors."""
+        nodes = indices.long().cpu() + self.num_leaves
+        self._tree[nodes] = priorities.to(device="cpu", dtype=torch.float64)
+        # All leaves are at the same depth: update the ancestors one level at a time
+        while nodes[0] > 1:
+            nodes = torch.unique(nodes // 2)
+            self._tree[nodes] = self._tree[2 * nodes] + self._tree[2 * nodes + 1]
+
+    def sample(self, batch_size: int) -> torch.Tensor:
+        """Sample `batch_size` leaf indices in proportion to their priorities, one in each of `batch_size` equal
+        segments of the total priority (stratified sampling)."""
+        segment = self.total / batch_size
+        targets = (
+            torch.arange(batch_size, dtype=torch.float64) + torch.rand(batch_size, dtype=torch.float64)
+        ) * segment
+        nodes = torch.ones(batch_size, dtype=torch.long)
+        while nodes[0] < self.num_leaves:
+            left = self._tree[2 * nodes]
+            # Never go down to an empty subtree, whatever the rounding of the targets
+            go_right = ((targets >= left) & (self._tree[2 * nodes + 1] > 0)) | (left <= 0)
+            targets = torch.where(go_right, targets - left, targets)
+            nodes = 2 * nodes + go_right.long()
+        return nodes - self.num_leaves
+
+
+class PrioritizedReplayBuffer(ReplayBuffer):
+    def __init__(
+        self,
+        capacity: int,
+        device: str = "cuda:0",
+        state_keys: Sequence[str] | None = None,
+        image_augmentation_function: Callable | None = None,
+        use_drq: bool = True,
+        storage_device: str = "cpu",
+        optimize_memory: bool = False,
+        store_images_as_uint8: bool = False,
+        pin_memory: bool = False,
+        storage_dir: str | Path | None = None,
+        alpha: float = 0.6,
+        beta: float = 0.4,
+        epsilon: float = 1e-6,
+    ):
+        """
+        Replay buffer sampling transitions in proportion to their priority (prioritized experience replay).
+        The priority of a transition is `(|td_error| + epsilon) ** alpha`, with the TD error of its last update
+        (see `update_priorities`). New transitions get the highest priority seen so far, to be sampled at least
+        once. Batches sampled hold the importance sampling weights correcting the bias of non-uniform sampling
+        in `weights`, and the indices of their transitions in `indices`.
+
+        Priority updates are queued and applied when sampling the next batch, so that the learner never waits
+        for its TD errors to be copied from the GPU (with `async_prefetch`, they are applied in the prefetching
+        thread).
+        Args:
+            alpha (float): How much prioritization is used, from 0 (uniform sampling) to 1.
+            beta (float): Importance sampling correction, from 0 (none) to 1 (full correction).
+            epsilon (float): Minimal priority, so that every transition can be sampled.
+            For the other arguments, see `ReplayBuffer`.
+        """
+        super().__init__(
+            capacity=capacity,
+            device=device,
+            state_keys=state_keys,
+            image_augmentation_function=image_augmentation_function,
+            use_drq=use_drq,
+            storage_device=storage_device,
+            optimize_memory=optimize_memory,
+            store_images_as_uint8=store_images_as_uint8,
+            pin_memory=pin_memory,
+            storage_dir=storage_dir,
+        )
+        if not 0 <= alpha <= 1:
+            raise ValueError(f"alpha must be between 0 and 1, got {alpha}")
+        if not 0 <= beta <= 1:
+            raise ValueError(f"beta must be between 0 and 1, got {beta}")
+
+        self.alpha = alpha
+        self.beta = beta
+        self.epsilon = epsilon
+        self.priorities = SumTree(capacity)
+        # Highest priority seen so far (to the power alpha), given to new transitions
+        self.max_priority = 1.0
+        self._pending_updates: list[tuple[torch.Tensor, torch.Tensor]] = []
+        # Guards the tree, as it is sampled by the prefetching thread while the learner updates priorities
+        self._priorities_lock = threading.Lock()
+
+    def add(self, *args, **kwargs):
+        position = self.position
+        super().add(*args, **kwargs)
+        self._on_insert(torch.tensor([position]))
+
+    def add_batch(self, *args, **kwargs) -> torch.Tensor:
+        positions = super().add_batch(*args, **kwargs)
+        if len(positions) > 0:
+            self._on_insert(positions.cpu())
+        return positions
+
+    def _on_insert(self, positions: torch.Tensor) -> None:
+        """Give the highest priority to the transitions just written at `positions`, in insertion order."""
+        priorities = torch.full((len(positions),), self.max_priority, dtype=torch.float64)
+        if self.optimize_memory:
+            # The next state of the newest transition is the state of the next transition, not stored yet:
+            # it can only be sampled once the next transition arrives
+            priorities[-1] = 0.0
+            if self.size > len(positions):
+                positions = torch.cat([(positions[:1] - 1) % self.capacity, positions])
+                priorities = torch.cat([priorities.new_full((1,), self.max_priority), priorities])
+        with self._priorities_lock:
+            self.priorities.update(positions, priorities)
+
+    @classmethod
+    def from_storage_dir(cls, *args, **kwargs) -> "PrioritizedReplayBuffer":
+        """See `ReplayBuffer.from_storage_dir`. Priorities are not saved: the transitions of the resumed buffer
+        all get the highest priority."""
+        replay_buffer = super().from_storage_dir(*args, **kwargs)
+        if replay_buffer.size > 0:
+            positions = replay_buffer.position - replay_buffer.size + torch.arange(replay_buffer.size)
+            replay_buffer._on_insert(positions % replay_buffer.capacity)
+        return replay_buffer
+
+    def update_priorities(self, indices: torch.Tensor, td_errors: torch.Tensor) -> None:
+        """Queue the update of the priorities of the transitions at `indices` (from a sampled batch) with their
+        new TD errors. The update is applied before the next batch is sampled."""
+        priorities = (td_errors.detach().abs() + self.epsilon).pow(self.alpha)
+        with self._priorities_lock:
+            self._pending_updates.append((indices, priorities))
+
+    def _apply_pending_updates(self) -> None:
+        """Call with `_priorities_lock` held."""
+        for indices, priorities in self._pending_updates:
+            priorities = priorities.to(device="cpu", dtype=torch.float64)
+            self.priorities.update(indices, priorities)
+            self.max_priority = max(self.max_priority, priorities.max().item())
+        self._pending_updates = []
+
+    def sample(self, batch_size: int) -> BatchTransition:
+        """Sample a batch of transitions in proportion to their priorities, with their importance weights."""
+        if not self.initialized:
+            raise RuntimeError("Cannot sample from an empty buffer. Add transitions first.")
+
+        batch_size = min(batch_size, self.size)
+        with self._priorities_lock:
+            self._apply_pending_updates()
+            idx = self.priorities.sample(batch_size)
+            probabilities = self.priorities[idx] / self.priorities.total
+
+        # Normalized by the largest weight of the batch, to only ever scale the updates down
+        weights = (self.size * probabilities) ** (-self.beta)
+        weights = (weights / weights.max()).float()
+
+        batch = self._collate(idx.to(self.storage_device))
+        batch["weights"] = weights.to(self.device)
+        batch["indices"] = idx
+        return batch
+
+
 # Utility function to guess shapes/dtypes from a tensor
 def guess_feature_info(t, name: str):
     """
@@ -814,6 +1307,18 @@ def concatenate_batch_transitions(
         dim=0,
     )
 
+    # Concatenate the importance sampling weights of prioritized buffers, uniform samples weighing 1
+    left_weights = left_batch_transitions.get("weights")
+    right_weights = right_batch_transition.get("weights")
+    if left_weights is not None or right_weights is not None:
+        if left_weights is None:
+            left_weights = torch.ones_like(left_batch_transitions["reward"])
+        if right_weights is None:
+            right_weights = torch.ones_like(right_batch_transition["reward"])
+        left_batch_transitions["weights"] = torch.cat([left_weights, right_weights], dim=0)
+    # Indices refer to the transitions of a single buffer
+    left_batch_transitions.pop("indices", None)
+
     # Handle complementary_info
     left_info = left_batch_transitions.get("complementary_info")
     right_info = right_batch_transition.get("complementary_info")
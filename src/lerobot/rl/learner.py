@@ -66,13 +66,14 @@ from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
-from lerobot.rl.buffer import ReplayBuffer, concatenate_batch_transitions
+from lerobot.rl.buffer import PrioritizedReplayBuffer, ReplayBuffer, concatenate_batch_transitions
 from lerobot.rl.process import ProcessSignalHandler
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.robots import so_follower  # noqa: F401
 from lerobot.teleoperators import gamepad, so_leader  # noqa: F401
 from lerobot.teleoperators.utils import TeleopEvents
 from lerobot.transport import services_pb2_grpc
+from lerobot.transport.parameter_delta import ParameterDeltaEncoder
 from lerobot.transport.utils import (
     MAX_MESSAGE_SIZE,
     bytes_to_python_object,
@@ -94,7 +95,12 @@ from lerobot.utils.train_utils import (
     save_checkpoint,
     update_last_checkpoint,
 )
-from lerobot.utils.transition import move_state_dict_to_device, move_transition_to_device
+from lerobot.utils.transition import (
+    Transition,
+    index_transition,
+    move_state_dict_to_device,
+    stack_transitions,
+)
 from lerobot.utils.utils import (
     format_big_number,
     init_logging,
@@ -102,6 +108,9 @@ from lerobot.utils.utils import (
 
 from .learner_service import MAX_WORKERS, SHUTDOWN_TIMEOUT, LearnerService
 
+# Directory of the memory-mapped online replay buffer in the output directory (see `buffer_memory_map`)
+REPLAY_BUFFER_DIR = "replay_buffer"
+
 
 @parser.wrap()
 def train_cli(cfg: TrainRLServerPipelineConfig):
@@ -315,7 +324,10 @@ def add_actor_information_and_train(
 
     policy.train()
 
-    push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+    parameter_encoder = make_parameter_encoder(cfg)
+    push_actor_policy_to_queue(
+        parameters_queue=parameters_queue, policy=policy, parameter_encoder=parameter_encoder
+    )
 
     last_time_policy_pushed = time.time()
 
@@ -363,7 +375,6 @@ def add_actor_information_and_train(
             transition_queue=transition_queue,
             replay_buffer=replay_buffer,
             offline_replay_buffer=offline_replay_buffer,
-            device=device,
             dataset_repo_id=dataset_repo_id,
             shutdown_event=shutdown_event,
         )
@@ -394,9 +405,13 @@ def add_actor_information_and_train(
         for _ in range(utd_ratio - 1):
             # Sample from the iterators
             batch = next(online_iterator)
+            sampled_indices = [(replay_buffer, batch.pop("indices", None), len(batch["reward"]))]
 
             if dataset_repo_id is not None:
                 batch_offline = next(offline_iterator)
+                sampled_indices.append(
+                    (offline_replay_buffer, batch_offline.pop("indices", None), len(batch_offline["reward"]))
+                )
                 batch = concatenate_batch_transitions(
                     left_batch_transitions=batch, right_batch_transition=batch_offline
                 )
@@ -422,10 +437,12 @@ def add_actor_information_and_train(
                 "observation_feature": observation_features,
                 "next_observation_feature": next_observation_features,
                 "complementary_info": batch["complementary_info"],
+                "weights": batch.get("weights"),
             }
 
             # Use the forward method for critic loss
             critic_output = policy.forward(forward_batch, model="critic")
+            update_replay_priorities(sampled_indices, critic_output["td_errors"])
 
             # Main critic optimization
             loss_critic = critic_output["loss_critic"]
@@ -452,9 +469,13 @@ def add_actor_information_and_train(
 
         # Sample for the last update in the UTD ratio
         batch = next(online_iterator)
+        sampled_indices = [(replay_buffer, batch.pop("indices", None), len(batch["reward"]))]
 
         if dataset_repo_id is not None:
             batch_offline = next(offline_iterator)
+            sampled_indices.append(
+                (offline_replay_buffer, batch_offline.pop("indices", None), len(batch_offline["reward"]))
+            )
             batch = concatenate_batch_transitions(
                 left_batch_transitions=batch, right_batch_transition=batch_offline
             )
@@ -480,9 +501,11 @@ def add_actor_information_and_train(
             "done": done,
             "observation_feature": observation_features,
             "next_observation_feature": next_observation_features,
+            "weights": batch.get("weights"),
         }
 
         critic_output = policy.forward(forward_batch, model="critic")
+        update_replay_priorities(sampled_indices, critic_output["td_errors"])
 
         loss_critic = critic_output["loss_critic"]
         optimizers["critic"].zero_grad()
@@ -547,7 +570,9 @@ def add_actor_information_and_train(
 
         # Push policy to actors if needed
         if time.time() - last_time_policy_pushed > policy_parameters_push_frequency:
-            push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+            push_actor_policy_to_queue(
+                parameters_queue=parameters_queue, policy=policy, parameter_encoder=parameter_encoder
+            )
             last_time_policy_pushed = time.time()
 
         # Update target networks (main and discrete)
@@ -691,7 +716,7 @@ def save_training_checkpoint(
     2. Saves the policy model, configuration, and optimizer states
     3. Saves the current interaction step for resuming training
     4. Updates the "last" checkpoint symlink to point to this checkpoint
-    5. Saves the replay buffer as a dataset for later use
+    5. Saves the replay buffer as a dataset for later use, or flushes it if it is memory-mapped
     6. If an offline replay buffer exists, saves it as a separate dataset
 
     Args:
@@ -732,17 +757,21 @@ def save_training_checkpoint(
     # Update the "last" symlink
     update_last_checkpoint(checkpoint_dir)
 
-    # TODO : temporary save replay buffer here, remove later when on the robot
-    # We want to control this with the keyboard inputs
-    dataset_dir = os.path.join(cfg.output_dir, "dataset")
-    if os.path.exists(dataset_dir) and os.path.isdir(dataset_dir):
-        shutil.rmtree(dataset_dir)
-
-    # Save dataset
-    # NOTE: Handle the case where the dataset repo id is not specified in the config
-    # eg. RL training without demonstrations data
-    repo_id_buffer_save = cfg.env.task if dataset_repo_id is None else dataset_repo_id
-    replay_buffer.to_lerobot_dataset(repo_id=repo_id_buffer_save, fps=fps, root=dataset_dir)
+    if replay_buffer.storage_dir is not None:
+        # Memory-mapped buffers are checkpointed in place, by flushing them
+        replay_buffer.save_state()
+    else:
+        # TODO : temporary save replay buffer here, remove later when on the robot
+        # We want to control this with the keyboard inputs
+        dataset_dir = os.path.join(cfg.output_dir, "dataset")
+        if os.path.exists(dataset_dir) and os.path.isdir(dataset_dir):
+            shutil.rmtree(dataset_dir)
+
+        # Save dataset
+        # NOTE: Handle the case where the dataset repo id is not specified in the config
+        # eg. RL training without demonstrations data
+        repo_id_buffer_save = cfg.env.task if dataset_repo_id is None else dataset_repo_id
+        replay_buffer.to_lerobot_dataset(repo_id=repo_id_buffer_save, fps=fps, root=dataset_dir)
 
     if offline_replay_buffer is not None:
         dataset_offline_dir = os.path.join(cfg.output_dir, "dataset_offline")
@@ -929,6 +958,31 @@ def log_training_info(cfg: TrainRLServerPipelineConfig, policy: nn.Module) -> No
     logging.info(f"{num_total_params=} ({format_big_number(num_total_params)})")
 
 
+def get_replay_buffer_class(cfg: TrainRLServerPipelineConfig) -> tuple[type[ReplayBuffer], dict]:
+    """Replay buffer class to use, uniform or prioritized, with its specific arguments."""
+    if cfg.policy.prioritized_replay:
+        return PrioritizedReplayBuffer, {"alpha": cfg.policy.priority_alpha, "beta": cfg.policy.priority_beta}
+    return ReplayBuffer, {}
+
+
+def update_replay_priorities(
+    sampled_indices: list[tuple[ReplayBuffer, torch.Tensor | None, int]], td_errors: torch.Tensor
+) -> None:
+    """
+    Update the priorities of the transitions of a batch from their TD errors, for prioritized buffers.
+
+    Args:
+        sampled_indices: For every buffer the batch was sampled from, in concatenation order: the buffer, the
+            indices of its transitions (None for uniform buffers) and their number.
+        td_errors: The TD errors of the transitions of the whole batch.
+    """
+    offset = 0
+    for buffer, indices, num_transitions in sampled_indices:
+        if indices is not None:
+            buffer.update_priorities(indices, td_errors[offset : offset + num_transitions])
+        offset += num_transitions
+
+
 def initialize_replay_buffer(
     cfg: TrainRLServerPipelineConfig, device: str, storage_device: str
 ) -> ReplayBuffer:
@@ -943,13 +997,30 @@ def initialize_replay_buffer(
     Returns:
         ReplayBuffer: Initialized replay buffer
     """
+    buffer_class, buffer_kwargs = get_replay_buffer_class(cfg)
+    storage_dir = None
+    if cfg.policy.buffer_memory_map:
+        storage_dir = os.path.join(cfg.output_dir, REPLAY_BUFFER_DIR)
+        if cfg.resume:
+            logging.info("Resume training load the memory-mapped online buffer")
+            return buffer_class.from_storage_dir(
+                storage_dir,
+                device=device,
+                pin_memory=cfg.policy.buffer_pin_memory,
+                **buffer_kwargs,
+            )
+
     if not cfg.resume:
-        return ReplayBuffer(
+        return buffer_class(
             capacity=cfg.policy.online_buffer_capacity,
             device=device,
             state_keys=cfg.policy.input_features.keys(),
             storage_device=storage_device,
             optimize_memory=True,
+            store_images_as_uint8=cfg.policy.buffer_images_as_uint8,
+            pin_memory=cfg.policy.buffer_pin_memory,
+            storage_dir=storage_dir,
+            **buffer_kwargs,
         )
 
     logging.info("Resume training load the online dataset")
@@ -963,12 +1034,15 @@ def initialize_replay_buffer(
         repo_id=repo_id,
         root=dataset_path,
     )
-    return ReplayBuffer.from_lerobot_dataset(
+    return buffer_class.from_lerobot_dataset(
         lerobot_dataset=dataset,
         capacity=cfg.policy.online_buffer_capacity,
         device=device,
         state_keys=cfg.policy.input_features.keys(),
         optimize_memory=True,
+        store_images_as_uint8=cfg.policy.buffer_images_as_uint8,
+        pin_memory=cfg.policy.buffer_pin_memory,
+        **buffer_kwargs,
     )
 
 
@@ -1000,13 +1074,17 @@ def initialize_offline_replay_buffer(
         )
 
     logging.info("Convert to a offline replay buffer")
-    offline_replay_buffer = ReplayBuffer.from_lerobot_dataset(
+    buffer_class, buffer_kwargs = get_replay_buffer_class(cfg)
+    offline_replay_buffer = buffer_class.from_lerobot_dataset(
         offline_dataset,
         device=device,
         state_keys=cfg.policy.input_features.keys(),
         storage_device=storage_device,
         optimize_memory=True,
         capacity=cfg.policy.offline_buffer_capacity,
+        store_images_as_uint8=cfg.policy.buffer_images_as_uint8,
+        pin_memory=cfg.policy.buffer_pin_memory,
+        **buffer_kwargs,
     )
     return offline_replay_buffer
 
@@ -1091,20 +1169,44 @@ def check_nan_in_transition(
     return nan_detected
 
 
-def push_actor_policy_to_queue(parameters_queue: Queue, policy: nn.Module):
+def make_parameter_encoder(cfg: TrainRLServerPipelineConfig) -> ParameterDeltaEncoder | None:
+    """Create the encoder of the parameters pushed to the actor, or None to push full state dicts."""
+    actor_learner_config = cfg.policy.actor_learner_config
+    if not actor_learner_config.policy_parameters_delta:
+        return None
+    dtype = actor_learner_config.policy_parameters_dtype
+    return ParameterDeltaEncoder(
+        keyframe_interval=actor_learner_config.policy_parameters_keyframe_interval,
+        dtype=getattr(torch, dtype) if dtype is not None else None,
+    )
+
+
+def push_actor_policy_to_queue(
+    parameters_queue: Queue, policy: nn.Module, parameter_encoder: ParameterDeltaEncoder | None = None
+):
+    """Push the parameters of the actor (and discrete critic) to the queue streamed to the actor.
+
+    Args:
+        parameters_queue: Queue of the parameters streamed to the actor.
+        policy: The policy whose parameters are pushed.
+        parameter_encoder: If provided, only the parameters that changed since its last keyframe are pushed.
+            Otherwise, the full state dicts are pushed.
+    """
     logging.debug("[LEARNER] Pushing actor policy to the queue")
 
     # Create a dictionary to hold all the state dicts
-    state_dicts = {"policy": move_state_dict_to_device(policy.actor.state_dict(), device="cpu")}
+    state_dicts = {"policy": policy.actor.state_dict()}
 
     # Add discrete critic if it exists
     if hasattr(policy, "discrete_critic") and policy.discrete_critic is not None:
-        state_dicts["discrete_critic"] = move_state_dict_to_device(
-            policy.discrete_critic.state_dict(), device="cpu"
-        )
+        state_dicts["discrete_critic"] = policy.discrete_critic.state_dict()
         logging.debug("[LEARNER] Including discrete critic in state dict push")
 
-    state_bytes = state_to_bytes(state_dicts)
+    if parameter_encoder is not None:
+        # Compares the parameters on their device, only the ones sent are copied to CPU
+        state_bytes = parameter_encoder.encode(state_dicts)
+    else:
+        state_bytes = state_to_bytes(move_state_dict_to_device(state_dicts, device="cpu"))
     parameters_queue.put(state_bytes)
 
 
@@ -1123,47 +1225,56 @@ def process_interaction_message(
     return message
 
 
+def find_nan_in_transitions(transitions: Transition) -> torch.Tensor:
+    """Boolean mask of the transitions, stacked with `stack_transitions`, containing NaN values in their
+    observations, actions or next observations."""
+    values = [*transitions["state"].values(), transitions[ACTION], *transitions["next_state"].values()]
+    nan_mask = torch.zeros(len(transitions[ACTION]), dtype=torch.bool, device=transitions[ACTION].device)
+    for value in values:
+        nan_mask |= torch.isnan(value).reshape(len(value), -1).any(dim=1)
+    return nan_mask
+
+
 def process_transitions(
     transition_queue: Queue,
     replay_buffer: ReplayBuffer,
     offline_replay_buffer: ReplayBuffer,
-    device: str,
     dataset_repo_id: str | None,
     shutdown_event: any,
 ):
     """Process all available transitions from the queue.
 
+    The transitions of each message are stacked, checked for NaN values and added to the replay buffers at
+    once, with a single copy per key.
+
     Args:
         transition_queue: Queue for receiving transitions from the actor
         replay_buffer: Replay buffer to add transitions to
         offline_replay_buffer: Offline replay buffer to add transitions to
-        device: Device to move transitions to
         dataset_repo_id: Repository ID for dataset
         shutdown_event: Event to signal shutdown
     """
     while not transition_queue.empty() and not shutdown_event.is_set():
         transition_list = transition_queue.get()
         transition_list = bytes_to_transitions(buffer=transition_list)
-
-        for transition in transition_list:
-            transition = move_transition_to_device(transition=transition, device=device)
-
-            # Skip transitions with NaN values
-            if check_nan_in_transition(
-                observations=transition["state"],
-                actions=transition[ACTION],
-                next_state=transition["next_state"],
-            ):
-                logging.warning("[LEARNER] NaN detected in transition, skipping")
-                continue
-
-            replay_buffer.add(**transition)
-
-            # Add to offline buffer if it's an intervention
-            if dataset_repo_id is not None and transition.get("complementary_info", {}).get(
-                TeleopEvents.IS_INTERVENTION
-            ):
-                offline_replay_buffer.add(**transition)
+        if len(transition_list) == 0:
+            continue
+        transitions = stack_transitions(transition_list)
+
+        # Skip transitions with NaN values
+        nan_mask = find_nan_in_transitions(transitions)
+        if nan_mask.any():
+            logging.warning(f"[LEARNER] NaN detected in {int(nan_mask.sum())} transitions, skipping them")
+            transitions = index_transition(transitions, ~nan_mask)
+
+        replay_buffer.add_batch(**transitions)
+
+        # Add to offline buffer the interventions
+        complementary_info = transitions.get("complementary_info") or {}
+        if dataset_repo_id is not None and TeleopEvents.IS_INTERVENTION in complementary_info:
+            is_intervention = complementary_info[TeleopEvents.IS_INTERVENTION].bool()
+            if is_intervention.any():
+                offline_replay_buffer.add_batch(**index_transition(transitions, is_intervention))
 
 
 def process_interaction_messages(
@@ -30,6 +30,7 @@ Usage:
 ```bash
 python src/lerobot/scripts/augment_dataset_quantile_stats.py \
     --repo-id=lerobot/pusht \
+    --num-workers=8
 ```
 """
 
@@ -44,12 +45,15 @@ from huggingface_hub import HfApi
 from requests import HTTPError
 from tqdm import tqdm
 
-from lerobot.datasets.compute_stats import DEFAULT_QUANTILES, aggregate_stats, get_feature_stats
+from lerobot.datasets.compute_stats import DEFAULT_QUANTILES, FeatureStatsSketch, aggregate_sketches
 from lerobot.datasets.dataset_metadata import CODEBASE_VERSION
 from lerobot.datasets.io_utils import write_stats
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.utils.utils import init_logging
 
+# Dataset opened once by each process of the pool computing the episode stats
+_worker_dataset: LeRobotDataset | None = None
+
 
 def has_quantile_stats(stats: dict[str, dict] | None, quantile_list_keys: list[str] | None = None) -> bool:
     """Check if dataset statistics already contain quantile information.
@@ -73,15 +77,15 @@ def has_quantile_stats(stats: dict[str, dict] | None, quantile_list_keys: list[s
     return False
 
 
-def process_single_episode(dataset: LeRobotDataset, episode_idx: int) -> dict:
-    """Process a single episode and return its statistics.
+def process_single_episode(dataset: LeRobotDataset, episode_idx: int) -> dict[str, FeatureStatsSketch]:
+    """Process a single episode and return its mergeable statistics.
 
     Args:
         dataset: The LeRobot dataset
         episode_idx: Index of the episode to process
 
     Returns:
-        Dictionary containing episode statistics
+        Dictionary mapping feature names to the statistics sketch of the episode
     """
     logging.info(f"Computing stats for episode {episode_idx}")
 
@@ -99,91 +103,87 @@ def process_single_episode(dataset: LeRobotDataset, episode_idx: int) -> dict:
                 collected_data[key] = []
             collected_data[key].append(value)
 
-    ep_stats = {}
+    ep_sketches = {}
     for key, data_list in collected_data.items():
         if dataset.features[key]["dtype"] == "string":
             continue
 
         data = torch.stack(data_list).cpu().numpy()
-        if dataset.features[key]["dtype"] in ["image", "video"]:
-            if data.dtype == np.uint8:
-                data = data.astype(np.float32) / 255.0
-
-            axes_to_reduce = (0, 2, 3)
-            keepdims = True
-        else:
-            axes_to_reduce = 0
-            keepdims = data.ndim == 1
-
-        ep_stats[key] = get_feature_stats(
-            data, axis=axes_to_reduce, keepdims=keepdims, quantile_list=DEFAULT_QUANTILES
-        )
+        is_visual = dataset.features[key]["dtype"] in ["image", "video"]
+        if is_visual and data.dtype == np.uint8:
+            data = data.astype(np.float32) / 255.0
+
+        ep_sketches[key] = FeatureStatsSketch(is_visual=is_visual, quantile_list=DEFAULT_QUANTILES)
+        ep_sketches[key].update(data)
+
+    return ep_sketches
 
-        if dataset.features[key]["dtype"] in ["image", "video"]:
-            ep_stats[key] = {
-                k: v if k == "count" else np.squeeze(v, axis=0) for k, v in ep_stats[key].items()
-            }
 
-    return ep_stats
+def _init_worker(repo_id: str, root: Path | None, revision: str | None) -> None:
+    global _worker_dataset
+    _worker_dataset = LeRobotDataset(repo_id=repo_id, root=root, revision=revision)
 
 
-def compute_quantile_stats_for_dataset(dataset: LeRobotDataset) -> dict[str, dict]:
+def _process_episode_in_worker(episode_idx: int) -> dict[str, FeatureStatsSketch]:
+    return process_single_episode(_worker_dataset, episode_idx)
+
+
+def compute_quantile_stats_for_dataset(dataset: LeRobotDataset, num_workers: int = 0) -> dict[str, dict]:
     """Compute quantile statistics for all episodes in the dataset.
 
     Args:
         dataset: The LeRobot dataset to compute statistics for
+        num_workers: Number of processes computing the episode statistics. Each process opens its own
+            copy of the dataset (and video decoders). 0 processes the episodes in the current process,
+            with a pool of threads when the dataset has no videos and sequentially otherwise.
 
     Returns:
         Dictionary containing aggregated statistics with quantiles
 
     Note:
-        Video decoding operations are not thread-safe, so we process episodes sequentially
-        when video keys are present. For datasets without videos, we use parallel processing
-        with ThreadPoolExecutor for better performance.
+        Each episode yields mergeable sketches (moments and quantile histograms) rather than final stats,
+        so that the quantiles of the whole dataset are computed from the merged histograms instead of
+        averaging per-episode quantiles.
     """
     logging.info(f"Computing quantile statistics for dataset with {dataset.num_episodes} episodes")
 
-    episode_stats_list = []
-    has_videos = len(dataset.meta.video_keys) > 0
-
-    if has_videos:
-        logging.info("Dataset contains video keys - using sequential processing for thread safety")
-        for episode_idx in tqdm(range(dataset.num_episodes), desc="Processing episodes"):
-            ep_stats = process_single_episode(dataset, episode_idx)
-            episode_stats_list.append(ep_stats)
+    episodes = range(dataset.num_episodes)
+    if num_workers > 0:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_worker,
+            initargs=(dataset.repo_id, dataset.root, dataset.revision),
+        )
+        episode_sketches = executor.map(_process_episode_in_worker, episodes)
+    elif len(dataset.meta.video_keys) == 0:
+        # Without videos, the episodes can safely be processed by threads sharing the dataset
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(dataset.num_episodes, 16))
+        episode_sketches = executor.map(
+            lambda episode_idx: process_single_episode(dataset, episode_idx), episodes
+        )
     else:
-        logging.info("Dataset has no video keys - using parallel processing for better performance")
-        max_workers = min(dataset.num_episodes, 16)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_episode = {
-                executor.submit(process_single_episode, dataset, episode_idx): episode_idx
-                for episode_idx in range(dataset.num_episodes)
-            }
-
-            episode_results = {}
-            with tqdm(total=dataset.num_episodes, desc="Processing episodes") as pbar:
-                for future in concurrent.futures.as_completed(future_to_episode):
-                    episode_idx = future_to_episode[future]
-                    ep_stats = future.result()
-                    episode_results[episode_idx] = ep_stats
-                    pbar.update(1)
-
-        for episode_idx in range(dataset.num_episodes):
-            if episode_idx in episode_results:
-                episode_stats_list.append(episode_results[episode_idx])
-
-    if not episode_stats_list:
+        executor = None
+        episode_sketches = (process_single_episode(dataset, episode_idx) for episode_idx in episodes)
+
+    try:
+        stats = aggregate_sketches(
+            tqdm(episode_sketches, total=dataset.num_episodes, desc="Processing episodes")
+        )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if not stats:
         raise ValueError("No episode data found for computing statistics")
 
-    logging.info(f"Aggregating statistics from {len(episode_stats_list)} episodes")
-    return aggregate_stats(episode_stats_list)
+    return stats
 
 
 def augment_dataset_with_quantile_stats(
     repo_id: str,
     root: str | Path | None = None,
     overwrite: bool = False,
+    num_workers: int = 0,
 ) -> None:
     """Augment a dataset with quantile statistics if they are missing.
 
@@ -191,6 +191,7 @@ def augment_dataset_with_quantile_stats(
         repo_id: Repository ID of the dataset
         root: Local root directory for the dataset
         overwrite: Overwrite existing quantile statistics if they already exist
+        num_workers: Number of processes computing the episode statistics
     """
     logging.info(f"Loading dataset: {repo_id}")
     dataset = LeRobotDataset(
@@ -204,7 +205,7 @@ def augment_dataset_with_quantile_stats(
 
     logging.info("Dataset does not contain quantile statistics. Computing them now...")
 
-    new_stats = compute_quantile_stats_for_dataset(dataset)
+    new_stats = compute_quantile_stats_for_dataset(dataset, num_workers=num_workers)
 
     logging.info("Updating dataset metadata with new quantile statistics")
     dataset.meta.stats = new_stats
@@ -244,6 +245,12 @@ def main():
         action="store_true",
         help="Overwrite existing quantile statistics if they already exist",
     )
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=0,
+        help="Number of processes computing the episode statistics. 0 uses the current process.",
+    )
 
     args = parser.parse_args()
     root = Path(args.root) if args.root else None
@@ -254,6 +261,7 @@ def main():
         repo_id=args.repo_id,
         root=root,
         overwrite=args.overwrite,
+        num_workers=args.num_workers,
     )
 
 
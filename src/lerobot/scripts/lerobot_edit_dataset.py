@@ -136,6 +136,14 @@ Convert image dataset to video format and push to hub:
         --operation.type convert_image_to_video \
         --push_to_hub true
 
+Build a pre-decoded training view of the camera frames, resized to 256x256 and center-cropped to 224x224
+(used by LeRobotDataset(frame_view=FrameViewSpec(resize=(256, 256), crop=(224, 224)))):
+    lerobot-edit-dataset \
+        --repo_id lerobot/pusht \
+        --operation.type build_frame_view \
+        --operation.resize "[256, 256]" \
+        --operation.crop "[224, 224]"
+
 Show dataset information:
     lerobot-edit-dataset \
         --repo_id lerobot/pusht_image \
@@ -171,6 +179,7 @@ from lerobot.datasets.dataset_tools import (
     remove_feature,
     split_dataset,
 )
+from lerobot.datasets.frame_view import FrameViewSpec, build_frame_view
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.utils.constants import HF_LEROBOT_HOME
 from lerobot.utils.utils import init_logging
@@ -230,6 +239,17 @@ class ConvertImageToVideoConfig(OperationConfig):
     max_frames_per_batch: int | None = None
 
 
+@OperationConfig.register_subclass("build_frame_view")
+@dataclass
+class BuildFrameViewConfig(OperationConfig):
+    # Target (height, width) of the frames, before cropping.
+    resize: list[int] | None = None
+    # Target (height, width) of the center crop.
+    crop: list[int] | None = None
+    # Where to write the view. Defaults to the location LeRobotDataset looks up, under $HF_LEROBOT_HOME/frame_views.
+    output_dir: str | None = None
+
+
 @OperationConfig.register_subclass("info")
 @dataclass
 class InfoConfig(OperationConfig):
@@ -525,6 +545,22 @@ def handle_convert_image_to_video(cfg: EditDatasetConfig) -> None:
         logging.info("Dataset saved locally (not pushed to hub)")
 
 
+def handle_build_frame_view(cfg: EditDatasetConfig) -> None:
+    if not isinstance(cfg.operation, BuildFrameViewConfig):
+        raise ValueError("Operation config must be BuildFrameViewConfig")
+
+    spec = FrameViewSpec(resize=cfg.operation.resize, crop=cfg.operation.crop)
+    dataset = LeRobotDataset(cfg.repo_id, root=cfg.root)
+    logging.info(f"Building frame view '{spec.name}' of {cfg.repo_id} for {dataset.meta.camera_keys}")
+
+    output_dir = Path(cfg.operation.output_dir) if cfg.operation.output_dir else None
+    view = build_frame_view(dataset, spec, view_dir=output_dir)
+
+    logging.info("Frame view built successfully!")
+    logging.info(f"Location: {view.view_dir}")
+    logging.info(f"Frames: {len(view)}")
+
+
 def _get_dataset_size(repo_path):
     import os
 
@@ -596,6 +632,8 @@ def edit_dataset(cfg: EditDatasetConfig) -> None:
         handle_modify_tasks(cfg)
     elif operation_type == "convert_image_to_video":
         handle_convert_image_to_video(cfg)
+    elif operation_type == "build_frame_view":
+        handle_build_frame_view(cfg)
     elif operation_type == "info":
         handle_info(cfg)
     else:
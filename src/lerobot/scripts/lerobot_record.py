@@ -198,6 +198,13 @@ class DatasetRecordConfig:
     # Number of threads per encoder instance. None = auto (codec default).
     # Lower values reduce CPU usage, maps to 'lp' (via svtav1-params) for libsvtav1 and 'threads' for h264/hevc..
     encoder_threads: int | None = None
+    # Run each streaming encoder in its own subprocess instead of a thread of the recording process.
+    # Frames are handed over through shared memory, so encoding does not compete with the control loop
+    # for the GIL.
+    encoder_processes: bool = False
+    # Number of processes encoding the videos of (episode, camera) pairs in parallel when not streaming.
+    # None = one per camera, up to half of the CPU cores when batch encoding.
+    encoding_workers: int | None = None
     # Rename map for the observation to override the image and state keys
     rename_map: dict[str, str] = field(default_factory=dict)
 
@@ -477,6 +484,8 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 streaming_encoding=cfg.dataset.streaming_encoding,
                 encoder_queue_maxsize=cfg.dataset.encoder_queue_maxsize,
                 encoder_threads=cfg.dataset.encoder_threads,
+                encoder_processes=cfg.dataset.encoder_processes,
+                encoding_workers=cfg.dataset.encoding_workers,
                 image_writer_processes=cfg.dataset.num_image_writer_processes if num_cameras > 0 else 0,
                 image_writer_threads=cfg.dataset.num_image_writer_threads_per_camera * num_cameras
                 if num_cameras > 0
@@ -500,6 +509,8 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 streaming_encoding=cfg.dataset.streaming_encoding,
                 encoder_queue_maxsize=cfg.dataset.encoder_queue_maxsize,
                 encoder_threads=cfg.dataset.encoder_threads,
+                encoder_processes=cfg.dataset.encoder_processes,
+                encoding_workers=cfg.dataset.encoding_workers,
             )
 
         # Load pretrained policy
@@ -516,6 +527,9 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                     "rename_observations_processor": {"rename_map": cfg.dataset.rename_map},
                 },
             )
+            # Called at every control step: run them without hooks, with fused steps
+            preprocessor.freeze()
+            postprocessor.freeze()
 
         robot.connect()
         if teleop is not None:
@@ -36,6 +36,7 @@ from lerobot.envs.utils import close_envs
 from lerobot.optim.factory import make_optimizer_and_scheduler
 from lerobot.policies.factory import make_policy, make_pre_post_processors
 from lerobot.policies.pretrained import PreTrainedPolicy
+from lerobot.processor.prefetch import PreprocessorPrefetcher, WorkerPreprocessor, num_worker_safe_steps
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.scripts.lerobot_eval import eval_policy_all
 from lerobot.utils.import_utils import register_third_party_plugins
@@ -44,6 +45,7 @@ from lerobot.utils.random_utils import set_seed
 from lerobot.utils.train_utils import (
     get_step_checkpoint_dir,
     get_step_identifier,
+    load_sampler_state,
     load_training_state,
     save_checkpoint,
     update_last_checkpoint,
@@ -343,18 +345,29 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
         logging.info(f"{num_total_params=} ({format_big_number(num_total_params)})")
 
     # create dataloader for offline training
-    if hasattr(cfg.policy, "drop_n_last_frames"):
+    if hasattr(cfg.policy, "drop_n_last_frames") or cfg.dataset.shuffle_chunk_size > 1:
         shuffle = False
         sampler = EpisodeAwareSampler(
             dataset.meta.episodes["dataset_from_index"],
             dataset.meta.episodes["dataset_to_index"],
             episode_indices_to_use=dataset.episodes,
-            drop_n_last_frames=cfg.policy.drop_n_last_frames,
+            drop_n_last_frames=getattr(cfg.policy, "drop_n_last_frames", 0),
             shuffle=True,
+            chunk_size=cfg.dataset.shuffle_chunk_size,
+            seed=cfg.seed,
         )
     else:
         shuffle = True
         sampler = None
+    resumed_sampler = cfg.resume and sampler is not None and load_sampler_state(cfg.checkpoint_path, sampler)
+
+    # Leading steps of the preprocessor run in the dataloader workers, the others by the prefetcher below
+    num_worker_steps = 0
+    if cfg.preprocess_in_workers and cfg.num_workers > 0:
+        num_worker_steps = num_worker_safe_steps(preprocessor)
+        if is_main_process:
+            worker_steps = [type(step).__name__ for step in preprocessor.steps[:num_worker_steps]]
+            logging.info(f"Preprocessor steps run in the dataloader workers: {worker_steps}")
 
     dataloader = torch.utils.data.DataLoader(
         dataset,
@@ -362,17 +375,36 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
         batch_size=cfg.batch_size,
         shuffle=shuffle and not cfg.dataset.streaming,
         sampler=sampler,
+        collate_fn=WorkerPreprocessor(preprocessor, num_worker_steps) if num_worker_steps > 0 else None,
         pin_memory=device.type == "cuda",
         drop_last=False,
         prefetch_factor=2 if cfg.num_workers > 0 else None,
     )
 
-    # Prepare everything with accelerator
+    # Prepare everything with accelerator. With `prefetch_batches` or `preprocess_in_workers`, the batches are
+    # moved to the device by the prefetcher, to time the transfers and overlap them with the training steps.
+    use_prefetcher = cfg.prefetch_batches > 0 or num_worker_steps > 0
     accelerator.wait_for_everyone()
     policy, optimizer, dataloader, lr_scheduler = accelerator.prepare(
-        policy, optimizer, dataloader, lr_scheduler
+        policy,
+        optimizer,
+        dataloader,
+        lr_scheduler,
+        device_placement=[True, True, not use_prefetcher, True],
     )
+    if resumed_sampler:
+        # accelerate sets the epoch of the sampler from its own count of iterations over the dataloader
+        dataloader.set_epoch(sampler.epoch)
     dl_iter = cycle(dataloader)
+    batches = None
+    if use_prefetcher:
+        batches = PreprocessorPrefetcher(
+            dl_iter,
+            preprocessor,
+            device,
+            num_prefetch=cfg.prefetch_batches,
+            start_step=num_worker_steps,
+        )
 
     policy.train()
 
@@ -383,6 +415,12 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
         "update_s": AverageMeter("updt_s", ":.3f"),
         "dataloading_s": AverageMeter("data_s", ":.3f"),
     }
+    if use_prefetcher:
+        # Time spent by the stages of `dataloading_s`: waiting for the dataloader workers, device transfer and
+        # preprocessing (overlapped with the training steps when prefetching)
+        train_metrics["data_wait_s"] = AverageMeter("wait_s", ":.3f")
+        train_metrics["h2d_s"] = AverageMeter("h2d_s", ":.3f")
+        train_metrics["preprocess_s"] = AverageMeter("prep_s", ":.3f")
 
     # Keep global batch size for logging; MetricsTracker handles world size internally.
     effective_batch_size = cfg.batch_size * accelerator.num_processes
@@ -410,8 +448,14 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
 
     for _ in range(step, cfg.steps):
         start_time = time.perf_counter()
-        batch = next(dl_iter)
-        batch = preprocessor(batch)
+        if batches is not None:
+            batch, timings = batches.next_with_timings()
+            train_tracker.data_wait_s = timings.wait_s
+            train_tracker.h2d_s = timings.h2d_s
+            train_tracker.preprocess_s = timings.preprocess_s
+        else:
+            batch = next(dl_iter)
+            batch = preprocessor(batch)
         train_tracker.dataloading_s = time.perf_counter() - start_time
 
         train_tracker, output_dict = update_policy(
@@ -467,6 +511,12 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
                     scheduler=lr_scheduler,
                     preprocessor=preprocessor,
                     postprocessor=postprocessor,
+                    # Derived from the consumed batches, as the sampler also counts those prefetched by workers
+                    sampler_state=(
+                        sampler.state_dict_after(step * accelerator.num_processes, cfg.batch_size)
+                        if sampler is not None
+                        else None
+                    ),
                 )
                 update_last_checkpoint(checkpoint_dir)
                 if wandb_logger:
@@ -523,6 +573,8 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
 
             accelerator.wait_for_everyone()
 
+    if batches is not None:
+        batches.close()
     if is_main_process:
         progbar.close()
 
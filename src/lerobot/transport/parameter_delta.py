@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Delta streaming of policy parameters from the learner to the actors.
+
+Sending the full state dicts of the policy on every push wastes bandwidth on the tensors that do not change
+(e.g. a frozen vision encoder). :class:`ParameterDeltaEncoder` instead sends, every ``keyframe_interval``
+pushes, a full snapshot of the parameters (a "keyframe"), and in between only the tensors that differ from
+the last keyframe. Deltas being relative to the keyframe rather than to the previous push, an actor that
+misses a push (the parameter queues only keep the latest message) still reconstructs the latest parameters.
+
+Messages are encoded with :mod:`lerobot.transport.tensor_wire`. Their metadata holds the version of the
+parameters, the version of the keyframe they apply to, and a CRC32 checksum of the tensors they carry, which
+:class:`ParameterDeltaDecoder` checks before handing the parameters over. Floating point tensors can be cast
+to float16 / bfloat16 before being sent, halving the size of the messages.
+"""
+
+import logging
+import zlib
+from collections.abc import Mapping
+
+import torch
+
+from lerobot.transport.tensor_wire import decode_tensors, encode_tensors
+
+# Separates the name of a state dict (e.g. "policy") from the name of its tensors in the message keys
+_KEY_SEPARATOR = "/"
+
+
+def tensors_checksum(tensors: Mapping[str, torch.Tensor]) -> int:
+    """CRC32 of the names and raw bytes of CPU tensors, independent of their order."""
+    checksum = 0
+    for key in sorted(tensors):
+        checksum = zlib.crc32(key.encode(), checksum)
+        checksum = zlib.crc32(tensors[key].contiguous().reshape(-1).view(torch.uint8).numpy(), checksum)
+    return checksum
+
+
+def _flatten(state_dicts: Mapping[str, Mapping[str, torch.Tensor]]) -> dict[str, torch.Tensor]:
+    return {
+        f"{name}{_KEY_SEPARATOR}{key}": tensor
+        for name, state_dict in state_dicts.items()
+        for key, tensor in state_dict.items()
+    }
+
+
+def _unflatten(tensors: Mapping[str, torch.Tensor]) -> dict[str, dict[str, torch.Tensor]]:
+    state_dicts: dict[str, dict[str, torch.Tensor]] = {}
+    for flat_key, tensor in tensors.items():
+        name, key = flat_key.split(_KEY_SEPARATOR, 1)
+        state_dicts.setdefault(name, {})[key] = tensor
+    return state_dicts
+
+
+class ParameterDeltaEncoder:
+    """Learner side of the delta streaming of parameters, see the module docstring.
+
+    Args:
+        keyframe_interval: Number of pushes between two full snapshots of the parameters. 1 sends the full
+            parameters on every push.
+        dtype: If set (float16 or bfloat16), floating point tensors are cast to it before being sent.
+    """
+
+    def __init__(self, keyframe_interval: int = 10, dtype: torch.dtype | None = None):
+        if keyframe_interval < 1:
+            raise ValueError(f"keyframe_interval must be >= 1, got {keyframe_interval}")
+        if dtype not in (None, torch.float16, torch.bfloat16):
+            raise ValueError(f"dtype must be None, torch.float16 or torch.bfloat16, got {dtype}")
+        self.keyframe_interval = keyframe_interval
+        self.dtype = dtype
+        self.version = 0
+        self.keyframe_version = 0
+        # Tensors of the last keyframe as sent, kept on the device of the parameters to compare them there
+        self._keyframe: dict[str, torch.Tensor] = {}
+
+    def _cast(self, tensor: torch.Tensor) -> torch.Tensor:
+        tensor = tensor.detach()
+        if self.dtype is not None and tensor.is_floating_point():
+            return tensor.to(self.dtype)
+        return tensor
+
+    def encode(self, state_dicts: Mapping[str, Mapping[str, torch.Tensor]]) -> bytes:
+        """Encode the parameters to push, e.g. `{"policy": actor.state_dict()}`, as a keyframe or a delta."""
+        tensors = {key: self._cast(tensor) for key, tensor in _flatten(state_dicts).items()}
+        self.version += 1
+
+        is_keyframe = (
+            self.version - self.keyframe_version >= self.keyframe_interval
+            or self._keyframe.keys() != tensors.keys()
+            or any(tensors[key].shape != self._keyframe[key].shape for key in tensors)
+        )
+        if is_keyframe:
+            self.keyframe_version = self.version
+            self._keyframe = {key: tensor.clone() for key, tensor in tensors.items()}
+        elif tensors:
+            # One device synchronization for all the comparisons
+            changed = torch.stack([(tensor != self._keyframe[key]).any() for key, tensor in tensors.items()])
+            changed = changed.tolist()
+            tensors = {
+                key: tensor
+                for (key, tensor), is_changed in zip(tensors.items(), changed, strict=True)
+                if is_changed
+            }
+
+        tensors = {key: tensor.cpu() for key, tensor in tensors.items()}
+        meta = {
+            "version": self.version,
+            "keyframe_version": self.keyframe_version,
+            "checksum": tensors_checksum(tensors),
+        }
+        logging.debug(f"[LEARNER] Encoded {len(tensors)} tensors of parameters version {self.version}")
+        return encode_tensors(tensors, meta=meta)
+
+
+class ParameterDeltaDecoder:
+    """Actor side of the delta streaming of parameters, see the module docstring."""
+
+    def __init__(self):
+        self.version: int | None = None
+        self.keyframe_version: int | None = None
+        self._keyframe: dict[str, torch.Tensor] = {}
+
+    def decode(self, buffer: bytes) -> dict[str, dict[str, torch.Tensor]] | None:
+        """Decode a message from :class:`ParameterDeltaEncoder` into full state dicts, by name.
+
+        Returns None if the message cannot be applied: corrupted, or a delta of a keyframe that was not
+        received. The parameters are then updated by the next keyframe.
+
+        The tensors returned are read-only views of the messages, to be copied e.g. with `load_state_dict`.
+        """
+        tensors, meta = decode_tensors(buffer)
+        if tensors_checksum(tensors) != meta["checksum"]:
+            logging.warning(f"[ACTOR] Checksum mismatch for parameters version {meta['version']}, skipping")
+            return None
+
+        if meta["version"] == meta["keyframe_version"]:
+            self._keyframe = tensors
+            self.keyframe_version = meta["keyframe_version"]
+        elif meta["keyframe_version"] != self.keyframe_version:
+            logging.warning(
+                f"[ACTOR] Parameters version {meta['version']} is a delta of the keyframe "
+                f"{meta['keyframe_version']}, which was not received, skipping"
+            )
+            return None
+
+        self.version = meta["version"]
+        return _unflatten({**self._keyframe, **tensors})
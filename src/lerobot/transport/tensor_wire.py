@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Typed binary framing of named tensors, used instead of pickle to move observations and actions.
+
+A message is laid out as::
+
+    | magic (4B) | version (1B) | header length (4B) | JSON header | padding | buffer 0 | padding | buffer 1 | ...
+
+The JSON header holds free-form metadata (timestamps, timesteps, scalars...) and, for every tensor, its key,
+dtype, shape, codec and the location of its buffer. Buffers are the raw contiguous bytes of the tensors,
+aligned on ``ALIGNMENT`` bytes, so that decoding maps them with ``np.frombuffer`` / ``torch.frombuffer``
+instead of copying them. Buffers can optionally be compressed with zlib, losslessly or after dropping the
+least significant bits of integer tensors (see :class:`TensorCompression`).
+"""
+
+import json
+import struct
+import warnings
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import torch
+
+MAGIC = b"LRTW"
+VERSION = 1
+ALIGNMENT = 16
+_PREFIX = struct.Struct("<4sBI")  # magic, version, header length
+
+TensorLike = np.ndarray | torch.Tensor
+
+
+@dataclass(frozen=True)
+class TensorCompression:
+    """Compression of the buffer of a tensor sent with :func:`encode_tensors`.
+
+    Args:
+        level: zlib compression level, from 1 (fastest) to 9 (smallest).
+        quantization_bits: Lossy compression of integer tensors, e.g. uint8 camera images: number of least
+            significant bits dropped before compressing. Values are reconstructed at the center of their
+            quantization step, so the error is at most ``2 ** (quantization_bits - 1)``. 0 is lossless.
+    """
+
+    level: int = 1
+    quantization_bits: int = 0
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.level <= 9:
+            raise ValueError(f"level must be between 1 and 9, got {self.level}")
+        if not 0 <= self.quantization_bits <= 7:
+            raise ValueError(f"quantization_bits must be between 0 and 7, got {self.quantization_bits}")
+
+
+def _align(offset: int) -> int:
+    return offset + (-offset % ALIGNMENT)
+
+
+def _as_array(value: TensorLike) -> tuple[np.ndarray, str, str]:
+    """Contiguous numpy array sharing the memory of ``value``, with its kind and dtype name."""
+    if isinstance(value, torch.Tensor):
+        tensor = value.detach().cpu().contiguous()
+        dtype = str(tensor.dtype).removeprefix("torch.")
+        if tensor.dtype == torch.bfloat16:
+            # numpy has no bfloat16, ship the raw bits
+            tensor = tensor.view(torch.int16)
+        return tensor.numpy(), "torch", dtype
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject or value.dtype.names is not None:
+            raise TypeError(f"Cannot encode numpy arrays of dtype {value.dtype}")
+        # Unlike `np.ascontiguousarray`, keeps 0-d arrays 0-d
+        array = value if value.flags.c_contiguous else value.copy(order="C")
+        return array, "numpy", array.dtype.name
+    raise TypeError(f"Expected a numpy array or a torch tensor, got {type(value)}")
+
+
+def _quantize(array: np.ndarray, bits: int) -> np.ndarray:
+    if not np.issubdtype(array.dtype, np.integer):
+        raise ValueError(f"Lossy compression only applies to integer tensors, got {array.dtype}")
+    step = array.dtype.type(1 << bits)
+    return (array & ~(step - 1)) | (step >> 1)
+
+
+def encode_tensors(
+    tensors: Mapping[str, TensorLike],
+    meta: dict[str, Any] | None = None,
+    compression: Mapping[str, TensorCompression] | None = None,
+) -> bytes:
+    """Serialize named numpy arrays / torch tensors and JSON-serializable metadata into a single message.
+
+    Args:
+        tensors: Tensors to send, by key. Torch tensors are moved to CPU.
+        meta: JSON-serializable metadata sent in the header.
+        compression: Optional compression of the tensors, by key. Other tensors are sent raw.
+
+    Returns:
+        The encoded message. Each tensor is copied exactly once, into the message.
+    """
+    compression = compression or {}
+    entries = []
+    buffers = []
+    offset = 0
+    for key, value in tensors.items():
+        array, kind, dtype = _as_array(value)
+        codec = "raw"
+        if key in compression:
+            if compression[key].quantization_bits > 0:
+                array = _quantize(array, compression[key].quantization_bits)
+            data = zlib.compress(array.reshape(-1).view(np.uint8), compression[key].level)
+            codec = "zlib"
+        else:
+            data = array.reshape(-1).view(np.uint8)
+
+        offset = _align(offset)
+        entries.append(
+            {
+                "key": key,
+                "kind": kind,
+                "dtype": dtype,
+                "shape": list(array.shape),
+                "codec": codec,
+                "offset": offset,
+                "nbytes": len(data),
+            }
+        )
+        buffers.append((offset, data))
+        offset += len(data)
+
+    header = json.dumps({"meta": meta or {}, "entries": entries}).encode()
+    data_start = _align(_PREFIX.size + len(header))
+    parts = [
+        _PREFIX.pack(MAGIC, VERSION, len(header)),
+        header,
+        bytes(data_start - _PREFIX.size - len(header)),
+    ]
+    position = 0
+    for buffer_offset, data in buffers:
+        parts.append(bytes(buffer_offset - position))
+        parts.append(data)
+        position = buffer_offset + len(data)
+    return b"".join(parts)
+
+
+def _from_buffer(data: memoryview | bytes, entry: dict) -> TensorLike:
+    shape = entry["shape"]
+    if entry["kind"] == "numpy":
+        return np.frombuffer(data, dtype=entry["dtype"]).reshape(shape)
+
+    dtype = getattr(torch, entry["dtype"])
+    if len(data) == 0:
+        return torch.empty(shape, dtype=dtype)
+    with warnings.catch_warnings():
+        # Received messages are immutable bytes: the tensors are views of them, see `decode_tensors`
+        warnings.filterwarnings("ignore", message="The given buffer is not writable")
+        return torch.frombuffer(data, dtype=dtype).reshape(shape)
+
+
+def decode_tensors(buffer: bytes | bytearray | memoryview) -> tuple[dict[str, TensorLike], dict[str, Any]]:
+    """Decode a message built by :func:`encode_tensors`.
+
+    Uncompressed tensors are views of ``buffer``, not copies. Like ``buffer`` itself when it is ``bytes``,
+    they must be treated as read-only: clone them before modifying them in place.
+
+    Returns:
+        The tensors by key, as numpy arrays or torch tensors like they were sent, and the metadata.
+    """
+    view = memoryview(buffer)
+    if len(view) < _PREFIX.size:
+        raise ValueError(f"Message of {len(view)} bytes is too short to be a tensor message.")
+    magic, version, header_length = _PREFIX.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError(f"Not a tensor message (magic {magic!r}).")
+    if version != VERSION:
+        raise ValueError(f"Unsupported tensor message version {version}, expected {VERSION}.")
+
+    header = json.loads(bytes(view[_PREFIX.size : _PREFIX.size + header_length]))
+    data_start = _align(_PREFIX.size + header_length)
+    tensors = {}
+    for entry in header["entries"]:
+        start = data_start + entry["offset"]
+        data = view[start : start + entry["nbytes"]]
+        if len(data) != entry["nbytes"]:
+            raise ValueError(f"Truncated tensor message: missing bytes of '{entry['key']}'.")
+        if entry["codec"] == "zlib":
+            data = zlib.decompress(data)
+        elif entry["codec"] != "raw":
+            raise ValueError(f"Unknown codec '{entry['codec']}' for '{entry['key']}'.")
+        tensors[entry["key"]] = _from_buffer(data, entry)
+    return tensors, header["meta"]
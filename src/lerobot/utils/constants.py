@@ -52,6 +52,7 @@ TRAINING_STEP = "training_step.json"
 OPTIMIZER_STATE = "optimizer_state.safetensors"
 OPTIMIZER_PARAM_GROUPS = "optimizer_param_groups.json"
 SCHEDULER_STATE = "scheduler_state.json"
+SAMPLER_STATE = "sampler_state.json"
 
 POLICY_PREPROCESSOR_DEFAULT_NAME = "policy_preprocessor"
 POLICY_POSTPROCESSOR_DEFAULT_NAME = "policy_postprocessor"
@@ -69,6 +70,10 @@ HF_LEROBOT_HOME = Path(os.getenv("HF_LEROBOT_HOME", default_cache_path)).expandu
 # Used as the ``cache_dir`` argument to ``snapshot_download`` so that different
 # dataset revisions are stored in isolated snapshot directories.
 HF_LEROBOT_HUB_CACHE = HF_LEROBOT_HOME / "hub"
+# Memory-mapped columnar caches of dataset features (see ``lerobot.datasets.frame_store``).
+HF_LEROBOT_FRAME_STORE = HF_LEROBOT_HOME / "frame_store"
+# Pre-decoded, downscaled camera frames for training (see ``lerobot.datasets.frame_view``).
+HF_LEROBOT_FRAME_VIEWS = HF_LEROBOT_HOME / "frame_views"
 
 # calibration dir
 default_calibration_path = HF_LEROBOT_HOME / "calibration"
@@ -20,6 +20,7 @@ from torch.optim.lr_scheduler import LRScheduler
 
 from lerobot.configs.train import TrainPipelineConfig
 from lerobot.datasets.io_utils import load_json, write_json
+from lerobot.datasets.sampler import EpisodeAwareSampler
 from lerobot.optim.optimizers import load_optimizer_state, save_optimizer_state
 from lerobot.optim.schedulers import load_scheduler_state, save_scheduler_state
 from lerobot.policies.pretrained import PreTrainedPolicy
@@ -28,6 +29,7 @@ from lerobot.utils.constants import (
     CHECKPOINTS_DIR,
     LAST_CHECKPOINT_LINK,
     PRETRAINED_MODEL_DIR,
+    SAMPLER_STATE,
     TRAINING_STATE_DIR,
     TRAINING_STEP,
 )
@@ -71,6 +73,7 @@ def save_checkpoint(
     scheduler: LRScheduler | None = None,
     preprocessor: PolicyProcessorPipeline | None = None,
     postprocessor: PolicyProcessorPipeline | None = None,
+    sampler_state: dict[str, int] | None = None,
 ) -> None:
     """This function creates the following directory structure:
 
@@ -85,6 +88,7 @@ def save_checkpoint(
         ├── optimizer_param_groups.json  #  optimizer param groups
         ├── optimizer_state.safetensors  # optimizer state
         ├── rng_state.safetensors  # rng states
+        ├── sampler_state.json  # sampler state (if sampler_state provided)
         ├── scheduler_state.json  # scheduler state
         └── training_step.json  # training step
 
@@ -95,6 +99,8 @@ def save_checkpoint(
         optimizer (Optimizer | None, optional): The optimizer to save the state from. Defaults to None.
         scheduler (LRScheduler | None, optional): The scheduler to save the state from. Defaults to None.
         preprocessor: The preprocessor/pipeline to save. Defaults to None.
+        sampler_state (dict[str, int] | None, optional): The position of the training sampler, from
+            `EpisodeAwareSampler.state_dict_after`. Defaults to None.
     """
     pretrained_dir = checkpoint_dir / PRETRAINED_MODEL_DIR
     policy.save_pretrained(pretrained_dir)
@@ -107,7 +113,7 @@ def save_checkpoint(
         preprocessor.save_pretrained(pretrained_dir)
     if postprocessor is not None:
         postprocessor.save_pretrained(pretrained_dir)
-    save_training_state(checkpoint_dir, step, optimizer, scheduler)
+    save_training_state(checkpoint_dir, step, optimizer, scheduler, sampler_state)
 
 
 def save_training_state(
@@ -115,9 +121,10 @@ def save_training_state(
     train_step: int,
     optimizer: Optimizer | None = None,
     scheduler: LRScheduler | None = None,
+    sampler_state: dict[str, int] | None = None,
 ) -> None:
     """
-    Saves the training step, optimizer state, scheduler state, and rng state.
+    Saves the training step, optimizer state, scheduler state, sampler state, and rng state.
 
     Args:
         save_dir (Path): The directory to save artifacts to.
@@ -126,6 +133,8 @@ def save_training_state(
             Defaults to None.
         scheduler (LRScheduler | None, optional): The scheduler from which to save the state_dict.
             Defaults to None.
+        sampler_state (dict[str, int] | None, optional): The position of the training sampler.
+            Defaults to None.
     """
     save_dir = checkpoint_dir / TRAINING_STATE_DIR
     save_dir.mkdir(parents=True, exist_ok=True)
@@ -135,6 +144,8 @@ def save_training_state(
         save_optimizer_state(optimizer, save_dir)
     if scheduler is not None:
         save_scheduler_state(scheduler, save_dir)
+    if sampler_state is not None:
+        write_json(sampler_state, save_dir / SAMPLER_STATE)
 
 
 def load_training_state(
@@ -167,3 +178,22 @@ def load_training_state(
         scheduler = load_scheduler_state(scheduler, training_state_dir)
 
     return step, optimizer, scheduler
+
+
+def load_sampler_state(checkpoint_dir: Path, sampler: EpisodeAwareSampler) -> bool:
+    """
+    Restores the position of the training sampler saved with a checkpoint, so that a resumed run continues
+    the epoch where it stopped instead of starting a new one.
+
+    Args:
+        checkpoint_dir (Path): The checkpoint directory. Should contain a 'training_state' dir.
+        sampler (EpisodeAwareSampler): The sampler to load the state_dict to.
+
+    Returns:
+        bool: Whether the checkpoint had a sampler state (checkpoints saved without it leave the sampler as is).
+    """
+    sampler_state_path = checkpoint_dir / TRAINING_STATE_DIR / SAMPLER_STATE
+    if not sampler_state_path.is_file():
+        return False
+    sampler.load_state_dict(load_json(sampler_state_path))
+    return True
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Sequence
 from typing import TypedDict
 
 import torch
@@ -70,6 +71,65 @@ def move_transition_to_device(transition: Transition, device: str = "cpu") -> Tr
     return transition
 
 
+def _stack_values(values: Sequence[torch.Tensor | float | int | bool]) -> torch.Tensor:
+    """Stack per-transition tensors (with or without their batch dimension of 1) or scalars."""
+    if isinstance(values[0], torch.Tensor):
+        return torch.stack([torch.as_tensor(value).squeeze(dim=0) for value in values])
+    return torch.tensor(values)
+
+
+def stack_transitions(transitions: Sequence[Transition]) -> Transition:
+    """Stack transitions into a single transition whose values are batched along their first dimension.
+
+    Only the complementary_info keys present in every transition are kept.
+    """
+    if len(transitions) == 0:
+        raise ValueError("Cannot stack an empty list of transitions.")
+
+    complementary_info = None
+    if all(transition.get("complementary_info") is not None for transition in transitions):
+        keys = set.intersection(*(set(transition["complementary_info"]) for transition in transitions))
+        complementary_info = {
+            key: _stack_values([transition["complementary_info"][key] for transition in transitions])
+            for key in transitions[0]["complementary_info"]
+            if key in keys
+        }
+
+    return Transition(
+        state={
+            key: _stack_values([transition["state"][key] for transition in transitions])
+            for key in transitions[0]["state"]
+        },
+        action=_stack_values([transition[ACTION] for transition in transitions]),
+        reward=_stack_values([transition["reward"] for transition in transitions]),
+        next_state={
+            key: _stack_values([transition["next_state"][key] for transition in transitions])
+            for key in transitions[0]["next_state"]
+        },
+        done=_stack_values([transition["done"] for transition in transitions]),
+        truncated=_stack_values([transition["truncated"] for transition in transitions]),
+        complementary_info=complementary_info,
+    )
+
+
+def index_transition(transition: Transition, index: torch.Tensor) -> Transition:
+    """Select transitions of a transition stacked with `stack_transitions`, e.g. with a boolean mask."""
+    complementary_info = transition.get("complementary_info")
+    return Transition(
+        state={key: value[index] for key, value in transition["state"].items()},
+        action=transition[ACTION][index],
+        reward=transition["reward"][index],
+        next_state={key: value[index] for key, value in transition["next_state"].items()},
+        done=transition["done"][index],
+        truncated=transition["truncated"][index],
+        complementary_info=(
+            {key: value[index] for key, value in complementary_info.items()}
+            if complementary_info is not None
+            else None
+        ),
+    )
+
+
 def move_state_dict_to_device(state_dict, device="cpu"):
     """
     Recursively move all tensors in a (potentially) nested
@@ -43,20 +43,12 @@ pytest.importorskip("grpc")
 # -----------------------------------------------------------------------------
 
 
-def test_async_inference_e2e(monkeypatch):
-    """Tests the full asynchronous inference pipeline."""
-    # Import grpc-dependent modules inside the test function
-    import grpc
-
-    from lerobot.async_inference.configs import PolicyServerConfig, RobotClientConfig
+def make_policy_server(monkeypatch, config):
+    """PolicyServer with a stub policy returning zeros, and with the policy loading bypassed."""
     from lerobot.async_inference.helpers import map_robot_keys_to_lerobot_features
     from lerobot.async_inference.policy_server import PolicyServer
-    from lerobot.async_inference.robot_client import RobotClient
     from lerobot.robots.utils import make_robot_from_config
-    from lerobot.transport import (
-        services_pb2,  # type: ignore
-        services_pb2_grpc,  # type: ignore
-    )
+    from lerobot.transport import services_pb2  # type: ignore
     from tests.mocks.mock_robot import MockRobotConfig
 
     # Create a stub policy similar to test_policy_server.py
@@ -82,11 +74,7 @@ def test_async_inference_e2e(monkeypatch):
             batch_size = len(batch["robot_type"])
             return torch.zeros(batch_size, 20, 6)
 
-    # ------------------------------------------------------------------
-    # 1. Create PolicyServer instance with mock policy
-    # ------------------------------------------------------------------
-    policy_server_config = PolicyServerConfig(host="localhost", port=9999)
-    policy_server = PolicyServer(policy_server_config)
+    policy_server = PolicyServer(config)
     # Replace the real policy with our fast, deterministic stub.
     policy_server.policy = MockPolicy()
     policy_server.actions_per_chunk = 20
@@ -95,12 +83,9 @@ def test_async_inference_e2e(monkeypatch):
     policy_server.preprocessor = lambda obs: obs
     policy_server.postprocessor = lambda tensor: tensor
 
-    # Set up robot config and features
-    robot_config = MockRobotConfig()
-    mock_robot = make_robot_from_config(robot_config)
-
-    lerobot_features = map_robot_keys_to_lerobot_features(mock_robot)
-    policy_server.lerobot_features = lerobot_features
+    # Set up robot features
+    mock_robot = make_robot_from_config(MockRobotConfig())
+    policy_server.lerobot_features = map_robot_keys_to_lerobot_features(mock_robot)
 
     # Force server to produce deterministic action chunks in test mode
     policy_server.policy_type = "act"
@@ -119,9 +104,44 @@ def test_async_inference_e2e(monkeypatch):
         return services_pb2.Empty()
 
     monkeypatch.setattr(PolicyServer, "SendPolicyInstructions", _fake_send_policy_instructions, raising=True)
+    return policy_server
+
+
+def make_robot_client(server_address: str, stream_actions: bool = True):
+    from lerobot.async_inference.configs import RobotClientConfig
+    from lerobot.async_inference.robot_client import RobotClient
+    from tests.mocks.mock_robot import MockRobotConfig
+
+    client_config = RobotClientConfig(
+        server_address=server_address,
+        robot=MockRobotConfig(),
+        chunk_size_threshold=0.0,
+        policy_type="test",
+        pretrained_name_or_path="test",
+        actions_per_chunk=20,
+        stream_actions=stream_actions,
+    )
+    return RobotClient(client_config)
+
+
+@pytest.mark.parametrize("stream_actions", [True, False])
+def test_async_inference_e2e(monkeypatch, stream_actions: bool):
+    """Tests the full asynchronous inference pipeline, with actions streamed or polled by the client."""
+    # Import grpc-dependent modules inside the test function
+    import grpc
+
+    from lerobot.async_inference.configs import PolicyServerConfig
+    from lerobot.transport import services_pb2_grpc  # type: ignore
+
+    # ------------------------------------------------------------------
+    # 1. Create PolicyServer instance with mock policy
+    # ------------------------------------------------------------------
+    policy_server_config = PolicyServerConfig(host="localhost", port=9999)
+    policy_server = make_policy_server(monkeypatch, policy_server_config)
 
     # Build gRPC server running a PolicyServer
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="policy_server"))
+    # The client holds its action stream open while sending observations, so it needs two workers
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="policy_server"))
     services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
 
     # Use the host/port specified in the fixture's config
@@ -132,16 +152,7 @@ def test_async_inference_e2e(monkeypatch):
     # ------------------------------------------------------------------
     # 2. Create a RobotClient around the MockRobot
     # ------------------------------------------------------------------
-    client_config = RobotClientConfig(
-        server_address=server_address,
-        robot=robot_config,
-        chunk_size_threshold=0.0,
-        policy_type="test",
-        pretrained_name_or_path="test",
-        actions_per_chunk=20,
-    )
-
-    client = RobotClient(client_config)
+    client = make_robot_client(server_address, stream_actions)
     assert client.start(), "Client failed initial handshake with the server"
 
     # Track action chunks received and verify device type
@@ -183,3 +194,57 @@ def test_async_inference_e2e(monkeypatch):
     control_thread.join()
     policy_server.stop()
     server.stop(grace=None)
+
+
+def test_async_inference_e2e_many_streaming_clients(monkeypatch):
+    """More streaming clients than `max_batch_size`, and than `max_clients`: the clients within `max_clients`
+    stream their actions, the others poll for them, and none of their calls is starved of gRPC workers."""
+    import grpc
+
+    from lerobot.async_inference.configs import PolicyServerConfig
+    from lerobot.async_inference.policy_server import grpc_max_workers
+    from lerobot.transport import services_pb2_grpc  # type: ignore
+
+    num_clients = 7
+    policy_server_config = PolicyServerConfig(host="localhost", port=9998, max_batch_size=1, max_clients=6)
+    policy_server = make_policy_server(monkeypatch, policy_server_config)
+
+    server = grpc.server(
+        futures.ThreadPoolExecutor(
+            max_workers=grpc_max_workers(policy_server_config), thread_name_prefix="policy_server"
+        )
+    )
+    services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
+    server_address = f"{policy_server.config.host}:{policy_server.config.port}"
+    server.add_insecure_port(server_address)
+    server.start()
+
+    clients = [make_robot_client(server_address) for _ in range(num_clients)]
+    chunks_received = {client.client_id: 0 for client in clients}
+    threads = []
+    for client in clients:
+        assert client.start(), "Client failed initial handshake with the server"
+        original_aggregate = client._aggregate_action_queues
+
+        def counting_aggregate(
+            *args, client_id=client.client_id, original_aggregate=original_aggregate, **kwargs
+        ):
+            chunks_received[client_id] += 1
+            return original_aggregate(*args, **kwargs)
+
+        monkeypatch.setattr(client, "_aggregate_action_queues", counting_aggregate)
+        threads.append(threading.Thread(target=client.receive_actions, daemon=True))
+        threads.append(threading.Thread(target=client.control_loop, args=({"task": ""}), daemon=True))
+
+    for thread in threads:
+        thread.start()
+    server.wait_for_termination(timeout=8)
+
+    assert all(count > 0 for count in chunks_received.values()), f"Clients starved: {chunks_received}"
+
+    for client in clients:
+        client.stop()
+    for thread in threads:
+        thread.join()
+    policy_server.stop()
+    server.stop(grace=None)
@@ -15,21 +15,31 @@
 import math
 import pickle
 import time
+from queue import Empty
 
 import numpy as np
+import pytest
 import torch
 
 from lerobot.async_inference.helpers import (
+    ActionTimeline,
     FPSTracker,
     TimedAction,
+    TimedActionChunk,
     TimedObservation,
+    bytes_to_timed_action_chunk,
+    bytes_to_timed_actions,
+    bytes_to_timed_observation,
     observations_similar,
     prepare_image,
     prepare_raw_observation,
     raw_observation_to_observation,
     resize_robot_observation_image,
+    timed_actions_to_bytes,
+    timed_observation_to_bytes,
 )
 from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.transport.tensor_wire import TensorCompression
 from lerobot.utils.constants import OBS_IMAGES, OBS_STATE
 
 # ---------------------------------------------------------------------
@@ -127,8 +137,6 @@ def test_timed_observation_getters():
 def test_timed_data_deserialization_data_getters():
     """TimedAction / TimedObservation survive a round-trip through ``pickle``.
 
-    The async-inference stack uses ``pickle.dumps`` to move these objects across
-    the gRPC boundary (see RobotClient.send_observation and PolicyServer.StreamActions).
     This test ensures that the payload keeps its content intact after
     the (de)serialization round-trip.
     """
@@ -165,6 +173,45 @@ def test_timed_data_deserialization_data_getters():
     torch.testing.assert_close(to_out.get_observation()[OBS_STATE], obs_dict[OBS_STATE])
 
 
+def test_timed_observation_wire_round_trip():
+    """TimedObservation survives a round-trip through the tensor wire format used across the gRPC boundary."""
+    ts = time.time()
+    image = np.random.randint(0, 256, (48, 64, 3), dtype=np.uint8)
+    obs_dict = {"shoulder": 1.5, "elbow": np.float32(-0.25), "laptop": image, "task": "fold my tshirt"}
+    to_in = TimedObservation(timestamp=ts, observation=obs_dict, timestep=7, must_go=True)
+
+    compression = {"laptop": TensorCompression(level=1)}
+    to_out = bytes_to_timed_observation(timed_observation_to_bytes(to_in, compression))
+
+    assert to_out.get_timestamp() == ts
+    assert to_out.get_timestep() == 7
+    assert to_out.must_go is True
+    observation = to_out.get_observation()
+    assert list(observation) == list(obs_dict)
+    assert observation["shoulder"] == 1.5
+    assert observation["elbow"] == -0.25
+    assert observation["task"] == "fold my tshirt"
+    np.testing.assert_array_equal(observation["laptop"], image)
+
+
+def test_timed_actions_wire_round_trip():
+    """An action chunk survives a round-trip through the tensor wire format."""
+    ts = time.time()
+    actions_in = [
+        TimedAction(timestamp=ts + i * 0.1, timestep=10 + i, action=torch.randn(6)) for i in range(5)
+    ]
+
+    actions_out = bytes_to_timed_actions(timed_actions_to_bytes(actions_in))
+
+    assert len(actions_out) == len(actions_in)
+    for action_in, action_out in zip(actions_in, actions_out, strict=True):
+        assert action_out.get_timestamp() == action_in.get_timestamp()
+        assert action_out.get_timestep() == action_in.get_timestep()
+        torch.testing.assert_close(action_out.get_action(), action_in.get_action())
+
+    assert bytes_to_timed_actions(timed_actions_to_bytes([])) == []
+
+
 # ---------------------------------------------------------------------
 # observations_similar()
 # ---------------------------------------------------------------------
@@ -184,6 +231,95 @@ def _make_obs(state: torch.Tensor) -> TimedObservation:
     )
 
 
+def test_timed_action_chunk_wire_round_trip():
+    """A chunk of actions is decoded as a single tensor, without per-action objects."""
+    actions = [
+        TimedAction(timestamp=1.5 + i, timestep=7 + i, action=torch.full((3,), float(i))) for i in range(4)
+    ]
+
+    chunk = bytes_to_timed_action_chunk(timed_actions_to_bytes(actions))
+
+    assert chunk.timestep == 7
+    assert len(chunk) == 4
+    assert torch.equal(chunk.actions, torch.stack([a.get_action() for a in actions]))
+    assert [a.get_timestamp() for a in chunk] == [a.get_timestamp() for a in actions]
+    assert [a.get_timestep() for a in chunk] == [a.get_timestep() for a in actions]
+
+
+def test_timed_action_chunk_requires_consecutive_timesteps():
+    actions = [TimedAction(timestamp=0.0, timestep=t, action=torch.zeros(2)) for t in (1, 2, 4)]
+    with pytest.raises(ValueError):
+        TimedActionChunk.from_timed_actions(actions)
+    with pytest.raises(ValueError):
+        bytes_to_timed_action_chunk(timed_actions_to_bytes(actions))
+
+
+def _make_chunk(timestep: int, values: list[float]) -> TimedActionChunk:
+    return TimedActionChunk(
+        timestep=timestep,
+        timestamps=torch.arange(len(values), dtype=torch.float64) + timestep,
+        actions=torch.tensor(values)[:, None].repeat(1, 2),
+    )
+
+
+def test_action_timeline_put_get():
+    """The timeline behaves like a FIFO queue of consecutive actions."""
+    timeline = ActionTimeline(capacity=2)
+    assert timeline.empty()
+
+    for action in _make_chunk(4, [1.0, 2.0, 3.0]):
+        timeline.put(action)
+
+    assert timeline.qsize() == 3
+    assert [a.get_timestep() for a in timeline.queue] == [4, 5, 6]
+    action = timeline.get_nowait()
+    assert action.get_timestep() == 4
+    assert action.get_timestamp() == 4.0
+    assert torch.equal(action.get_action(), torch.tensor([1.0, 1.0]))
+    assert timeline.start == 5
+
+    with pytest.raises(ValueError):
+        timeline.put(TimedAction(timestamp=0.0, timestep=9, action=torch.zeros(2)))
+
+    timeline.get_nowait()
+    timeline.get_nowait()
+    with pytest.raises(Empty):
+        timeline.get_nowait()
+
+
+def test_action_timeline_merge_aggregates_overlap():
+    """Merging a chunk drops its stale actions and aggregates the overlapping ones in a single call."""
+    timeline = ActionTimeline(capacity=4)
+    timeline.merge(_make_chunk(0, [10.0, 10.0, 10.0, 10.0]), min_timestep=0)
+    timeline.get_nowait()
+
+    calls = []
+
+    def aggregate_fn(current, new):
+        calls.append(len(current))
+        return 0.5 * current + 0.5 * new
+
+    # Timeline holds 1..3, the chunk 2..7 and action 1 is being performed
+    timeline.merge(_make_chunk(2, [0.0] * 6), min_timestep=2, aggregate_fn=aggregate_fn)
+
+    assert calls == [2]
+    queue = timeline.queue
+    assert [a.get_timestep() for a in queue] == list(range(2, 8))
+    assert [a.get_action()[0].item() for a in queue] == [5.0, 5.0, 0.0, 0.0, 0.0, 0.0]
+    assert [a.get_timestamp() for a in queue] == [float(t) for t in range(2, 8)]
+
+
+def test_action_timeline_merge_stale_chunk():
+    """A chunk with no action left to perform empties the timeline."""
+    timeline = ActionTimeline()
+    timeline.merge(_make_chunk(0, [1.0, 2.0]), min_timestep=0)
+
+    timeline.merge(_make_chunk(0, [1.0, 2.0]), min_timestep=5)
+
+    assert timeline.empty()
+    assert timeline.start == 5
+
+
 def test_observations_similar_true():
     """Distance below atol → observations considered similar."""
     # Create mock lerobot features for the similarity check
@@ -17,7 +17,9 @@ Monkey-patch the `policy` attribute with a stub so that no real model inference
 
 from __future__ import annotations
 
+import threading
 import time
+from unittest.mock import patch
 
 import pytest
 import torch
@@ -217,3 +219,287 @@ def test_predict_action_chunk(monkeypatch, policy_server):
     for i, ta in enumerate(timed_actions):
         expected_ts = obs.get_timestamp() + i * policy_server.config.environment_dt
         assert abs(ta.get_timestamp() - expected_ts) < 1e-6
+
+
+class EchoPolicy(MockPolicy):
+    """Returns chunks repeating the observed state, to tell apart the actions predicted for each client."""
+
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes = []
+
+    def predict_action_chunk(self, observation: dict[str, torch.Tensor]) -> torch.Tensor:
+        state = observation[OBS_STATE]
+        self.batch_sizes.append(len(state))
+        return state[:, None, :].expand(-1, 20, -1)
+
+
+def test_predict_action_chunks_batches_clients(policy_server):
+    """Observations of several clients run through the policy at once, each chunk timed for its client."""
+    policy_server.policy = EchoPolicy()
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = lambda tensor: tensor
+    policy_server._get_client("robot_a").actions_per_chunk = 10
+
+    obs_a = _make_obs(torch.ones(6), timestep=3)
+    obs_b = _make_obs(torch.ones(6) * 2, timestep=50)
+    chunk_a, chunk_b = policy_server._predict_action_chunks([obs_a, obs_b], ["robot_a", "robot_b"])
+
+    assert policy_server.policy.batch_sizes == [2]
+    assert [ta.get_timestep() for ta in chunk_a] == list(range(3, 13))
+    assert [ta.get_timestep() for ta in chunk_b] == list(range(50, 70))
+    assert all(torch.equal(ta.get_action(), torch.ones(6)) for ta in chunk_a)
+    assert all(torch.equal(ta.get_action(), torch.ones(6) * 2) for ta in chunk_b)
+    assert policy_server._get_client("robot_a").last_processed_obs is obs_a
+    assert policy_server._get_client("robot_b").last_processed_obs is obs_b
+
+
+def test_postprocessor_runs_once_per_batch(policy_server):
+    """The postprocessor runs on all the actions of the batched chunks at once, not on each timestep."""
+    policy_server.policy = EchoPolicy()
+    policy_server.preprocessor = lambda obs: obs
+    postprocessed_shapes = []
+
+    def postprocessor(tensor):
+        postprocessed_shapes.append(tuple(tensor.shape))
+        return 2 * tensor
+
+    policy_server.postprocessor = postprocessor
+
+    obs_a = _make_obs(torch.ones(6), timestep=0)
+    obs_b = _make_obs(torch.ones(6) * 2, timestep=0)
+    chunk_a, chunk_b = policy_server._predict_action_chunks([obs_a, obs_b], ["robot_a", "robot_b"])
+
+    assert postprocessed_shapes == [(2 * 20, 6)]
+    assert all(torch.equal(ta.get_action(), torch.ones(6) * 2) for ta in chunk_a)
+    assert all(torch.equal(ta.get_action(), torch.ones(6) * 4) for ta in chunk_b)
+
+
+def test_scheduler_routes_batched_chunks(policy_server):
+    """The scheduler waits for the observations of several clients and routes each chunk back to its client."""
+    policy_server.policy = EchoPolicy()
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = lambda tensor: tensor
+    policy_server.config.max_batch_size = 3
+    policy_server.config.batch_deadline = 0.5
+    policy_server.config.inference_latency = 0
+
+    try:
+        policy_server._ensure_scheduler()
+        for i, client_id in enumerate(["robot_a", "robot_b", "robot_c"]):
+            obs = _make_obs(torch.ones(6) * i, timestep=10 * i, must_go=True)
+            assert policy_server._enqueue_observation(obs, client_id) is True
+
+        for i, client_id in enumerate(["robot_a", "robot_b", "robot_c"]):
+            action_chunk, obs = policy_server._get_client(client_id).action_queue.get(timeout=5)
+            assert obs.get_timestep() == 10 * i
+            assert action_chunk[0].get_timestep() == 10 * i
+            assert torch.equal(action_chunk[0].get_action(), torch.ones(6) * i)
+            assert 10 * i in policy_server._get_client(client_id).predicted_timesteps
+    finally:
+        policy_server.stop()
+
+    assert policy_server.policy.batch_sizes == [3]
+    metrics = policy_server.get_metrics()
+    assert metrics["num_batches"] == 1
+    assert metrics["avg_batch_size"] == 3
+    assert metrics["max_queue_delay_ms"] >= 0
+
+
+def test_concurrent_calls_start_a_single_scheduler(policy_server):
+    """Concurrent `SendObservations` calls start the scheduler once."""
+    started = []
+    original_start = threading.Thread.start
+
+    def counting_start(thread):
+        if thread.name == "policy_server_scheduler":
+            started.append(thread)
+            time.sleep(0.05)  # Widen the window between the liveness check and the start
+        original_start(thread)
+
+    barrier = threading.Barrier(4)
+
+    def ensure_scheduler():
+        barrier.wait()
+        policy_server._ensure_scheduler()
+
+    threads = [threading.Thread(target=ensure_scheduler) for _ in range(4)]
+    try:
+        with patch.object(threading.Thread, "start", counting_start):
+            for thread in threads:
+                original_start(thread)
+            for thread in threads:
+                thread.join()
+    finally:
+        policy_server.stop()
+
+    assert len(started) == 1
+
+
+def test_scheduler_deadline_runs_partial_batch(policy_server):
+    """A batch that is not full runs once the deadline of its first observation passed."""
+    policy_server.policy = EchoPolicy()
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = lambda tensor: tensor
+    policy_server.config.max_batch_size = 4
+    policy_server.config.batch_deadline = 0.05
+    policy_server.config.inference_latency = 0
+
+    try:
+        policy_server._ensure_scheduler()
+        policy_server._enqueue_observation(_make_obs(torch.ones(6), timestep=1, must_go=True), "robot_a")
+        action_chunk, _ = policy_server._get_client("robot_a").action_queue.get(timeout=5)
+        assert len(action_chunk) == policy_server.actions_per_chunk
+    finally:
+        policy_server.stop()
+
+    assert policy_server.policy.batch_sizes == [1]
+
+
+class _FakeContext:
+    """Minimal gRPC servicer context of a client, active until `close` is called."""
+
+    def __init__(self, client_id: str):
+        self.client_id = client_id
+        self.active = True
+
+    def invocation_metadata(self):
+        from lerobot.async_inference.constants import CLIENT_ID_METADATA_KEY
+
+        return ((CLIENT_ID_METADATA_KEY, self.client_id),)
+
+    def peer(self):
+        return "ipv4:127.0.0.1:0"
+
+    def is_active(self):
+        return self.active
+
+    def close(self):
+        self.active = False
+
+
+def test_stream_actions_pushes_chunks(policy_server):
+    """Every chunk predicted for a client is pushed on its action stream, until it disconnects."""
+    from lerobot.async_inference.helpers import bytes_to_timed_actions
+    from lerobot.transport import services_pb2  # type: ignore
+
+    policy_server.policy = EchoPolicy()
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = lambda tensor: tensor
+    policy_server.config.inference_latency = 0
+    context = _FakeContext("robot_a")
+    stream = policy_server.StreamActions(services_pb2.Empty(), context)
+
+    try:
+        policy_server._ensure_scheduler()
+        for timestep in (0, 30):
+            policy_server._enqueue_observation(
+                _make_obs(torch.ones(6), timestep=timestep, must_go=True), "robot_a"
+            )
+            timed_actions = bytes_to_timed_actions(next(stream).data)
+            assert timed_actions[0].get_timestep() == timestep
+    finally:
+        policy_server.stop()
+
+    context.close()
+    assert list(stream) == []
+
+
+def test_policy_swap_waits_for_running_batch(monkeypatch, policy_server):
+    """A policy sent by a client replaces the policy and its processors together, between two batches."""
+    import pickle  # nosec
+
+    from lerobot.async_inference import policy_server as policy_server_module
+    from lerobot.async_inference.helpers import RemotePolicyConfig
+    from lerobot.transport import services_pb2  # type: ignore
+
+    batch_started, release_batch = threading.Event(), threading.Event()
+
+    def blocking_preprocessor(obs):
+        batch_started.set()
+        assert release_batch.wait(timeout=5)
+        return obs
+
+    old_policy, new_policy = EchoPolicy(), EchoPolicy()
+    policy_server.policy = old_policy
+    policy_server.preprocessor = blocking_preprocessor
+    policy_server.postprocessor = lambda tensor: tensor
+
+    class NewPolicyClass:
+        @staticmethod
+        def from_pretrained(path):
+            return new_policy
+
+    monkeypatch.setattr(policy_server_module, "get_policy_class", lambda policy_type: NewPolicyClass)
+    # The new postprocessor would scale the actions of the old policy if they were mixed within a batch
+    new_processors = (lambda obs: obs, lambda tensor: 10 * tensor)
+    for processor in new_processors:
+        processor.freeze = lambda: None
+    monkeypatch.setattr(
+        policy_server_module, "make_pre_post_processors", lambda *args, **kwargs: new_processors
+    )
+
+    chunks = []
+    inference = threading.Thread(
+        target=lambda: chunks.extend(
+            policy_server._predict_action_chunks([_make_obs(torch.ones(6))], ["robot_a"])
+        )
+    )
+    inference.start()
+    assert batch_started.wait(timeout=5)
+
+    specs = RemotePolicyConfig("act", "new/policy", policy_server.lerobot_features, actions_per_chunk=20)
+    request = services_pb2.PolicySetup(data=pickle.dumps(specs))
+    swap = threading.Thread(
+        target=policy_server.SendPolicyInstructions, args=(request, _FakeContext("robot_b"))
+    )
+    swap.start()
+    swap.join(timeout=0.2)
+    # The swap waits for the running batch
+    assert swap.is_alive()
+    assert policy_server.policy is old_policy
+
+    release_batch.set()
+    inference.join(timeout=5)
+    swap.join(timeout=5)
+
+    assert old_policy.batch_sizes == [1] and new_policy.batch_sizes == []
+    assert all(torch.equal(ta.get_action(), torch.ones(6)) for ta in chunks[0])
+    assert policy_server.policy is new_policy
+    assert (policy_server.preprocessor, policy_server.postprocessor) == new_processors
+
+
+def test_speculative_inference_skips_latency(policy_server):
+    """With speculative inference, the next observation runs without waiting for `inference_latency`."""
+    policy_server.policy = EchoPolicy()
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = lambda tensor: tensor
+    policy_server.config.inference_latency = 10
+    policy_server.config.speculative_inference = True
+    client = policy_server._get_client("robot_a")
+
+    try:
+        policy_server._ensure_scheduler()
+        policy_server._enqueue_observation(_make_obs(torch.ones(6), timestep=0, must_go=True), "robot_a")
+        client.action_queue.get(timeout=5)
+        policy_server._enqueue_observation(_make_obs(torch.ones(6), timestep=30, must_go=True), "robot_a")
+        _, obs = client.action_queue.get(timeout=5)
+        assert obs.get_timestep() == 30
+    finally:
+        policy_server.stop()
+
+
+def test_group_stackable():
+    """Observations with different shapes are run in separate batches."""
+    from lerobot.async_inference.policy_server import _group_stackable, _stack_observations
+
+    observations = [
+        {OBS_STATE: torch.zeros(1, 6), "task": ["a"]},
+        {OBS_STATE: torch.zeros(1, 7), "task": ["b"]},
+        {OBS_STATE: torch.ones(1, 6), "task": ["c"]},
+    ]
+    assert _group_stackable(observations) == [[0, 2], [1]]
+
+    stacked = _stack_observations([observations[0], observations[2]])
+    assert stacked[OBS_STATE].shape == (2, 6)
+    assert stacked["task"] == ["a", "c"]
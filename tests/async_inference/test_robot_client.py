@@ -20,7 +20,6 @@ no real hardware is accessed. Only the queue-update mechanism is verified.
 from __future__ import annotations
 
 import time
-from queue import Queue
 
 import pytest
 import torch
@@ -172,6 +171,22 @@ def test_aggregate_action_queues_combines_actions_in_overlap(
     assert torch.allclose(queue_non_overlap_actions[0].get_action(), incoming[-1].get_action())
 
 
+def test_aggregate_action_queues_accepts_chunk(robot_client):
+    """Chunks decoded from the wire are merged without being split into per-action objects."""
+    from lerobot.async_inference.helpers import TimedActionChunk
+
+    robot_client.latest_action = 4
+    for a in _make_actions(start_ts=time.time(), start_t=5, count=2):
+        robot_client.action_queue.put(a)
+
+    incoming = TimedActionChunk.from_timed_actions(_make_actions(start_ts=time.time(), start_t=3, count=5))
+    robot_client._aggregate_action_queues(incoming, aggregate_fn=lambda x1, x2: x1 + x2)
+
+    queue = robot_client.action_queue.queue
+    assert [a.get_timestep() for a in queue] == [5, 6, 7]
+    assert [a.get_action()[0].item() for a in queue] == [10.0, 12.0, 7.0]
+
+
 @pytest.mark.parametrize(
     "chunk_size, queue_len, expected",
     [
@@ -183,11 +198,12 @@ def test_aggregate_action_queues_combines_actions_in_overlap(
 )
 def test_ready_to_send_observation(robot_client, chunk_size: int, queue_len: int, expected: bool):
     """Validate `_ready_to_send_observation` ratio logic for various sizes."""
+    from lerobot.async_inference.helpers import ActionTimeline
 
     robot_client.action_chunk_size = chunk_size
 
     # Clear any existing actions then fill with `queue_len` dummy entries ----
-    robot_client.action_queue = Queue()
+    robot_client.action_queue = ActionTimeline(capacity=2 * robot_client.config.actions_per_chunk)
 
     dummy_actions = _make_actions(start_ts=time.time(), start_t=0, count=queue_len)
     for act in dummy_actions:
@@ -216,6 +232,8 @@ def test_ready_to_send_observation(robot_client, chunk_size: int, queue_len: int
 )
 def test_ready_to_send_observation_with_varying_threshold(robot_client, g_threshold: float, expected: bool):
     """Validate `_ready_to_send_observation` with fixed sizes and varying `g`."""
+    from lerobot.async_inference.helpers import ActionTimeline
+
     # Fixed sizes for this test: ratio = 6 / 10 = 0.6
     chunk_size = 10
     queue_len = 6
@@ -225,7 +243,7 @@ def test_ready_to_send_observation_with_varying_threshold(robot_client, g_thresh
     robot_client._chunk_size_threshold = g_threshold
 
     # Fill queue with dummy actions
-    robot_client.action_queue = Queue()
+    robot_client.action_queue = ActionTimeline(capacity=2 * robot_client.config.actions_per_chunk)
     dummy_actions = _make_actions(start_ts=time.time(), start_t=0, count=queue_len)
     for act in dummy_actions:
         robot_client.action_queue.put(act)
@@ -233,6 +251,35 @@ def test_ready_to_send_observation_with_varying_threshold(robot_client, g_thresh
     assert robot_client._ready_to_send_observation() is expected
 
 
+def test_receive_actions_falls_back_to_polling(robot_client):
+    """Clients of a server without `StreamActions` poll it with `GetActions` instead."""
+    import grpc
+
+    from lerobot.async_inference.helpers import timed_actions_to_bytes
+    from lerobot.transport import services_pb2  # type: ignore
+
+    class _Unimplemented(grpc.RpcError):
+        def code(self):
+            return grpc.StatusCode.UNIMPLEMENTED
+
+    class _OldServerStub:
+        def StreamActions(self, request, metadata=None):  # noqa: N802
+            raise _Unimplemented()
+
+        def GetActions(self, request, metadata=None):  # noqa: N802
+            robot_client.shutdown_event.set()
+            data = timed_actions_to_bytes(_make_actions(start_ts=time.time(), start_t=0, count=3))
+            return services_pb2.Actions(data=data)
+
+    robot_client.stub = _OldServerStub()
+    robot_client.start_barrier = type("NoBarrier", (), {"wait": lambda self: None})()
+    robot_client.shutdown_event.clear()
+
+    robot_client.receive_actions()
+
+    assert [a.get_timestep() for a in robot_client.action_queue.queue] == [0, 1, 2]
+
+
 # -----------------------------------------------------------------------------
 # Regression test: robot type registry populated by robot_client imports
 # -----------------------------------------------------------------------------
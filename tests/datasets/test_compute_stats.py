@@ -22,8 +22,11 @@ from lerobot.datasets.compute_stats import (
     RunningQuantileStats,
     _assert_type_and_shape,
     aggregate_feature_stats,
+    aggregate_sketches,
     aggregate_stats,
+    compute_episode_sketches,
     compute_episode_stats,
+    compute_stats,
     estimate_num_samples,
     get_feature_stats,
     sample_images,
@@ -832,3 +835,81 @@ def test_fixed_quantiles_always_computed():
         for q_key in expected_quantiles:
             assert q_key in episode_stats[key]
             assert episode_stats[key][q_key].shape == (features[key]["shape"][0],)
+
+
+def test_running_quantile_stats_merge_matches_single_pass():
+    np.random.seed(42)
+    data1 = np.random.normal(0, 1, (500, 2))
+    data2 = np.random.normal(3, 2, (700, 2))
+
+    single_pass = RunningQuantileStats()
+    single_pass.update(data1)
+    single_pass.update(data2)
+
+    merged = RunningQuantileStats()
+    merged.merge(RunningQuantileStats())  # Merging empty stats is a no-op
+    for data in (data1, data2):
+        partial = RunningQuantileStats()
+        partial.update(data)
+        merged.merge(partial)
+
+    expected = single_pass.get_statistics()
+    stats = merged.get_statistics()
+    for key in ("min", "max", "mean", "std", "count"):
+        np.testing.assert_allclose(stats[key], expected[key], atol=1e-10)
+    # Both re-bin the histogram of data1 onto the extended range in the same way
+    for key in ("q01", "q10", "q50", "q90", "q99"):
+        np.testing.assert_allclose(stats[key], expected[key], atol=1e-2)
+
+
+def test_aggregate_sketches_exact_quantiles():
+    np.random.seed(42)
+    episodes = [
+        {OBS_STATE: np.random.normal(0, 1, (300, 3))},
+        {OBS_STATE: np.random.normal(5, 1, (100, 3))},
+    ]
+    features = {OBS_STATE: {"dtype": "float32"}}
+
+    stats = aggregate_sketches(compute_episode_sketches(ep, features) for ep in episodes)[OBS_STATE]
+
+    all_data = np.concatenate([ep[OBS_STATE] for ep in episodes])
+    np.testing.assert_allclose(stats["mean"], all_data.mean(axis=0), atol=1e-10)
+    np.testing.assert_allclose(stats["std"], all_data.std(axis=0), atol=1e-8)
+    np.testing.assert_equal(stats["count"], np.array([400]))
+    # Unlike the count-weighted average of the per-episode medians (~1.25), the median of the merged
+    # histograms is the one of the data
+    np.testing.assert_allclose(stats["q50"], np.quantile(all_data, 0.5, axis=0), atol=0.05)
+    np.testing.assert_allclose(stats["q99"], np.quantile(all_data, 0.99, axis=0), atol=0.05)
+
+
+def test_aggregate_sketches_image_data():
+    episode_data = {OBS_IMAGE: [f"image_{i}.jpg" for i in range(100)]}
+    features = {OBS_IMAGE: {"dtype": "image"}}
+
+    with patch("lerobot.datasets.compute_stats.load_image_as_numpy", side_effect=mock_load_image_as_numpy):
+        expected = compute_episode_stats(episode_data, features)
+        sketches = [compute_episode_sketches(episode_data, features) for _ in range(2)]
+
+    stats = aggregate_sketches(sketches)
+    _assert_type_and_shape([stats])
+    assert stats[OBS_IMAGE]["count"].item() == 200
+    for key in ("min", "max", "mean", "std", "q50"):
+        assert stats[OBS_IMAGE][key].shape == (3, 1, 1)
+        np.testing.assert_allclose(stats[OBS_IMAGE][key], expected[OBS_IMAGE][key], atol=1e-6)
+
+
+def test_compute_stats_from_episode_generator():
+    np.random.seed(42)
+    episodes = [{OBS_STATE: np.random.normal(i, 1, (50 + i, 4)), "task": ["t"] * (50 + i)} for i in range(6)]
+    features = {OBS_STATE: {"dtype": "float32"}, "task": {"dtype": "string"}}
+
+    stats = compute_stats(iter(episodes), features)
+    expected = compute_episode_stats(
+        {OBS_STATE: np.concatenate([episode[OBS_STATE] for episode in episodes])},
+        {OBS_STATE: features[OBS_STATE]},
+    )
+
+    assert set(stats) == {OBS_STATE}
+    assert stats[OBS_STATE]["count"].item() == sum(50 + i for i in range(6))
+    for key in ("min", "max", "mean", "std"):
+        np.testing.assert_allclose(stats[OBS_STATE][key], expected[OBS_STATE][key])
@@ -15,8 +15,17 @@
 # limitations under the License.
 """Contract tests for DatasetReader."""
 
+import math
+import threading
+import time
+
+import torch
+
 from lerobot.datasets.dataset_reader import DatasetReader
+from lerobot.datasets.frame_view import FrameViewSpec, build_frame_view
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.datasets.video_utils import get_safe_default_codec
+from lerobot.utils.constants import ACTION
 
 # ── Loading ──────────────────────────────────────────────────────────
 
@@ -166,3 +175,243 @@ def test_get_episodes_file_paths_includes_video_paths(tmp_path, lerobot_dataset_
     if len(dataset.meta.video_keys) > 0:
         paths = dataset.reader.get_episodes_file_paths()
         assert any("video" in str(p).lower() for p in paths)
+
+
+# ── get_items ────────────────────────────────────────────────────────
+
+
+def _assert_batch_matches_items(batch, items):
+    for key, val in batch.items():
+        if isinstance(val, list):
+            assert val == [item[key] for item in items], key
+        else:
+            torch.testing.assert_close(val, torch.stack([item[key] for item in items]), msg=key)
+
+
+def test_get_items_matches_get_item(tmp_path, lerobot_dataset_factory):
+    """get_items() returns the same values as collating per-sample get_item() calls."""
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds", total_episodes=3, total_frames=60, use_videos=False
+    )
+    indices = [0, 5, 59, 21, 5]
+    batch = dataset.reader.get_items(indices)
+
+    assert set(batch) == set(dataset.reader.get_item(0))
+    _assert_batch_matches_items(batch, [dataset.reader.get_item(i) for i in indices])
+
+
+def test_get_items_delta_timestamps_with_episode_filter(tmp_path, lerobot_dataset_factory):
+    """Batched windows and padding masks match get_item() at episode boundaries with a filter."""
+    fps = 30
+    delta_timestamps = {ACTION: [i / fps for i in range(-2, 5)], "state": [-1 / fps, 0.0]}
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds",
+        total_episodes=4,
+        total_frames=80,
+        episodes=[1, 3],
+        use_videos=False,
+        delta_timestamps=delta_timestamps,
+    )
+    indices = list(range(len(dataset)))
+    batch = dataset.reader.get_items(indices)
+
+    assert batch[ACTION].shape[:2] == (len(indices), 7)
+    assert batch[f"{ACTION}_is_pad"].any()
+    _assert_batch_matches_items(batch, [dataset.reader.get_item(i) for i in indices])
+
+
+def test_getitems_is_compatible_with_default_collate(tmp_path, lerobot_dataset_factory):
+    """A DataLoader using __getitems__ yields the same batch as per-sample indexing."""
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds", total_episodes=2, total_frames=20, use_videos=False
+    )
+    samples = dataset.__getitems__([3, 1, 4])
+    assert len(samples) == 3
+
+    loader = torch.utils.data.DataLoader(dataset, batch_size=4, shuffle=False)
+    batch = next(iter(loader))
+    _assert_batch_matches_items(batch, [dataset[i] for i in range(4)])
+
+
+# ── Frame store ──────────────────────────────────────────────────────
+
+
+def test_frame_store_items_match_hf_dataset(tmp_path, lerobot_dataset_factory, monkeypatch):
+    """With use_frame_store=True, items are identical to the parquet path, including delta windows."""
+    monkeypatch.setattr("lerobot.datasets.frame_store.HF_LEROBOT_FRAME_STORE", tmp_path / "frame_store")
+    fps = 30
+    delta_timestamps = {ACTION: [i / fps for i in range(-1, 3)]}
+    kwargs = {"total_episodes": 3, "total_frames": 45, "episodes": [0, 2], "use_videos": False}
+    dataset = lerobot_dataset_factory(root=tmp_path / "ds", delta_timestamps=delta_timestamps, **kwargs)
+    stored = LeRobotDataset(
+        dataset.repo_id,
+        root=dataset.root,
+        episodes=[0, 2],
+        delta_timestamps=delta_timestamps,
+        use_frame_store=True,
+    )
+
+    assert stored.reader._frame_store is not None
+    assert ACTION in stored.reader._frame_store
+    for idx in range(len(dataset)):
+        expected, item = dataset[idx], stored[idx]
+        assert set(item) == set(expected)
+        for key, val in expected.items():
+            if isinstance(val, torch.Tensor):
+                assert item[key].dtype == val.dtype, key
+                torch.testing.assert_close(item[key], val, msg=key)
+            else:
+                assert item[key] == val
+    indices = [0, 7, len(dataset) - 1]
+    _assert_batch_matches_items(stored.get_items(indices), [dataset[i] for i in indices])
+
+
+def test_frame_store_is_reused(tmp_path, lerobot_dataset_factory, monkeypatch):
+    """The store is built once and re-opened (not rebuilt) by later readers of the same dataset."""
+    monkeypatch.setattr("lerobot.datasets.frame_store.HF_LEROBOT_FRAME_STORE", tmp_path / "frame_store")
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds", total_episodes=2, total_frames=20, use_videos=False, use_frame_store=True
+    )
+    store_dir = dataset.reader._frame_store.store_dir
+    mtime = (store_dir / "frame_store.json").stat().st_mtime_ns
+
+    reloaded = LeRobotDataset(dataset.repo_id, root=dataset.root, use_frame_store=True)
+    assert reloaded.reader._frame_store.store_dir == store_dir
+    assert (store_dir / "frame_store.json").stat().st_mtime_ns == mtime
+    assert len(list(store_dir.parent.iterdir())) == 1
+
+
+# ── Parallel video decoding ──────────────────────────────────────────
+
+
+def _fake_decode_video_frames(decoding_threads):
+    """Stand-in for decode_video_frames returning frames derived from the path and timestamps."""
+
+    def decode(video_path, timestamps, tolerance_s, backend=None, decoder_cache=None, as_uint8=False):
+        decoding_threads.add(threading.current_thread().name)
+        # Give the other cameras a chance to be decoded at the same time
+        time.sleep(0.001)
+        values = torch.tensor(timestamps) + len(str(video_path))
+        frames = values[:, None, None, None].expand(len(timestamps), 3, 4, 4).clone()
+        return (frames * 255).round().to(torch.uint8) if as_uint8 else frames
+
+    return decode
+
+
+def test_parallel_video_decoding_matches_serial(tmp_path, lerobot_dataset_factory, monkeypatch):
+    """Camera streams decoded on the thread pool give the same items and batches as serial decoding."""
+    decoding_threads = set()
+    monkeypatch.setattr(
+        "lerobot.datasets.dataset_reader.decode_video_frames", _fake_decode_video_frames(decoding_threads)
+    )
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds", total_episodes=2, total_frames=20, use_videos=True
+    )
+    assert len(dataset.meta.video_keys) > 1
+    parallel = LeRobotDataset(dataset.repo_id, root=dataset.root, video_decode_threads=2)
+
+    indices = [0, 11, 19]
+    serial_items = [dataset[i] for i in indices]
+    assert decoding_threads == {threading.current_thread().name}
+    for idx, expected in zip(indices, serial_items, strict=True):
+        item = parallel[idx]
+        for key in dataset.meta.video_keys:
+            torch.testing.assert_close(item[key], expected[key], msg=key)
+    _assert_batch_matches_items(parallel.get_items(indices), serial_items)
+    assert any(name.startswith("lerobot-video-decode") for name in decoding_threads)
+
+    stats = parallel.reader.timing_stats()
+    assert stats["num_items"] == 2 * len(indices)
+    assert stats["video_decode_s"] > 0
+    parallel.reader.reset_timing_stats()
+    assert parallel.reader.timing_stats()["num_items"] == 0
+
+
+# ── Frame views ──────────────────────────────────────────────────────
+
+
+def test_frame_view_matches_on_the_fly_resize(tmp_path, lerobot_dataset_factory, monkeypatch):
+    """Items read from a built view are identical to frames decoded and resized on the fly."""
+    monkeypatch.setattr("lerobot.datasets.frame_view.HF_LEROBOT_FRAME_VIEWS", tmp_path / "frame_views")
+    fps = 30
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds", total_episodes=2, total_frames=20, use_videos=False
+    )
+    camera_key = dataset.meta.camera_keys[0]
+    spec = FrameViewSpec(resize=(32, 48), crop=(24, 24))
+    kwargs = {"episodes": [1], "delta_timestamps": {camera_key: [-1 / fps, 0.0]}, "frame_view": spec}
+
+    on_the_fly = LeRobotDataset(dataset.repo_id, root=dataset.root, **kwargs)
+    assert on_the_fly.reader._frame_view is None
+
+    view = build_frame_view(dataset, spec)
+    assert len(view) == dataset.meta.total_frames
+    assert view.columns[camera_key].shape == (20, 3, 24, 24)
+
+    from_view = LeRobotDataset(dataset.repo_id, root=dataset.root, **kwargs)
+    assert from_view.reader._frame_view is not None
+    # Image columns served by the view are not loaded from the parquet files
+    assert camera_key not in from_view.hf_dataset.column_names
+    for idx in range(len(from_view)):
+        expected, item = on_the_fly[idx], from_view[idx]
+        assert item[camera_key].shape == (2, 3, 24, 24)
+        for key in dataset.meta.camera_keys:
+            torch.testing.assert_close(item[key], expected[key], msg=key)
+        torch.testing.assert_close(item[f"{camera_key}_is_pad"], expected[f"{camera_key}_is_pad"])
+    indices = [0, 3, len(from_view) - 1]
+    _assert_batch_matches_items(from_view.get_items(indices), [on_the_fly[i] for i in indices])
+
+
+def test_frame_view_skips_video_decoding(tmp_path, lerobot_dataset_factory, monkeypatch):
+    """Video keys served by a view are never decoded."""
+    monkeypatch.setattr("lerobot.datasets.frame_view.HF_LEROBOT_FRAME_VIEWS", tmp_path / "frame_views")
+    decoding_threads = set()
+    monkeypatch.setattr(
+        "lerobot.datasets.dataset_reader.decode_video_frames", _fake_decode_video_frames(decoding_threads)
+    )
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds", total_episodes=2, total_frames=20, use_videos=True
+    )
+    spec = FrameViewSpec(resize=(2, 2))
+    build_frame_view(dataset, spec)
+
+    decoding_threads.clear()
+    from_view = LeRobotDataset(dataset.repo_id, root=dataset.root, frame_view=spec)
+    item = from_view[5]
+    assert not decoding_threads
+    for key in dataset.meta.video_keys:
+        torch.testing.assert_close(item[key], spec.apply_to_float(dataset[5][key]), msg=key)
+
+
+def test_frame_view_build_chunks_within_memory_budget(tmp_path, lerobot_dataset_factory, monkeypatch):
+    """Views built from uint8 decoded videos, a few frames at a time, match the frames resized on the fly."""
+    monkeypatch.setattr("lerobot.datasets.frame_view.HF_LEROBOT_FRAME_VIEWS", tmp_path / "frame_views")
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "ds", total_episodes=2, total_frames=20, use_videos=True
+    )
+    dataset = LeRobotDataset(dataset.repo_id, root=dataset.root, video_backend="pyav")
+    decoded_frames = []
+    decode_videos = dataset.reader._decode_videos
+
+    def recording_decode_videos(requests, as_uint8=False):
+        decoded = decode_videos(requests, as_uint8=as_uint8)
+        decoded_frames.extend(frames for key_frames in decoded.values() for frames in key_frames)
+        return decoded
+
+    monkeypatch.setattr(dataset.reader, "_decode_videos", recording_decode_videos)
+    video_key = dataset.meta.video_keys[0]
+    frame_bytes = math.prod(dataset.meta.features[video_key]["shape"])
+    # Budget of 3 uint8 frames
+    monkeypatch.setattr("lerobot.datasets.frame_view.FRAME_VIEW_BUILD_CHUNK_MB", 3 * frame_bytes / 1024**2)
+
+    spec = FrameViewSpec(resize=(8, 8))
+    view = build_frame_view(dataset, spec)
+
+    assert decoded_frames and all(
+        frames.dtype == torch.uint8 and len(frames) <= 3 for frames in decoded_frames
+    )
+    for idx in [0, 7, 19]:
+        for key in dataset.meta.video_keys:
+            torch.testing.assert_close(
+                view.get_frames(key, idx), spec.apply_to_float(dataset[idx][key]), msg=key
+            )
@@ -24,6 +24,7 @@ import torch
 from PIL import Image
 
 from lerobot.datasets.dataset_writer import _encode_video_worker
+from lerobot.datasets.io_utils import load_episodes
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.datasets.utils import DEFAULT_IMAGE_PATH
 from tests.fixtures.constants import DEFAULT_FPS, DUMMY_REPO_ID
@@ -224,3 +225,53 @@ def test_finalize_then_read_roundtrip(tmp_path):
     for i in range(5):
         item = dataset[i]
         assert torch.allclose(item["state"], known_states[i], atol=1e-5)
+
+
+# ── video encoding pool ──────────────────────────────────────────────
+
+
+def test_batch_encoding_reuses_encoding_pool(tmp_path):
+    """Batched episodes are encoded in a persistent pool, shut down by finalize()."""
+    features = {
+        "state": {"dtype": "float32", "shape": (2,), "names": None},
+        "cam_a": {"dtype": "video", "shape": (32, 48, 3), "names": ["height", "width", "channels"]},
+        "cam_b": {"dtype": "video", "shape": (32, 48, 3), "names": ["height", "width", "channels"]},
+    }
+    dataset = LeRobotDataset.create(
+        repo_id=DUMMY_REPO_ID,
+        fps=DEFAULT_FPS,
+        features=features,
+        root=tmp_path / "ds",
+        batch_encoding_size=2,
+        vcodec="h264",
+        encoding_workers=2,
+    )
+    episode_lengths = [3, 4, 2]
+    pools = []
+    for length in episode_lengths:
+        for _ in range(length):
+            dataset.add_frame(_make_frame(features))
+        dataset.save_episode()
+        pools.append(dataset.writer._encoding_pool)
+
+    # The first batch of 2 episodes was encoded when saving the second one, the last episode is pending
+    assert pools[0] is None
+    assert pools[1] is not None and pools[2] is pools[1]
+    assert dataset.writer._episodes_since_last_encoding == 1
+
+    dataset.finalize()
+    assert dataset.writer._encoding_pool is None
+
+    assert dataset.meta.total_episodes == 3
+    episodes = load_episodes(tmp_path / "ds")
+    for ep_idx, length in enumerate(episode_lengths):
+        episode = episodes[ep_idx]
+        for key in ("cam_a", "cam_b"):
+            duration = episode[f"videos/{key}/to_timestamp"] - episode[f"videos/{key}/from_timestamp"]
+            assert duration == pytest.approx(length / DEFAULT_FPS, abs=1e-3)
+    assert episodes["dataset_from_index"] == [0, 3, 7]
+    # The metadata of all the batches is written to the same file, the videos of all the episodes too
+    assert len(list((tmp_path / "ds" / "meta" / "episodes").rglob("*.parquet"))) == 1
+    assert set(episodes["meta/episodes/file_index"]) == {0}
+    assert set(episodes["videos/cam_a/file_index"]) == {0}
+    assert episodes["videos/cam_a/from_timestamp"][2] == pytest.approx(7 / DEFAULT_FPS, abs=1e-3)
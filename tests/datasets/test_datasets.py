@@ -45,7 +45,7 @@ from lerobot.envs.factory import make_env_config
 from lerobot.policies.factory import make_policy_config
 from lerobot.robots import make_robot_from_config
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGES, OBS_STATE, OBS_STR, REWARD
-from tests.fixtures.constants import DUMMY_CHW, DUMMY_HWC, DUMMY_REPO_ID
+from tests.fixtures.constants import DUMMY_CHW, DUMMY_HWC, DUMMY_MOTOR_FEATURES, DUMMY_REPO_ID
 from tests.mocks.mock_robot import MockRobotConfig
 from tests.utils import require_x86_64_kernel
 
@@ -541,6 +541,62 @@ def test_multidataset_frames():
             assert torch.equal(sub_dataset_item[k], dataset_item[k])
 
 
+def test_multidataset_prunes_uncommon_features(tmp_path, lerobot_dataset_factory, info_factory):
+    motor_features = {**DUMMY_MOTOR_FEATURES, "effort": {"dtype": "float32", "shape": (2,), "names": None}}
+    sub_datasets = [
+        lerobot_dataset_factory(
+            root=tmp_path / "dummy/a", repo_id="dummy/a", total_episodes=2, total_frames=20, use_videos=False
+        ),
+        lerobot_dataset_factory(
+            root=tmp_path / "dummy/b",
+            repo_id="dummy/b",
+            info=info_factory(
+                total_episodes=3,
+                total_frames=30,
+                total_tasks=1,
+                motor_features=motor_features,
+                use_videos=False,
+            ),
+        ),
+    ]
+    dataset = MultiLeRobotDataset(["dummy/a", "dummy/b"], root=tmp_path)
+
+    assert dataset.disabled_features == {"effort"}
+    # The disabled column is never loaded
+    assert "effort" not in dataset._datasets[1].hf_dataset.column_names
+    assert "effort" not in dataset.features
+    assert len(dataset) == 50
+    for idx, (dataset_idx, sub_idx) in enumerate([(0, 0), (0, 19), (1, 0), (1, 29)]):
+        item = dataset[[0, 19, 20, 49][idx]]
+        expected = sub_datasets[dataset_idx][sub_idx]
+        assert item.pop("dataset_index") == dataset_idx
+        assert set(item) == set(expected) - {"effort"}
+        torch.testing.assert_close(item[ACTION], expected[ACTION])
+    with pytest.raises(IndexError):
+        dataset[50]
+
+
+def test_multidataset_weighted_sampler(tmp_path, lerobot_dataset_factory):
+    for repo_id, total_frames in [("dummy/a", 20), ("dummy/b", 30)]:
+        lerobot_dataset_factory(
+            root=tmp_path / repo_id,
+            repo_id=repo_id,
+            total_episodes=2,
+            total_frames=total_frames,
+            use_videos=False,
+        )
+    with pytest.raises(ValueError, match="one entry per repo_id"):
+        MultiLeRobotDataset(["dummy/a", "dummy/b"], root=tmp_path, sampling_weights={"dummy/a": 1.0})
+
+    dataset = MultiLeRobotDataset(
+        ["dummy/a", "dummy/b"], root=tmp_path, sampling_weights={"dummy/a": 1.0, "dummy/b": 0.0}
+    )
+    sampler = dataset.make_sampler(num_samples=100, seed=0)
+    indices = list(sampler)
+    assert len(indices) == len(sampler) == 100
+    assert all(0 <= idx < 20 for idx in indices)
+
+
 @pytest.mark.parametrize(
     "repo_id",
     [
@@ -0,0 +1,83 @@
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pickle
+import queue
+
+import numpy as np
+import pytest
+
+from lerobot.datasets.frame_ring import SharedFrameRing, to_hwc_uint8
+
+
+def test_to_hwc_uint8():
+    chw = np.random.rand(3, 4, 5).astype(np.float32)
+    hwc = to_hwc_uint8(chw)
+    assert hwc.shape == (4, 5, 3)
+    assert hwc.dtype == np.uint8
+    np.testing.assert_array_equal(hwc, (chw.transpose(1, 2, 0) * 255).astype(np.uint8))
+
+
+def test_put_and_reclaim():
+    ring = SharedFrameRing((4, 5, 3), num_slots=2)
+    try:
+        frames = [np.full((4, 5, 3), i, dtype=np.uint8) for i in range(3)]
+        slots = [ring.put(frame) for frame in frames]
+        # The third frame does not fit until a slot is released
+        assert slots[2] is None
+        assert ring.num_free == 0
+        np.testing.assert_array_equal(ring.frame(slots[1]), frames[1])
+
+        released = queue.Queue()
+        released.put(slots[0])
+        ring.reclaim(released)
+        assert ring.num_free == 1
+        assert ring.put(frames[2]) == slots[0]
+        np.testing.assert_array_equal(ring.frame(slots[0]), frames[2])
+
+        ring.reset()
+        assert ring.num_free == 2
+    finally:
+        ring.close()
+
+
+def test_put_wrong_shape():
+    ring = SharedFrameRing((4, 5, 3), num_slots=1)
+    try:
+        with pytest.raises(ValueError):
+            ring.put(np.zeros((5, 4, 3), dtype=np.uint8))
+        # The failed put does not consume the slot
+        assert ring.num_free == 1
+    finally:
+        ring.close()
+
+
+def test_pickled_ring_shares_slots():
+    ring = SharedFrameRing((4, 5, 3), num_slots=2)
+    try:
+        frame = np.random.randint(0, 256, (3, 4, 5), dtype=np.uint8)
+        slot = ring.put(frame)
+        consumer_ring = pickle.loads(pickle.dumps(ring))
+        assert consumer_ring.name == ring.name
+        np.testing.assert_array_equal(consumer_ring.frame(slot), frame.transpose(1, 2, 0))
+        # Consumers do not own the block nor track free slots
+        assert consumer_ring.num_free == 0
+        consumer_ring.close()
+        np.testing.assert_array_equal(ring.frame(slot), frame.transpose(1, 2, 0))
+    finally:
+        ring.close()
+
+
+def test_invalid_num_slots():
+    with pytest.raises(ValueError):
+        SharedFrameRing((4, 5, 3), num_slots=0)
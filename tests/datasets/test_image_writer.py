@@ -324,6 +324,23 @@ def test_wait_until_done_multiprocessing(tmp_path, img_array_factory):
         writer.stop()
 
 
+def test_save_image_shared_memory_slots_reused(tmp_path, img_array_factory):
+    writer = AsyncImageWriter(num_processes=1, num_threads=2, shared_memory_slots=2)
+    try:
+        image_arrays = [img_array_factory() for _ in range(10)]
+        fpaths = [tmp_path / f"frame_{i:06d}.png" for i in range(len(image_arrays))]
+        for image_array, fpath in zip(image_arrays, fpaths, strict=True):
+            writer.save_image(image_array, fpath)
+            writer.wait_until_done()
+        # Every image was written from a slot of the same ring, released back after each write
+        assert len(writer._frame_rings) == 1
+        for fpath, image_array in zip(fpaths, image_arrays, strict=True):
+            assert np.array_equal(np.array(Image.open(fpath)), image_array)
+    finally:
+        writer.stop()
+    assert writer._frame_rings == {}
+
+
 def test_exception_handling(tmp_path, img_array_factory):
     writer = AsyncImageWriter()
     try:
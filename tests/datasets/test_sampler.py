@@ -22,7 +22,7 @@ from datasets import Dataset
 from lerobot.datasets.io_utils import (
     hf_transform_to_torch,
 )
-from lerobot.datasets.sampler import EpisodeAwareSampler
+from lerobot.datasets.sampler import EpisodeAwareSampler, WeightedDatasetSampler
 
 
 def calculate_episode_data_index(hf_dataset: Dataset) -> dict[str, torch.Tensor]:
@@ -134,3 +134,120 @@ def test_partial_episode_drop_warns(caplog):
     # Episode 0 is skipped (1 frame, drop 1), Episode 1 keeps frames 2-5
     assert sampler.indices == [2, 3, 4, 5]
     assert "Episode 0" in caplog.text
+
+
+def test_shuffle_chunks():
+    # Episodes of 7 and 5 frames, starting at 0 and 7
+    sampler = EpisodeAwareSampler([0, 7], [7, 12], drop_n_first_frames=1, shuffle=True, chunk_size=3, seed=0)
+    chunk_bounds = list(
+        zip(sampler._episode_chunk_starts.tolist(), sampler._episode_chunk_ends.tolist(), strict=True)
+    )
+    assert chunk_bounds == [(0, 3), (3, 6), (6, 9), (9, 10)]
+
+    sampled = list(sampler)
+    assert sorted(sampled) == sampler.indices
+    assert sampled != sampler.indices
+    # Every chunk is yielded as a contiguous run, and never crosses an episode boundary
+    for start, end in chunk_bounds:
+        chunk = sampler.indices[start:end]
+        pos = sampled.index(chunk[0])
+        assert sampled[pos : pos + len(chunk)] == chunk
+        assert chunk[-1] < 7 or chunk[0] >= 7
+
+
+def test_invalid_chunk_size_raises():
+    with pytest.raises(ValueError, match="chunk_size must be >= 1"):
+        EpisodeAwareSampler([0], [10], chunk_size=0)
+
+
+def test_seeded_epochs_are_deterministic():
+    sampler = EpisodeAwareSampler([0, 10], [10, 30], shuffle=True, seed=42)
+    other = EpisodeAwareSampler([0, 10], [10, 30], shuffle=True, seed=42)
+    first_epoch = list(sampler)
+    assert first_epoch == list(other)
+    # Exhausting an epoch moves on to the next permutation
+    second_epoch = list(sampler)
+    assert sampler.epoch == 2
+    assert sorted(second_epoch) == sorted(first_epoch)
+    assert second_epoch != first_epoch
+
+    other.set_epoch(1)
+    assert list(other) == second_epoch
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4])
+def test_distributed_shards(chunk_size):
+    world_size = 3
+    shards = [
+        list(
+            EpisodeAwareSampler(
+                [0, 10],
+                [10, 29],
+                shuffle=True,
+                chunk_size=chunk_size,
+                seed=7,
+                rank=rank,
+                world_size=world_size,
+            )
+        )
+        for rank in range(world_size)
+    ]
+    # 29 frames are padded to 30 so that every rank gets 10 samples
+    assert [len(shard) for shard in shards] == [10, 10, 10]
+    samples = sum(shards, [])
+    assert set(samples) == set(range(29))
+    assert len(samples) - len(set(samples)) == 1
+
+
+def test_invalid_rank_raises():
+    with pytest.raises(ValueError, match="Invalid rank"):
+        EpisodeAwareSampler([0], [10], rank=2, world_size=2)
+
+
+def test_resume_mid_epoch():
+    sampler = EpisodeAwareSampler([0, 10], [10, 30], shuffle=True, chunk_size=3, seed=3)
+    expected = list(sampler)
+    sampler.set_epoch(0)
+
+    it = iter(sampler)
+    head = [next(it) for _ in range(8)]
+    state = sampler.state_dict()
+    assert state == {"seed": 3, "epoch": 0, "position": 8}
+
+    resumed = EpisodeAwareSampler([0, 10], [10, 30], shuffle=True, chunk_size=3)
+    resumed.load_state_dict(state)
+    # Restoring the same epoch is not reset by a following `set_epoch` call (e.g. from accelerate)
+    resumed.set_epoch(0)
+    assert head + list(resumed) == expected
+    assert resumed.state_dict() == {"seed": 3, "epoch": 1, "position": 0}
+
+
+def test_state_dict_after_consumed_batches():
+    sampler = EpisodeAwareSampler([0, 10], [10, 30], shuffle=True, seed=3)
+    # 30 samples make 4 batches of 8 per epoch, the last one incomplete
+    assert sampler.state_dict_after(0, 8) == {"seed": 3, "epoch": 0, "position": 0}
+    assert sampler.state_dict_after(3, 8) == {"seed": 3, "epoch": 0, "position": 24}
+    assert sampler.state_dict_after(4, 8) == {"seed": 3, "epoch": 1, "position": 0}
+    assert sampler.state_dict_after(9, 8) == {"seed": 3, "epoch": 2, "position": 8}
+
+
+def test_weighted_dataset_sampler():
+    sampler = WeightedDatasetSampler([10, 30, 60], [0.5, 0.5, 0.0], num_samples=2000, seed=0)
+    indices = list(sampler)
+    assert len(indices) == len(sampler) == 2000
+    # The third dataset (indices 40 to 99) has no weight
+    assert all(0 <= idx < 40 for idx in indices)
+    # Each of the two datasets is drawn about half of the time, regardless of their sizes
+    assert abs(sum(idx < 10 for idx in indices) / 2000 - 0.5) < 0.05
+    # Epochs are deterministic given the seed, and differ from each other
+    assert list(WeightedDatasetSampler([10, 30, 60], [0.5, 0.5, 0.0], num_samples=2000, seed=0)) == indices
+    assert list(sampler) != indices
+
+
+def test_weighted_dataset_sampler_invalid_weights():
+    with pytest.raises(ValueError, match="weights for"):
+        WeightedDatasetSampler([10, 20], [1.0])
+    with pytest.raises(ValueError, match="non-negative"):
+        WeightedDatasetSampler([10, 20], [1.0, -1.0])
+    with pytest.raises(ValueError, match="Empty datasets"):
+        WeightedDatasetSampler([10, 0], [1.0, 1.0])
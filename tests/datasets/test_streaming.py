@@ -13,11 +13,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import threading
+
 import numpy as np
+import pandas as pd
 import pytest
 import torch
 
-from lerobot.datasets.streaming_dataset import StreamingLeRobotDataset
+from lerobot.datasets.streaming_dataset import ShardPrefetcher, StreamingLeRobotDataset
 from lerobot.datasets.utils import safe_shard
 from lerobot.utils.constants import ACTION
 from tests.fixtures.constants import DUMMY_REPO_ID
@@ -390,3 +393,109 @@ def test_frames_with_delta_consistency_with_shards(
         assert all(t[1] for t in key_checks), (
             f"Checking {list(filter(lambda t: not t[1], key_checks))[0][0]} left and right were found different (i: {i}, frame_idx: {frame_idx})"
         )
+
+
+def test_prefetch_preserves_frames(tmp_path, lerobot_dataset_factory):
+    """Reading shards ahead of time on background threads yields the same frames in the same order."""
+    local_path = tmp_path / "test"
+    repo_id = f"{DUMMY_REPO_ID}-ciao"
+    delta_timestamps = {"state": [-0.2, -0.1, 0], ACTION: [0, 0.1, 0.2]}
+
+    lerobot_dataset_factory(
+        root=local_path,
+        repo_id=repo_id,
+        total_episodes=10,
+        total_frames=100,
+        delta_timestamps=delta_timestamps,
+        data_files_size_in_mb=0.001,
+        chunks_size=1,
+        use_videos=False,
+    )
+    kwargs = {
+        "repo_id": repo_id,
+        "root": local_path,
+        "buffer_size": 10,
+        "seed": 42,
+        "shuffle": False,
+        "delta_timestamps": delta_timestamps,
+        "max_num_shards": 4,
+    }
+    expected = list(StreamingLeRobotDataset(**kwargs))
+    streaming_ds = StreamingLeRobotDataset(**kwargs, prefetch_size=3)
+    frames = list(streaming_ds)
+
+    assert len(frames) == 100
+    assert [f["index"] for f in frames] == [f["index"] for f in expected]
+    for frame, expected_frame in zip(frames, expected, strict=True):
+        assert frame.keys() == expected_frame.keys()
+        for key in (ACTION, "state", f"{ACTION}_is_pad", "state_is_pad"):
+            torch.testing.assert_close(frame[key], expected_frame[key])
+
+    stats = streaming_ds.timing_stats()
+    assert stats["num_items"] == len(frames)
+    assert stats["make_frame_s"] > 0
+
+
+def test_prefetch_threads_stop_on_early_exit(tmp_path, lerobot_dataset_factory):
+    local_path = tmp_path / "test"
+    lerobot_dataset_factory(
+        root=local_path, repo_id=DUMMY_REPO_ID, total_episodes=10, total_frames=400, use_videos=False
+    )
+    streaming_ds = StreamingLeRobotDataset(
+        repo_id=DUMMY_REPO_ID, root=local_path, buffer_size=10, prefetch_size=2
+    )
+
+    frames = iter(streaming_ds)
+    for _ in range(20):
+        next(frames)
+    frames.close()
+
+    threads = [t for t in threading.enumerate() if t.name.startswith("lerobot-stream-shard-")]
+    for thread in threads:
+        thread.join(timeout=5)
+    assert not any(thread.is_alive() for thread in threads)
+
+
+def test_prefetch_threads_do_not_share_decoders(tmp_path, lerobot_dataset_factory, monkeypatch):
+    local_path = tmp_path / "test"
+    dataset = lerobot_dataset_factory(
+        root=local_path, repo_id=DUMMY_REPO_ID, total_episodes=10, total_frames=100
+    )
+    assert dataset.meta.video_keys
+    # Split the data file in several shards, read by as many prefetching threads
+    data_path = local_path / "data" / "chunk-000" / "file-000.parquet"
+    data = pd.read_parquet(data_path)
+    data_path.unlink()
+    for file_idx, episodes in enumerate(np.array_split(np.arange(10), 4)):
+        data[data["episode_index"].isin(episodes)].to_parquet(data_path.with_stem(f"file-{file_idx:03d}"))
+
+    cache_threads = {}
+
+    def fake_decode(video_path, timestamps, tolerance_s, decoder_cache=None):
+        cache_threads.setdefault(id(decoder_cache), set()).add(threading.current_thread().name)
+        return torch.zeros(len(timestamps), 3, 8, 8)
+
+    monkeypatch.setattr(
+        "lerobot.datasets.streaming_dataset.decode_video_frames_torchcodec", fake_decode, raising=True
+    )
+    streaming_ds = StreamingLeRobotDataset(
+        repo_id=DUMMY_REPO_ID, root=local_path, buffer_size=10, max_num_shards=4, prefetch_size=2
+    )
+    assert streaming_ds.num_shards > 1
+    assert len(list(streaming_ds)) == 100
+
+    assert len(cache_threads) == streaming_ds.num_shards
+    assert all(len(threads) == 1 for threads in cache_threads.values())
+
+
+def test_shard_prefetcher_forwards_errors():
+    def frames():
+        yield {"index": 0}
+        raise ValueError("corrupted shard")
+
+    prefetcher = ShardPrefetcher(frames(), size=1)
+    assert next(prefetcher) == {"index": 0}
+    with pytest.raises(ValueError, match="corrupted shard"):
+        next(prefetcher)
+    with pytest.raises(StopIteration):
+        next(prefetcher)
@@ -24,6 +24,7 @@ import av
 import numpy as np
 import pytest
 
+from lerobot.datasets.frame_ring import SharedFrameRing
 from lerobot.datasets.video_utils import (
     VALID_VIDEO_CODECS,
     StreamingVideoEncoder,
@@ -258,6 +259,42 @@ class TestCameraEncoderThread:
         encoder_thread.join(timeout=10)
         assert not encoder_thread.is_alive()
 
+    def test_error_releases_pending_ring_slots(self, tmp_path):
+        """Test that a crashing encoder gives back the ring slots of the frames it won't encode."""
+        frame_ring = SharedFrameRing((64, 96, 3), num_slots=3)
+        try:
+            frame_queue: queue.Queue = queue.Queue()
+            released_queue: queue.Queue = queue.Queue()
+            result_queue: queue.Queue = queue.Queue(maxsize=1)
+            frame_queue.put(frame_ring)
+            for _ in range(3):
+                frame_queue.put(frame_ring.put(np.zeros((64, 96, 3), dtype=np.uint8)))
+            frame_queue.put(None)
+            assert frame_ring.num_free == 0
+
+            encoder_thread = _CameraEncoderThread(
+                video_path=tmp_path / "test_error" / "test.mp4",
+                fps=30,
+                vcodec="not_a_codec",
+                pix_fmt="yuv420p",
+                g=2,
+                crf=30,
+                preset=13,
+                frame_queue=frame_queue,
+                result_queue=result_queue,
+                stop_event=threading.Event(),
+                released_queue=released_queue,
+            )
+            encoder_thread.start()
+            encoder_thread.join(timeout=10)
+
+            status, _ = result_queue.get(timeout=5)
+            assert status == "error"
+            frame_ring.reclaim(released_queue)
+            assert frame_ring.num_free == 3
+        finally:
+            frame_ring.close()
+
 
 # ─── StreamingVideoEncoder tests ───
 
@@ -479,6 +516,29 @@ class TestStreamingVideoEncoder:
         assert encoder.encoder_threads is None
         encoder.close()
 
+    def test_process_encoders(self, tmp_path):
+        """Test encoding in subprocesses, with frames handed over through shared memory."""
+        encoder = StreamingVideoEncoder(
+            fps=30, vcodec="libsvtav1", pix_fmt="yuv420p", g=2, crf=30, preset=13, use_processes=True
+        )
+        video_keys = [f"{OBS_IMAGES}.cam"]
+
+        for num_frames in (12, 8):
+            encoder.start_episode(video_keys, tmp_path)
+            for _ in range(num_frames):
+                frame = np.random.randint(0, 255, (64, 96, 3), dtype=np.uint8)
+                encoder.feed_frame(f"{OBS_IMAGES}.cam", frame)
+            results = encoder.finish_episode()
+
+            mp4_path, stats = results[f"{OBS_IMAGES}.cam"]
+            assert stats is not None
+            with av.open(str(mp4_path)) as container:
+                stream = container.streams.video[0]
+                total_frames = sum(1 for _ in container.decode(stream))
+            assert total_frames == num_frames - encoder._dropped_frames.get(f"{OBS_IMAGES}.cam", 0)
+
+        encoder.close()
+
     def test_graceful_frame_dropping(self, tmp_path):
         """Test that full queue drops frames instead of crashing."""
         encoder = StreamingVideoEncoder(
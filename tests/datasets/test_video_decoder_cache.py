@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the decoder and decoded-frame caching of VideoDecoderCache."""
+
+import importlib.util
+import pickle
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from lerobot.datasets.video_utils import VideoDecoderCache, decode_video_frames_torchcodec
+
+FPS = 10
+# One uint8 CHW frame of 3x4x4 is 48 bytes
+FRAME_SHAPE = (3, 4, 4)
+FRAME_MB = 48 / 1024**2
+
+
+class _FakeDecoder:
+    """Minimal stand-in for torchcodec's VideoDecoder that records decoded indices."""
+
+    def __init__(self, *args, **kwargs):
+        self.metadata = SimpleNamespace(average_fps=FPS)
+        self.decoded = []
+
+    def get_frames_at(self, indices):
+        self.decoded.extend(indices)
+        data = torch.stack([torch.full(FRAME_SHAPE, idx, dtype=torch.uint8) for idx in indices])
+        return SimpleNamespace(data=data, pts_seconds=torch.tensor([idx / FPS for idx in indices]))
+
+
+class _FakeDecoderCache(VideoDecoderCache):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.decoder = _FakeDecoder()
+
+    def get_decoder(self, video_path):
+        return self.decoder
+
+
+def _frame(value: int) -> torch.Tensor:
+    return torch.full(FRAME_SHAPE, value, dtype=torch.uint8)
+
+
+def test_frame_cache_disabled_by_default():
+    cache = VideoDecoderCache()
+    cache.put_frames("video.mp4", [0], _frame(0)[None], [0.0])
+    assert cache.get_frames("video.mp4", [0]) == {}
+    assert cache.stats()["num_cached_frames"] == 0
+
+
+def test_frame_cache_hits_and_misses():
+    cache = VideoDecoderCache(frame_cache_size_mb=10 * FRAME_MB)
+    cache.put_frames("video.mp4", [0, 1], torch.stack([_frame(0), _frame(1)]), [0.0, 0.1])
+
+    found = cache.get_frames("video.mp4", [0, 1, 2])
+    assert set(found) == {0, 1}
+    torch.testing.assert_close(found[1][0], _frame(1))
+    assert found[1][1] == 0.1
+    # Same frame index in another file is a different entry
+    assert cache.get_frames("other.mp4", [0]) == {}
+
+    stats = cache.stats()
+    assert stats["frame_hits"] == 2
+    assert stats["frame_misses"] == 2
+    assert stats["frame_cache_bytes"] == 2 * 48
+
+
+def test_frame_cache_evicts_least_recently_used_within_budget():
+    cache = VideoDecoderCache(frame_cache_size_mb=2 * FRAME_MB)
+    cache.put_frames("video.mp4", [0, 1], torch.stack([_frame(0), _frame(1)]), [0.0, 0.1])
+    # Touch frame 0 so that frame 1 becomes the least recently used one
+    cache.get_frames("video.mp4", [0])
+    cache.put_frames("video.mp4", [2], _frame(2)[None], [0.2])
+
+    assert set(cache.get_frames("video.mp4", [0, 1, 2])) == {0, 2}
+    assert cache.stats()["frame_cache_bytes"] <= 2 * 48
+
+
+def test_decode_only_decodes_missing_frames():
+    cache = _FakeDecoderCache(frame_cache_size_mb=10 * FRAME_MB)
+
+    first = decode_video_frames_torchcodec("video.mp4", [0.0, 0.1, 0.2], 1e-4, decoder_cache=cache)
+    second = decode_video_frames_torchcodec("video.mp4", [0.1, 0.2, 0.3, 0.3], 1e-4, decoder_cache=cache)
+
+    assert cache.decoder.decoded == [0, 1, 2, 3]
+    assert second.shape == (4, *FRAME_SHAPE)
+    torch.testing.assert_close(second[0], first[1])
+    torch.testing.assert_close(second[3], torch.full(FRAME_SHAPE, 3 / 255.0))
+
+
+def test_decode_without_frame_cache_matches_cached_decode():
+    uncached = _FakeDecoderCache()
+    cached = _FakeDecoderCache(frame_cache_size_mb=10 * FRAME_MB)
+    for _ in range(2):
+        expected = decode_video_frames_torchcodec("video.mp4", [0.1, 0.0], 1e-4, decoder_cache=uncached)
+        frames = decode_video_frames_torchcodec("video.mp4", [0.1, 0.0], 1e-4, decoder_cache=cached)
+        torch.testing.assert_close(frames, expected)
+    assert uncached.decoder.decoded == [1, 0, 1, 0]
+    assert cached.decoder.decoded == [1, 0]
+
+
+@pytest.mark.skipif(importlib.util.find_spec("torchcodec") is None, reason="torchcodec is not installed")
+def test_decoders_are_evicted_and_closed(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "torchcodec.decoders", types.SimpleNamespace(VideoDecoder=_FakeDecoder))
+    paths = []
+    for i in range(3):
+        paths.append(tmp_path / f"video_{i}.mp4")
+        paths[-1].write_bytes(b"")
+
+    cache = VideoDecoderCache(max_decoders=2)
+    decoders = [cache.get_decoder(path) for path in paths[:2]]
+    # Touch the first one so the second becomes the least recently used
+    assert cache.get_decoder(paths[0]) is decoders[0]
+    file_handle = cache._cache[str(paths[1])][1]
+    cache.get_decoder(paths[2])
+
+    assert cache.size() == 2
+    assert str(paths[1]) not in cache._cache
+    assert cache.stats()["decoder_evictions"] == 1
+    # The file is closed as soon as no one uses the evicted decoder anymore
+    assert not file_handle.closed
+    del decoders
+    assert file_handle.closed
+
+
+def test_pickling_keeps_config_only():
+    cache = VideoDecoderCache(max_decoders=4, frame_cache_size_mb=10 * FRAME_MB)
+    cache.put_frames("video.mp4", [0], _frame(0)[None], [0.0])
+
+    restored = pickle.loads(pickle.dumps(cache))
+    assert restored.max_decoders == 4
+    assert restored.frame_cache_size_mb == cache.frame_cache_size_mb
+    assert restored.stats()["num_cached_frames"] == 0
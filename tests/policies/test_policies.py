@@ -35,6 +35,8 @@ from lerobot.envs.utils import preprocess_observation
 from lerobot.optim.factory import make_optimizer_and_scheduler
 from lerobot.policies.act.configuration_act import ACTConfig
 from lerobot.policies.act.modeling_act import ACTTemporalEnsembler
+from lerobot.policies.diffusion.configuration_diffusion import DiffusionConfig
+from lerobot.policies.diffusion.modeling_diffusion import DiffusionPolicy
 from lerobot.policies.factory import (
     get_policy_class,
     make_policy,
@@ -464,6 +466,58 @@ def test_act_temporal_ensembler():
         torch.testing.assert_close(online_avg, offline_avg, rtol=1e-4, atol=1e-4)
 
 
+@pytest.mark.parametrize("use_separate_rgb_encoder_per_camera", [False, True])
+def test_diffusion_select_action_encodes_each_observation_once(use_separate_rgb_encoder_per_camera: bool):
+    """The image features of the observation queue are reused by the next action chunks.
+
+    Actions must match the generation from the raw observation queue, which encodes all its images.
+    """
+    config = DiffusionConfig(
+        n_obs_steps=3,
+        horizon=8,
+        n_action_steps=2,
+        down_dims=(32, 64),
+        num_inference_steps=2,
+        crop_shape=(64, 64),
+        use_separate_rgb_encoder_per_camera=use_separate_rgb_encoder_per_camera,
+    )
+    config.input_features = {
+        f"{OBS_IMAGES}.top": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 72, 72)),
+        f"{OBS_IMAGES}.wrist": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 72, 72)),
+        OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(6,)),
+    }
+    config.output_features = {ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(6,))}
+    policy = DiffusionPolicy(config).eval()
+
+    num_encoded_images = 0
+
+    def count_encoded_images(module, args, output):
+        nonlocal num_encoded_images
+        num_encoded_images += args[0].shape[0]
+
+    encoders = policy.diffusion.rgb_encoder
+    for encoder in encoders if use_separate_rgb_encoder_per_camera else [encoders]:
+        encoder.register_forward_hook(count_encoded_images)
+
+    num_steps = 7
+    for step in range(num_steps):
+        observation = {key: torch.rand(2, *ft.shape) for key, ft in config.input_features.items()}
+        noise = torch.randn(2, config.horizon, 6)
+        # The DDPM scheduler samples the noise of each denoising step
+        with seeded_context(step):
+            actions = policy.select_action(observation, noise=noise)
+        if step % config.n_action_steps == 0:
+            batch = {key: torch.stack(list(policy._queues[key]), dim=1) for key in [OBS_STATE, OBS_IMAGES]}
+            num_policy_encoded_images = num_encoded_images
+            with torch.no_grad(), seeded_context(step):
+                expected_actions = policy.diffusion.generate_actions(batch, noise=noise)
+            num_encoded_images = num_policy_encoded_images
+            torch.testing.assert_close(actions, expected_actions[:, 0])
+
+    # Each observation is encoded once, for 2 samples and 2 cameras
+    assert num_encoded_images == num_steps * 2 * 2
+
+
 def test_vqbet_discretize_keeps_buffers_on_device():
     """Regression test: VQBeTHead.discretize() must not move registered buffers off the model device.
 
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+
+import pytest
+import torch
+
+from lerobot.policies.utils import PrefixKVCache
+from tests.utils import require_package
+
+PREFIX_LEN = 7
+SUFFIX_LEN = 4
+
+
+def make_gemma_models(attn_implementation: str):
+    from transformers.models.gemma.modeling_gemma import GemmaConfig
+
+    from lerobot.policies.pi_gemma import PiGemmaModel
+
+    def make_config(use_adarms: bool):
+        config = GemmaConfig(
+            vocab_size=32,
+            hidden_size=32,
+            intermediate_size=64,
+            num_hidden_layers=2,
+            num_attention_heads=2,
+            num_key_value_heads=1,
+            head_dim=16,
+            use_adarms=use_adarms,
+            adarms_cond_dim=32 if use_adarms else None,
+        )
+        config._attn_implementation = attn_implementation
+        return config
+
+    torch.manual_seed(0)
+    return PiGemmaModel(make_config(False)).eval(), PiGemmaModel(make_config(True)).eval()
+
+
+def suffix_inputs(step: int) -> dict:
+    generator = torch.Generator().manual_seed(step)
+    # Suffix tokens attend to the whole prefix and causally to the suffix, as in PI0 `denoise_step`
+    mask = torch.ones(2, 1, SUFFIX_LEN, PREFIX_LEN + SUFFIX_LEN, dtype=torch.bool)
+    mask[..., PREFIX_LEN:] = torch.tril(mask[..., PREFIX_LEN:])
+    return {
+        "inputs_embeds": torch.randn(2, SUFFIX_LEN, 32, generator=generator),
+        "attention_mask": torch.where(mask, 0.0, -2.3819763e38),
+        "position_ids": torch.arange(PREFIX_LEN, PREFIX_LEN + SUFFIX_LEN).expand(2, -1),
+        "adarms_cond": torch.randn(2, 32, generator=generator),
+        "use_cache": False,
+    }
+
+
+@require_package("transformers")
+@pytest.mark.parametrize("attn_implementation", ["eager", "sdpa"])
+def test_prefix_cache_matches_copied_dynamic_cache(attn_implementation):
+    prefix_model, expert = make_gemma_models(attn_implementation)
+    with torch.no_grad():
+        dynamic_cache = prefix_model(
+            inputs_embeds=torch.randn(2, PREFIX_LEN, 32), use_cache=True
+        ).past_key_values
+    prefix_keys = [layer.keys.clone() for layer in dynamic_cache.layers]
+    prefix_cache = PrefixKVCache.from_dynamic_cache(dynamic_cache)
+    assert prefix_cache.get_seq_length() == PREFIX_LEN
+
+    for step in range(3):
+        inputs = suffix_inputs(step)
+        with torch.no_grad():
+            expected = expert(past_key_values=copy.deepcopy(dynamic_cache), **inputs).last_hidden_state
+            actual = expert(past_key_values=prefix_cache, **inputs).last_hidden_state
+        torch.testing.assert_close(actual, expected)
+
+    # The prefix is never modified, and its keys / values are not copied
+    assert dynamic_cache.get_seq_length() == PREFIX_LEN
+    for layer_idx, layer in enumerate(dynamic_cache.layers):
+        assert torch.equal(layer.keys, prefix_keys[layer_idx])
+        assert prefix_cache.keys[layer_idx] is layer.keys
+
+
+def test_prefix_cache_update_reuses_buffers():
+    # SmolVLA layout: (batch, seq, heads, head_dim)
+    layer_cache = {
+        idx: {
+            "key_states": torch.randn(2, PREFIX_LEN, 1, 8),
+            "value_states": torch.randn(2, PREFIX_LEN, 1, 8),
+        }
+        for idx in range(2)
+    }
+    prefix_cache = PrefixKVCache.from_layer_dict(layer_cache)
+    assert len(prefix_cache) == 2
+    assert prefix_cache[1]["key_states"] is layer_cache[1]["key_states"]
+
+    buffers = []
+    for _ in range(2):
+        suffix_keys, suffix_values = torch.randn(2, SUFFIX_LEN, 1, 8), torch.randn(2, SUFFIX_LEN, 1, 8)
+        keys, values = prefix_cache.update(suffix_keys, suffix_values, layer_idx=1)
+        torch.testing.assert_close(keys, torch.cat([layer_cache[1]["key_states"], suffix_keys], dim=1))
+        torch.testing.assert_close(values, torch.cat([layer_cache[1]["value_states"], suffix_values], dim=1))
+        buffers.append(keys)
+    assert buffers[0] is buffers[1]
+
+    # Suffixes tracked by autograd (e.g. Real-Time Chunking guidance) are not written to the buffers
+    suffix_keys = torch.randn(2, SUFFIX_LEN, 1, 8, requires_grad=True)
+    keys, _ = prefix_cache.update(suffix_keys, torch.randn(2, SUFFIX_LEN, 1, 8), layer_idx=1)
+    assert keys is not buffers[0] and keys.requires_grad
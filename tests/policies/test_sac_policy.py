@@ -257,6 +257,26 @@ def test_sac_policy_with_default_config(batch_size: int, state_dim: int, action_
         assert selected_action.shape == (batch_size, action_dim)
 
 
+def test_sac_policy_critic_importance_weights():
+    batch = create_default_train_batch(batch_size=4, action_dim=6, state_dim=6)
+    config = create_default_config(state_dim=6, continuous_action_dim=6)
+    policy = SACPolicy(config=config)
+    policy.train()
+
+    with seeded_context(0):
+        output = policy.forward(batch, model="critic")
+    with seeded_context(0):
+        uniform_loss = policy.forward({**batch, "weights": torch.ones(4)}, model="critic")["loss_critic"]
+    with seeded_context(0):
+        weighted_loss = policy.forward({**batch, "weights": torch.zeros(4)}, model="critic")["loss_critic"]
+
+    assert output["td_errors"].shape == (4,)
+    assert torch.all(output["td_errors"] >= 0)
+    assert not output["td_errors"].requires_grad
+    assert torch.allclose(uniform_loss, output["loss_critic"])
+    assert weighted_loss.item() == 0.0
+
+
 @pytest.mark.parametrize("batch_size,state_dim,action_dim", [(2, 6, 6), (1, 10, 10)])
 def test_sac_policy_with_visual_input(batch_size: int, state_dim: int, action_dim: int):
     config = create_config_with_visual_input(state_dim=state_dim, continuous_action_dim=action_dim)
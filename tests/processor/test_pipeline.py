@@ -17,6 +17,7 @@
 import json
 import tempfile
 from collections.abc import Callable
+from copy import deepcopy
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -25,13 +26,17 @@ import pytest
 import torch
 import torch.nn as nn
 
-from lerobot.configs.types import FeatureType, PipelineFeatureType, PolicyFeature
+from lerobot.configs.types import FeatureType, NormalizationMode, PipelineFeatureType, PolicyFeature
 from lerobot.datasets.pipeline_features import aggregate_pipeline_dataset_features
 from lerobot.processor import (
+    AddBatchDimensionProcessorStep,
     DataProcessorPipeline,
+    DeviceProcessorStep,
     EnvTransition,
+    NormalizerProcessorStep,
     ProcessorStep,
     ProcessorStepRegistry,
+    RenameObservationsProcessorStep,
     TransitionKey,
 )
 from lerobot.processor.converters import create_transition, identity_transition
@@ -2196,3 +2201,124 @@ def test_initial_camera_not_overridden_by_step_image():
     key = f"{OBS_IMAGES}.front"
     assert key in out
     assert out[key]["shape"] == (240, 320, 3)  # from the step, not from initial
+
+
+def make_fusable_pipeline() -> DataProcessorPipeline:
+    features = {
+        OBS_STATE: PolicyFeature(FeatureType.STATE, (3,)),
+        f"{OBS_IMAGES}.top": PolicyFeature(FeatureType.VISUAL, (3, 4, 4)),
+        ACTION: PolicyFeature(FeatureType.ACTION, (2,)),
+    }
+    norm_map = {
+        FeatureType.STATE: NormalizationMode.MEAN_STD,
+        FeatureType.VISUAL: NormalizationMode.MIN_MAX,
+        FeatureType.ACTION: NormalizationMode.QUANTILES,
+    }
+    stats = {
+        OBS_STATE: {"mean": torch.randn(3), "std": torch.rand(3) + 0.5},
+        f"{OBS_IMAGES}.top": {
+            "min": torch.zeros(3, 1, 1),
+            "max": torch.tensor([1.0, 0.0, 2.0]).view(3, 1, 1),
+        },
+        ACTION: {"q01": -torch.rand(2), "q99": torch.rand(2)},
+    }
+    return DataProcessorPipeline(
+        [
+            RenameObservationsProcessorStep(rename_map={f"{OBS_IMAGES}.cam": f"{OBS_IMAGES}.top"}),
+            AddBatchDimensionProcessorStep(),
+            DeviceProcessorStep(device="cpu"),
+            NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats),
+        ],
+        to_transition=identity_transition,
+        to_output=identity_transition,
+    )
+
+
+def make_fusable_transition() -> EnvTransition:
+    return create_transition(
+        observation={OBS_STATE: torch.randn(3), f"{OBS_IMAGES}.cam": torch.rand(3, 4, 4), "extra": 1},
+        action=torch.randn(2),
+        reward=torch.tensor(1.0),
+        complementary_data={"task": "pick", "index": torch.tensor(3)},
+    )
+
+
+def assert_transitions_close(actual: EnvTransition, expected: EnvTransition):
+    assert actual.keys() == expected.keys()
+    for key in expected:
+        if isinstance(expected[key], dict):
+            assert list(actual[key]) == list(expected[key])
+            assert_transitions_close(actual[key], expected[key])
+        elif isinstance(expected[key], torch.Tensor):
+            torch.testing.assert_close(actual[key], expected[key])
+        else:
+            assert actual[key] == expected[key]
+
+
+def test_frozen_pipeline_fuses_steps():
+    pipeline = make_fusable_pipeline()
+    frozen = deepcopy(pipeline).freeze()
+    assert frozen.frozen and not pipeline.frozen
+    assert len(frozen._frozen_steps) == 1
+
+    for _ in range(3):
+        transition = make_fusable_transition()
+        assert_transitions_close(frozen(transition), pipeline(transition))
+
+    # Transitions with other keys are processed as well
+    transition = make_fusable_transition()
+    transition[TransitionKey.OBSERVATION] = {OBS_STATE: torch.randn(3)}
+    transition[TransitionKey.ACTION] = None
+    for _ in range(2):
+        assert_transitions_close(frozen(transition), pipeline(transition))
+
+    assert not frozen.unfreeze().frozen
+
+
+def test_frozen_pipeline_does_not_modify_inputs():
+    frozen = make_fusable_pipeline().freeze()
+    transition = make_fusable_transition()
+    frozen(transition)
+    observation = transition[TransitionKey.OBSERVATION]
+    state = observation[OBS_STATE].clone()
+
+    output = frozen(transition)
+
+    assert transition[TransitionKey.OBSERVATION] is observation
+    assert list(observation) == [OBS_STATE, f"{OBS_IMAGES}.cam", "extra"]
+    assert torch.equal(observation[OBS_STATE], state)
+    assert transition[TransitionKey.COMPLEMENTARY_DATA]["task"] == "pick"
+    assert output[TransitionKey.COMPLEMENTARY_DATA]["task"] == ["pick"]
+
+
+def test_frozen_pipeline_skips_hooks_and_keeps_unfusable_steps():
+    pipeline = make_fusable_pipeline()
+    pipeline.steps = [*pipeline.steps[:2], MockStep("middle"), *pipeline.steps[2:]]
+    hook_calls = []
+    pipeline.register_before_step_hook(lambda idx, transition: hook_calls.append(idx))
+    pipeline.freeze()
+
+    output = pipeline(make_fusable_transition())
+    output = pipeline(make_fusable_transition())
+
+    assert hook_calls == []
+    assert len(pipeline._frozen_steps) == 3
+    assert output[TransitionKey.COMPLEMENTARY_DATA]["middle_counter"] == 1
+
+
+def test_frozen_pipeline_uses_reloaded_stats():
+    pipeline = make_fusable_pipeline().freeze()
+    transition = make_fusable_transition()
+    pipeline(transition)
+
+    normalizer = pipeline.steps[-1]
+    state_dict = normalizer.state_dict()
+    state_dict[f"{OBS_STATE}.mean"] = torch.zeros(3)
+    state_dict[f"{OBS_STATE}.std"] = torch.ones(3)
+    normalizer._stats_explicitly_provided = False
+    normalizer.load_state_dict(state_dict)
+
+    output = pipeline(transition)
+    torch.testing.assert_close(
+        output[TransitionKey.OBSERVATION][OBS_STATE], transition[TransitionKey.OBSERVATION][OBS_STATE][None]
+    )
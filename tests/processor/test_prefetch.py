@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+from torch.utils.data import DataLoader
+
+from lerobot.configs.types import FeatureType, NormalizationMode, PolicyFeature
+from lerobot.datasets.utils import cycle
+from lerobot.processor import (
+    AddBatchDimensionProcessorStep,
+    DataProcessorPipeline,
+    DeviceProcessorStep,
+    NormalizerProcessorStep,
+    RenameObservationsProcessorStep,
+)
+from lerobot.processor.prefetch import PreprocessorPrefetcher, WorkerPreprocessor, num_worker_safe_steps
+from lerobot.utils.constants import ACTION, OBS_STATE
+
+DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+
+def make_preprocessor(normalize_before_device: bool = False) -> DataProcessorPipeline:
+    features = {
+        OBS_STATE: PolicyFeature(FeatureType.STATE, (4,)),
+        ACTION: PolicyFeature(FeatureType.ACTION, (2,)),
+    }
+    norm_map = {FeatureType.STATE: NormalizationMode.MEAN_STD, FeatureType.ACTION: NormalizationMode.MIN_MAX}
+    stats = {
+        OBS_STATE: {"mean": torch.arange(4.0), "std": torch.full((4,), 2.0)},
+        ACTION: {"min": torch.full((2,), -3.0), "max": torch.full((2,), 3.0)},
+    }
+    normalizer = NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats)
+    device_step = DeviceProcessorStep(device=DEVICE.type)
+    steps = [
+        RenameObservationsProcessorStep(rename_map={"observation.joints": OBS_STATE}),
+        AddBatchDimensionProcessorStep(),
+        *([normalizer, device_step] if normalize_before_device else [device_step, normalizer]),
+    ]
+    return DataProcessorPipeline(steps=steps)
+
+
+def make_samples(num_samples: int) -> list[dict]:
+    return [
+        {
+            "observation.joints": torch.randn(4),
+            ACTION: torch.randn(2),
+            "task": f"task {i}",
+            "index": torch.tensor(i),
+        }
+        for i in range(num_samples)
+    ]
+
+
+def assert_batches_equal(actual: dict, expected: dict):
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, torch.Tensor):
+            assert actual[key].device.type == DEVICE.type
+            torch.testing.assert_close(actual[key], value)
+        else:
+            assert actual[key] == value
+
+
+@pytest.mark.parametrize("num_prefetch", [0, 1, 3])
+def test_prefetcher_matches_preprocessor(num_prefetch):
+    preprocessor = make_preprocessor()
+    dataloader = DataLoader(make_samples(20), batch_size=4)
+    prefetcher = PreprocessorPrefetcher(cycle(dataloader), preprocessor, DEVICE, num_prefetch=num_prefetch)
+
+    # Cycles over the dataloader
+    expected_batches = [preprocessor(batch) for batch in dataloader] * 2
+    for expected in expected_batches:
+        batch, timings = prefetcher.next_with_timings()
+        assert_batches_equal(batch, expected)
+        assert timings.wait_s >= 0 and timings.h2d_s >= 0 and timings.preprocess_s > 0
+    prefetcher.close()
+
+
+def test_num_worker_safe_steps():
+    assert num_worker_safe_steps(make_preprocessor()) == 2
+    # CPU statistics can be used in the workers
+    assert num_worker_safe_steps(make_preprocessor(normalize_before_device=True)) == 3
+    assert num_worker_safe_steps(make_preprocessor()[:2]) == 2
+
+    with pytest.raises(ValueError, match="first 2 steps"):
+        WorkerPreprocessor(make_preprocessor(), num_steps=3)
+
+
+@pytest.mark.parametrize("normalize_before_device", [False, True])
+def test_preprocessing_in_workers(normalize_before_device):
+    preprocessor = make_preprocessor(normalize_before_device)
+    samples = make_samples(12)
+    num_worker_steps = num_worker_safe_steps(preprocessor)
+    dataloader = DataLoader(
+        samples,
+        batch_size=4,
+        num_workers=2,
+        collate_fn=WorkerPreprocessor(preprocessor, num_worker_steps),
+    )
+    prefetcher = PreprocessorPrefetcher(
+        iter(dataloader), preprocessor, DEVICE, num_prefetch=1, start_step=num_worker_steps
+    )
+
+    expected_batches = [preprocessor(batch) for batch in DataLoader(samples, batch_size=4)]
+    for expected in expected_batches:
+        assert_batches_equal(next(prefetcher), expected)
+    # The end of the dataloader ends the iteration
+    with pytest.raises(StopIteration):
+        next(prefetcher)
+
+
+def test_prefetcher_raises_preprocessing_errors():
+    preprocessor = make_preprocessor()
+    batches = iter([{OBS_STATE: torch.randn(2, 4), ACTION: "not an action"}])
+    prefetcher = PreprocessorPrefetcher(batches, preprocessor, DEVICE, num_prefetch=2)
+
+    with pytest.raises(ValueError, match="PolicyAction"):
+        next(prefetcher)
+    with pytest.raises(RuntimeError, match="closed"):
+        next(prefetcher)
+
+
+def test_prefetcher_close_stops_thread():
+    dataloader = DataLoader(make_samples(8), batch_size=2)
+    prefetcher = PreprocessorPrefetcher(cycle(dataloader), make_preprocessor(), DEVICE, num_prefetch=2)
+    next(prefetcher)
+
+    prefetcher.close()
+    assert not prefetcher._thread.is_alive()
+
+    with pytest.raises(ValueError, match="num_prefetch"):
+        PreprocessorPrefetcher(cycle(dataloader), make_preprocessor(), DEVICE, num_prefetch=-1)
@@ -21,15 +21,18 @@ Tests for the TokenizerProcessorStep class.
 import tempfile
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 import torch
 
 from lerobot.configs.types import FeatureType, PipelineFeatureType, PolicyFeature
-from lerobot.processor import DataProcessorPipeline, TokenizerProcessorStep
+from lerobot.processor import ActionTokenizerProcessorStep, DataProcessorPipeline, TokenizerProcessorStep
 from lerobot.processor.converters import create_transition, identity_transition
 from lerobot.types import TransitionKey
 from lerobot.utils.constants import (
     ACTION,
+    ACTION_TOKEN_MASK,
+    ACTION_TOKENS,
     OBS_IMAGE,
     OBS_LANGUAGE,
     OBS_LANGUAGE_SUBTASK_ATTENTION_MASK,
@@ -1502,3 +1505,101 @@ def test_subtask_not_added_for_unsupported_types():
 
     # But main task tokens should still be present
     assert f"{OBS_LANGUAGE}.tokens" in observation
+
+
+class MockPaligemmaTokenizer:
+    """Mock PaliGemma tokenizer: one token per character, and an EOS token with the special tokens."""
+
+    bos_token_id = 2
+    eos_token_id = 1
+    vocab_size = 1000
+
+    def encode(self, text: str, add_special_tokens: bool = True) -> list[int]:
+        return [ord(char) for char in text] + ([self.eos_token_id] if add_special_tokens else [])
+
+
+class MockBPETokenizer:
+    """Mock BPE tokenizer: one token per character, merging repeated characters."""
+
+    def __call__(self, text: str | list[str]) -> dict:
+        texts = [text] if isinstance(text, str) else text
+        input_ids = [
+            [ord(char) for i, char in enumerate(txt) if i == 0 or txt[i - 1] != char] for txt in texts
+        ]
+        return {"input_ids": input_ids[0] if isinstance(text, str) else input_ids}
+
+
+class MockFastActionProcessor:
+    """Mimics the FAST action processor, which encodes the samples of a batch one by one."""
+
+    def __init__(self, scale: float = 10.0, min_token: int = -100):
+        self.bpe_tokenizer = MockBPETokenizer()
+        self.scale = scale
+        self.min_token = min_token
+
+    def __call__(self, action_chunk) -> list[list[int]]:
+        from scipy.fft import dct
+
+        action_chunk = np.asarray(action_chunk)
+        if action_chunk.ndim < 3:
+            action_chunk = action_chunk[None, ...]
+        dct_coeff = np.around(dct(action_chunk, axis=1, norm="ortho") * self.scale)
+        return [
+            self.bpe_tokenizer("".join(map(chr, np.maximum(elem.flatten() - self.min_token, 0).astype(int))))[
+                "input_ids"
+            ]
+            for elem in dct_coeff
+        ]
+
+
+@require_package("transformers")
+@require_package("scipy")
+@patch("lerobot.processor.tokenizer_processor.AutoTokenizer")
+@pytest.mark.parametrize("action_shape", [(6, 10, 3), (6, 4)])
+def test_action_tokenizer_batched_encoding(mock_auto_tokenizer, action_shape):
+    """The batched encoding of FAST processors matches the encoding of the processor sample by sample."""
+    mock_auto_tokenizer.from_pretrained.return_value = MockPaligemmaTokenizer()
+    fast_processor = MockFastActionProcessor()
+    batched = ActionTokenizerProcessorStep(action_tokenizer_input_object=fast_processor, max_action_tokens=64)
+    # A plain function hides the FAST processor: samples are encoded one by one
+    per_sample = ActionTokenizerProcessorStep(
+        action_tokenizer_input_object=lambda action: fast_processor(action), max_action_tokens=64
+    )
+    assert batched._is_fast_tokenizer() and not per_sample._is_fast_tokenizer()
+
+    action = torch.randn(action_shape)
+    result = batched(create_transition(action=action, complementary_data={}))
+    tokens = result[TransitionKey.COMPLEMENTARY_DATA][ACTION_TOKENS]
+    mask = result[TransitionKey.COMPLEMENTARY_DATA][ACTION_TOKEN_MASK]
+
+    expected_tokens, expected_mask = per_sample._tokenize_action(action)
+    assert tokens.shape == mask.shape == (action_shape[0], 64)
+    assert tokens.dtype == torch.long and mask.dtype == torch.bool
+    assert torch.equal(tokens, expected_tokens)
+    assert torch.equal(mask, expected_mask)
+
+    # "<bos>Action: ", the action tokens, then "|<eos>" and padding
+    prefix = [MockPaligemmaTokenizer.bos_token_id, *map(ord, "Action: ")]
+    length = int(mask[0].sum())
+    assert tokens[0, : len(prefix)].tolist() == prefix
+    assert tokens[0, length - 2 : length].tolist() == [ord("|"), MockPaligemmaTokenizer.eos_token_id]
+    assert not tokens[0, length:].any()
+    assert mask[0, :length].all()
+
+
+@require_package("transformers")
+@require_package("scipy")
+@patch("lerobot.processor.tokenizer_processor.AutoTokenizer")
+def test_action_tokenizer_truncation_and_single_sample(mock_auto_tokenizer, caplog):
+    mock_auto_tokenizer.from_pretrained.return_value = MockPaligemmaTokenizer()
+    processor = ActionTokenizerProcessorStep(
+        action_tokenizer_input_object=MockFastActionProcessor(scale=1000.0), max_action_tokens=12
+    )
+
+    tokens, mask = processor._tokenize_action(torch.randn(3, 10, 3))
+    assert tokens.shape == (3, 12)
+    assert mask.all()
+    assert "truncating" in caplog.text
+
+    tokens, mask = processor._tokenize_action(torch.randn(3))
+    assert tokens.shape == mask.shape == (12,)
@@ -18,6 +18,7 @@ import draccus
 import pytest
 
 from lerobot.scripts.lerobot_edit_dataset import (
+    BuildFrameViewConfig,
     ConvertImageToVideoConfig,
     DeleteEpisodesConfig,
     EditDatasetConfig,
@@ -48,6 +49,7 @@ class TestOperationTypeParsing:
             ("remove_feature", RemoveFeatureConfig),
             ("modify_tasks", ModifyTasksConfig),
             ("convert_image_to_video", ConvertImageToVideoConfig),
+            ("build_frame_view", BuildFrameViewConfig),
             ("info", InfoConfig),
         ],
     )
@@ -59,6 +61,22 @@ class TestOperationTypeParsing:
             f"Expected {expected_cls.__name__}, got {type(cfg.operation).__name__}"
         )
 
+    def test_build_frame_view_parses_shapes(self):
+        cfg = parse_cfg(
+            [
+                "--repo_id",
+                "test/repo",
+                "--operation.type",
+                "build_frame_view",
+                "--operation.resize",
+                "[256, 256]",
+                "--operation.crop",
+                "[224, 224]",
+            ]
+        )
+        assert cfg.operation.resize == [256, 256]
+        assert cfg.operation.crop == [224, 224]
+
     def test_merge_requires_new_repo_id(self):
         cfg = parse_cfg(["--operation.type", "merge"])
         with pytest.raises(ValueError, match="--new_repo_id is required for merge"):
@@ -78,6 +96,7 @@ class TestOperationTypeParsing:
             ("remove_feature", RemoveFeatureConfig),
             ("modify_tasks", ModifyTasksConfig),
             ("convert_image_to_video", ConvertImageToVideoConfig),
+            ("build_frame_view", BuildFrameViewConfig),
             ("info", InfoConfig),
         ],
     )
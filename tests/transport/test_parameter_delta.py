@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from lerobot.transport.parameter_delta import ParameterDeltaDecoder, ParameterDeltaEncoder
+from lerobot.transport.tensor_wire import decode_tensors, encode_tensors
+
+
+def make_state_dicts() -> dict[str, dict[str, torch.Tensor]]:
+    return {
+        "policy": {
+            "encoder.weight": torch.randn(16, 8),
+            "head.weight": torch.randn(4, 16),
+            "head.bias": torch.zeros(4),
+            "steps": torch.tensor(3),
+        },
+        "discrete_critic": {"weight": torch.randn(3, 16)},
+    }
+
+
+def assert_state_dicts_equal(actual: dict, expected: dict) -> None:
+    assert actual.keys() == expected.keys()
+    for name in expected:
+        assert actual[name].keys() == expected[name].keys()
+        for key in expected[name]:
+            assert torch.equal(actual[name][key], expected[name][key])
+
+
+def test_deltas_only_send_changed_tensors():
+    encoder = ParameterDeltaEncoder(keyframe_interval=10)
+    decoder = ParameterDeltaDecoder()
+    state_dicts = make_state_dicts()
+
+    keyframe = encoder.encode(state_dicts)
+    assert_state_dicts_equal(decoder.decode(keyframe), state_dicts)
+
+    state_dicts["policy"]["head.weight"] += 1.0
+    delta = encoder.encode(state_dicts)
+
+    tensors, meta = decode_tensors(delta)
+    assert list(tensors) == ["policy/head.weight"]
+    assert (meta["version"], meta["keyframe_version"]) == (2, 1)
+    assert len(delta) < len(keyframe) / 2
+    assert_state_dicts_equal(decoder.decode(delta), state_dicts)
+    assert decoder.version == 2
+
+
+def test_deltas_are_relative_to_the_keyframe():
+    encoder = ParameterDeltaEncoder(keyframe_interval=10)
+    decoder = ParameterDeltaDecoder()
+    state_dicts = make_state_dicts()
+    decoder.decode(encoder.encode(state_dicts))
+
+    state_dicts["policy"]["head.bias"] += 1.0
+    encoder.encode(state_dicts)  # Never received by the decoder
+    state_dicts["discrete_critic"]["weight"] += 1.0
+    delta = encoder.encode(state_dicts)
+
+    assert set(decode_tensors(delta)[0]) == {"policy/head.bias", "discrete_critic/weight"}
+    assert_state_dicts_equal(decoder.decode(delta), state_dicts)
+
+
+def test_keyframe_interval():
+    encoder = ParameterDeltaEncoder(keyframe_interval=3)
+    state_dicts = make_state_dicts()
+
+    keyframe_versions = [decode_tensors(encoder.encode(state_dicts))[1]["keyframe_version"] for _ in range(7)]
+
+    assert keyframe_versions == [1, 1, 1, 4, 4, 4, 7]
+
+
+def test_delta_of_missed_keyframe_is_skipped():
+    encoder = ParameterDeltaEncoder(keyframe_interval=2)
+    decoder = ParameterDeltaDecoder()
+    state_dicts = make_state_dicts()
+
+    encoder.encode(state_dicts)  # Keyframe never received by the decoder
+    assert decoder.decode(encoder.encode(state_dicts)) is None
+
+    keyframe = encoder.encode(state_dicts)
+    assert_state_dicts_equal(decoder.decode(keyframe), state_dicts)
+
+
+def test_checksum_mismatch_is_skipped():
+    encoder = ParameterDeltaEncoder()
+    decoder = ParameterDeltaDecoder()
+    tensors, meta = decode_tensors(encoder.encode(make_state_dicts()))
+
+    tensors = {key: tensor.clone() for key, tensor in tensors.items()}
+    tensors["policy/head.bias"][0] = 1.0
+
+    assert decoder.decode(encode_tensors(tensors, meta=meta)) is None
+    assert decoder.version is None
+
+
+@pytest.mark.parametrize("dtype", [torch.float16, torch.bfloat16])
+def test_quantized_parameters(dtype):
+    encoder = ParameterDeltaEncoder(dtype=dtype)
+    decoder = ParameterDeltaDecoder()
+    state_dicts = make_state_dicts()
+
+    message = encoder.encode(state_dicts)
+    decoded = decoder.decode(message)
+
+    assert len(message) < len(ParameterDeltaEncoder().encode(state_dicts))
+    assert decoded["policy"]["head.weight"].dtype == dtype
+    assert decoded["policy"]["steps"].dtype == torch.int64
+    torch.testing.assert_close(
+        decoded["policy"]["head.weight"].float(), state_dicts["policy"]["head.weight"], atol=0.05, rtol=0.01
+    )
+
+    # Loading the parameters casts them back to the dtype of the model
+    model = torch.nn.Linear(16, 4)
+    model.load_state_dict(
+        {"weight": decoded["policy"]["head.weight"], "bias": decoded["policy"]["head.bias"]}
+    )
+    assert model.weight.dtype == torch.float32
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="keyframe_interval"):
+        ParameterDeltaEncoder(keyframe_interval=0)
+    with pytest.raises(ValueError, match="dtype"):
+        ParameterDeltaEncoder(dtype=torch.int8)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import torch
+
+from lerobot.transport.tensor_wire import ALIGNMENT, TensorCompression, decode_tensors, encode_tensors
+
+
+def test_round_trip_keeps_kinds_dtypes_and_shapes():
+    tensors = {
+        "image": np.random.randint(0, 256, (48, 64, 3), dtype=np.uint8),
+        "state": torch.randn(1, 6),
+        "mask": torch.tensor([True, False, True]),
+        "half": torch.randn(5, dtype=torch.bfloat16),
+        "scalar": np.array(3.5),
+        "empty": torch.zeros(0, 4),
+    }
+    meta = {"timestamp": 1234.5678, "timestep": 42, "task": "pick the cube"}
+
+    decoded, decoded_meta = decode_tensors(encode_tensors(tensors, meta))
+
+    assert decoded_meta == meta
+    assert list(decoded) == list(tensors)
+    for key, value in tensors.items():
+        assert type(decoded[key]) is type(value)
+        assert decoded[key].dtype == value.dtype
+        assert tuple(decoded[key].shape) == tuple(value.shape)
+        if isinstance(value, torch.Tensor):
+            torch.testing.assert_close(decoded[key], value)
+        else:
+            np.testing.assert_array_equal(decoded[key], value)
+
+
+def test_decoded_tensors_are_views_of_the_message():
+    message = bytearray(encode_tensors({"a": torch.arange(10, dtype=torch.float32)}))
+    decoded, _ = decode_tensors(message)
+
+    # The tensor maps the (aligned) buffer of the message instead of a copy of it
+    buffer_address = np.frombuffer(message, dtype=np.uint8).ctypes.data
+    offset = decoded["a"].data_ptr() - buffer_address
+    assert 0 < offset < len(message)
+    assert offset % ALIGNMENT == 0
+
+
+def test_non_contiguous_input():
+    image = torch.randint(0, 256, (3, 32, 40), dtype=torch.uint8).permute(1, 2, 0)
+    decoded, _ = decode_tensors(encode_tensors({"image": image}))
+    torch.testing.assert_close(decoded["image"], image)
+
+
+def test_lossless_compression():
+    image = np.zeros((120, 160, 3), dtype=np.uint8)
+    image[40:80, 50:110] = 200
+    raw = encode_tensors({"image": image})
+    compressed = encode_tensors({"image": image}, compression={"image": TensorCompression(level=6)})
+
+    assert len(compressed) < len(raw) // 10
+    decoded, _ = decode_tensors(compressed)
+    np.testing.assert_array_equal(decoded["image"], image)
+
+
+def test_lossy_compression_error_is_bounded():
+    image = np.random.randint(0, 256, (60, 80, 3), dtype=np.uint8)
+    compression = {"image": TensorCompression(level=1, quantization_bits=3)}
+    decoded, _ = decode_tensors(encode_tensors({"image": image}, compression=compression))
+
+    error = np.abs(decoded["image"].astype(np.int16) - image.astype(np.int16))
+    assert error.max() <= 4
+
+
+def test_lossy_compression_rejects_floats():
+    with pytest.raises(ValueError):
+        encode_tensors(
+            {"state": torch.randn(6)}, compression={"state": TensorCompression(quantization_bits=2)}
+        )
+
+
+@pytest.mark.parametrize("level, quantization_bits", [(0, 0), (10, 0), (1, 8), (1, -1)])
+def test_invalid_compression(level, quantization_bits):
+    with pytest.raises(ValueError):
+        TensorCompression(level=level, quantization_bits=quantization_bits)
+
+
+def test_unsupported_values():
+    with pytest.raises(TypeError):
+        encode_tensors({"values": [1, 2, 3]})
+    with pytest.raises(TypeError):
+        encode_tensors({"objects": np.array([{}, None])})
+
+
+def test_invalid_messages():
+    message = encode_tensors({"a": torch.arange(100)})
+    with pytest.raises(ValueError, match="magic"):
+        decode_tensors(b"XXXX" + message[4:])
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_tensors(message[:-8])
+    with pytest.raises(ValueError, match="too short"):
+        decode_tensors(b"LR")
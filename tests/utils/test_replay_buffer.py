@@ -21,8 +21,16 @@ import pytest
 import torch
 
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
-from lerobot.rl.buffer import BatchTransition, ReplayBuffer, random_crop_vectorized
+from lerobot.rl.buffer import (
+    BatchTransition,
+    PrioritizedReplayBuffer,
+    ReplayBuffer,
+    SumTree,
+    concatenate_batch_transitions,
+    random_crop_vectorized,
+)
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGE, OBS_STATE, OBS_STR, REWARD
+from lerobot.utils.transition import Transition, index_transition, stack_transitions
 from tests.fixtures.constants import DUMMY_REPO_ID
 
 
@@ -679,3 +687,275 @@ def test_async_iterator_multiple_iterations():
 
     # Ensure iterator can be disposed without blocking
     del iterator
+
+
+def test_store_images_as_uint8():
+    buffer = ReplayBuffer(
+        capacity=10,
+        device="cpu",
+        state_keys=[OBS_IMAGE, OBS_STATE],
+        use_drq=False,
+        optimize_memory=True,
+        store_images_as_uint8=True,
+    )
+    states = [create_dummy_state() for _ in range(4)]
+    for i, state in enumerate(states):
+        buffer.add(state, create_dummy_action(), 1.0, None, i == 3, False)
+
+    assert buffer.states[OBS_IMAGE].dtype == torch.uint8
+    assert buffer.states[OBS_STATE].dtype == torch.float32
+
+    batch = buffer.sample(8)
+    images, next_images = batch["state"][OBS_IMAGE], batch["next_state"][OBS_IMAGE]
+    assert images.dtype == torch.float32
+    assert next_images.shape == images.shape
+    for image, state in zip(images, batch["state"][OBS_STATE], strict=True):
+        original = next(s for s in states if torch.equal(s[OBS_STATE], state))
+        assert torch.allclose(image, original[OBS_IMAGE], atol=0.5 / 255 + 1e-6)
+
+
+@pytest.mark.skipif(torch.cuda.is_available(), reason="pin_memory is only disabled without CUDA")
+def test_pin_memory_disabled_without_cuda():
+    buffer = ReplayBuffer(capacity=10, device="cpu", state_keys=state_dims(), use_drq=False, pin_memory=True)
+    assert buffer.pin_memory is False
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires a CUDA device")
+def test_stream_iterator_pinned_memory():
+    buffer = ReplayBuffer(
+        capacity=10,
+        device="cuda",
+        state_keys=[OBS_IMAGE, OBS_STATE],
+        storage_device="cpu",
+        use_drq=False,
+        store_images_as_uint8=True,
+        pin_memory=True,
+    )
+    for i in range(10):
+        state = {OBS_IMAGE: torch.full((3, 8, 8), i / 10), OBS_STATE: torch.arange(11).float() + i}
+        buffer.add(state, torch.tensor([float(i)]), float(i), state, False, False)
+
+    iterator = buffer.get_iterator(batch_size=4, async_prefetch=True, queue_size=2)
+    for _ in range(3):
+        batch = next(iterator)
+        assert batch["state"][OBS_IMAGE].device.type == "cuda"
+        steps = batch[ACTION][:, 0]
+        assert torch.equal(batch["reward"], steps)
+        assert torch.allclose(batch["state"][OBS_IMAGE][:, 0, 0, 0], steps / 10, atol=1 / 255)
+
+
+def test_sum_tree_update_and_total():
+    tree = SumTree(5)
+    tree.update(torch.tensor([0, 1, 2, 3, 4]), torch.tensor([1.0, 2.0, 3.0, 4.0, 5.0]))
+    assert tree.total == 15.0
+
+    tree.update(torch.tensor([4, 1]), torch.tensor([0.0, 1.0]))
+    assert tree.total == 9.0
+    assert torch.equal(tree[torch.tensor([1, 4])], torch.tensor([1.0, 0.0], dtype=torch.float64))
+
+
+def test_sum_tree_samples_in_proportion_to_priorities():
+    tree = SumTree(4)
+    tree.update(torch.arange(4), torch.tensor([0.0, 1.0, 3.0, 0.0]))
+
+    indices = torch.cat([tree.sample(100) for _ in range(20)])
+
+    assert set(indices.tolist()) <= {1, 2}
+    assert abs((indices == 2).float().mean().item() - 0.75) < 0.05
+
+
+def _fill_prioritized_buffer(capacity: int = 8, **kwargs) -> PrioritizedReplayBuffer:
+    buffer = PrioritizedReplayBuffer(
+        capacity, "cpu", [OBS_STATE], use_drq=False, optimize_memory=False, **kwargs
+    )
+    for i in range(capacity):
+        state = {OBS_STATE: torch.full((3,), float(i))}
+        buffer.add(state, torch.tensor([float(i)]), float(i), state, False, False)
+    return buffer
+
+
+def test_prioritized_buffer_samples_high_td_errors():
+    buffer = _fill_prioritized_buffer(alpha=1.0, beta=1.0)
+
+    batch = buffer.sample(8)
+    assert torch.equal(batch["weights"], torch.ones(8))
+    assert torch.equal(batch["reward"], batch["indices"].float())
+
+    # Only transition 5 keeps a significant TD error
+    buffer.update_priorities(torch.arange(8), torch.tensor([0.0, 0.0, 0.0, 0.0, 0.0, 10.0, 0.0, 0.0]))
+    batch = buffer.sample(8)
+
+    assert torch.all(batch["indices"] == 5)
+    assert torch.all(batch["reward"] == 5.0)
+    assert buffer.max_priority == pytest.approx(10.0)
+
+
+def test_prioritized_buffer_importance_weights():
+    buffer = _fill_prioritized_buffer(alpha=1.0, beta=1.0)
+    buffer.update_priorities(torch.arange(8), torch.tensor([1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 9.0]))
+
+    batch = buffer.sample(64)
+
+    # Rarely sampled transitions weigh more, the largest weight of the batch being 1
+    rare = batch["indices"] != 7
+    assert torch.allclose(batch["weights"][rare], torch.ones(int(rare.sum())))
+    assert torch.allclose(batch["weights"][~rare], torch.full((int((~rare).sum()),), 1 / 9))
+
+
+def test_prioritized_buffer_optimize_memory_skips_newest_transition():
+    buffer = PrioritizedReplayBuffer(10, "cpu", [OBS_STATE], use_drq=False, optimize_memory=True)
+    for i in range(3):
+        state = {OBS_STATE: torch.full((3,), float(i))}
+        buffer.add(state, torch.tensor([float(i)]), float(i), None, False, False)
+
+    indices = buffer.sample(100)["indices"]
+    assert set(indices.tolist()) == {0, 1}
+
+
+def test_concatenate_prioritized_and_uniform_batches():
+    prioritized = _fill_prioritized_buffer().sample(4)
+    uniform = _fill_prioritized_buffer()
+    uniform_batch = ReplayBuffer.sample(uniform, 2)
+
+    batch = concatenate_batch_transitions(prioritized, uniform_batch)
+
+    assert batch["weights"].shape == (6,)
+    assert torch.equal(batch["weights"][4:], torch.ones(2))
+    assert "indices" not in batch
+
+
+def _random_transitions(num_transitions: int) -> list[Transition]:
+    return [
+        Transition(
+            state={OBS_IMAGE: torch.rand(1, 3, 8, 8), OBS_STATE: torch.randn(1, 10)},
+            action=torch.randn(1, 4),
+            reward=float(i),
+            next_state={OBS_IMAGE: torch.rand(1, 3, 8, 8), OBS_STATE: torch.randn(1, 10)},
+            done=i % 3 == 0,
+            truncated=False,
+            complementary_info={"discrete_penalty": torch.tensor([float(-i)])},
+        )
+        for i in range(num_transitions)
+    ]
+
+
+@pytest.mark.parametrize("store_images_as_uint8", [False, True])
+def test_add_batch_matches_add(store_images_as_uint8):
+    # 14 transitions in a buffer of capacity 10 wrap around, including within the second batch
+    transitions = _random_transitions(14)
+    sequential = ReplayBuffer(10, "cpu", state_dims(), store_images_as_uint8=store_images_as_uint8)
+    batched = ReplayBuffer(10, "cpu", state_dims(), store_images_as_uint8=store_images_as_uint8)
+
+    for transition in transitions:
+        sequential.add(**transition)
+    positions = batched.add_batch(**stack_transitions(transitions[:3]))
+    assert positions.tolist() == [0, 1, 2]
+    positions = batched.add_batch(**stack_transitions(transitions[3:]))
+    # The first of these 11 transitions would be overwritten by the last one, it is skipped
+    assert positions.tolist() == [4, 5, 6, 7, 8, 9, 0, 1, 2, 3]
+
+    assert (batched.position, batched.size) == (sequential.position, sequential.size)
+    for key in state_dims():
+        assert torch.equal(batched.states[key], sequential.states[key])
+        assert torch.equal(batched.next_states[key], sequential.next_states[key])
+    assert torch.equal(batched.actions, sequential.actions)
+    assert torch.equal(batched.rewards, sequential.rewards)
+    assert torch.equal(batched.dones, sequential.dones)
+    assert torch.equal(batched.truncateds, sequential.truncateds)
+    assert torch.equal(
+        batched.complementary_info["discrete_penalty"], sequential.complementary_info["discrete_penalty"]
+    )
+
+
+def test_add_batch_larger_than_capacity():
+    transitions = _random_transitions(25)
+    sequential = create_empty_replay_buffer()
+    batched = create_empty_replay_buffer()
+
+    for transition in transitions:
+        sequential.add(**transition)
+    batched.add_batch(**stack_transitions(transitions))
+
+    assert (batched.position, batched.size) == (sequential.position, sequential.size)
+    assert torch.equal(batched.rewards, sequential.rewards)
+    assert torch.equal(batched.states[OBS_STATE], sequential.states[OBS_STATE])
+
+
+def test_index_stacked_transitions():
+    transitions = stack_transitions(_random_transitions(4))
+    selected = index_transition(transitions, torch.tensor([True, False, False, True]))
+
+    assert selected["state"][OBS_IMAGE].shape == (2, 3, 8, 8)
+    assert torch.equal(selected["reward"], torch.tensor([0.0, 3.0]))
+    assert torch.equal(selected["done"], torch.tensor([True, True]))
+    assert torch.equal(selected["complementary_info"]["discrete_penalty"], torch.tensor([-0.0, -3.0]))
+
+
+def test_prioritized_buffer_add_batch_gives_max_priority():
+    buffer = _fill_prioritized_buffer(alpha=1.0)
+    buffer.update_priorities(torch.arange(8), torch.full((8,), 4.0))
+    buffer.sample(1)
+
+    state = {OBS_STATE: torch.zeros(2, 3)}
+    buffer.add_batch(state, torch.zeros(2), torch.zeros(2), state, torch.zeros(2), torch.zeros(2))
+
+    assert buffer.position == 2
+    assert torch.allclose(buffer.priorities[torch.arange(2)], torch.full((2,), 4.0, dtype=torch.float64))
+
+
+def test_memory_mapped_buffer_resumes_from_storage_dir(tmp_path):
+    storage_dir = tmp_path / "buffer"
+    buffer = ReplayBuffer(10, "cpu", state_dims(), store_images_as_uint8=True, storage_dir=storage_dir)
+    transitions = _random_transitions(13)
+    buffer.add_batch(**stack_transitions(transitions[:12]))
+    buffer.save_state()
+
+    assert (storage_dir / f"state.{OBS_IMAGE}.npy").exists()
+    assert buffer.states[OBS_IMAGE].dtype == torch.uint8
+
+    resumed = ReplayBuffer.from_storage_dir(storage_dir, device="cpu", use_drq=False)
+
+    assert (resumed.position, resumed.size, resumed.capacity) == (2, 10, 10)
+    assert resumed.store_images_as_uint8
+    for key in state_dims():
+        assert torch.equal(resumed.states[key], buffer.states[key])
+        assert torch.equal(resumed.next_states[key], buffer.next_states[key])
+    assert torch.equal(resumed.rewards, buffer.rewards)
+    assert torch.equal(resumed.episode_ends, buffer.dones)
+    assert torch.equal(
+        resumed.complementary_info["discrete_penalty"], buffer.complementary_info["discrete_penalty"]
+    )
+
+    # Both map the same files
+    resumed.add(**transitions[12])
+    assert buffer.rewards[2] == 12.0
+    assert resumed.sample(4)[ACTION].shape == (4, 4)
+
+
+def test_memory_mapped_buffer_requires_cpu_storage(tmp_path):
+    with pytest.raises(ValueError, match="must be stored on CPU"):
+        ReplayBuffer(10, "cpu", state_dims(), storage_device="meta", storage_dir=tmp_path)
+
+
+def test_new_memory_mapped_buffer_discards_saved_state(tmp_path):
+    buffer = ReplayBuffer(10, "cpu", state_dims(), storage_dir=tmp_path)
+    buffer.add_batch(**stack_transitions(_random_transitions(3)))
+    buffer.save_state()
+
+    buffer = ReplayBuffer(10, "cpu", state_dims(), storage_dir=tmp_path)
+    buffer.add(**_random_transitions(1)[0])
+
+    with pytest.raises(FileNotFoundError):
+        ReplayBuffer.from_storage_dir(tmp_path, device="cpu")
+
+
+def test_resumed_prioritized_buffer_samples_every_transition(tmp_path):
+    buffer = PrioritizedReplayBuffer(10, "cpu", [OBS_STATE], use_drq=False, storage_dir=tmp_path)
+    for i in range(4):
+        state = {OBS_STATE: torch.full((3,), float(i))}
+        buffer.add(state, torch.tensor([float(i)]), float(i), state, False, False)
+    buffer.save_state()
+
+    resumed = PrioritizedReplayBuffer.from_storage_dir(tmp_path, device="cpu", use_drq=False)
+
+    assert set(resumed.sample(200)["indices"].tolist()) == {0, 1, 2, 3}
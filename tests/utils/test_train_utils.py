@@ -17,12 +17,16 @@
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import torch
+
+from lerobot.datasets.sampler import EpisodeAwareSampler
 from lerobot.utils.constants import (
     CHECKPOINTS_DIR,
     LAST_CHECKPOINT_LINK,
     OPTIMIZER_PARAM_GROUPS,
     OPTIMIZER_STATE,
     RNG_STATE,
+    SAMPLER_STATE,
     SCHEDULER_STATE,
     TRAINING_STATE_DIR,
     TRAINING_STEP,
@@ -30,6 +34,7 @@ from lerobot.utils.constants import (
 from lerobot.utils.train_utils import (
     get_step_checkpoint_dir,
     get_step_identifier,
+    load_sampler_state,
     load_training_state,
     load_training_step,
     save_checkpoint,
@@ -112,3 +117,44 @@ def test_save_load_training_state(tmp_path, optimizer, scheduler):
     assert loaded_step == 10
     assert loaded_optimizer is optimizer
     assert loaded_scheduler is scheduler
+
+
+def test_resume_sampler_from_checkpoint(tmp_path, optimizer, scheduler):
+    def make_sampler():
+        return EpisodeAwareSampler([0, 10], [10, 30], shuffle=True, chunk_size=3, seed=3)
+
+    def make_dataloader(sampler):
+        return torch.utils.data.DataLoader(
+            range(30), batch_size=4, sampler=sampler, num_workers=1, prefetch_factor=2
+        )
+
+    reference = make_sampler()
+    reference.set_epoch(1)
+    expected = [idx for batch in make_dataloader(reference) for idx in batch.tolist()]
+
+    sampler = make_sampler()
+    list(make_dataloader(sampler))
+
+    # Run 3 steps over a second epoch, then checkpoint: the workers have prefetched further batches
+    batches = iter(make_dataloader(sampler))
+    consumed = [idx for _ in range(3) for idx in next(batches).tolist()]
+    assert sampler.state_dict()["position"] > len(consumed)
+    step = 8 + 3
+    save_training_state(tmp_path, step, optimizer, scheduler, sampler.state_dict_after(step, batch_size=4))
+    del batches
+    assert (tmp_path / TRAINING_STATE_DIR / SAMPLER_STATE).is_file()
+
+    resumed = make_sampler()
+    loaded_step, _, _ = load_training_state(tmp_path, optimizer, scheduler)
+    assert load_sampler_state(tmp_path, resumed)
+    assert loaded_step == step
+    assert resumed.epoch == 1
+    remaining = [idx for batch in make_dataloader(resumed) for idx in batch.tolist()]
+    assert consumed + remaining == expected
+
+
+def test_load_sampler_state_missing(tmp_path, optimizer, scheduler):
+    save_training_state(tmp_path, 10, optimizer, scheduler)
+    sampler = EpisodeAwareSampler([0], [10], shuffle=True, seed=3)
+    assert not load_sampler_state(tmp_path, sampler)
+    assert sampler.state_dict() == {"seed": 3, "epoch": 0, "position": 0}